@@ -0,0 +1,104 @@
+"""Structured access and audit logs, and the middleware writing access records."""
+
+import random
+import time
+from typing import Callable
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from api.tracing import TRACEPARENT_HEADER
+from config import Settings
+from utils.json_codec import get_json_encoder
+from utils.metrics import MetricsRegistry
+from utils.structured_log import StructuredLog
+
+
+def build_structured_logs(
+    settings: Settings, metrics: MetricsRegistry
+) -> dict[str, StructuredLog]:
+    """Create the configured JSON-lines logs; they are started by the lifespan.
+
+    Args:
+        settings: Application settings.
+        metrics: Registry the logs report into.
+
+    Returns:
+        The ``"access"`` and ``"audit"`` logs whose paths are set.
+    """
+    paths = {"access": settings.access_log_path, "audit": settings.audit_log_path}
+    encoder = get_json_encoder(settings.json_encoder)
+    return {
+        name: StructuredLog(
+            name,
+            path,
+            encoder,
+            metrics,
+            queue_size=settings.log_queue_size,
+            batch_size=settings.log_batch_size,
+            max_bytes=settings.log_max_bytes,
+            backup_count=settings.log_backup_count,
+        )
+        for name, path in paths.items()
+        if path
+    }
+
+
+class AccessLogMiddleware:
+    """Write one record per sampled API request once its response is sent.
+
+    A ``sample_rate`` share of requests is logged, plus every request that
+    ended in a 5xx or an exception. Records carry the route template, the
+    status, response body bytes and the duration; outside TracingMiddleware
+    they also carry the trace id from the ``traceparent`` response header.
+    Logging only queues the record, so the response is never held up.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        log: StructuredLog,
+        sample_rate: float = 1.0,
+        path_prefix: str = "/api/",
+        sampler: Callable[[], float] = random.random,
+    ) -> None:
+        self.app = app
+        self.log = log
+        self.sample_rate = sample_rate
+        self.path_prefix = path_prefix
+        self._sampler = sampler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+        start = time.perf_counter()
+        status, size, traceparent = 500, 0, None
+
+        async def send_and_measure(message: Message) -> None:
+            nonlocal status, size, traceparent
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                for name, value in message.get("headers", ()):
+                    if name == TRACEPARENT_HEADER:
+                        traceparent = value.decode("latin-1")
+            else:
+                size += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_and_measure)
+        finally:
+            if status >= 500 or self._sampler() < self.sample_rate:
+                route = scope.get("route")
+                client = scope.get("client")
+                self.log.emit(
+                    "http.request",
+                    method=scope["method"],
+                    path=scope["path"],
+                    route=None if route is None else route.path,
+                    status=status,
+                    bytes=size,
+                    duration_ms=round((time.perf_counter() - start) * 1000, 3),
+                    client=None if client is None else client[0],
+                    trace_id=None if traceparent is None else traceparent.split("-")[1],
+                )
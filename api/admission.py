@@ -0,0 +1,148 @@
+"""ASGI middleware for per-client rate limiting and adaptive load shedding."""
+
+import math
+import time
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from utils.admission import CoDelLimiter, TokenBucketLimiter
+from utils.metrics import MetricsRegistry
+
+
+async def send_rejection(send: Send, status: int, retry_after: float, detail: bytes) -> None:
+    """Send a minimal JSON error without touching the application.
+
+    Args:
+        send: The ASGI send callable.
+        status: HTTP status code, e.g. 429.
+        retry_after: Seconds the client should wait, rounded up in the header.
+        detail: Encoded JSON body.
+    """
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(detail)).encode()),
+            (b"retry-after", str(max(1, math.ceil(retry_after))).encode()),
+        ],
+    })
+    await send({"type": "http.response.body", "body": detail})
+
+
+def client_key(scope: Scope) -> str:
+    """Identify the caller: API key header first, else the peer address.
+
+    Args:
+        scope: The ASGI connection scope.
+
+    Returns:
+        A stable key for the client.
+    """
+    api_key = Headers(scope=scope).get("x-api-key")
+    if api_key:
+        return f"key:{api_key}"
+    client = scope.get("client")
+    return f"addr:{client[0]}" if client else "addr:unknown"
+
+
+class RateLimitMiddleware:
+    """Reject requests with 429 once a client's token bucket is empty."""
+
+    _BODY = b'{"detail":"Rate limit exceeded"}'
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiter: TokenBucketLimiter,
+        metrics: MetricsRegistry,
+        path_prefix: str = "/api/",
+    ) -> None:
+        self.app = app
+        self.limiter = limiter
+        self.path_prefix = path_prefix
+        self._allowed = metrics.counter(
+            "ratelimit_allowed_total", "Requests admitted by the rate limiter"
+        )
+        self._rejected = metrics.counter(
+            "ratelimit_rejected_total", "Requests rejected with 429 by the rate limiter"
+        )
+        metrics.gauge(
+            "ratelimit_tracked_clients", "Clients with a live token bucket"
+        ).set_function(lambda: len(limiter))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+        wait = self.limiter.acquire(client_key(scope))
+        if wait > 0:
+            self._rejected.inc()
+            await send_rejection(send, 429, wait, self._BODY)
+            return
+        self._allowed.inc()
+        await self.app(scope, receive, send)
+
+
+class LoadSheddingMiddleware:
+    """Bound concurrency and shed with 503 once queueing delay passes target.
+
+    Long-lived streams listed in ``exempt_paths`` bypass the limiter; they
+    would otherwise pin a concurrency slot for their whole lifetime.
+    """
+
+    _BODY = b'{"detail":"Service overloaded, retry later"}'
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiter: CoDelLimiter,
+        metrics: MetricsRegistry,
+        path_prefix: str = "/api/",
+        exempt_paths: frozenset[str] = frozenset(),
+    ) -> None:
+        self.app = app
+        self.limiter = limiter
+        self.path_prefix = path_prefix
+        self.exempt_paths = exempt_paths
+        self._shed = metrics.counter(
+            "loadshed_rejected_total", "Requests shed with 503 by the concurrency limiter"
+        )
+        self._delay = metrics.histogram(
+            "loadshed_queue_delay_seconds", "Time admitted requests spent queued"
+        )
+        self._latency = metrics.histogram(
+            "http_request_duration_seconds", "Latency of admitted requests"
+        )
+        metrics.gauge("loadshed_in_flight", "Requests currently executing").set_function(
+            lambda: limiter.in_flight
+        )
+        metrics.gauge("loadshed_queue_depth", "Requests waiting for a slot").set_function(
+            lambda: limiter.queue_depth
+        )
+        metrics.gauge("loadshed_overloaded", "1 while the queue is standing").set_function(
+            lambda: float(limiter.overloaded)
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        path = scope.get("path", "")
+        if (
+            scope["type"] != "http"
+            or not path.startswith(self.path_prefix)
+            or path in self.exempt_paths
+        ):
+            await self.app(scope, receive, send)
+            return
+        start = time.perf_counter()
+        delay = await self.limiter.acquire()
+        if delay is None:
+            self._shed.inc()
+            await send_rejection(send, 503, self.limiter.interval, self._BODY)
+            return
+        self._delay.observe(delay)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.limiter.release()
+            self._latency.observe(time.perf_counter() - start)
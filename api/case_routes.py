@@ -1,33 +1,136 @@
 """Case API routes matching contracts/case.yaml."""
 
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Header, Query, Request, Response
 
 from api.dependencies import get_case_service
-from exceptions import NotFoundError, InvalidStateError
-from schemas import AssignExpertRequest, CaseAssignmentResponse, CaseResponse
-from services.case_service import CaseService
+from api.error_handlers import MAPPED_ERRORS, ErrorBodies, error_response
+from api.idempotency import IDEMPOTENCY_HEADER, run_idempotent
+from schemas import (
+    AssignExpertRequest,
+    BatchGetRequest,
+    BatchGetResponse,
+    CaseAssignmentResponse,
+    CaseResponse,
+    CaseSearchResponse,
+    CaseStatsRebuildResponse,
+    CaseStatsResponse,
+)
+from services.case_service import MAX_SEARCH_LIMIT, CaseService
+from utils.idempotency import StoredResponse
 
 router = APIRouter(prefix="/api/v1", tags=["cases"])
 
 
+@router.get("/cases:search", response_model=CaseSearchResponse)
+async def search_cases(
+    referrer_id: str | None = None,
+    expert_id: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_SEARCH_LIMIT)] = 50,
+    service: CaseService = Depends(get_case_service),
+) -> CaseSearchResponse:
+    """Search cases by exact or prefix (``ref-1*``) referrer/expert ids.
+
+    Args:
+        referrer_id: Referrer id pattern.
+        expert_id: Expert id pattern.
+        limit: Maximum number of cases to return.
+        service: Injected CaseService.
+
+    Returns:
+        The matching cases and whether more matches exist.
+    """
+    page = await service.search_cases(
+        referrer_id=referrer_id, expert_id=expert_id, limit=limit
+    )
+    return CaseSearchResponse.from_model(page)
+
+
+@router.get("/cases:overdue", response_model=CaseSearchResponse)
+async def list_overdue_cases(
+    limit: Annotated[int, Query(ge=1, le=MAX_SEARCH_LIMIT)] = 50,
+    service: CaseService = Depends(get_case_service),
+) -> CaseSearchResponse:
+    """List cases past their SLA deadline, most overdue first.
+
+    Args:
+        limit: Maximum number of cases to return.
+        service: Injected CaseService.
+
+    Returns:
+        The overdue cases and whether more exist.
+    """
+    return CaseSearchResponse.from_model(await service.list_overdue(limit=limit))
+
+
+@router.post("/cases:batchGet", response_model=BatchGetResponse)
+async def batch_get_cases(
+    body: BatchGetRequest,
+    service: CaseService = Depends(get_case_service),
+) -> BatchGetResponse:
+    """Retrieve up to 100 cases by id in one request.
+
+    Args:
+        body: Request body containing the ids.
+        service: Injected CaseService.
+
+    Returns:
+        The found cases and the ids that were not found.
+    """
+    batch = await service.get_cases(body.ids)
+    return BatchGetResponse.from_model(batch)
+
+
+@router.get("/cases:stats", response_model=CaseStatsResponse)
+async def get_case_stats(
+    service: CaseService = Depends(get_case_service),
+) -> CaseStatsResponse:
+    """Return case counts per status, expert and creation day.
+
+    Args:
+        service: Injected CaseService.
+
+    Returns:
+        The incrementally maintained statistics.
+    """
+    return CaseStatsResponse.from_model(await service.get_stats())
+
+
+@router.post("/cases:rebuildStats", response_model=CaseStatsRebuildResponse)
+async def rebuild_case_stats(
+    service: CaseService = Depends(get_case_service),
+) -> CaseStatsRebuildResponse:
+    """Recompute statistics from every stored case.
+
+    Args:
+        service: Injected CaseService.
+
+    Returns:
+        The recomputed statistics and whether the live counters had drifted.
+    """
+    return CaseStatsRebuildResponse.from_model(await service.rebuild_stats())
+
+
 @router.get("/cases/{case_id}", response_model=CaseResponse)
 async def get_case(
     case_id: str,
+    request: Request,
     service: CaseService = Depends(get_case_service),
-) -> CaseResponse:
+) -> CaseResponse | Response:
     """Retrieve a case by its ID.
 
     Args:
         case_id: Unique identifier of the case.
+        request: The incoming request.
         service: Injected CaseService.
 
     Returns:
-        The case data.
+        The case data, or a pre-encoded 404 if it does not exist.
     """
-    try:
-        case = await service.get_case(case_id)
-    except NotFoundError as exc:
-        raise HTTPException(status_code=404, detail=exc.message)
+    case = await service.find_case(case_id)
+    if case is None:
+        return error_response(404, request.app.state.errors.case_not_found)
     return CaseResponse.from_model(case)
 
 
@@ -35,22 +138,46 @@ async def get_case(
 async def assign_expert(
     case_id: str,
     body: AssignExpertRequest,
+    request: Request,
     service: CaseService = Depends(get_case_service),
-) -> CaseAssignmentResponse:
+    idempotency_key: Annotated[str | None, Header(alias=IDEMPOTENCY_HEADER)] = None,
+) -> CaseAssignmentResponse | Response:
     """Assign an expert to a case.
 
+    With an Idempotency-Key header, the first request for a key executes and
+    its response is recorded; retries and concurrent duplicates receive the
+    recorded response without reaching the service.
+
     Args:
         case_id: Unique identifier of the case.
         body: Request body containing the expert_id.
+        request: The incoming request.
         service: Injected CaseService.
+        idempotency_key: Optional client-chosen key for safe retries.
 
     Returns:
         The assignment result.
     """
-    try:
-        assignment = await service.assign_expert(case_id, body.expert_id)
-    except NotFoundError as exc:
-        raise HTTPException(status_code=404, detail=exc.message)
-    except InvalidStateError as exc:
-        raise HTTPException(status_code=409, detail=exc.message)
+    if idempotency_key is not None:
+        return await run_idempotent(
+            request,
+            idempotency_key,
+            body.model_dump_json().encode(),
+            lambda: _assign_serialized(service, request.app.state.errors, case_id, body.expert_id),
+        )
+    assignment = await service.assign_expert(case_id, body.expert_id)
     return CaseAssignmentResponse.from_model(assignment)
+
+
+async def _assign_serialized(
+    service: CaseService, errors: ErrorBodies, case_id: str, expert_id: str
+) -> StoredResponse:
+    """Run an assignment and capture its outcome as a replayable response."""
+    try:
+        assignment = await service.assign_expert(case_id, expert_id)
+    except MAPPED_ERRORS as exc:
+        status, body = errors.for_error(exc)
+    else:
+        status = 200
+        body = CaseAssignmentResponse.from_model(assignment).model_dump_json().encode()
+    return StoredResponse(status_code=status, body=body, fingerprint="")
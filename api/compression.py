@@ -0,0 +1,191 @@
+"""ASGI middleware compressing responses with brotli or gzip.
+
+Small bodies are sent as-is — compression overhead would exceed the savings.
+Streaming responses are compressed chunk by chunk with a sync flush so the
+client still receives each chunk promptly. Event streams are never compressed:
+each open stream would otherwise pin a compressor's window in memory.
+"""
+
+import zlib
+from typing import Protocol
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+_UNCOMPRESSIBLE_TYPES = ("text/event-stream", "image/", "video/", "audio/")
+
+
+class _Compressor(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+    def finish(self) -> bytes: ...
+
+
+class _GzipCompressor:
+    def __init__(self, level: int) -> None:
+        self._obj = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._obj.flush(zlib.Z_FINISH)
+
+
+class _BrotliCompressor:
+    def __init__(self, quality: int) -> None:
+        self._obj = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.process(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush()
+
+    def finish(self) -> bytes:
+        return self._obj.finish()
+
+
+def supported_encodings() -> list[str]:
+    """List the content-codings this process can produce.
+
+    Returns:
+        Encoding tokens as used in ``Accept-Encoding``.
+    """
+    return ["br", "gzip"] if brotli is not None else ["gzip"]
+
+
+def negotiate_encoding(accept_encoding: str, preferred: tuple[str, ...]) -> str | None:
+    """Pick the first preferred encoding the client accepts.
+
+    Args:
+        accept_encoding: Raw ``Accept-Encoding`` request header value.
+        preferred: Server-side preference order.
+
+    Returns:
+        The chosen encoding, or None to send the body uncompressed.
+    """
+    accepted: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[token.strip().lower()] = quality
+    wildcard = accepted.get("*", 0.0)
+    for encoding in preferred:
+        if accepted.get(encoding, wildcard) > 0:
+            return encoding
+    return None
+
+
+class CompressionMiddleware:
+    """Size-threshold, streaming-aware response compression."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        encodings: tuple[str, ...] = ("br", "gzip"),
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        supported = supported_encodings()
+        self.encodings = tuple(e for e in encodings if e in supported)
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.encodings:
+            await self.app(scope, receive, send)
+            return
+        accept = Headers(scope=scope).get("accept-encoding", "")
+        encoding = negotiate_encoding(accept, self.encodings) if accept else None
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressingResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    def new_compressor(self, encoding: str) -> _Compressor:
+        """Create a compressor for one response body."""
+        if encoding == "br":
+            return _BrotliCompressor(self.brotli_quality)
+        return _GzipCompressor(self.gzip_level)
+
+
+class _CompressingResponder:
+    """Per-response send wrapper; decides on the first body chunk."""
+
+    def __init__(self, owner: CompressionMiddleware, encoding: str, send: Send) -> None:
+        self._owner = owner
+        self._encoding = encoding
+        self._send = send
+        self._start: Message | None = None
+        self._compressor: _Compressor | None = None
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self._start = message
+            headers = Headers(raw=message["headers"])
+            content_type = headers.get("content-type", "")
+            self._passthrough = "content-encoding" in headers or content_type.startswith(
+                _UNCOMPRESSIBLE_TYPES
+            )
+            return
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+        if self._start is not None:
+            await self._first_body(message)
+        elif self._compressor is not None:
+            await self._next_body(message)
+        else:
+            await self._send(message)
+
+    async def _first_body(self, message: Message) -> None:
+        start, self._start = self._start, None
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self._passthrough or (not more_body and len(body) < self._owner.minimum_size):
+            await self._send(start)
+            await self._send(message)
+            return
+
+        self._compressor = self._owner.new_compressor(self._encoding)
+        headers = MutableHeaders(raw=list(start["headers"]))
+        headers["Content-Encoding"] = self._encoding
+        headers.add_vary_header("Accept-Encoding")
+        if more_body:
+            del headers["Content-Length"]
+            payload = self._compressor.compress(body) + self._compressor.flush()
+        else:
+            payload = self._compressor.compress(body) + self._compressor.finish()
+            headers["Content-Length"] = str(len(payload))
+        start["headers"] = headers.raw
+        await self._send(start)
+        await self._send({"type": "http.response.body", "body": payload, "more_body": more_body})
+
+    async def _next_body(self, message: Message) -> None:
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        payload = self._compressor.compress(body)
+        payload += self._compressor.flush() if more_body else self._compressor.finish()
+        await self._send({"type": "http.response.body", "body": payload, "more_body": more_body})
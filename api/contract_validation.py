@@ -0,0 +1,141 @@
+"""Sampled runtime validation of API responses against the OpenAPI contracts."""
+
+import json
+import random
+import time
+from collections import deque
+from typing import Any, Callable
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from exceptions import ContractViolation
+from utils.contracts import ContractSet
+from utils.metrics import MetricsRegistry
+
+
+class ContractMonitor:
+    """Checks responses against the contracts and records the outcomes.
+
+    Every check is counted in ``contract_checks_total`` by result and timed
+    in ``contract_check_seconds``; the most recent violations are kept for
+    /debug/contracts.
+    """
+
+    def __init__(
+        self, contracts: ContractSet, metrics: MetricsRegistry, history: int = 100
+    ) -> None:
+        self.contracts = contracts
+        self._checks = metrics.counter(
+            "contract_checks_total", "Responses checked against the contracts, by result"
+        )
+        self._seconds = metrics.histogram(
+            "contract_check_seconds", "Time to decode and validate a sampled response",
+            buckets=(0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01),
+        )
+        self._violations: deque[dict[str, Any]] = deque(maxlen=history)
+
+    def check(self, method: str, path: str, status: int, body: bytes | None) -> bool:
+        """Validate one response and record the result.
+
+        Args:
+            method: Upper-case HTTP method.
+            path: Route path template.
+            status: Response status code.
+            body: Raw JSON body, or None for responses without one.
+
+        Returns:
+            True if the response conforms.
+        """
+        start = time.perf_counter()
+        try:
+            document = json.loads(body) if body else None
+            self.contracts.validate_response(method, path, status, document)
+        except (ContractViolation, ValueError) as exc:
+            message = exc.message if isinstance(exc, ContractViolation) else f"invalid JSON: {exc}"
+            self._violations.append({
+                "method": method, "path": path, "status": status, "error": message,
+                "at": time.time(),
+            })
+            ok = False
+        else:
+            ok = True
+        self._seconds.observe(time.perf_counter() - start)
+        self._checks.inc(result="ok" if ok else "violation")
+        return ok
+
+    def skipped(self) -> None:
+        """Count a sampled response whose body was too large to check."""
+        self._checks.inc(result="skipped")
+
+    def violations(self) -> list[dict[str, Any]]:
+        """Return recent violations, oldest first."""
+        return list(self._violations)
+
+
+class ContractValidationMiddleware:
+    """Validate a random sample of JSON API responses against the contracts.
+
+    Sampled responses are passed through unchanged while their body is
+    copied; the check runs after the last chunk has been sent, so clients
+    never wait for it. Only ``application/json`` bodies are collected, which
+    leaves event streams alone, and bodies above ``max_body_bytes`` are
+    dropped unchecked, which bounds the cost of one check. Must run inside
+    compression so it sees uncompressed bodies.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        monitor: ContractMonitor,
+        sample_rate: float,
+        max_body_bytes: int = 65_536,
+        path_prefix: str = "/api/",
+        sampler: Callable[[], float] = random.random,
+    ) -> None:
+        self.app = app
+        self.monitor = monitor
+        self.sample_rate = sample_rate
+        self.max_body_bytes = max_body_bytes
+        self.path_prefix = path_prefix
+        self._sampler = sampler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or not scope["path"].startswith(self.path_prefix)
+            or self._sampler() >= self.sample_rate
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        status, chunks, size = 0, [], 0
+        collecting = oversized = False
+
+        async def send_and_copy(message: Message) -> None:
+            nonlocal status, size, collecting, oversized
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                collecting = any(
+                    name == b"content-type" and value.startswith(b"application/json")
+                    for name, value in message.get("headers", ())
+                )
+            elif collecting:
+                body = message.get("body", b"")
+                size += len(body)
+                if size > self.max_body_bytes:
+                    collecting, oversized = False, True
+                    chunks.clear()
+                else:
+                    chunks.append(body)
+            await send(message)
+
+        await self.app(scope, receive, send_and_copy)
+        route = scope.get("route")
+        if route is None or not self.monitor.contracts.covers(scope["method"], route.path):
+            return
+        if oversized:
+            self.monitor.skipped()
+            return
+        self.monitor.check(
+            scope["method"], route.path, status, b"".join(chunks) if collecting else None
+        )
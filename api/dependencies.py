@@ -2,38 +2,289 @@
 
 from functools import lru_cache
 
-from models import Case, CaseStatus
-from services.case_service import CaseService
-from utils.in_memory_repo import InMemoryCaseRepository
+from fastapi import Request
 
+from api.contract_validation import ContractMonitor
+from api.repositories import build_case_repository
+from api.sla import build_sla_policy
+from config import Settings
+from models import HOURS_PER_WEEK, Case, CaseStatus, Expert
+from services.case_service import CaseRepository, CaseService
+from services.expert_service import ExpertService
+from utils.assignment_effects import (
+    AssignmentSideEffects,
+    AssignmentStats,
+    LogAuditSink,
+    LogExpertNotifier,
+    NullAuditSink,
+)
+from utils.change_feed import ChangeFeed
+from utils.contracts import ContractSet
+from utils.expert_repo import InMemoryExpertRepository
+from utils.job_queue import JobQueue, RetryPolicy
+from utils.json_codec import get_json_encoder
+from utils.metrics import MetricsRegistry
+from utils.structured_log import StructuredLog
+from utils.tenancy import QuotaCaseRepository
+from utils.trace_exporters import OtlpJsonFileExporter, RingBufferExporter
+from utils.tracing import Traced, Tracer, start_span
 
-@lru_cache(maxsize=1)
-def _get_repo() -> InMemoryCaseRepository:
-    """Create and seed a singleton in-memory repository.
+
+def build_tracer(settings: Settings) -> Tracer:
+    """Create the request tracer and its exporters.
+
+    Args:
+        settings: Application settings.
 
     Returns:
-        A seeded InMemoryCaseRepository instance.
+        A Tracer exporting to a ring buffer and, if configured, an
+        OTLP/JSON file; without exporters when tracing is disabled.
     """
-    repo = InMemoryCaseRepository()
-    repo.seed([
-        Case(
-            id="case-001",
-            referrer_id="ref-100",
-            status=CaseStatus.SUBMITTED,
-        ),
-        Case(
-            id="case-002",
-            referrer_id="ref-200",
-            status=CaseStatus.DRAFT,
-        ),
-    ])
+    if not settings.tracing_enabled:
+        return Tracer()
+    exporters = [RingBufferExporter(settings.tracing_buffer_spans)]
+    if settings.tracing_otlp_path:
+        exporters.append(OtlpJsonFileExporter(
+            settings.tracing_otlp_path,
+            get_json_encoder(settings.json_encoder),
+            service_name=settings.app_name,
+        ))
+    return Tracer(exporters)
+
+
+@lru_cache
+def _load_contracts(directory: str) -> ContractSet:
+    return ContractSet.load(directory)
+
+
+def build_contract_monitor(
+    settings: Settings, metrics: MetricsRegistry
+) -> ContractMonitor | None:
+    """Compile the contracts for sampled response validation.
+
+    Contracts are parsed and compiled once per directory and process.
+
+    Args:
+        settings: Application settings.
+        metrics: Registry the monitor reports into.
+
+    Returns:
+        A ContractMonitor, or None when validation is disabled.
+    """
+    if settings.contract_validation_rate <= 0:
+        return None
+    return ContractMonitor(_load_contracts(settings.contracts_dir), metrics)
+
+
+def build_change_feed(settings: Settings) -> ChangeFeed:
+    """Create the change feed every repository save publishes to.
+
+    Args:
+        settings: Application settings.
+
+    Returns:
+        An empty ChangeFeed sized from settings.
+    """
+    return ChangeFeed(
+        history=settings.change_feed_history,
+        max_buffer=settings.change_feed_buffer,
+    )
+
+
+def build_partition_repository(
+    settings: Settings,
+    metrics: MetricsRegistry,
+    change_feed: ChangeFeed,
+    tenant: str | None = None,
+    backend: CaseRepository | None = None,
+) -> CaseRepository:
+    """Build one empty case repository chain.
+
+    Args:
+        settings: Application settings selecting backend, cache and metrics.
+        metrics: Registry the cache and latency decorators report into.
+        change_feed: Feed the backend publishes saves to.
+        tenant: Tenant the chain serves; its metrics are labelled with it
+            and it is capped at tenant_max_cases. None without tenancy.
+        backend: Repository to wrap instead of building repo_backend.
+
+    Returns:
+        The outermost repository, traced when tracing is enabled.
+    """
+    labels = None if tenant is None else {"tenant": tenant}
+    repo = build_case_repository(settings, metrics, change_feed, labels, backend)
+    if tenant is not None:
+        repo = QuotaCaseRepository(repo, settings.tenant_max_cases)
+    if settings.tracing_enabled:
+        repo = Traced(repo, "CaseRepository")
+    return repo
+
+
+# Backends whose cases start empty in every process.
+_IN_MEMORY_BACKENDS = ("memory", "sharded")
+
+
+def _seeds_demo(settings: Settings, in_memory: bool) -> bool:
+    if settings.repo_seed_demo is None:
+        return in_memory
+    return settings.repo_seed_demo
+
+
+def build_repository(
+    settings: Settings,
+    metrics: MetricsRegistry,
+    change_feed: ChangeFeed,
+    backend: CaseRepository | None = None,
+) -> CaseRepository:
+    """Create the configured case repository, seeded with demo cases.
+
+    The submitted demo case is due as if it had just been submitted. With
+    tenancy enabled this is the default tenant's partition. Unless
+    repo_seed_demo says otherwise, only an in-memory backend is seeded,
+    never a database or snapshot file, nor a replica, which copies its
+    primary instead.
+
+    Args:
+        settings: Application settings selecting backend, cache and metrics.
+        metrics: Registry the cache and latency decorators report into.
+        change_feed: Feed the backend publishes saves to.
+        backend: Repository to wrap instead of building repo_backend, such
+            as this process's read replica.
+
+    Returns:
+        The outermost repository of the decorator chain, traced when
+        tracing is enabled.
+    """
+    tenant = settings.tenant_default if settings.tenancy_enabled else None
+    repo = build_partition_repository(settings, metrics, change_feed, tenant, backend)
+    in_memory = backend is None and settings.repo_backend in _IN_MEMORY_BACKENDS
+    if _seeds_demo(settings, in_memory):
+        submitted = Case(id="case-001", referrer_id="ref-100", status=CaseStatus.SUBMITTED)
+        if settings.sla_enabled:
+            submitted.due_at = build_sla_policy(settings).due_at(
+                submitted.status, submitted.created_at
+            )
+        repo.seed([
+            submitted,
+            Case(
+                id="case-002",
+                referrer_id="ref-200",
+                status=CaseStatus.DRAFT,
+            ),
+        ])
     return repo
 
 
-def get_case_service() -> CaseService:
+# Monday to Friday, 09:00-17:00 UTC, as hours of the week.
+_OFFICE_HOURS = [day * 24 + hour for day in range(5) for hour in range(9, 17)]
+
+
+def build_expert_repository(settings: Settings) -> InMemoryExpertRepository | Traced:
+    """Create the expert repository, seeded with demo experts.
+
+    Args:
+        settings: Application settings.
+
+    Returns:
+        An in-memory expert repository with its availability index, traced
+        when tracing is enabled.
+    """
+    repo = InMemoryExpertRepository()
+    if _seeds_demo(settings, in_memory=True):
+        repo.seed([
+            Expert(
+                id="exp-100",
+                name="Dr. Robin Hale",
+                specialties=["orthopaedics"],
+                on_call_hours=_OFFICE_HOURS,
+            ),
+            Expert(
+                id="exp-200",
+                name="Dr. Sam Okafor",
+                specialties=["psychiatry", "neurology"],
+                on_call_hours=_OFFICE_HOURS,
+            ),
+            Expert(
+                id="exp-300",
+                name="Dr. Jordan Reyes",
+                specialties=["neurology"],
+                on_call_hours=list(range(HOURS_PER_WEEK)),
+            ),
+        ])
+    if settings.tracing_enabled:
+        return Traced(repo, "ExpertRepository")
+    return repo
+
+
+def get_change_feed(request: Request) -> ChangeFeed:
+    """Provide the app's change feed for FastAPI Depends().
+
+    Args:
+        request: The incoming request, used to reach app state.
+
+    Returns:
+        The ChangeFeed the request's tenant's saves publish to.
+    """
+    partition = getattr(request.state, "tenant", None)
+    if partition is None:
+        return request.app.state.change_feed
+    return partition.change_feed
+
+
+def build_assignment_side_effects(
+    settings: Settings, metrics: MetricsRegistry, audit_log: StructuredLog | None = None
+) -> AssignmentSideEffects:
+    """Create the background job queue and the post-assignment jobs.
+
+    Args:
+        settings: Application settings.
+        metrics: Registry the job queue reports into.
+        audit_log: Log receiving audit records; they are dropped when None.
+
+    Returns:
+        Side effects wired to a logging notifier and the audit sink.
+    """
+    jobs = JobQueue(
+        metrics,
+        capacity=settings.job_queue_capacity,
+        workers=settings.job_workers,
+        retry=RetryPolicy(
+            max_attempts=settings.job_max_attempts,
+            base_delay=settings.job_retry_base_delay,
+            max_delay=settings.job_retry_max_delay,
+        ),
+    )
+    audit = NullAuditSink() if audit_log is None else LogAuditSink(audit_log)
+    return AssignmentSideEffects(jobs, LogExpertNotifier(), audit, AssignmentStats())
+
+
+def get_case_service(request: Request) -> CaseService:
     """Provide a CaseService instance for FastAPI Depends().
 
+    Args:
+        request: The incoming request, used to reach app-scoped state.
+
+    Returns:
+        A CaseService wired with the request's tenant's repository and
+        SLA tracker.
+    """
+    with start_span("get_case_service"):
+        partition = getattr(request.state, "tenant", None)
+        return CaseService(
+            case_repo=request.app.state.repo if partition is None else partition.repo,
+            listeners=(request.app.state.side_effects,),
+            experts=request.app.state.experts,
+            deadlines=request.app.state.sla if partition is None else partition.deadlines,
+        )
+
+
+def get_expert_service(request: Request) -> ExpertService:
+    """Provide an ExpertService instance for FastAPI Depends().
+
+    Args:
+        request: The incoming request, used to reach app-scoped state.
+
     Returns:
-        A CaseService wired with the in-memory repository.
+        An ExpertService wired with the app's expert repository.
     """
-    return CaseService(case_repo=_get_repo())
+    return ExpertService(expert_repo=request.app.state.experts)
@@ -1,57 +1,98 @@
-"""Global exception handlers mapping domain exceptions to HTTP responses."""
+"""Global exception handlers mapping domain exceptions to HTTP responses.
+
+Every domain error reaches the client through one table, ERROR_STATUS, so
+routes, the idempotency replay path and the global handler cannot disagree
+on status codes. Bodies are encoded by the app's configured JSON encoder,
+through the ErrorBodies kept in ``app.state.errors``.
+"""
 
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
 from exceptions import (
     InvalidStateError,
     MEDirectError,
     NotFoundError,
+    QuotaExceededError,
+    ReplicaLagError,
     ValidationError,
 )
+from utils.json_codec import JSONEncoder
+
+ERROR_STATUS: dict[type[MEDirectError], int] = {
+    NotFoundError: 404,
+    InvalidStateError: 409,
+    ValidationError: 422,
+    QuotaExceededError: 429,
+    ReplicaLagError: 503,
+}
+MAPPED_ERRORS = tuple(ERROR_STATUS)
+
+
+class ErrorBodies:
+    """Error bodies encoded by one JSON encoder.
+
+    Bodies that never vary are encoded once, when the app is built.
+
+    Attributes:
+        internal: Body of an undisclosed 500.
+        case_not_found: Body of a 404 for a missing case.
+        expert_not_found: Body of a 404 for a missing expert.
+    """
+
+    def __init__(self, encoder: JSONEncoder) -> None:
+        self.encoder = encoder
+        self.internal = self.detail("An internal error occurred")
+        self.case_not_found = self.detail("Case not found")
+        self.expert_not_found = self.detail("Expert not found")
+
+    def detail(self, message: str) -> bytes:
+        """Encode the body ``{"detail": message}``."""
+        return self.encoder.dumps({"detail": message})
+
+    def for_error(self, exc: MEDirectError) -> tuple[int, bytes]:
+        """Map a domain error to its status code and encoded body.
+
+        The most specific class in ERROR_STATUS wins; unmapped domain errors
+        are 500s whose message is not disclosed.
 
+        Args:
+            exc: The domain error.
 
-def register_error_handlers(app: FastAPI) -> None:
-    """Register global exception handlers on the FastAPI app.
+        Returns:
+            The HTTP status code and the JSON body ``{"detail": ...}``.
+        """
+        for cls in type(exc).__mro__:
+            status = ERROR_STATUS.get(cls)
+            if status is not None:
+                return status, self.detail(exc.message)
+        return 500, self.internal
+
+
+def error_response(status: int, body: bytes) -> Response:
+    """Build a JSON error response around an already encoded body.
 
     Args:
-        app: The FastAPI application instance.
+        status: HTTP status code.
+        body: Encoded JSON body, e.g. ErrorBodies.case_not_found.
+
+    Returns:
+        A response that skips serialization entirely.
     """
+    return Response(body, status_code=status, media_type="application/json")
+
+
+async def _handle_domain_error(request: Request, exc: MEDirectError) -> Response:
+    """Render any domain error raised by a route through ERROR_STATUS."""
+    return error_response(*request.app.state.errors.for_error(exc))
 
-    @app.exception_handler(NotFoundError)
-    async def not_found_handler(request: Request, exc: NotFoundError) -> JSONResponse:
-        """Handle NotFoundError as 404."""
-        return JSONResponse(
-            status_code=404,
-            content={"detail": exc.message},
-        )
-
-    @app.exception_handler(InvalidStateError)
-    async def invalid_state_handler(
-        request: Request, exc: InvalidStateError
-    ) -> JSONResponse:
-        """Handle InvalidStateError as 409 Conflict."""
-        return JSONResponse(
-            status_code=409,
-            content={"detail": exc.message},
-        )
-
-    @app.exception_handler(ValidationError)
-    async def validation_handler(
-        request: Request, exc: ValidationError
-    ) -> JSONResponse:
-        """Handle ValidationError as 422."""
-        return JSONResponse(
-            status_code=422,
-            content={"detail": exc.message},
-        )
-
-    @app.exception_handler(MEDirectError)
-    async def generic_domain_handler(
-        request: Request, exc: MEDirectError
-    ) -> JSONResponse:
-        """Handle any other domain error as 500."""
-        return JSONResponse(
-            status_code=500,
-            content={"detail": "An internal error occurred"},
-        )
+
+def register_error_handlers(app: FastAPI, encoder: JSONEncoder) -> None:
+    """Register the global domain exception handler on the FastAPI app.
+
+    Args:
+        app: The FastAPI application instance.
+        encoder: The app's JSON encoder, used for every error body.
+    """
+    app.state.errors = ErrorBodies(encoder)
+    app.add_exception_handler(MEDirectError, _handle_domain_error)
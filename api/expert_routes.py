@@ -0,0 +1,77 @@
+"""Expert API routes matching contracts/expert.yaml."""
+
+from datetime import datetime
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+
+from api.dependencies import get_expert_service
+from api.error_handlers import error_response
+from schemas import ExpertListResponse, ExpertRequest, ExpertResponse
+from services.expert_service import MAX_AVAILABLE_LIMIT, ExpertService
+
+router = APIRouter(prefix="/api/v1", tags=["experts"])
+
+
+@router.get("/experts:available", response_model=ExpertListResponse)
+async def find_available_experts(
+    specialty: str,
+    at: datetime | None = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_AVAILABLE_LIMIT)] = 20,
+    service: ExpertService = Depends(get_expert_service),
+) -> ExpertListResponse:
+    """List active experts below capacity with a specialty.
+
+    Args:
+        specialty: Required specialty.
+        at: Optional instant the experts must be on call at.
+        limit: Maximum number of experts to return.
+        service: Injected ExpertService.
+
+    Returns:
+        The available experts and whether more exist.
+    """
+    page = await service.find_available(specialty, at=at, limit=limit)
+    return ExpertListResponse.from_model(page)
+
+
+@router.get("/experts/{expert_id}", response_model=ExpertResponse)
+async def get_expert(
+    expert_id: str,
+    request: Request,
+    service: ExpertService = Depends(get_expert_service),
+) -> ExpertResponse | Response:
+    """Retrieve an expert by ID.
+
+    Args:
+        expert_id: Unique identifier of the expert.
+        request: The incoming request.
+        service: Injected ExpertService.
+
+    Returns:
+        The expert data, or a pre-encoded 404 if it does not exist.
+    """
+    expert = await service.find_expert(expert_id)
+    if expert is None:
+        return error_response(404, request.app.state.errors.expert_not_found)
+    return ExpertResponse.from_model(expert)
+
+
+@router.put("/experts/{expert_id}", response_model=ExpertResponse)
+async def put_expert(
+    expert_id: str,
+    body: ExpertRequest,
+    service: ExpertService = Depends(get_expert_service),
+) -> ExpertResponse:
+    """Create or replace an expert's profile.
+
+    Args:
+        expert_id: Unique identifier of the expert.
+        body: The expert's profile.
+        service: Injected ExpertService.
+
+    Returns:
+        The saved expert, including its current open case count.
+    """
+    expert = await service.save_expert(body.to_model(expert_id))
+    return ExpertResponse.from_model(expert)
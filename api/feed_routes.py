@@ -0,0 +1,171 @@
+"""Server-Sent Events stream of case changes, and the copy it continues."""
+
+import base64
+import binascii
+import secrets
+from typing import Annotated, AsyncIterator
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+
+from api.dependencies import get_change_feed
+from exceptions import InvalidStateError, ValidationError
+from models import CaseStatus
+from schemas import CaseResponse, CaseSnapshotResponse
+from utils.change_feed import EPOCH_HEADER, REPLICATION_TOKEN_HEADER, ChangeFeed, Subscriber
+
+router = APIRouter(prefix="/api/v1", tags=["cases"])
+
+WATCH_PATH = "/cases:watch"
+SNAPSHOT_PATH = "/cases:snapshot"
+MAX_SNAPSHOT_PAGE = 5000
+_KEEPALIVE = b": keepalive\n\n"
+
+
+def _frame(event_type: bytes, data: bytes, seq: int | None = None) -> bytes:
+    """Encode one SSE message."""
+    head = b"id: %d\n" % seq if seq is not None else b""
+    return head + b"event: " + event_type + b"\ndata: " + data + b"\n\n"
+
+
+async def _stream(
+    feed: ChangeFeed, sub: Subscriber, heartbeat: float
+) -> AsyncIterator[bytes]:
+    """Yield SSE frames until the subscriber closes or the client leaves."""
+    try:
+        if sub.missed:
+            yield _frame(b"reset", b'{"reason":"history_truncated"}')
+        while True:
+            batch = await sub.next_batch(heartbeat)
+            if batch:
+                yield b"".join(_frame(b"case", e.data, e.seq) for e in batch)
+            elif not sub.closed:
+                yield _KEEPALIVE
+            if sub.closed:
+                break
+        if sub.dropped:
+            yield _frame(b"dropped", b'{"reason":"slow_consumer"}')
+    finally:
+        feed.unsubscribe(sub)
+
+
+@router.get(
+    WATCH_PATH,
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {"schema": {"type": "string"}}}}},
+)
+async def watch_cases(
+    request: Request,
+    status: CaseStatus | None = None,
+    referrer_id: str | None = None,
+    after: int | None = None,
+    last_event_id: Annotated[int | None, Header(alias="Last-Event-ID")] = None,
+    feed: ChangeFeed = Depends(get_change_feed),
+) -> StreamingResponse:
+    """Stream case changes as Server-Sent Events.
+
+    Each ``case`` event carries the case JSON and its sequence number as the
+    SSE id, so reconnecting clients resume via Last-Event-ID. A ``reset``
+    event means some changes could not be replayed; a ``dropped`` event means
+    the client fell behind and was disconnected. The epoch header names
+    the feed, so a client can tell that sequence numbers restarted.
+
+    Args:
+        request: The incoming request, used to reach app settings.
+        status: Only stream cases in this status.
+        referrer_id: Only stream cases from this referrer.
+        after: Resume after this sequence number (overridden by Last-Event-ID).
+        last_event_id: Standard SSE resume header.
+        feed: Injected change feed.
+
+    Returns:
+        A text/event-stream response.
+    """
+    resume = last_event_id if last_event_id is not None else after
+    sub = feed.subscribe(status=status, referrer_id=referrer_id, after_seq=resume)
+    heartbeat = request.app.state.settings.change_feed_heartbeat_seconds
+    return StreamingResponse(
+        _stream(feed, sub, heartbeat),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+            EPOCH_HEADER: feed.epoch,
+        },
+    )
+
+
+def _encode_cursor(epoch: str, position: int, last_id: str) -> str:
+    raw = f"{epoch}:{position}:{last_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[str, int, str]:
+    """Split a cursor into the copy's epoch and position and the last id sent."""
+    try:
+        epoch, position, last_id = base64.urlsafe_b64decode(cursor).decode().split(":", 2)
+        return epoch, int(position), last_id
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValidationError("Malformed snapshot cursor") from None
+
+
+def _check_replication_token(expected: str, token: str | None) -> None:
+    """Refuse the copy unless replication is configured and the token matches."""
+    if not expected:
+        raise HTTPException(status_code=404, detail="Replication is disabled")
+    if token is None or not secrets.compare_digest(token.encode(), expected.encode()):
+        raise HTTPException(status_code=403, detail="A valid replication token is required")
+
+
+@router.get(SNAPSHOT_PATH, response_model=CaseSnapshotResponse)
+async def snapshot_cases(
+    request: Request,
+    response: Response,
+    cursor: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_SNAPSHOT_PAGE)] = 1000,
+    token: Annotated[str | None, Header(alias=REPLICATION_TOKEN_HEADER)] = None,
+    feed: ChangeFeed = Depends(get_change_feed),
+) -> CaseSnapshotResponse:
+    """Copy the cases a page at a time, in id order, for a replica.
+
+    The first page takes the feed position, before any case is read; each
+    next_cursor carries it with the last id sent. Changes published while
+    the pages are read are in the copy, replayed after it, or both.
+    Replaying a change re-applies the case as it was saved, which is
+    harmless.
+
+    Args:
+        request: The incoming request, used to reach the case store.
+        response: Response whose headers carry the feed's epoch.
+        cursor: next_cursor of the previous page; None starts a copy.
+        limit: Maximum number of cases in the page.
+        token: The replication token shared with the replicas.
+        feed: Injected change feed of the same partition.
+
+    Returns:
+        The feed's epoch and position, a page of cases and, unless it is the
+        last page, the cursor of the next.
+
+    Raises:
+        HTTPException: 404 without a configured replication token, 403 if
+            the request does not carry it.
+        ValidationError: If the cursor is malformed.
+        InvalidStateError: If the cursor belongs to another feed epoch.
+    """
+    _check_replication_token(request.app.state.settings.repo_replication_token, token)
+    position, after = feed.last_seq, None
+    if cursor is not None:
+        epoch, position, after = _decode_cursor(cursor)
+        if epoch != feed.epoch:
+            raise InvalidStateError("The feed restarted since this copy began; start again")
+    partition = getattr(request.state, "tenant", None)
+    repo = request.app.state.repo if partition is None else partition.repo
+    cases = await repo.page_by_id(after, limit)
+    full = len(cases) == limit
+    response.headers[EPOCH_HEADER] = feed.epoch
+    return CaseSnapshotResponse(
+        epoch=feed.epoch,
+        position=position,
+        items=[CaseResponse.from_model(case) for case in cases],
+        next_cursor=_encode_cursor(feed.epoch, position, cases[-1].id) if full else None,
+    )
@@ -0,0 +1,78 @@
+"""Idempotency-Key handling for unsafe case endpoints."""
+
+import hashlib
+from typing import Awaitable, Callable
+
+from fastapi import Request, Response
+
+from config import Settings
+from utils.idempotency import (
+    IdempotencyCoordinator,
+    IdempotencyStore,
+    InMemoryIdempotencyStore,
+    SQLiteIdempotencyStore,
+    StoredResponse,
+)
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+
+def build_idempotency_store(settings: Settings) -> IdempotencyStore:
+    """Create the store selected by settings.idempotency_backend.
+
+    Args:
+        settings: Application settings.
+
+    Returns:
+        An in-memory or SQLite idempotency store.
+    """
+    if settings.idempotency_backend == "sqlite":
+        return SQLiteIdempotencyStore(
+            path=settings.idempotency_sqlite_path,
+            ttl=settings.idempotency_ttl_seconds,
+            max_entries=settings.idempotency_max_entries,
+        )
+    return InMemoryIdempotencyStore(
+        ttl=settings.idempotency_ttl_seconds,
+        max_entries=settings.idempotency_max_entries,
+    )
+
+
+async def run_idempotent(
+    request: Request,
+    key: str,
+    payload: bytes,
+    fn: Callable[[], Awaitable[StoredResponse]],
+) -> Response:
+    """Execute fn at most once per key, replaying the recorded response.
+
+    Keys are scoped to the request's tenant, so two tenants choosing the
+    same key never see each other's responses.
+
+    Args:
+        request: The incoming request, used to reach app state.
+        key: The Idempotency-Key header value.
+        payload: Canonical request body, fingerprinted with method and path.
+        fn: Produces the serialized response on first execution.
+
+    Returns:
+        The recorded or freshly produced response.
+    """
+    digest = hashlib.sha256(f"{request.method} {request.url.path}\n".encode())
+    digest.update(payload)
+    partition = getattr(request.state, "tenant", None)
+    if partition is not None:
+        key = f"{partition.tenant}/{key}"
+    coordinator: IdempotencyCoordinator = request.app.state.idempotency
+    stored, replayed = await coordinator.execute(key, digest.hexdigest(), fn)
+    if replayed:
+        request.app.state.metrics.counter(
+            "idempotency_replays_total", "Requests answered from the idempotency store"
+        ).inc()
+    return Response(
+        content=stored.body,
+        status_code=stored.status_code,
+        media_type="application/json",
+        headers={REPLAYED_HEADER: "true"} if replayed else None,
+    )
@@ -0,0 +1,136 @@
+"""Installs the ASGI middleware stack configured by Settings."""
+
+from fastapi import FastAPI
+
+from api.access_log import AccessLogMiddleware
+from api.admission import LoadSheddingMiddleware, RateLimitMiddleware
+from api.compression import CompressionMiddleware
+from api.contract_validation import ContractMonitor, ContractValidationMiddleware
+from api.feed_routes import WATCH_PATH
+from api.replication import ConsistencyMiddleware, primary_position
+from api.tenancy import TenantMiddleware
+from api.tracing import TracingMiddleware
+from config import Settings
+from utils.admission import CoDelLimiter, KeyedConcurrencyLimiter, TokenBucketLimiter
+from utils.metrics import MetricsRegistry
+from utils.replication import CaseReplica
+from utils.structured_log import StructuredLog
+from utils.tenancy import TenantRegistry
+from utils.tracing import Tracer
+
+
+def install_middleware(
+    app: FastAPI,
+    settings: Settings,
+    metrics: MetricsRegistry,
+    tracer: Tracer,
+    contracts: ContractMonitor | None = None,
+    tenants: TenantRegistry | None = None,
+    access_log: StructuredLog | None = None,
+    replica: CaseReplica | None = None,
+) -> None:
+    """Add middleware to the app, innermost first.
+
+    Resulting request order: access log → tracing → compression → tenant
+    quotas → rate limiting → load shedding → consistency tokens → contract
+    validation → routes.
+    The access log is outermost so it records every rejection and the
+    trace id tracing adds to the response. Tracing comes next so a
+    request's span includes time spent rejected, queued or compressing.
+    Tenant quotas come before the shared limiters so a noisy tenant is
+    turned away before it can use up their capacity.
+    Contract validation is innermost so it sees route responses before
+    compression, and never sees rejections the contracts do not describe.
+    Rate limiting runs before load shedding so a single abusive client is
+    turned away before it can occupy queue slots. Consistency tokens are
+    read inside the tenant middleware, so on a primary they give the
+    position of the request's own tenant's change feed.
+
+    Args:
+        app: The FastAPI application instance.
+        settings: Application settings.
+        metrics: Registry the middleware reports into.
+        tracer: Tracer that opens a trace per request.
+        contracts: Monitor for sampled contract validation, if enabled.
+        tenants: Registry of tenant partitions, if tenancy is enabled.
+        access_log: Log for sampled access records, if enabled.
+        replica: This process's read replica; consistency tokens then
+            report its position rather than the primary's.
+    """
+    if contracts is not None:
+        app.add_middleware(
+            ContractValidationMiddleware,
+            monitor=contracts,
+            sample_rate=settings.contract_validation_rate,
+            max_body_bytes=settings.contract_validation_max_body_bytes,
+            path_prefix=settings.api_prefix,
+        )
+
+    app.add_middleware(
+        ConsistencyMiddleware,
+        position=primary_position if replica is None else lambda scope: replica.applied,
+        header=settings.consistency_header,
+        path_prefix=settings.api_prefix,
+    )
+
+    if settings.load_shedding_enabled:
+        app.add_middleware(
+            LoadSheddingMiddleware,
+            limiter=CoDelLimiter(
+                max_concurrency=settings.load_shedding_max_concurrency,
+                target=settings.load_shedding_target_delay,
+                interval=settings.load_shedding_interval,
+                max_queue=settings.load_shedding_max_queue,
+            ),
+            metrics=metrics,
+            path_prefix=settings.api_prefix,
+            exempt_paths=frozenset({settings.api_prefix + WATCH_PATH}),
+        )
+
+    if settings.rate_limit_enabled:
+        app.add_middleware(
+            RateLimitMiddleware,
+            limiter=TokenBucketLimiter(
+                rate=settings.rate_limit_per_second,
+                burst=settings.rate_limit_burst,
+                max_keys=settings.rate_limit_max_clients,
+            ),
+            metrics=metrics,
+            path_prefix=settings.api_prefix,
+        )
+
+    if tenants is not None:
+        app.add_middleware(
+            TenantMiddleware,
+            tenants=tenants,
+            rate_limiter=TokenBucketLimiter(
+                rate=settings.tenant_rate_per_second,
+                burst=settings.tenant_burst,
+                max_keys=settings.tenant_max_tenants,
+            ),
+            concurrency=KeyedConcurrencyLimiter(settings.tenant_max_concurrency),
+            metrics=metrics,
+            header=settings.tenant_header,
+            path_prefix=settings.api_prefix,
+            exempt_paths=frozenset({settings.api_prefix + WATCH_PATH}),
+        )
+
+    if settings.compression_enabled:
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=settings.compression_minimum_size,
+            encodings=settings.compression_encodings,
+            gzip_level=settings.compression_gzip_level,
+            brotli_quality=settings.compression_brotli_quality,
+        )
+
+    if settings.tracing_enabled:
+        app.add_middleware(TracingMiddleware, tracer=tracer, path_prefix=settings.api_prefix)
+
+    if access_log is not None:
+        app.add_middleware(
+            AccessLogMiddleware,
+            log=access_log,
+            sample_rate=settings.access_log_sample_rate,
+            path_prefix=settings.api_prefix,
+        )
@@ -0,0 +1,96 @@
+"""Operational endpoints — probes and metrics exposition."""
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+from utils.trace_exporters import RingBufferExporter
+
+router = APIRouter(tags=["ops"])
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics(request: Request) -> PlainTextResponse:
+    """Expose the app's metrics in the Prometheus text format.
+
+    Args:
+        request: The incoming request, used to reach app state.
+
+    Returns:
+        The exposition text.
+    """
+    return PlainTextResponse(
+        request.app.state.metrics.render_prometheus(),
+        media_type="text/plain; version=0.0.4",
+    )
+
+
+@router.get("/healthz")
+async def healthz() -> dict:
+    """Liveness probe: the process is up and its event loop is responsive.
+
+    Returns:
+        A static OK document.
+    """
+    return {"status": "ok"}
+
+
+@router.get("/readyz")
+async def readyz(request: Request) -> JSONResponse:
+    """Readiness probe: 200 once warm-up has finished, else 503.
+
+    Args:
+        request: The incoming request, used to reach app state.
+
+    Returns:
+        The readiness status, with warm-up timing or the failure reason.
+    """
+    readiness = request.app.state.readiness
+    body = {"status": readiness.status}
+    if readiness.ready:
+        body["warmup_seconds"] = readiness.warmup_seconds
+    elif readiness.error is not None:
+        body["detail"] = readiness.error
+    return JSONResponse(body, status_code=200 if readiness.ready else 503)
+
+
+@router.get("/debug/traces")
+async def recent_traces(request: Request, trace_id: str | None = None) -> dict:
+    """Return recently finished spans from the tracing ring buffer.
+
+    Args:
+        request: The incoming request, used to reach app state.
+        trace_id: Optional 32-hex-digit trace id to filter by.
+
+    Returns:
+        Spans in the OTLP/JSON span shape, oldest first.
+    """
+    buffer = next(
+        (e for e in request.app.state.tracer.exporters if isinstance(e, RingBufferExporter)),
+        None,
+    )
+    if buffer is None:
+        raise HTTPException(status_code=404, detail="Tracing is disabled")
+    try:
+        wanted = int(trace_id, 16) if trace_id is not None else None
+    except ValueError:
+        raise HTTPException(status_code=422, detail="trace_id must be hexadecimal")
+    return {"spans": [span.to_otlp() for span in buffer.spans(wanted)]}
+
+
+@router.get("/debug/contracts")
+async def contract_violations(request: Request) -> dict:
+    """Return the most recent responses that did not match the contracts.
+
+    Args:
+        request: The incoming request, used to reach app state.
+
+    Returns:
+        The sample rate and recent violations, oldest first.
+    """
+    monitor = request.app.state.contracts
+    if monitor is None:
+        raise HTTPException(status_code=404, detail="Contract validation is disabled")
+    return {
+        "sample_rate": request.app.state.settings.contract_validation_rate,
+        "violations": monitor.violations(),
+    }
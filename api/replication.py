@@ -0,0 +1,134 @@
+"""Read-replica wiring and the consistency tokens that make it safe to use.
+
+A primary and its replicas are separate processes. Writes go to the
+primary; a load balancer may spread reads over all of them. Every API
+response carries the position of the data the request saw. A client that
+sends this token back on its next request is answered only from data at
+least that new, so it reads its own writes and never moves backwards.
+"""
+
+from typing import Callable
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from api.error_handlers import error_response
+from api.feed_routes import SNAPSHOT_PATH, WATCH_PATH
+from config import Settings
+from exceptions import ValidationError
+from utils.change_feed import ChangeFeed
+from utils.feed_follower import FeedFollower
+from utils.in_memory_repo import InMemoryCaseRepository
+from utils.metrics import MetricsRegistry
+from utils.replication import CaseReplica, read_position
+
+
+def build_replica(
+    settings: Settings, metrics: MetricsRegistry, change_feed: ChangeFeed
+) -> CaseReplica | None:
+    """Create this process's replica store when it follows a primary.
+
+    Args:
+        settings: Application settings.
+        metrics: Registry for the replica's read metrics.
+        change_feed: This process's feed, republishing applied changes.
+
+    Returns:
+        A CaseReplica without a copy yet, or None when this process is a
+        primary.
+
+    Raises:
+        ValidationError: If tenancy or a case cache is also enabled, since
+            the replica follows one partition and applies changes below the
+            cache, or if no replication token is set to copy the primary with.
+    """
+    if not settings.repo_replica_of:
+        return None
+    if settings.tenancy_enabled or settings.repo_cache not in ("", "off"):
+        raise ValidationError("Read replicas support neither tenancy nor repo_cache")
+    if not settings.repo_replication_token:
+        raise ValidationError("Read replicas need repo_replication_token to copy the primary")
+    return CaseReplica(
+        InMemoryCaseRepository(change_feed=change_feed),
+        max_wait=settings.repo_replica_max_wait,
+        metrics=metrics,
+    )
+
+
+def build_feed_follower(
+    settings: Settings, metrics: MetricsRegistry, replica: CaseReplica | None
+) -> FeedFollower | None:
+    """Create the follower that feeds the replica; the lifespan runs it.
+
+    Args:
+        settings: Application settings naming the primary.
+        metrics: Registry for the follower's counters.
+        replica: This process's replica, if any.
+
+    Returns:
+        A FeedFollower, or None when this process is a primary.
+    """
+    if replica is None:
+        return None
+    base = settings.repo_replica_of.rstrip("/") + settings.api_prefix.rstrip("/")
+    return FeedFollower(
+        replica,
+        base + WATCH_PATH,
+        base + SNAPSHOT_PATH,
+        metrics,
+        token=settings.repo_replication_token,
+        page_size=settings.repo_replica_page_size,
+    )
+
+
+def primary_position(scope: Scope) -> int:
+    """Newest change published by the feed of the request's partition."""
+    partition = scope.get("state", {}).get("tenant")
+    if partition is not None:
+        return partition.change_feed.last_seq
+    return scope["app"].state.change_feed.last_seq
+
+
+class ConsistencyMiddleware:
+    """Apply incoming consistency tokens and issue one with every API response.
+
+    A request's token sets ``read_position`` for its reads; a token that is
+    not a non-negative integer is a 422. The response token is the
+    position returned by ``position`` once the route has run, so it covers
+    the request's own write.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        position: Callable[[Scope], int],
+        header: str = "x-consistency-token",
+        path_prefix: str = "/api/",
+    ) -> None:
+        self.app = app
+        self.position = position
+        self.header = header
+        self.path_prefix = path_prefix
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+        raw = Headers(scope=scope).get(self.header)
+        if raw is not None and not raw.isdigit():
+            exc = ValidationError(f"Header '{self.header}' must be a non-negative integer")
+            status, body = scope["app"].state.errors.for_error(exc)
+            await error_response(status, body)(scope, receive, send)
+            return
+
+        async def send_with_token(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers[self.header] = str(self.position(scope))
+            await send(message)
+
+        token = read_position.set(int(raw) if raw is not None else 0)
+        try:
+            await self.app(scope, receive, send_with_token)
+        finally:
+            read_position.reset(token)
@@ -0,0 +1,134 @@
+"""Case repository backends by name, and the factory that stacks decorators.
+
+Settings select a backend (``repo_backend``), optional read coalescing
+(``repo_batching``), an optional LRU cache (``repo_cache="lru:10000"``)
+and optional per-call metrics (``repo_metrics``). The chain is built once,
+at app creation:
+
+    metrics → cache → batching → backend
+
+Batching sits below the cache so hits are answered at once and only
+misses wait for the tick's batch.
+"""
+
+from typing import Callable
+
+from config import Settings
+from exceptions import ValidationError
+from services.case_service import CaseRepository
+from utils.batching_repo import BatchingCaseRepository
+from utils.change_feed import ChangeFeed
+from utils.in_memory_repo import InMemoryCaseRepository
+from utils.metrics import MetricsRegistry
+from utils.repo_decorators import CachingCaseRepository, MeteredCaseRepository
+from utils.sharded_repo import ShardedCaseRepository
+from utils.snapshot_repo import SnapshotCaseRepository
+from utils.sqlite_repo import SQLiteCaseRepository
+
+BackendFactory = Callable[[Settings, ChangeFeed | None], CaseRepository]
+
+_BACKENDS: dict[str, BackendFactory] = {}
+
+
+def register_backend(name: str) -> Callable[[BackendFactory], BackendFactory]:
+    """Register a factory under a backend name.
+
+    Args:
+        name: Value of Settings.repo_backend that selects the backend.
+
+    Returns:
+        A decorator that records the factory and returns it unchanged.
+    """
+    def decorator(factory: BackendFactory) -> BackendFactory:
+        _BACKENDS[name] = factory
+        return factory
+    return decorator
+
+
+def available_backends() -> list[str]:
+    """List registered backend names."""
+    return sorted(_BACKENDS)
+
+
+@register_backend("memory")
+def _memory(settings: Settings, change_feed: ChangeFeed | None) -> CaseRepository:
+    return InMemoryCaseRepository(change_feed=change_feed)
+
+
+@register_backend("sharded")
+def _sharded(settings: Settings, change_feed: ChangeFeed | None) -> CaseRepository:
+    return ShardedCaseRepository(shards=settings.repo_shards, change_feed=change_feed)
+
+
+@register_backend("sqlite")
+def _sqlite(settings: Settings, change_feed: ChangeFeed | None) -> CaseRepository:
+    return SQLiteCaseRepository(settings.repo_sqlite_path, change_feed=change_feed)
+
+
+@register_backend("snapshot")
+def _snapshot(settings: Settings, change_feed: ChangeFeed | None) -> CaseRepository:
+    return SnapshotCaseRepository(settings.repo_snapshot_path, change_feed=change_feed)
+
+
+def parse_cache_spec(spec: str) -> int | None:
+    """Parse a cache spec such as ``"lru:10000"``.
+
+    Args:
+        spec: ``"off"`` (or empty) for no cache, else ``"lru:<max entries>"``.
+
+    Returns:
+        The maximum number of cached cases, or None for no cache.
+
+    Raises:
+        ValidationError: If the spec is malformed.
+    """
+    if spec in ("", "off"):
+        return None
+    kind, _, size = spec.partition(":")
+    if kind != "lru" or not size.isdigit() or int(size) < 1:
+        raise ValidationError(f"Invalid repository cache spec '{spec}', expected 'lru:<n>'")
+    return int(size)
+
+
+def _build_backend(settings: Settings, change_feed: ChangeFeed | None) -> CaseRepository:
+    factory = _BACKENDS.get(settings.repo_backend)
+    if factory is None:
+        raise ValidationError(
+            f"Unknown repository backend '{settings.repo_backend}'; "
+            f"available: {', '.join(available_backends())}"
+        )
+    return factory(settings, change_feed)
+
+
+def build_case_repository(
+    settings: Settings,
+    metrics: MetricsRegistry | None = None,
+    change_feed: ChangeFeed | None = None,
+    labels: dict[str, str] | None = None,
+    backend: CaseRepository | None = None,
+) -> CaseRepository:
+    """Build the configured backend wrapped in its decorators.
+
+    Args:
+        settings: Application settings.
+        metrics: Registry for batching, cache and latency metrics, if any.
+        change_feed: Feed the backend publishes saves to, if any.
+        labels: Extra labels for the decorators' metrics, if any.
+        backend: Repository to wrap instead of building repo_backend, such
+            as a read replica.
+
+    Returns:
+        The outermost repository of the chain.
+
+    Raises:
+        ValidationError: If the backend name or cache spec is invalid.
+    """
+    repo = backend if backend is not None else _build_backend(settings, change_feed)
+    if settings.repo_batching:
+        repo = BatchingCaseRepository(repo, settings.repo_batch_max_ids, metrics, labels)
+    cache_size = parse_cache_spec(settings.repo_cache)
+    if cache_size is not None:
+        repo = CachingCaseRepository(repo, cache_size, metrics, labels)
+    if settings.repo_metrics and metrics is not None:
+        repo = MeteredCaseRepository(repo, metrics, labels)
+    return repo
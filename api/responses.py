@@ -0,0 +1,40 @@
+"""JSON response classes bound to a configurable encoder."""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+from utils.json_codec import JSONEncoder, get_json_encoder
+
+
+class EncodedJSONResponse(JSONResponse):
+    """JSONResponse that renders through a pluggable JSONEncoder."""
+
+    encoder: JSONEncoder = get_json_encoder("auto")
+
+    def render(self, content: Any) -> bytes:
+        """Encode the response content.
+
+        Args:
+            content: JSON-compatible response data.
+
+        Returns:
+            The encoded body.
+        """
+        return self.encoder.dumps(content)
+
+
+def make_response_class(encoder: JSONEncoder) -> type[EncodedJSONResponse]:
+    """Build a response class bound to the given encoder.
+
+    Args:
+        encoder: The encoder every response of this class should use.
+
+    Returns:
+        An EncodedJSONResponse subclass usable as FastAPI's default_response_class.
+    """
+    return type(
+        f"{encoder.name.capitalize()}JSONResponse",
+        (EncodedJSONResponse,),
+        {"encoder": encoder},
+    )
@@ -0,0 +1,136 @@
+"""HTTP server profiles: how ``python main.py`` runs the app under uvicorn.
+
+The "dev" profile is a single uvicorn process with its defaults. The
+"production" profile tunes the event loop, HTTP parser, keep-alive and
+accept backlog, and always runs its workers under uvicorn's process
+supervisor, even a single one. The supervisor replaces workers that
+exit after their request budget, and on SIGHUP replaces every worker in
+turn without closing the listening socket.
+
+Several or recycled workers each build their own app, so every piece of
+state kept in process memory is split between them. Settings that keep
+such state where it changes answers are rejected: an in-process case
+backend, in-memory idempotency keys, tenant quotas, SLA trackers and
+seeding, which would run in every new worker. The rest stays per worker
+and is logged as a warning: expert open-case counts (so capacity is
+checked per worker), case statistics counted since the worker started,
+the change feed and consistency tokens (which cover only the worker's
+own writes, so replicas need a single-worker primary), rate limits and
+load shedding, and debug traces.
+"""
+
+import logging
+import os
+from importlib.util import find_spec
+
+import uvicorn
+from uvicorn.supervisors import Multiprocess
+
+from config import Settings
+from exceptions import ValidationError
+
+logger = logging.getLogger(__name__)
+
+PROFILES = ("dev", "production")
+_IN_PROCESS_BACKENDS = ("memory", "sharded", "snapshot")
+
+
+def _fastest(preferred: str, fallback: str) -> str:
+    if find_spec(preferred) is not None:
+        return preferred
+    logger.warning("%s is not installed; using %s", preferred, fallback)
+    return fallback
+
+
+_PER_WORKER = (
+    "expert open-case counts, case statistics, the change feed and consistency "
+    "tokens, rate limits, load shedding and debug traces are kept per worker"
+)
+
+
+def _process_local(settings: Settings) -> list[str]:
+    """Settings that would keep answers in one worker's memory."""
+    local = []
+    if settings.repo_backend in _IN_PROCESS_BACKENDS:
+        local.append(f"repo_backend={settings.repo_backend}")
+    if settings.idempotency_backend == "memory":
+        local.append("idempotency_backend=memory")
+    if settings.tenancy_enabled:
+        local.append("tenancy_enabled")
+    if settings.sla_enabled:
+        local.append("sla_enabled")
+    if settings.repo_seed_demo:
+        local.append("repo_seed_demo")
+    return local
+
+
+def server_config(settings: Settings, app: str = "main:create_app") -> uvicorn.Config:
+    """Build the uvicorn configuration of settings.server_profile.
+
+    Workers build their own app from ``app`` and the MEDIRECT_* environment,
+    so settings given here should come from the same environment.
+
+    Args:
+        settings: Application settings.
+        app: Import string of the app factory.
+
+    Returns:
+        A uvicorn Config for serve().
+
+    Raises:
+        ValidationError: If the profile is unknown, or the production
+            profile would run several or recycled workers with settings
+            that keep state in process memory.
+    """
+    if settings.server_profile not in PROFILES:
+        raise ValidationError(
+            f"Unknown server profile '{settings.server_profile}'; "
+            f"available: {', '.join(PROFILES)}"
+        )
+    if settings.server_profile == "dev":
+        return uvicorn.Config(app, factory=True, host=settings.host, port=settings.port)
+    workers = settings.server_workers or os.cpu_count() or 1
+    recycled = settings.server_max_requests > 0
+    if workers > 1 or recycled:
+        local = _process_local(settings)
+        if local:
+            raise ValidationError(
+                "Several or recycled workers would each keep their own state for: "
+                + ", ".join(local)
+            )
+        logger.warning("Running %d workers; %s", workers, _PER_WORKER)
+    return uvicorn.Config(
+        app,
+        factory=True,
+        host=settings.host,
+        port=settings.port,
+        loop=_fastest("uvloop", "asyncio"),
+        http=_fastest("httptools", "h11"),
+        workers=workers,
+        backlog=settings.server_backlog,
+        timeout_keep_alive=settings.server_keepalive_seconds,
+        limit_concurrency=settings.server_limit_concurrency or None,
+        limit_max_requests=settings.server_max_requests if recycled else None,
+        limit_max_requests_jitter=settings.server_max_requests_jitter,
+        timeout_graceful_shutdown=settings.server_graceful_timeout,
+        access_log=False,
+    )
+
+
+def serve(settings: Settings, app: str = "main:create_app") -> None:
+    """Run the server until interrupted.
+
+    Under the production profile, SIGHUP starts a replacement for each
+    worker in turn. The old worker is stopped only once its replacement
+    is ready. It then stops accepting connections, finishes its in-flight
+    requests and runs the app's shutdown.
+
+    Args:
+        settings: Application settings.
+        app: Import string of the app factory.
+    """
+    config = server_config(settings, app)
+    if settings.server_profile == "dev":
+        uvicorn.Server(config).run()
+        return
+    Multiprocess(config, sockets=[config.bind_socket()]).run()
@@ -0,0 +1,89 @@
+"""SLA deadline trackers and the background task that ticks them."""
+
+import asyncio
+import time
+from datetime import timedelta
+from typing import Callable, Iterable
+
+from config import Settings
+from models import CaseStatus
+from services.case_service import CaseRepository
+from utils.metrics import MetricsRegistry
+from utils.sla import SlaPolicy, SlaTracker
+
+
+def build_sla_policy(settings: Settings) -> SlaPolicy:
+    """Create the turnaround policy configured by the sla_* settings.
+
+    Args:
+        settings: Application settings.
+
+    Returns:
+        The allowed time in the submitted and assigned statuses.
+    """
+    return SlaPolicy({
+        CaseStatus.SUBMITTED: timedelta(hours=settings.sla_submitted_hours),
+        CaseStatus.ASSIGNED: timedelta(hours=settings.sla_assigned_hours),
+    })
+
+
+def build_sla_tracker(
+    settings: Settings, metrics: MetricsRegistry, tenant: str | None = None
+) -> SlaTracker | None:
+    """Create the deadline tracker of one case partition.
+
+    Args:
+        settings: Application settings.
+        metrics: Registry the tracker reports into.
+        tenant: Tenant the partition serves; its metrics are labelled with
+            it. None without tenancy.
+
+    Returns:
+        An empty SlaTracker, or None when SLA tracking is disabled.
+    """
+    if not settings.sla_enabled:
+        return None
+    return SlaTracker(
+        build_sla_policy(settings),
+        metrics,
+        tick_seconds=settings.sla_tick_seconds,
+        labels=None if tenant is None else {"tenant": tenant},
+    )
+
+
+async def restore_deadlines(tracker: SlaTracker, repo: CaseRepository) -> int:
+    """Track the deadline stored with every case of a partition.
+
+    Deadlines are saved with their cases, so a store that outlives its
+    process, such as a sqlite file, keeps them across restarts; a new
+    tracker starts empty until they are restored. Only the cases with a
+    deadline are read, through the store's due_at index.
+
+    Args:
+        tracker: The partition's new tracker.
+        repo: The partition's repository.
+
+    Returns:
+        The number of deadlines tracked.
+    """
+    cases = await repo.with_deadlines()
+    for case in cases:
+        tracker.schedule(case)
+    return len(cases)
+
+
+async def run_sla_ticker(
+    trackers: Callable[[], Iterable[SlaTracker]], tick_seconds: float
+) -> None:
+    """Advance every tracker once per tick until cancelled.
+
+    Args:
+        trackers: Returns the trackers to advance; called every tick so
+            partitions created later are included.
+        tick_seconds: Time between ticks.
+    """
+    while True:
+        await asyncio.sleep(tick_seconds)
+        now = time.time()
+        for tracker in trackers():
+            tracker.advance(now)
@@ -0,0 +1,144 @@
+"""Tenant resolution and per-tenant request quotas.
+
+A tenant is named by a request header and owns a partition of the case
+store (see utils.tenancy). TenantMiddleware resolves the partition for the
+dependencies and applies the tenant's own token bucket and in-flight cap,
+so one tenant's burst is turned away before it can fill the shared load
+shedder's queue.
+"""
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from api.admission import send_rejection
+from api.dependencies import build_change_feed, build_partition_repository
+from api.error_handlers import error_response
+from api.sla import build_sla_tracker
+from config import Settings
+from exceptions import MEDirectError, ValidationError
+from services.case_service import CaseRepository
+from utils.admission import KeyedConcurrencyLimiter, TokenBucketLimiter
+from utils.change_feed import ChangeFeed
+from utils.metrics import MetricsRegistry
+from utils.sla import SlaTracker
+from utils.tenancy import TenantPartition, TenantRegistry
+
+
+def build_tenant_registry(
+    settings: Settings,
+    metrics: MetricsRegistry,
+    repo: CaseRepository,
+    change_feed: ChangeFeed,
+    deadlines: SlaTracker | None = None,
+) -> TenantRegistry | None:
+    """Create the registry of per-tenant partitions.
+
+    Args:
+        settings: Application settings.
+        metrics: Registry the partitions' decorators report into.
+        repo: The default tenant's repository, from build_repository().
+        change_feed: The default tenant's change feed.
+        deadlines: The default tenant's SLA tracker, if any.
+
+    Returns:
+        A TenantRegistry, or None when tenancy is disabled.
+
+    Raises:
+        ValidationError: If the backend keeps cases outside the process,
+            where partitions would share storage.
+    """
+    if not settings.tenancy_enabled:
+        return None
+    if settings.repo_backend not in ("memory", "sharded"):
+        raise ValidationError(
+            f"Tenancy requires the 'memory' or 'sharded' backend, not '{settings.repo_backend}'"
+        )
+
+    def partition(tenant: str) -> TenantPartition:
+        feed = build_change_feed(settings)
+        return TenantPartition(
+            tenant,
+            build_partition_repository(settings, metrics, feed, tenant),
+            feed,
+            build_sla_tracker(settings, metrics, tenant),
+        )
+
+    return TenantRegistry(
+        partition,
+        TenantPartition(settings.tenant_default, repo, change_feed, deadlines),
+        max_tenants=settings.tenant_max_tenants,
+        allowed=frozenset(settings.tenant_allowed),
+    )
+
+
+class TenantMiddleware:
+    """Resolve each API request's tenant and enforce its request quotas.
+
+    The partition is stored as ``request.state.tenant``. Tenants that
+    cannot be resolved are answered through ERROR_STATUS: 422 for a
+    malformed id, 404 for one outside the allow-list and 429 once no more
+    partitions may be created. Admitted tenants then take a token from
+    their bucket and a slot of their in-flight cap; running out of either
+    is a 429 with Retry-After. Long-lived streams in ``exempt_paths`` are
+    rate limited but hold no slot.
+    """
+
+    _RATE_BODY = b'{"detail":"Tenant rate limit exceeded"}'
+    _CONCURRENCY_BODY = b'{"detail":"Too many concurrent requests for tenant"}'
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        tenants: TenantRegistry,
+        rate_limiter: TokenBucketLimiter,
+        concurrency: KeyedConcurrencyLimiter,
+        metrics: MetricsRegistry,
+        header: str = "x-tenant-id",
+        path_prefix: str = "/api/",
+        exempt_paths: frozenset[str] = frozenset(),
+    ) -> None:
+        self.app = app
+        self.tenants = tenants
+        self.rate_limiter = rate_limiter
+        self.concurrency = concurrency
+        self.header = header
+        self.path_prefix = path_prefix
+        self.exempt_paths = exempt_paths
+        self._requests = metrics.counter(
+            "tenant_requests_total", "API requests by tenant and admission result"
+        )
+        metrics.gauge("tenant_partitions", "Tenants with a case partition").set_function(
+            lambda: len(tenants)
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        path = scope.get("path", "")
+        if scope["type"] != "http" or not path.startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+        try:
+            partition = self.tenants.get(Headers(scope=scope).get(self.header))
+        except MEDirectError as exc:
+            status, body = scope["app"].state.errors.for_error(exc)
+            await error_response(status, body)(scope, receive, send)
+            return
+        tenant = partition.tenant
+        wait = self.rate_limiter.acquire(tenant)
+        if wait > 0:
+            self._requests.inc(tenant=tenant, result="rate_limited")
+            await send_rejection(send, 429, wait, self._RATE_BODY)
+            return
+        scope.setdefault("state", {})["tenant"] = partition
+        if path in self.exempt_paths:
+            self._requests.inc(tenant=tenant, result="admitted")
+            await self.app(scope, receive, send)
+            return
+        if not self.concurrency.try_acquire(tenant):
+            self._requests.inc(tenant=tenant, result="concurrency_limited")
+            await send_rejection(send, 429, 1.0, self._CONCURRENCY_BODY)
+            return
+        self._requests.inc(tenant=tenant, result="admitted")
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.concurrency.release(tenant)
@@ -0,0 +1,51 @@
+"""ASGI middleware that opens a trace per HTTP request."""
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from utils.tracing import Tracer
+
+TRACEPARENT_HEADER = b"traceparent"
+
+
+class TracingMiddleware:
+    """Wrap each request in a server span and propagate W3C trace context.
+
+    An incoming ``traceparent`` header makes the request's span a child of
+    the caller's; the response carries the server span's ``traceparent`` so
+    clients can find the trace. Once routing has run, the span is renamed to
+    the matched route template, e.g. ``POST /api/v1/cases/{case_id}/assign``.
+    """
+
+    def __init__(self, app: ASGIApp, tracer: Tracer, path_prefix: str = "/api/") -> None:
+        self.app = app
+        self.tracer = tracer
+        self.path_prefix = path_prefix
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+        incoming = None
+        for name, value in scope["headers"]:
+            if name == TRACEPARENT_HEADER:
+                incoming = value.decode("latin-1")
+                break
+        method = scope["method"]
+        span = self.tracer.start_trace(
+            f"{method} {scope['path']}", incoming, **{"http.method": method}
+        )
+        header = (TRACEPARENT_HEADER, span.traceparent.encode())
+
+        async def send_with_context(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                span.set_attribute("http.status_code", message["status"])
+                message["headers"] = [*message.get("headers", ()), header]
+            await send(message)
+
+        with span:
+            try:
+                await self.app(scope, receive, send_with_context)
+            finally:
+                route = scope.get("route")
+                if route is not None:
+                    span.name = f"{method} {route.path}"
@@ -0,0 +1,93 @@
+"""Startup warm-up and the readiness state behind /readyz."""
+
+import asyncio
+import time
+
+from fastapi import FastAPI
+from starlette.concurrency import run_in_threadpool
+
+
+class Readiness:
+    """Whether the app should receive traffic, and why not if it shouldn't."""
+
+    def __init__(self) -> None:
+        self.ready = False
+        self.status = "starting"
+        self.error: str | None = None
+        self.warmup_seconds: float | None = None
+
+    def mark_ready(self, warmup_seconds: float = 0.0) -> None:
+        """Report ready after a completed (or skipped) warm-up."""
+        self.ready, self.status = True, "ready"
+        self.warmup_seconds = warmup_seconds
+
+    def mark_failed(self, error: BaseException) -> None:
+        """Stay unready and record the warm-up failure."""
+        self.ready, self.status = False, "failed"
+        self.error = f"{type(error).__name__}: {error}"
+
+    def mark_stopping(self) -> None:
+        """Report unready while the app shuts down, so load balancers drain it."""
+        self.ready, self.status = False, "stopping"
+
+
+async def _replay_get(app: FastAPI, path: str) -> int:
+    """Send one GET through the full ASGI stack and return its status."""
+    status = 0
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    raw_path, _, query = path.partition("?")
+    await app({
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": raw_path,
+        "raw_path": raw_path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": [(b"host", b"warmup")],
+        "client": None,
+        "server": None,
+        "app": app,
+    }, receive, send)
+    return status
+
+
+async def warm_up(app: FastAPI) -> None:
+    """Do the one-time work the first requests would otherwise pay for.
+
+    In order: bulk-load the configured hot case ids so a caching store
+    holds them; build the OpenAPI schema, which
+    makes FastAPI construct every route's validators and serializers; start
+    the worker threads used by sync dependencies; then replay the
+    configured GET requests through the middleware stack.
+
+    Args:
+        app: The application being started.
+    """
+    settings = app.state.settings
+    readiness: Readiness = app.state.readiness
+    readiness.status = "warming"
+    start = time.perf_counter()
+    try:
+        if settings.warmup_hot_ids:
+            await app.state.repo.get_many(list(settings.warmup_hot_ids))
+        app.openapi()
+        await run_in_threadpool(lambda: None)
+        for path in settings.warmup_requests:
+            await _replay_get(app, path)
+    except asyncio.CancelledError:
+        raise
+    except Exception as exc:
+        readiness.mark_failed(exc)
+        return
+    readiness.mark_ready(time.perf_counter() - start)
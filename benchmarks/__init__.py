@@ -0,0 +1 @@
+"""Micro-benchmarks for MEDirect Edge. Run each with ``python -m benchmarks.<name>``."""
@@ -0,0 +1,82 @@
+"""Shared timing and reporting helpers for the benchmark scripts."""
+
+import statistics
+import time
+from typing import Any, Awaitable, Callable
+
+
+def measure(fn: Callable[[], Any], number: int = 1, repeat: int = 5) -> float:
+    """Time a callable and return the best per-call duration in seconds.
+
+    Args:
+        fn: Zero-argument callable to time.
+        number: Calls per timed repetition.
+        repeat: Number of repetitions; the fastest one is reported.
+
+    Returns:
+        Best observed seconds per call.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+async def measure_async(
+    fn: Callable[[], Awaitable[Any]], number: int = 1, repeat: int = 5
+) -> float:
+    """Async counterpart of measure().
+
+    Args:
+        fn: Zero-argument coroutine function to time.
+        number: Awaits per timed repetition.
+        repeat: Number of repetitions; the fastest one is reported.
+
+    Returns:
+        Best observed seconds per await.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            await fn()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Return the pct-th percentile (0-100) of samples."""
+    if len(samples) < 2:
+        return samples[0] if samples else 0.0
+    return statistics.quantiles(samples, n=100, method="inclusive")[int(pct) - 1]
+
+
+def fmt_seconds(seconds: float) -> str:
+    """Format a duration with a human-friendly unit."""
+    if seconds < 1e-6:
+        return f"{seconds * 1e9:.0f} ns"
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f} µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds:.2f} s"
+
+
+def print_table(title: str, headers: list[str], rows: list[list[Any]]) -> None:
+    """Print a fixed-width results table.
+
+    Args:
+        title: Heading printed above the table.
+        headers: Column names.
+        rows: Row values; converted with str().
+    """
+    cells = [headers] + [[str(c) for c in row] for row in rows]
+    widths = [max(len(r[i]) for r in cells) for i in range(len(headers))]
+    print(f"\n{title}")
+    for i, row in enumerate(cells):
+        print("  ".join(c.rjust(w) for c, w in zip(row, widths)))
+        if i == 0:
+            print("  ".join("-" * w for w in widths))
@@ -0,0 +1,92 @@
+"""Per-operation latency of each repository backend configuration.
+
+Every configuration is built through the registry, exactly as the app
+builds it from Settings, and seeded with the same cases. Reads hit a
+small hot set, so the LRU cache's effect shows on a slow backend.
+
+Usage: python -m benchmarks.bench_backends [n_cases]
+"""
+
+import asyncio
+import sys
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from api.repositories import build_case_repository
+from benchmarks._harness import fmt_seconds, measure_async, print_table
+from config import Settings
+from models import Case, CaseStatus
+from utils.metrics import MetricsRegistry
+
+EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+CONFIGS = {
+    "memory": {"repo_backend": "memory"},
+    "sharded (16)": {"repo_backend": "sharded", "repo_shards": 16},
+    "memory + metrics": {"repo_backend": "memory", "repo_metrics": True},
+    "sqlite": {"repo_backend": "sqlite"},
+    "sqlite + lru": {"repo_backend": "sqlite", "repo_cache": "lru:10000"},
+    "sqlite + lru + metrics": {
+        "repo_backend": "sqlite", "repo_cache": "lru:10000", "repo_metrics": True,
+    },
+}
+
+
+def _cases(n: int) -> list[Case]:
+    return [
+        Case(
+            id=f"case-{i:07d}",
+            referrer_id=f"ref-{i % 1000}",
+            expert_id=f"exp-{i % 100}" if i % 2 else None,
+            status=CaseStatus.SUBMITTED,
+            created_at=EPOCH + timedelta(minutes=i),
+        )
+        for i in range(n)
+    ]
+
+
+async def _bench(settings: Settings, cases: list[Case]) -> list[str]:
+    repo = build_case_repository(settings, MetricsRegistry())
+    repo.seed(cases)
+    hot = [cases[i * 7919 % len(cases)].id for i in range(100)]
+    hot_cycle = iter(hot * 10_000)
+
+    async def get():
+        await repo.get_by_id(next(hot_cycle))
+
+    async def get_many():
+        await repo.get_many(hot)
+
+    async def save():
+        await repo.save(cases[0])
+
+    async def search():
+        await repo.search(referrer_id="ref-1*", limit=50)
+
+    timings = [
+        await measure_async(get, number=500),
+        await measure_async(get_many, number=50),
+        await measure_async(save, number=200),
+        await measure_async(search, number=50),
+        await measure_async(repo.stats, number=500),
+    ]
+    return [fmt_seconds(t) for t in timings]
+
+
+async def main(n: int) -> None:
+    """Seed n cases into each configuration and time the repository calls."""
+    cases = _cases(n)
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, overrides in CONFIGS.items():
+            settings = Settings(**overrides, repo_sqlite_path=str(Path(tmp) / f"{len(rows)}.db"))
+            rows.append([label] + await _bench(settings, cases))
+    print_table(
+        f"{n:,} cases, 100 hot ids",
+        ["backend", "get_by_id", "get_many(100)", "save", "search(50)", "stats"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000))
@@ -0,0 +1,54 @@
+"""POST /cases:batchGet vs. N single GET /cases/{id} requests, in-process.
+
+Usage: python -m benchmarks.bench_batch_get
+"""
+
+import asyncio
+
+from httpx import ASGITransport, AsyncClient
+
+from benchmarks._harness import fmt_seconds, measure_async, print_table
+from config import Settings
+from main import create_app
+from models import Case, CaseStatus
+
+BATCH_SIZES = (1, 10, 50, 100)
+
+
+async def main() -> None:
+    """Seed 10k cases and compare both access patterns per batch size."""
+    app = create_app(Settings(rate_limit_enabled=False))
+    app.state.repo.seed([
+        Case(id=f"bench-{i:05d}", referrer_id=f"ref-{i % 100}", status=CaseStatus.SUBMITTED)
+        for i in range(10_000)
+    ])
+    transport = ASGITransport(app=app)
+    rows = []
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        for n in BATCH_SIZES:
+            ids = [f"bench-{i * 97 % 10_000:05d}" for i in range(n)]
+
+            async def singles():
+                for case_id in ids:
+                    await client.get(f"/api/v1/cases/{case_id}")
+
+            async def sequential_batch():
+                await client.post("/api/v1/cases:batchGet", json={"ids": ids})
+
+            async def concurrent_singles():
+                await asyncio.gather(*(client.get(f"/api/v1/cases/{i}") for i in ids))
+
+            one = await measure_async(sequential_batch, number=20)
+            seq = await measure_async(singles, number=3)
+            par = await measure_async(concurrent_singles, number=3)
+            rows.append([n, fmt_seconds(one), fmt_seconds(seq), fmt_seconds(par),
+                         f"{seq / one:.1f}x"])
+    print_table(
+        "batchGet vs single GETs (in-process ASGI, no network)",
+        ["ids", "1 batchGet", "N GETs (serial)", "N GETs (gather)", "serial / batch"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
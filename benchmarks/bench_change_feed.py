@@ -0,0 +1,58 @@
+"""Memory per idle subscriber and publish cost with thousands of subscribers.
+
+Usage: python -m benchmarks.bench_change_feed [n_subscribers]
+"""
+
+import asyncio
+import sys
+import tracemalloc
+
+from benchmarks._harness import fmt_seconds, measure, print_table
+from models import Case, CaseStatus
+from utils.change_feed import ChangeFeed
+
+
+async def _idle_memory(n: int) -> float:
+    """Bytes per subscriber, including a task parked in next_batch()."""
+    feed = ChangeFeed()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    subs = [feed.subscribe(referrer_id=f"ref-{i}") for i in range(n)]
+    tasks = [asyncio.create_task(s.next_batch(3600)) for s in subs]
+    await asyncio.sleep(0)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    for t in tasks:
+        t.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    return (after - before) / n
+
+
+def _publish_cost(n: int, filtered: bool) -> float:
+    feed = ChangeFeed(max_buffer=10**9)
+    for i in range(n):
+        feed.subscribe(referrer_id=f"ref-{i}" if filtered else None)
+    case = Case(id="case-1", referrer_id="ref-0", status=CaseStatus.SUBMITTED)
+    return measure(lambda: feed.publish(case), number=200)
+
+
+async def main(n: int) -> None:
+    """Report idle memory and publish latency."""
+    per_sub = await _idle_memory(n)
+    print_table(
+        f"{n:,} idle subscribers",
+        ["metric", "value"],
+        [["bytes / idle subscriber (incl. parked task)", f"{per_sub:,.0f}"],
+         ["total", f"{per_sub * n / 1e6:,.1f} MB"]],
+    )
+    print_table(
+        "publish cost",
+        ["subscribers", "filter", "per publish"],
+        [[f"{n:,}", "per-referrer (1 matches)", fmt_seconds(_publish_cost(n, True))],
+         [f"{n:,}", "none (all match)", fmt_seconds(_publish_cost(n, False))],
+         ["0", "-", fmt_seconds(_publish_cost(0, False))]],
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000))
@@ -0,0 +1,105 @@
+"""Read coalescing: single-case reads with and without BatchingCaseRepository.
+
+200 concurrent clients each read 50 cases, picking ids from 10,000 with a
+Zipf (s=1.1) distribution, so a few hot cases take most of the reads.
+Each read is a CaseService.get_case; the backend is wrapped in a call
+counter, and with coalescing on, the counter in BatchingCaseRepository.
+The table reports how many calls reached the backend and the per-read
+latency, for the SQLite backend, whose reads run on a worker thread, and
+for the in-memory backend, where a read is a dict lookup.
+
+Usage: python -m benchmarks.bench_coalescing
+"""
+
+import asyncio
+import itertools
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from api.repositories import build_case_repository
+from benchmarks._harness import fmt_seconds, percentile, print_table
+from config import Settings
+from models import Case, CaseStatus
+from services.case_service import CaseService
+from utils.batching_repo import BatchingCaseRepository
+
+CASES, CLIENTS, READS, ZIPF_S = 10_000, 200, 50, 1.1
+
+
+class CallCounter:
+    """Wraps a backend and counts the read calls that reach it."""
+
+    def __init__(self, inner):
+        self.inner, self.calls = inner, 0
+
+    async def get_by_id(self, case_id):
+        self.calls += 1
+        return await self.inner.get_by_id(case_id)
+
+    async def get_many(self, case_ids):
+        self.calls += 1
+        return await self.inner.get_many(case_ids)
+
+    def __getattr__(self, name):
+        return getattr(self.inner, name)
+
+
+def _zipf_ids(rng: random.Random, n: int) -> list[str]:
+    weights = list(itertools.accumulate(1 / (k ** ZIPF_S) for k in range(1, CASES + 1)))
+    ranks = rng.choices(range(CASES), cum_weights=weights, k=n)
+    return [f"case-{rank:05d}" for rank in ranks]
+
+
+async def _run(settings: Settings, batching: bool, ids: list[str]) -> tuple[int, list[float]]:
+    backend = build_case_repository(settings)
+    backend.seed([
+        Case(id=f"case-{i:05d}", referrer_id=f"ref-{i % 100}", status=CaseStatus.SUBMITTED)
+        for i in range(CASES)
+    ])
+    counter = repo = CallCounter(backend)
+    if batching:
+        repo = BatchingCaseRepository(counter, settings.repo_batch_max_ids)
+    service = CaseService(case_repo=repo)
+    latencies: list[float] = []
+
+    async def client(offset: int) -> None:
+        for case_id in ids[offset * READS:(offset + 1) * READS]:
+            start = time.perf_counter()
+            await service.get_case(case_id)
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(client(c) for c in range(CLIENTS)))
+    return counter.calls, latencies
+
+
+async def main() -> None:
+    """Replay the same Zipf workload with and without coalescing."""
+    ids = _zipf_ids(random.Random(3), CLIENTS * READS)
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for backend in ("sqlite", "memory"):
+            for batching in (False, True):
+                settings = Settings(
+                    repo_backend=backend,
+                    repo_sqlite_path=str(Path(tmp) / f"{backend}-{batching}.db"),
+                )
+                start = time.perf_counter()
+                calls, latencies = await _run(settings, batching, ids)
+                elapsed = time.perf_counter() - start
+                rows.append([
+                    backend, "on" if batching else "off", f"{calls:,}",
+                    fmt_seconds(percentile(latencies, 50)),
+                    fmt_seconds(percentile(latencies, 99)),
+                    f"{len(latencies) / elapsed:,.0f}/s",
+                ])
+    print_table(
+        f"{CLIENTS} clients x {READS} Zipf reads over {CASES:,} cases",
+        ["backend", "batching", "backend calls", "p50", "p99", "throughput"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
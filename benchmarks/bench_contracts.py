@@ -0,0 +1,104 @@
+"""Cost of checking responses against the compiled contracts.
+
+The first table times one check (JSON decode plus validation) for a single
+case and for search pages of 50 and 500 cases, with bodies taken from the
+app itself. The second compares in-process GET and search latency with
+validation off, at the default 1% sample rate and on every response,
+alternating between the apps so machine noise affects them equally.
+
+Usage: python -m benchmarks.bench_contracts
+"""
+
+import asyncio
+from contextlib import AsyncExitStack
+
+from httpx import ASGITransport, AsyncClient
+
+from api.contract_validation import ContractMonitor
+from benchmarks._harness import fmt_seconds, measure, measure_async, print_table
+from config import Settings
+from main import create_app
+from models import Case, CaseStatus
+from utils.contracts import ContractSet
+from utils.metrics import MetricsRegistry
+
+RATES = (0.0, 0.01, 1.0)
+SEARCH = "/api/v1/cases:search"
+
+
+def _settings(rate: float) -> Settings:
+    return Settings(
+        contract_validation_rate=rate, rate_limit_enabled=False, tracing_enabled=False
+    )
+
+
+def _seed(app) -> None:
+    app.state.repo.seed([
+        Case(id=f"case-b{i:04d}", referrer_id=f"ref-bench-{i:04d}",
+             expert_id=f"exp-{i % 10}" if i % 2 else None, status=CaseStatus.SUBMITTED)
+        for i in range(500)
+    ])
+
+
+async def _check_costs() -> list[list[str]]:
+    app = create_app(_settings(0))
+    _seed(app)
+    monitor = ContractMonitor(ContractSet.load(app.state.settings.contracts_dir), MetricsRegistry())
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        bodies = [
+            ("one case", "/api/v1/cases/{case_id}",
+             (await client.get("/api/v1/cases/case-b0001")).content),
+        ]
+        for limit in (50, 500):
+            response = await client.get(SEARCH, params={"referrer_id": "ref-bench-*", "limit": limit})
+            bodies.append((f"search page of {limit}", SEARCH, response.content))
+    rows = []
+    for label, path, body in bodies:
+        assert monitor.check("GET", path, 200, body), monitor.violations()
+        took = measure(lambda: monitor.check("GET", path, 200, body), number=200)
+        rows.append([label, f"{len(body):,} B", fmt_seconds(took)])
+    return rows
+
+
+async def _request_latency(rounds: int = 7) -> list[list[str]]:
+    """Alternate between apps at each sample rate, keeping each one's best."""
+    apps = {rate: create_app(_settings(rate)) for rate in RATES}
+    best = {(rate, op): float("inf") for rate in RATES for op in ("get", "search")}
+    async with AsyncExitStack() as stack:
+        clients = {}
+        for rate, app in apps.items():
+            await stack.enter_async_context(app.router.lifespan_context(app))
+            _seed(app)
+            clients[rate] = await stack.enter_async_context(AsyncClient(
+                transport=ASGITransport(app=app), base_url="http://bench"
+            ))
+        for _ in range(rounds):
+            for rate, client in clients.items():
+                async def get():
+                    await client.get("/api/v1/cases/case-b0001")
+
+                async def search():
+                    await client.get(SEARCH, params={"referrer_id": "ref-bench-*"})
+
+                for op, fn in (("get", get), ("search", search)):
+                    took = await measure_async(fn, number=200, repeat=1)
+                    best[rate, op] = min(best[rate, op], took)
+    return [
+        [label, *(fmt_seconds(best[rate, op]) for rate in RATES)]
+        for label, op in (("GET case", "get"), ("search, 50 results", "search"))
+    ]
+
+
+async def main() -> None:
+    """Print per-check costs and request latency at several sample rates."""
+    print_table("one contract check", ["body", "size", "time"], await _check_costs())
+    print_table(
+        "in-process request latency (best of 7 interleaved rounds)",
+        ["request", *(f"rate {rate:g}" for rate in RATES)],
+        await _request_latency(),
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
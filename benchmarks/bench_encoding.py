@@ -0,0 +1,62 @@
+"""Encode time and wire bytes for case payloads of 1, 100 and 10k cases.
+
+Usage: python -m benchmarks.bench_encoding
+"""
+
+import gzip
+
+from benchmarks._harness import fmt_seconds, measure, print_table
+from models import Case, CaseStatus
+from schemas import CaseResponse
+from utils.json_codec import available_encoders, get_json_encoder
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+SIZES = (1, 100, 10_000)
+
+
+def _payload(n: int) -> list[dict]:
+    statuses = list(CaseStatus)
+    return [
+        CaseResponse.from_model(
+            Case(
+                id=f"case-{i:07d}",
+                referrer_id=f"ref-{i % 500}",
+                expert_id=f"exp-{i % 50}" if i % 3 else None,
+                status=statuses[i % len(statuses)],
+            )
+        ).model_dump(mode="json")
+        for i in range(n)
+    ]
+
+
+def main() -> None:
+    """Run the benchmark and print one table per payload size."""
+    for n in SIZES:
+        payload = _payload(n)
+        number = max(1, 2000 // n)
+        rows = []
+        for name in available_encoders():
+            encoder = get_json_encoder(name)
+            body = encoder.dumps(payload)
+            encode = measure(lambda: encoder.dumps(payload), number=number)
+            rows.append([name, "identity", fmt_seconds(encode), "-", len(body)])
+            gz = measure(lambda: gzip.compress(body, 6), number=number)
+            rows.append([name, "gzip-6", fmt_seconds(encode), fmt_seconds(gz),
+                         len(gzip.compress(body, 6))])
+            if brotli is not None:
+                br = measure(lambda: brotli.compress(body, quality=4), number=number)
+                rows.append([name, "br-4", fmt_seconds(encode), fmt_seconds(br),
+                             len(brotli.compress(body, quality=4))])
+        print_table(
+            f"{n} case(s)",
+            ["encoder", "encoding", "encode", "compress", "wire bytes"],
+            rows,
+        )
+
+
+if __name__ == "__main__":
+    main()
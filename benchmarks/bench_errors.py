@@ -0,0 +1,105 @@
+"""404-heavy traffic: Optional lookups and pre-encoded bodies vs. exceptions.
+
+The "exception" path reproduces the previous GET route: the service raises
+NotFoundError, the route converts it to an HTTPException and FastAPI renders
+a fresh JSONResponse. The "find_case" path is the current route. Both run
+in the same app, interleaved, so machine noise affects them equally.
+
+Usage: python -m benchmarks.bench_errors
+"""
+
+import asyncio
+import random
+
+from fastapi import Depends, HTTPException
+from fastapi.responses import JSONResponse
+from httpx import ASGITransport, AsyncClient
+
+from api.dependencies import get_case_service
+from api.error_handlers import ErrorBodies, error_response
+from benchmarks._harness import fmt_seconds, measure_async, print_table
+from config import Settings
+from exceptions import NotFoundError
+from main import create_app
+from schemas import CaseResponse
+from services.case_service import CaseService
+
+MISS_RATIOS = (0.0, 0.5, 0.9, 1.0)
+REQUESTS = 500
+ROUNDS = 5
+
+
+def _add_legacy_route(app) -> None:
+    @app.get("/api/v1/legacy/cases/{case_id}", response_model=CaseResponse)
+    async def legacy_get_case(
+        case_id: str, service: CaseService = Depends(get_case_service)
+    ) -> CaseResponse:
+        try:
+            case = await service.get_case(case_id)
+        except NotFoundError as exc:
+            raise HTTPException(status_code=404, detail=exc.message)
+        return CaseResponse.from_model(case)
+
+
+async def _service_level(service: CaseService, errors: ErrorBodies) -> list[list[str]]:
+    async def raising():
+        try:
+            await service.get_case("scan-404")
+        except NotFoundError as exc:
+            JSONResponse({"detail": exc.message}, status_code=404)
+
+    async def optional():
+        if await service.find_case("scan-404") is None:
+            error_response(404, errors.case_not_found)
+
+    old = await measure_async(raising, number=20_000)
+    new = await measure_async(optional, number=20_000)
+    return [
+        ["raise NotFoundError + JSONResponse", fmt_seconds(old)],
+        ["find_case + pre-encoded body", fmt_seconds(new)],
+        ["saved per miss", fmt_seconds(old - new)],
+    ]
+
+
+async def _http_level(client: AsyncClient) -> list[list[str]]:
+    rng = random.Random(40)
+    rows = []
+    for ratio in MISS_RATIOS:
+        ids = [
+            f"scan-{rng.randrange(10**9)}" if rng.random() < ratio else "case-002"
+            for _ in range(REQUESTS)
+        ]
+        best = {"/api/v1/legacy/cases/": float("inf"), "/api/v1/cases/": float("inf")}
+        for _ in range(ROUNDS):
+            for prefix in best:
+                async def run():
+                    for case_id in ids:
+                        await client.get(prefix + case_id)
+
+                took = await measure_async(run, number=1, repeat=1) / REQUESTS
+                best[prefix] = min(best[prefix], took)
+        old, new = best.values()
+        rows.append([f"{ratio:.0%}", fmt_seconds(old), fmt_seconds(new), f"{old / new:.2f}x"])
+    return rows
+
+
+async def main() -> None:
+    """Compare miss handling per lookup and per request at several miss ratios."""
+    app = create_app(Settings(rate_limit_enabled=False, tracing_enabled=False))
+    _add_legacy_route(app)
+    async with app.router.lifespan_context(app):
+        print_table(
+            "service-level miss handling", ["path", "time"],
+            await _service_level(CaseService(app.state.repo), app.state.errors),
+        )
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://bench") as client:
+            print_table(
+                f"in-process GET, {REQUESTS} requests (best of {ROUNDS} interleaved rounds)",
+                ["miss ratio", "exception path", "find_case path", "speedup"],
+                await _http_level(client),
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,108 @@
+"""Expert availability: bitset index vs. a scan, and assignment check cost.
+
+"find" asks for the first 10 experts with a specialty who are active,
+below capacity and on call at a given hour. The scan baseline walks every
+expert and tests the same conditions. "assign" times
+CaseService.assign_expert with and without the expert reservation.
+
+Usage: python -m benchmarks.bench_experts [n_experts]
+"""
+
+import asyncio
+import random
+import sys
+from itertools import islice
+
+from benchmarks._harness import fmt_seconds, measure, measure_async, print_table
+from models import HOURS_PER_WEEK, Case, CaseStatus, Expert
+from services.case_service import CaseService
+from utils.expert_repo import InMemoryExpertRepository
+from utils.in_memory_repo import InMemoryCaseRepository
+
+SPECIALTIES = [f"spec-{i}" for i in range(40)]
+N_CASES = 20_000
+
+
+def _experts(n: int) -> list[Expert]:
+    rng = random.Random(7)
+    experts = []
+    for i in range(n):
+        start = rng.randrange(HOURS_PER_WEEK)
+        experts.append(Expert(
+            id=f"exp-{i:06d}",
+            name=f"Expert {i}",
+            specialties=rng.sample(SPECIALTIES, 2),
+            active=rng.random() > 0.1,
+            max_open_cases=10,
+            open_cases=rng.randrange(12),
+            on_call_hours=[(start + h) % HOURS_PER_WEEK for h in range(40)],
+        ))
+    return experts
+
+
+def _scan(experts: list[Expert], specialty: str, hour: int, limit: int) -> list[Expert]:
+    return list(islice((
+        e for e in experts
+        if specialty in e.specialties and e.active
+        and e.open_cases < e.max_open_cases and hour in e.on_call_hours
+    ), limit))
+
+
+async def _assign_cost(check_experts: bool) -> float:
+    experts = None
+    if check_experts:
+        experts = InMemoryExpertRepository()
+        experts.seed([
+            Expert(id=f"exp-{i:06d}", name=f"Expert {i}", specialties=["spec-0"])
+            for i in range(1000)
+        ])
+    cases = InMemoryCaseRepository()
+    cases.seed([
+        Case.model_construct(
+            id=f"case-{i:06d}", referrer_id="ref-1", expert_id=None,
+            status=CaseStatus.SUBMITTED,
+        )
+        for i in range(N_CASES)
+    ])
+    service = CaseService(case_repo=cases, experts=experts)
+    ids = iter(range(N_CASES))
+
+    async def assign():
+        i = next(ids)
+        await service.assign_expert(f"case-{i:06d}", f"exp-{i % 1000:06d}")
+        if experts is not None:
+            await experts.release(f"exp-{i % 1000:06d}")
+
+    return await measure_async(assign, number=2000, repeat=5)
+
+
+async def main(n: int) -> None:
+    """Compare the index with a scan, and assignment with and without checks."""
+    experts = _experts(n)
+    repo = InMemoryExpertRepository()
+    repo.seed([e.model_copy() for e in experts])
+    for e in experts:
+        e.on_call_hours = set(e.on_call_hours)
+    hour = 42
+
+    rows = []
+    for specialty in ("spec-0", "spec-39"):
+        indexed = await measure_async(
+            lambda: repo.find_available(specialty, hour, 10), number=1000
+        )
+        scanned = measure(lambda: _scan(experts, specialty, hour, 10), number=20)
+        rows.append([f"find 10 ({specialty})", fmt_seconds(indexed), fmt_seconds(scanned),
+                     f"{scanned / indexed:,.0f}x"])
+    print_table(f"{n:,} experts, {len(SPECIALTIES)} specialties",
+                ["query", "index", "scan", "speedup"], rows)
+
+    unchecked = await _assign_cost(False)
+    checked = await _assign_cost(True)
+    print_table("assign_expert (includes releasing the reservation)", ["", "per call"], [
+        ["no expert check", fmt_seconds(unchecked)],
+        ["reserve + index update", fmt_seconds(checked)],
+    ])
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000))
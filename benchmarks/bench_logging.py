@@ -0,0 +1,105 @@
+"""Structured logging cost: per record, and its effect on request throughput.
+
+The first table times logging one record on the caller's thread: a
+StructuredLog emit (one LogRecord and a queue put) against the stdlib
+pattern of a FileHandler with a JSON formatter, which encodes, writes and
+flushes under the handler's lock on every call. The second table sends the
+same in-process GET requests with access logging off, on, and sampled at
+10%, alternating between the apps so machine noise affects all equally.
+
+Usage: python -m benchmarks.bench_logging
+"""
+
+import asyncio
+import json
+import logging
+import tempfile
+from contextlib import AsyncExitStack
+from pathlib import Path
+
+from httpx import ASGITransport, AsyncClient
+
+from benchmarks._harness import fmt_seconds, measure, measure_async, print_table
+from config import Settings
+from main import create_app
+from utils.json_codec import get_json_encoder
+from utils.metrics import MetricsRegistry
+from utils.structured_log import StructuredLog
+
+FIELDS = {"method": "GET", "path": "/api/v1/cases/case-002", "status": 200, "bytes": 120}
+REQUESTS = 500
+
+
+class _JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        return json.dumps({"event": record.getMessage(), **record.fields})
+
+
+def _per_record(tmp: Path) -> list[list[str]]:
+    queued = StructuredLog("bench", str(tmp / "queued.log"), get_json_encoder("auto"),
+                           MetricsRegistry(), queue_size=1_000_000)
+    queued.start()
+    handler = logging.FileHandler(tmp / "sync.log")
+    handler.setFormatter(_JsonFormatter())
+    sync = logging.Logger("sync", logging.INFO)
+    sync.addHandler(handler)
+    rows = [
+        ["StructuredLog.emit (queued)",
+         fmt_seconds(measure(lambda: queued.emit("http.request", **FIELDS), number=20_000))],
+        ["stdlib FileHandler + JSON",
+         fmt_seconds(measure(lambda: sync.info("http.request", extra={"fields": FIELDS}),
+                             number=20_000))],
+    ]
+    queued.close(timeout=30)
+    handler.close()
+    return rows
+
+
+async def _throughput(tmp: Path, rounds: int = 5) -> list[list[str]]:
+    """Alternate between the three apps, keeping each one's best round."""
+    variants = {
+        "off": {},
+        "on": {"access_log_path": str(tmp / "on.log")},
+        "sampled 10%": {"access_log_path": str(tmp / "sampled.log"),
+                        "access_log_sample_rate": 0.1},
+    }
+    best = dict.fromkeys(variants, float("inf"))
+    async with AsyncExitStack() as stack:
+        clients = {}
+        for name, overrides in variants.items():
+            app = create_app(Settings(rate_limit_enabled=False, warmup_enabled=False,
+                                      log_queue_size=100_000, **overrides))
+            await stack.enter_async_context(app.router.lifespan_context(app))
+            clients[name] = await stack.enter_async_context(AsyncClient(
+                transport=ASGITransport(app=app), base_url="http://bench"
+            ))
+        for _ in range(rounds):
+            for name, client in clients.items():
+
+                async def burst(client=client):
+                    await asyncio.gather(
+                        *(client.get("/api/v1/cases/case-002") for _ in range(50))
+                    )
+
+                took = await measure_async(burst, number=REQUESTS // 50, repeat=1)
+                best[name] = min(best[name], took / 50)
+    return [
+        [name, f"{1 / seconds:,.0f}/s", f"{best['off'] / seconds - 1:+.1%}"]
+        for name, seconds in best.items()
+    ]
+
+
+async def main() -> None:
+    """Print per-record cost and request throughput per logging mode."""
+    with tempfile.TemporaryDirectory() as tmp:
+        print_table("cost on the logging thread, per record", ["logger", "time"],
+                    _per_record(Path(tmp)))
+        print_table(
+            f"in-process GET throughput (best of 5 rounds of {REQUESTS})",
+            ["access log", "throughput", "vs off"],
+            await _throughput(Path(tmp)),
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
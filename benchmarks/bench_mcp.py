@@ -0,0 +1,126 @@
+"""End-to-end latency of a 1000-call MCP session against the warm index.
+
+The session mixes the three tools the way an editing session does. Most
+calls validate a file, and the rest fetch module boundaries or a contract.
+It runs over the in-memory MCP transport, so each call includes JSON-RPC
+encoding and dispatch. Index build and refresh costs are reported
+separately. The stateless baseline rebuilds the index for every call,
+which is what answering the same tools without persistent state costs.
+
+Usage: python -m benchmarks.bench_mcp
+"""
+
+import asyncio
+import os
+import random
+import time
+from pathlib import Path
+
+from mcp.shared.memory import create_connected_server_and_client_session
+
+from benchmarks._harness import fmt_seconds, measure, percentile, print_table
+from mcp_server import server as mcp
+from mcp_server.project_index import ProjectIndex
+from mcp_server.tools.get_contracts import get_contracts
+from mcp_server.tools.get_module_boundaries import get_module_boundaries
+from mcp_server.tools.validate_architecture import validate_architecture
+
+CALLS = 1000
+STATELESS_CALLS = 50
+TOOLS = {
+    "validate_architecture": validate_architecture,
+    "get_module_boundaries": get_module_boundaries,
+    "get_contracts": get_contracts,
+}
+
+
+def _session(paths: list[str], n: int) -> list[tuple[str, dict]]:
+    rng = random.Random(44)
+    calls = []
+    for _ in range(n):
+        roll = rng.random()
+        if roll < 0.7:
+            calls.append(("validate_architecture", {"file_path": rng.choice(paths)}))
+        elif roll < 0.9:
+            module = rng.choice(["services", "models", "schemas", "exceptions"])
+            calls.append(("get_module_boundaries", {"module": module}))
+        else:
+            calls.append(("get_contracts", {"domain": rng.choice(["case", "expert"])}))
+    return calls
+
+
+def _index_costs() -> list[list[str]]:
+    root = mcp.PROJECT_ROOT
+    index = ProjectIndex(root)
+    build = measure(lambda: ProjectIndex(root).refresh(), number=1, repeat=3)
+    index.refresh()
+    unchanged = measure(index.refresh, number=20)
+    touched = root / "services" / "__init__.py"
+
+    def one_change():
+        os.utime(touched, ns=(time.time_ns(), time.time_ns()))
+        index.refresh()
+
+    changed = measure(one_change, number=20)
+    return [
+        [f"cold build ({len(index.snapshot.modules)} files)", fmt_seconds(build)],
+        ["refresh, nothing changed", fmt_seconds(unchanged)],
+        ["refresh, one file changed", fmt_seconds(changed)],
+    ]
+
+
+async def _run_session(calls: list[tuple[str, dict]]) -> dict[str, list[float]]:
+    timings: dict[str, list[float]] = {}
+    async with create_connected_server_and_client_session(mcp.server) as client:
+        await mcp.index.ready()
+        for name, arguments in calls:
+            start = time.perf_counter()
+            await client.call_tool(name, arguments)
+            timings.setdefault(name, []).append(time.perf_counter() - start)
+    await mcp.index.stop()
+    return timings
+
+
+def _direct(calls: list[tuple[str, dict]], warm: bool) -> float:
+    """Mean seconds per tool function call, with the index kept or rebuilt."""
+    index = ProjectIndex(mcp.PROJECT_ROOT)
+    index.refresh()
+    start = time.perf_counter()
+    for name, arguments in calls:
+        if not warm:
+            index = ProjectIndex(mcp.PROJECT_ROOT)
+            index.refresh()
+        TOOLS[name](index.snapshot, **arguments)
+    return (time.perf_counter() - start) / len(calls)
+
+
+async def main() -> None:
+    """Print index costs and per-call latency of a 1000-call session."""
+    print_table("project index", ["operation", "time"], _index_costs())
+    root = Path(mcp.PROJECT_ROOT)
+    paths = [p.relative_to(root).as_posix() for p in root.glob("*/*.py")]
+    calls = _session(paths, CALLS)
+    start = time.perf_counter()
+    timings = await _run_session(calls)
+    total = time.perf_counter() - start
+    rows = [
+        [name, str(len(samples)), fmt_seconds(percentile(samples, 50)),
+         fmt_seconds(percentile(samples, 99))]
+        for name, samples in sorted(timings.items())
+    ]
+    everything = [t for samples in timings.values() for t in samples]
+    rows.append(["all", str(len(everything)), fmt_seconds(percentile(everything, 50)),
+                 fmt_seconds(percentile(everything, 99))])
+    print_table(
+        f"{CALLS}-call session over the in-memory transport ({total:.2f} s total)",
+        ["tool", "calls", "p50", "p99"], rows,
+    )
+    print_table(
+        "mean tool time per call, without transport", ["index", "time"],
+        [["rebuilt per call", fmt_seconds(_direct(calls[:STATELESS_CALLS], warm=False))],
+         ["warm", fmt_seconds(_direct(calls, warm=True))]],
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,130 @@
+"""Read replicas: a local multi-process demo and read throughput per topology.
+
+Starts one primary and two replica processes under uvicorn on loopback
+ports; the replicas follow the primary's /cases:watch stream. The demo
+assigns a case on the primary and reads it back from a replica with the
+write's consistency token, showing how long the replica took to catch
+up, and the stale answer a read without the token may get. The table
+then drives GET /api/v1/cases/{id} for a fixed time against the primary
+alone and against the primary plus replicas, with one load-generating
+process per server so the client is not the bottleneck. Replicas only
+add throughput when the machine has cores to spare for them.
+
+Usage: python -m benchmarks.bench_replication
+"""
+
+import asyncio
+import multiprocessing
+import os
+import socket
+import subprocess
+import sys
+import time
+from contextlib import ExitStack
+
+import httpx
+
+from benchmarks._harness import fmt_seconds, print_table
+
+TOKEN = "x-consistency-token"
+SECONDS = 3.0
+CONNECTIONS = 32
+ENV = {
+    "MEDIRECT_RATE_LIMIT_ENABLED": "false",
+    "MEDIRECT_LOAD_SHEDDING_ENABLED": "false",
+    "MEDIRECT_WARMUP_ENABLED": "false",
+}
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _serve(stack: ExitStack, primary: str | None = None) -> str:
+    """Start one server process and return its base URL once it is ready."""
+    port = _free_port()
+    env = {**os.environ, **ENV}
+    if primary is not None:
+        env["MEDIRECT_REPO_REPLICA_OF"] = primary
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "--factory", "main:create_app",
+         "--port", str(port), "--log-level", "warning"],
+        env=env,
+    )
+    stack.callback(process.wait)
+    stack.callback(process.terminate)
+    url = f"http://127.0.0.1:{port}"
+    for _ in range(200):
+        try:
+            if httpx.get(url + "/readyz").status_code == 200:
+                return url
+        except httpx.TransportError:
+            pass
+        time.sleep(0.05)
+    raise RuntimeError(f"server on port {port} did not start")
+
+
+def _demo(primary: str, replica: str) -> list[list[str]]:
+    written = httpx.post(primary + "/api/v1/cases/case-001/assign", json={"expert_id": "exp-300"})
+    token = written.headers[TOKEN]
+    stale = httpx.get(replica + "/api/v1/cases/case-001")
+    start = time.perf_counter()
+    fresh = httpx.get(replica + "/api/v1/cases/case-001", headers={TOKEN: token})
+    took = time.perf_counter() - start
+    return [
+        ["assign on primary", str(written.status_code), token, "assigned"],
+        ["replica, no token", str(stale.status_code), stale.headers[TOKEN],
+         stale.json()["status"]],
+        [f"replica, token {token} ({fmt_seconds(took)})", str(fresh.status_code),
+         fresh.headers[TOKEN], fresh.json()["status"]],
+    ]
+
+
+async def _drive(url: str, seconds: float, connections: int) -> int:
+    deadline = time.perf_counter() + seconds
+    done = 0
+
+    async def worker(client: httpx.AsyncClient) -> None:
+        nonlocal done
+        while time.perf_counter() < deadline:
+            await client.get("/api/v1/cases/case-002")
+            done += 1
+
+    limits = httpx.Limits(max_connections=connections)
+    async with httpx.AsyncClient(base_url=url, limits=limits) as client:
+        await asyncio.gather(*(worker(client) for _ in range(connections)))
+    return done
+
+
+def _load(url: str) -> int:
+    return asyncio.run(_drive(url, SECONDS, CONNECTIONS))
+
+
+def _throughput(urls: list[str]) -> float:
+    with multiprocessing.Pool(len(urls)) as pool:
+        return sum(pool.map(_load, urls)) / SECONDS
+
+
+def main() -> None:
+    """Run the demo, then print read throughput per topology."""
+    with ExitStack() as stack:
+        primary = _serve(stack)
+        replicas = [_serve(stack, primary) for _ in range(2)]
+        print_table("read-your-writes demo", ["request", "status", "token", "case status"],
+                    _demo(primary, replicas[0]))
+        rows = []
+        for name, urls in [("primary only", [primary]),
+                           ("primary + 1 replica", [primary, replicas[0]]),
+                           ("primary + 2 replicas", [primary, *replicas])]:
+            rows.append([name, str(len(urls)), f"{_throughput(urls):,.0f}/s"])
+        print_table(
+            f"GET throughput, {CONNECTIONS} connections per server, {os.cpu_count()} cores",
+            ["topology", "processes", "reads"],
+            rows,
+        )
+
+
+if __name__ == "__main__":
+    main()
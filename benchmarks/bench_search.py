@@ -0,0 +1,70 @@
+"""Prefix search via the repository index vs. a linear scan of the store.
+
+Usage: python -m benchmarks.bench_search [n_cases]
+"""
+
+import asyncio
+import sys
+import time
+from itertools import islice
+
+from benchmarks._harness import fmt_seconds, measure_async, print_table
+from models import Case, CaseStatus
+from utils.in_memory_repo import InMemoryCaseRepository
+
+QUERIES = [
+    ("selective prefix", {"referrer_id": "ref-1234*"}),
+    ("broad prefix", {"referrer_id": "ref-1*"}),
+    ("exact", {"referrer_id": "ref-4321"}),
+    ("expert prefix", {"expert_id": "exp-9*"}),
+    ("no match", {"referrer_id": "zzz*"}),
+]
+LIMIT = 50
+
+
+def _cases(n: int) -> list[Case]:
+    return [
+        Case.model_construct(
+            id=f"case-{i:07d}",
+            referrer_id=f"ref-{i % 10_000}",
+            expert_id=f"exp-{i % 1000}" if i % 2 else None,
+            status=CaseStatus.SUBMITTED,
+        )
+        for i in range(n)
+    ]
+
+
+def _linear(repo: InMemoryCaseRepository, referrer_id=None, expert_id=None):
+    field, pattern = ("referrer_id", referrer_id) if referrer_id else ("expert_id", expert_id)
+    literal = pattern.rstrip("*")
+    prefix = pattern.endswith("*")
+    hits = (
+        c for c in repo._store.values()
+        if (v := getattr(c, field)) is not None
+        and (v.startswith(literal) if prefix else v == literal)
+    )
+    return list(islice(hits, LIMIT))
+
+
+async def main(n: int) -> None:
+    """Build the dataset and compare both strategies per query shape."""
+    cases = _cases(n)
+    repo = InMemoryCaseRepository()
+    start = time.perf_counter()
+    repo.seed(cases)
+    print(f"seed + index build for {n:,} cases: {time.perf_counter() - start:.2f}s")
+
+    rows = []
+    for label, query in QUERIES:
+        indexed = await measure_async(lambda: repo.search(limit=LIMIT, **query), number=20)
+        start = time.perf_counter()
+        hits = _linear(repo, **query)
+        linear = time.perf_counter() - start
+        rows.append([label, len(hits), fmt_seconds(indexed), fmt_seconds(linear),
+                     f"{linear / indexed:,.0f}x"])
+    print_table(f"search, limit={LIMIT}, {n:,} cases",
+                ["query", "hits", "indexed", "linear scan", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000))
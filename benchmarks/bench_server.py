@@ -0,0 +1,182 @@
+"""Server profiles under connection-heavy load, and a reload under load.
+
+Starts ``python main.py`` once per profile and drives GET requests from
+this process for a fixed time in three patterns. The first keeps a pool
+of connections alive. The second opens a fresh connection per request,
+as clients without pooling do. The third opens a burst of connections at
+once, each sending one request, which exercises the accept backlog. For
+the production profile, one more keep-alive run sends SIGHUP halfway
+through. Its error column shows whether the worker swap dropped requests.
+Requests the server closed an idle connection under are retried, as
+clients do, and counted separately. The client speaks HTTP/1.1 over raw
+asyncio streams; a pooling library's overhead would otherwise dominate.
+Profiles differ most with uvloop and httptools installed; without them
+the production profile falls back to asyncio and h11.
+
+Usage: python -m benchmarks.bench_server
+"""
+
+import asyncio
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+import httpx
+
+from benchmarks._harness import print_table
+
+SECONDS = 3.0
+CONNECTIONS = 64
+BURST = 500
+ENV = {
+    "MEDIRECT_RATE_LIMIT_ENABLED": "false",
+    "MEDIRECT_LOAD_SHEDDING_ENABLED": "false",
+    "MEDIRECT_WARMUP_ENABLED": "false",
+}
+
+
+@contextmanager
+def _server(profile: str) -> Iterator[tuple[int, subprocess.Popen]]:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    env = {**os.environ, **ENV, "MEDIRECT_SERVER_PROFILE": profile,
+           "MEDIRECT_HOST": "127.0.0.1", "MEDIRECT_PORT": str(port)}
+    process = subprocess.Popen([sys.executable, "main.py"], env=env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    url = f"http://127.0.0.1:{port}"
+    try:
+        for _ in range(200):
+            try:
+                if httpx.get(url + "/readyz").status_code == 200:
+                    break
+            except httpx.TransportError:
+                time.sleep(0.05)
+        yield port, process
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def _request(path: str, close: bool) -> bytes:
+    connection = b"close" if close else b"keep-alive"
+    return b"GET %s HTTP/1.1\r\nHost: bench\r\nConnection: %s\r\n\r\n" % (
+        path.encode(), connection
+    )
+
+
+async def _exchange(reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                    request: bytes) -> tuple[int, bool]:
+    """Send one request; return its status and whether the server keeps the connection."""
+    writer.write(request)
+    head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1").lower()
+    status = int(head.split(" ", 2)[1])
+    length = int(head.split("content-length:", 1)[1].split("\r\n", 1)[0])
+    await reader.readexactly(length)
+    return status, "connection: close" not in head
+
+
+async def _drive(port: int, keepalive: bool, on_halfway=None) -> tuple[int, int, int]:
+    """Send requests from CONNECTIONS clients for SECONDS.
+
+    A request whose kept-alive connection was closed before any response
+    arrived is retried once on a new connection, as HTTP clients do for
+    idempotent requests.
+
+    Returns:
+        Successful requests, such retries, and errors.
+    """
+    request = _request("/api/v1/cases/case-002", close=not keepalive)
+    start = time.perf_counter()
+    ok = retried = errors = 0
+
+    async def client() -> None:
+        nonlocal ok, retried, errors
+        connection = None
+        while time.perf_counter() - start < SECONDS:
+            reused = connection is not None
+            if connection is None:
+                connection = await asyncio.open_connection("127.0.0.1", port)
+            try:
+                status, keep = await _exchange(*connection, request)
+            except (asyncio.IncompleteReadError, ConnectionError):
+                connection[1].close()
+                connection = None
+                if reused:
+                    retried += 1
+                else:
+                    errors += 1
+                continue
+            ok += status == 200
+            errors += status != 200
+            if not keep:
+                connection[1].close()
+                connection = None
+        if connection is not None:
+            connection[1].close()
+
+    async def halfway() -> None:
+        await asyncio.sleep(SECONDS / 2)
+        on_halfway()
+
+    tasks = [client() for _ in range(CONNECTIONS)]
+    if on_halfway is not None:
+        tasks.append(halfway())
+    await asyncio.gather(*tasks)
+    return ok, retried, errors
+
+
+async def _burst(port: int) -> tuple[int, float]:
+    """Open BURST connections at once, one request each."""
+    request = _request("/healthz", close=True)
+
+    async def one() -> bool:
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            status, _ = await _exchange(reader, writer, request)
+            writer.close()
+            return status == 200
+        except (asyncio.IncompleteReadError, ConnectionError):
+            return False
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(one() for _ in range(BURST)))
+    return sum(results), time.perf_counter() - start
+
+
+async def _profile_rows(profile: str) -> list[list[str]]:
+    rows = []
+    with _server(profile) as (port, process):
+        for name, keepalive in [("keep-alive", True), ("connection per request", False)]:
+            ok, retried, errors = await _drive(port, keepalive)
+            rows.append([profile, name, f"{ok / SECONDS:,.0f}/s", str(retried), str(errors)])
+        served, took = await _burst(port)
+        rows.append([profile, f"burst of {BURST} connects", f"{served / took:,.0f}/s", "-",
+                     str(BURST - served)])
+        if profile == "production":
+            ok, retried, errors = await _drive(
+                port, True, lambda: process.send_signal(signal.SIGHUP)
+            )
+            rows.append([profile, "keep-alive, SIGHUP halfway", f"{ok / SECONDS:,.0f}/s",
+                         str(retried), str(errors)])
+    return rows
+
+
+async def main() -> None:
+    """Print throughput and errors per profile and workload."""
+    rows = await _profile_rows("dev") + await _profile_rows("production")
+    print_table(
+        f"GET throughput over {SECONDS:.0f}s, {CONNECTIONS} concurrent clients, "
+        f"{os.cpu_count()} cores",
+        ["profile", "workload", "requests", "retried", "errors"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
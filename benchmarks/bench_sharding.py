@@ -0,0 +1,146 @@
+"""Mixed read/assign throughput: one store-wide lock vs. per-shard locks.
+
+Each worker loops over 90% get_case / 10% assign_expert through CaseService.
+Assignment holds the repository lock for the case across its read and save,
+and save sleeps ``--io-ms`` to model a persistence round trip: with a single
+lock every assignment queues behind every other, with shards only those
+landing in the same shard do.
+
+Async mode runs all workers as coroutines on one event loop. Thread-pool
+mode runs one event loop per thread, with thread locks in place of asyncio
+locks, as a multi-threaded host would; its unsharded baseline is a single
+shard, since the plain store's asyncio lock cannot span event loops.
+
+Usage: python -m benchmarks.bench_sharding [--workers 256] [--threads 32]
+                                            [--ops 200] [--io-ms 1]
+"""
+
+import argparse
+import asyncio
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
+
+from benchmarks._harness import print_table
+from exceptions import InvalidStateError
+from models import Case, CaseStatus
+from services.case_service import CaseService
+from utils.in_memory_repo import InMemoryCaseRepository
+from utils.sharded_repo import ShardedCaseRepository
+
+N_CASES = 200_000
+SHARD_COUNTS = (4, 16, 64)
+WRITE_RATIO = 0.1
+
+
+class _ThreadLock:
+    """threading.Lock behind the async context manager protocol."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+
+    async def __aenter__(self) -> None:
+        self._lock.acquire()
+
+    async def __aexit__(self, *exc) -> None:
+        self._lock.release()
+
+
+def _with_io(repo, io_delay: float):
+    """Make repo.save wait io_delay seconds before writing."""
+    save = repo.save
+
+    async def slow_save(case: Case) -> None:
+        await asyncio.sleep(io_delay)
+        await save(case)
+
+    repo.save = slow_save
+    return repo
+
+
+def _cases() -> list[Case]:
+    return [
+        Case.model_construct(
+            id=f"case-{i:07d}", referrer_id=f"ref-{i % 1000}",
+            expert_id=None, status=CaseStatus.SUBMITTED,
+        )
+        for i in range(N_CASES)
+    ]
+
+
+async def _worker(service: CaseService, ops: int, fresh: count, seed: int) -> None:
+    rng = random.Random(seed)
+    for _ in range(ops):
+        if rng.random() < WRITE_RATIO:
+            try:
+                await service.assign_expert(f"case-{next(fresh) % N_CASES:07d}", "exp-1")
+            except InvalidStateError:
+                pass
+        else:
+            await service.get_case(f"case-{rng.randrange(N_CASES):07d}")
+
+
+def _run_async(repo, workers: int, ops: int) -> float:
+    service = CaseService(case_repo=repo)
+    fresh = count()
+
+    async def main():
+        await asyncio.gather(*(_worker(service, ops, fresh, i) for i in range(workers)))
+
+    start = time.perf_counter()
+    asyncio.run(main())
+    return workers * ops / (time.perf_counter() - start)
+
+
+def _run_threads(repo, workers: int, ops: int) -> float:
+    service = CaseService(case_repo=repo)
+    fresh = count()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for future in [
+            pool.submit(asyncio.run, _worker(service, ops, fresh, i)) for i in range(workers)
+        ]:
+            future.result()
+    return workers * ops / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Compare throughput for each repository layout in both modes."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=256)
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--ops", type=int, default=200)
+    parser.add_argument("--io-ms", type=float, default=1.0)
+    args = parser.parse_args()
+    io = args.io_ms / 1000
+    cases = _cases()
+
+    def fresh_repo(build):
+        repo = build()
+        repo.seed([c.model_copy() for c in cases])
+        return _with_io(repo, io)
+
+    layouts = [("unsharded", InMemoryCaseRepository, lambda: ShardedCaseRepository(
+        1, lock_factory=_ThreadLock))]
+    for shards in SHARD_COUNTS:
+        layouts.append((
+            f"{shards} shards",
+            lambda n=shards: ShardedCaseRepository(n),
+            lambda n=shards: ShardedCaseRepository(n, lock_factory=_ThreadLock),
+        ))
+    rows = []
+    for label, build_async, build_threaded in layouts:
+        async_rate = _run_async(fresh_repo(build_async), args.workers, args.ops)
+        thread_rate = _run_threads(fresh_repo(build_threaded), args.threads, args.ops)
+        rows.append([label, f"{async_rate:,.0f}", f"{thread_rate:,.0f}"])
+    print_table(
+        f"{N_CASES:,} cases, {WRITE_RATIO:.0%} assigns, save I/O {args.io_ms} ms",
+        ["repository", f"async ops/s ({args.workers} tasks)", f"threads ops/s ({args.threads})"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""SLA deadlines: hierarchical timer wheel vs. a binary heap.
+
+One million deadlines are spread over 72 hours of one-second ticks, as
+SlaTracker schedules them. The heap baseline is heapq with lazy deletion:
+a reschedule pushes a new entry and stale entries are skipped on pop.
+The table reports the cost of scheduling every deadline, of rescheduling
+a tenth of them, and the per-tick cost of advancing through one hour,
+which fires roughly 14,000 deadlines. "entries" is what each structure
+still holds afterwards: the heap keeps stale entries until they surface.
+
+Usage: python -m benchmarks.bench_sla
+"""
+
+import heapq
+import random
+import time
+
+from benchmarks._harness import fmt_seconds, print_table
+from utils.timer_wheel import TimerWheel
+
+TIMERS, HORIZON, RESCHEDULED, HOUR = 1_000_000, 72 * 3600, 100_000, 3600
+
+
+class HeapTimers:
+    """The usual alternative: a heap of (tick, key), stale entries skipped."""
+
+    def __init__(self) -> None:
+        self.heap: list[tuple[int, int]] = []
+        self.current: dict[int, int] = {}
+
+    def schedule(self, key: int, tick: int) -> None:
+        self.current[key] = tick
+        heapq.heappush(self.heap, (tick, key))
+
+    def advance(self, to: int) -> list[tuple[int, int]]:
+        fired, heap, current = [], self.heap, self.current
+        while heap and heap[0][0] <= to:
+            tick, key = heapq.heappop(heap)
+            if current.get(key) == tick:
+                del current[key]
+                fired.append((key, tick))
+        return fired
+
+
+def _timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Schedule, reschedule and advance the same deadlines in both structures."""
+    rng = random.Random(7)
+    ticks = [rng.randrange(1, HORIZON) for _ in range(TIMERS)]
+    moves = [(rng.randrange(TIMERS), rng.randrange(1, HORIZON)) for _ in range(RESCHEDULED)]
+    rows = []
+    results = {}
+    for name, timers in [("timer wheel", TimerWheel()), ("heapq", HeapTimers())]:
+
+        def schedule_all(timers=timers):
+            for key, tick in enumerate(ticks):
+                timers.schedule(key, tick)
+
+        def reschedule(timers=timers):
+            for key, tick in moves:
+                timers.schedule(key, tick)
+
+        def advance_hour(timers=timers):
+            results[name] = sum(len(timers.advance(tick)) for tick in range(1, HOUR + 1))
+
+        scheduled = _timed(schedule_all)
+        rescheduled = _timed(reschedule)
+        advanced = _timed(advance_hour)
+        rows.append([
+            name,
+            fmt_seconds(scheduled / TIMERS),
+            fmt_seconds(rescheduled / RESCHEDULED),
+            fmt_seconds(advanced / HOUR),
+            f"{results[name]:,}",
+            f"{len(timers.heap) if isinstance(timers, HeapTimers) else len(timers):,}",
+        ])
+    assert len(set(results.values())) == 1
+    print_table(
+        f"{TIMERS:,} deadlines over 72 h of 1 s ticks",
+        ["structure", "schedule", "reschedule", "per tick (1 h)", "fired", "entries"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Cold start and lookup latency: memory-mapped snapshot vs. seeding in memory.
+
+"memory seed" is the time for InMemoryCaseRepository.seed() to index cases
+that are already built as Python objects, so it understates a real restart,
+which must also read and decode them. "snapshot open" is the time to map a
+snapshot file of the same cases. Lookups are random ids, half of them misses.
+
+Usage: python -m benchmarks.bench_snapshot [n_cases ...]
+"""
+
+import asyncio
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from benchmarks._harness import fmt_seconds, measure_async, print_table
+from models import Case, CaseStatus
+from utils.in_memory_repo import InMemoryCaseRepository
+from utils.snapshot_format import write_snapshot
+from utils.snapshot_repo import SnapshotCaseRepository
+
+EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+SIZES = (10_000, 100_000, 1_000_000)
+
+
+def _cases(n: int) -> list[Case]:
+    return [
+        Case(
+            id=f"case-{i:07d}",
+            referrer_id=f"ref-{i % 1000}",
+            expert_id=f"exp-{i % 100}" if i % 2 else None,
+            status=CaseStatus.SUBMITTED,
+            created_at=EPOCH + timedelta(minutes=i),
+        )
+        for i in range(n)
+    ]
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+async def _bench(n: int, directory: Path) -> list[str]:
+    cases = _cases(n)
+    path = str(directory / f"cases-{n}.snap")
+    _, write_time = _timed(lambda: write_snapshot(path, cases))
+
+    memory = InMemoryCaseRepository()
+    _, seed_time = _timed(lambda: memory.seed(cases))
+    snapshot, open_time = _timed(lambda: SnapshotCaseRepository(path))
+
+    rng = random.Random(41)
+    ids = [f"case-{rng.randrange(2 * n):07d}" for _ in range(10_000)]
+
+    def lookup(repo):
+        cycle = iter(ids * 100)
+
+        async def get():
+            await repo.get_by_id(next(cycle))
+        return get
+
+    memory_get = await measure_async(lookup(memory), number=10_000)
+    snapshot_get = await measure_async(lookup(snapshot), number=10_000)
+    search = await measure_async(
+        lambda: snapshot.search(referrer_id="ref-99*", limit=50), number=1_000
+    )
+    snapshot.close()
+    return [
+        f"{n:,}",
+        f"{Path(path).stat().st_size / 2**20:.1f} MiB",
+        fmt_seconds(write_time),
+        fmt_seconds(seed_time),
+        fmt_seconds(open_time),
+        fmt_seconds(memory_get),
+        fmt_seconds(snapshot_get),
+        fmt_seconds(search),
+    ]
+
+
+async def main() -> None:
+    """Write a snapshot per size, then compare startup and lookups."""
+    sizes = [int(arg) for arg in sys.argv[1:]] or SIZES
+    with tempfile.TemporaryDirectory() as directory:
+        rows = [await _bench(n, Path(directory)) for n in sizes]
+    print_table(
+        "cold start and lookups",
+        ["cases", "file", "write", "memory seed", "snapshot open",
+         "memory get", "snapshot get", "snapshot search"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
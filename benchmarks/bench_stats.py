@@ -0,0 +1,56 @@
+"""Reading incrementally maintained stats vs. recomputing them by scan.
+
+Usage: python -m benchmarks.bench_stats [n_cases]
+"""
+
+import asyncio
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+from benchmarks._harness import fmt_seconds, measure_async, print_table
+from models import Case, CaseStatus
+from utils.in_memory_repo import InMemoryCaseRepository
+
+STATUSES = list(CaseStatus)
+EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _cases(n: int) -> list[Case]:
+    return [
+        Case.model_construct(
+            id=f"case-{i:07d}",
+            referrer_id=f"ref-{i % 10_000}",
+            expert_id=f"exp-{i % 1000}" if i % 2 else None,
+            status=STATUSES[i % len(STATUSES)],
+            created_at=EPOCH + timedelta(minutes=i),
+        )
+        for i in range(n)
+    ]
+
+
+async def main(n: int) -> None:
+    """Seed n cases, then time a cached read, a read after a write, and a rebuild."""
+    repo = InMemoryCaseRepository()
+    cases = _cases(n)
+    start = time.perf_counter()
+    repo.seed(cases)
+    print(f"seed + index + stats for {n:,} cases: {time.perf_counter() - start:.2f}s")
+
+    case = cases[0]
+
+    async def read_after_write():
+        case.status = CaseStatus.COMPLETED if case.status != CaseStatus.COMPLETED else CaseStatus.DRAFT
+        await repo.save(case)
+        await repo.stats()
+
+    rows = [
+        ["stats (cached)", fmt_seconds(await measure_async(repo.stats, number=1000))],
+        ["save + stats", fmt_seconds(await measure_async(read_after_write, number=200))],
+        ["rebuild_stats (full scan)", fmt_seconds(await measure_async(repo.rebuild_stats, number=3))],
+    ]
+    print_table(f"case statistics, {n:,} cases", ["operation", "time"], rows)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000))
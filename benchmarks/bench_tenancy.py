@@ -0,0 +1,140 @@
+"""Noisy-neighbour isolation: one shared store vs. per-tenant partitions.
+
+Two scenarios run against an app with one shared store and against one
+with tenancy enabled. In both, the quiet tenant's traffic is identical and
+the noisy tenant's traffic is identical.
+
+Cache: the quiet tenant warms 200 hot cases. The noisy tenant then bulk
+imports and reads 10,000 cases through an LRU of 2,000. Finally the quiet
+tenant re-reads its hot set, and the table reports its cache hit ratio.
+
+Requests: the noisy tenant fires 2,000 concurrent requests at an endpoint
+that holds a slot for 5 ms, standing in for backend I/O. Meanwhile the
+quiet tenant sends 50 sequential requests. The table reports what each
+tenant was served and the quiet tenant's latency.
+
+Usage: python -m benchmarks.bench_tenancy
+"""
+
+import asyncio
+import time
+
+from fastapi import APIRouter
+from httpx import ASGITransport, AsyncClient
+
+from benchmarks._harness import fmt_seconds, percentile, print_table
+from config import Settings
+from main import create_app
+from models import Case, CaseStatus
+
+HOT, BULK, CACHE = 200, 10_000, 2_000
+FLOOD, QUIET_REQUESTS, IO_SECONDS = 2_000, 50, 0.005
+
+
+def _app(tenancy: bool):
+    settings = Settings(
+        tenancy_enabled=tenancy,
+        repo_cache=f"lru:{CACHE}",
+        repo_metrics=False,
+        repo_seed_demo=False,
+        rate_limit_enabled=False,
+        tracing_enabled=False,
+        contract_validation_rate=0,
+        load_shedding_max_concurrency=64,
+        load_shedding_max_queue=256,
+        tenant_max_concurrency=16,
+        tenant_rate_per_second=1_000,
+        tenant_burst=1_000,
+    )
+    app = create_app(settings)
+    router = APIRouter(prefix=settings.api_prefix)
+
+    @router.get("/bench/io")
+    async def io() -> dict:
+        await asyncio.sleep(IO_SECONDS)
+        return {"ok": True}
+
+    app.include_router(router)
+    return app
+
+
+def _repo(app, tenant: str):
+    tenants = app.state.tenants
+    return app.state.repo if tenants is None else tenants.get(tenant).repo
+
+
+def _cases(prefix: str, n: int) -> list[Case]:
+    return [
+        Case(id=f"{prefix}-{i:05d}", referrer_id=f"ref-{prefix}", status=CaseStatus.SUBMITTED)
+        for i in range(n)
+    ]
+
+
+async def _cache_row(label: str, tenancy: bool) -> list[str]:
+    app = _app(tenancy)
+    quiet, noisy = _repo(app, "quiet"), _repo(app, "noisy")
+    quiet.seed(_cases("hot", HOT))
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        async def read(tenant: str, ids) -> None:
+            for case_id in ids:
+                await client.get(f"/api/v1/cases/{case_id}", headers={"X-Tenant-ID": tenant})
+
+        hot_ids = [c.id for c in _cases("hot", HOT)]
+        await read("quiet", hot_ids)
+        bulk = _cases("bulk", BULK)
+        noisy.seed(bulk)
+        await read("noisy", [c.id for c in bulk])
+        hits = app.state.metrics.counter("repo_cache_hits_total", "")
+        labels = {"tenant": "quiet"} if tenancy else {}
+        before = hits.value(**labels)
+        await read("quiet", hot_ids)
+        ratio = (hits.value(**labels) - before) / HOT
+    return [label, f"{ratio:.0%}"]
+
+
+async def _request_row(label: str, tenancy: bool) -> list[str]:
+    app = _app(tenancy)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        async def noisy_flood() -> list[int]:
+            responses = await asyncio.gather(*(
+                client.get("/api/v1/bench/io", headers={"X-Tenant-ID": "noisy"})
+                for _ in range(FLOOD)
+            ))
+            return [r.status_code for r in responses]
+
+        async def quiet_trickle() -> list[tuple[int, float]]:
+            await asyncio.sleep(0.01)
+            results = []
+            for _ in range(QUIET_REQUESTS):
+                start = time.perf_counter()
+                response = await client.get("/api/v1/bench/io", headers={"X-Tenant-ID": "quiet"})
+                results.append((response.status_code, time.perf_counter() - start))
+            return results
+
+        noisy, quiet = await asyncio.gather(noisy_flood(), quiet_trickle())
+    ok = [took for status, took in quiet if status == 200]
+    return [
+        label,
+        f"{noisy.count(200)}/{FLOOD}",
+        f"{len(ok)}/{QUIET_REQUESTS}",
+        fmt_seconds(percentile(ok, 50)) if ok else "-",
+        fmt_seconds(percentile(ok, 99)) if ok else "-",
+    ]
+
+
+async def main() -> None:
+    """Compare the quiet tenant's cache hits and latency, shared vs. partitioned."""
+    print_table(
+        f"quiet tenant's hot-set hit ratio after a {BULK:,}-case noisy import (LRU {CACHE:,})",
+        ["store", "hit ratio"],
+        [await _cache_row("shared", False), await _cache_row("per-tenant", True)],
+    )
+    print_table(
+        f"{FLOOD:,} concurrent noisy requests vs. {QUIET_REQUESTS} sequential quiet ones",
+        ["store", "noisy served", "quiet served", "quiet p50", "quiet p99"],
+        [await _request_row("shared", False), await _request_row("per-tenant", True)],
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
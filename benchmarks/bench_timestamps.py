@@ -0,0 +1,95 @@
+"""Case timestamp representations: seed and serialize cost.
+
+Compares the previous naive ``datetime.utcnow`` field, the current aware
+UTC field used by ``models.Case``, and an epoch-microsecond ``int`` with a
+cached ISO-8601 serializer.
+
+Usage: python -m benchmarks.bench_timestamps [n_cases]
+"""
+
+import gc
+import sys
+import time
+import warnings
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Annotated, Optional
+
+from pydantic import BaseModel, Field, PlainSerializer
+
+from benchmarks._harness import print_table
+from models import Case, CaseStatus
+from utils.in_memory_repo import InMemoryCaseRepository
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+@lru_cache(maxsize=4096)
+def _second(seconds: int) -> str:
+    return (_EPOCH + timedelta(seconds=seconds)).isoformat()
+
+
+def _micros_iso(value: int) -> str:
+    seconds, fraction = divmod(value, 1_000_000)
+    return _second(seconds) + "." + str(fraction + 1_000_000)[1:] + "Z"
+
+
+class _NaiveCase(BaseModel):
+    id: str
+    referrer_id: str
+    expert_id: Optional[str] = None
+    status: CaseStatus = CaseStatus.DRAFT
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class _EpochMicrosCase(_NaiveCase):
+    created_at: Annotated[int, PlainSerializer(_micros_iso, when_used="json")] = Field(
+        default_factory=lambda: time.time_ns() // 1000
+    )
+
+
+def _timed(fn) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def _run(model: type[BaseModel], n: int, seed_repo: bool = True) -> list[str]:
+    gc.collect()
+    build, cases = _timed(lambda: [
+        model(id=f"case-{i:07d}", referrer_id=f"ref-{i % 10_000}", status=CaseStatus.SUBMITTED)
+        for i in range(n)
+    ])
+    seed = _timed(lambda: InMemoryCaseRepository().seed(cases))[0] if seed_repo else None
+    dump, _ = _timed(lambda: [c.model_dump_json() for c in cases])
+    field_bytes = sys.getsizeof(cases[0].created_at)
+    seeded = f"{seed:.2f}s" if seed is not None else "-"
+    return [f"{build:.2f}s", seeded, f"{dump:.2f}s", f"{field_bytes} B"]
+
+
+def main(n: int) -> None:
+    """Construct, seed and serialize n cases with each representation.
+
+    The cyclic GC is paused so collections triggered by earlier runs do not
+    land in later ones.
+    """
+    gc.disable()
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            before = _run(_NaiveCase, n)
+        after = _run(Case, n)
+        # Plain ints lack the datetime API the repository's stats rely on.
+        micros = _run(_EpochMicrosCase, n, seed_repo=False)
+    finally:
+        gc.enable()
+    print_table(
+        f"{n:,} cases",
+        ["created_at", "construct", "repo.seed", "model_dump_json", "field size"],
+        [["naive utcnow (before)", *before], ["aware UTC (after)", *after],
+         ["epoch micros + cached ISO", *micros]],
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
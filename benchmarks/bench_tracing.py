@@ -0,0 +1,112 @@
+"""Per-span tracing overhead, and its share of a full request.
+
+Micro-benchmarks time a span entered and exited inside an active trace
+(exported to the ring buffer), the no-op path outside a trace, a traced
+coroutine call against a plain one, and traceparent handling. The last
+table compares an in-process GET and assignment with tracing on and off,
+alternating between the two apps so machine noise affects both equally.
+
+Usage: python -m benchmarks.bench_tracing
+"""
+
+import asyncio
+from contextlib import AsyncExitStack
+
+from httpx import ASGITransport, AsyncClient
+
+from benchmarks._harness import fmt_seconds, measure, measure_async, print_table
+from config import Settings
+from main import create_app
+from models import CaseStatus
+from utils.trace_exporters import RingBufferExporter
+from utils.tracing import Traced, Tracer, parse_traceparent, start_span
+
+TRACEPARENT = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+
+
+class _Repo:
+    async def get(self, key):
+        return key
+
+
+def _span() -> None:
+    with start_span("op"):
+        pass
+
+
+async def _micro() -> list[list[str]]:
+    tracer = Tracer([RingBufferExporter(4096)])
+    repo, proxy = _Repo(), Traced(_Repo(), "Repo")
+
+    async def plain_call():
+        await repo.get(1)
+
+    async def traced_call():
+        await proxy.get(1)
+
+    rows = [["start_span outside a trace", fmt_seconds(measure(_span, number=100_000))]]
+    with tracer.start_trace("bench") as root:
+        rows.append(["span inside a trace", fmt_seconds(measure(_span, number=100_000))])
+        plain = await measure_async(plain_call, number=100_000)
+        wrapped = await measure_async(traced_call, number=100_000)
+        rows.append(["Traced method call - plain call", fmt_seconds(wrapped - plain)])
+    rows.append(["parse_traceparent", fmt_seconds(measure(
+        lambda: parse_traceparent(TRACEPARENT), number=100_000))])
+    rows.append(["format traceparent", fmt_seconds(measure(
+        lambda: root.traceparent, number=100_000))])
+    return rows
+
+
+async def _request_latency(rounds: int = 7) -> list[list[str]]:
+    """Alternate between apps with tracing off and on, keeping each one's best."""
+    apps = {
+        enabled: create_app(Settings(tracing_enabled=enabled, rate_limit_enabled=False))
+        for enabled in (False, True)
+    }
+    best = {(enabled, op): float("inf") for enabled in apps for op in ("get", "assign")}
+    async with AsyncExitStack() as stack:
+        clients = {}
+        for enabled, app in apps.items():
+            await stack.enter_async_context(app.router.lifespan_context(app))
+            clients[enabled] = await stack.enter_async_context(AsyncClient(
+                transport=ASGITransport(app=app), base_url="http://bench"
+            ))
+        for _ in range(rounds):
+            for enabled, app in apps.items():
+                client = clients[enabled]
+
+                async def get():
+                    await client.get(
+                        "/api/v1/cases/case-002", headers={"traceparent": TRACEPARENT}
+                    )
+
+                async def assign():
+                    case = await app.state.repo.get_by_id("case-001")
+                    case.status, case.expert_id = CaseStatus.SUBMITTED, None
+                    await app.state.experts.release("exp-200")
+                    await client.post(
+                        "/api/v1/cases/case-001/assign", json={"expert_id": "exp-200"}
+                    )
+
+                for op, fn in (("get", get), ("assign", assign)):
+                    took = await measure_async(fn, number=200, repeat=1)
+                    best[enabled, op] = min(best[enabled, op], took)
+    return [
+        [label, fmt_seconds(best[False, op]), fmt_seconds(best[True, op]),
+         fmt_seconds(best[True, op] - best[False, op])]
+        for label, op in (("GET case (3 spans)", "get"), ("assign (7 spans)", "assign"))
+    ]
+
+
+async def main() -> None:
+    """Print per-span costs and request latency with tracing on and off."""
+    print_table("per-operation overhead", ["operation", "time"], await _micro())
+    print_table(
+        "in-process request latency (best of 7 interleaved rounds)",
+        ["request", "tracing off", "tracing on", "delta"],
+        await _request_latency(),
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
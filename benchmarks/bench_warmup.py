@@ -0,0 +1,74 @@
+"""First-request latency after startup, with and without warm-up.
+
+Each sample runs in a fresh interpreter so import and lazy-initialization
+costs are real. The child starts the app's lifespan, waits for /readyz to
+settle, then times the first GET of a case, the first assignment and a
+subsequent (warm) GET.
+
+Usage: python -m benchmarks.bench_warmup [runs]
+"""
+
+import asyncio
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks._harness import fmt_seconds, print_table
+
+
+async def _child(warmup: bool) -> dict:
+    from httpx import ASGITransport, AsyncClient
+
+    from config import Settings
+    from main import create_app
+
+    app = create_app(Settings(warmup_enabled=warmup, rate_limit_enabled=False))
+    timings = {}
+    async with app.router.lifespan_context(app):
+        start = time.perf_counter()
+        while app.state.readiness.status in ("starting", "warming"):
+            await asyncio.sleep(0.001)
+        timings["until ready"] = time.perf_counter() - start
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://bench") as client:
+            for label, call in [
+                ("first GET", lambda: client.get("/api/v1/cases/case-002")),
+                ("first assign", lambda: client.post(
+                    "/api/v1/cases/case-001/assign", json={"expert_id": "exp-200"})),
+                ("warm GET", lambda: client.get("/api/v1/cases/case-002")),
+            ]:
+                start = time.perf_counter()
+                await call()
+                timings[label] = time.perf_counter() - start
+    return timings
+
+
+def _sample(warmup: bool) -> dict:
+    out = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_warmup", "--child", str(int(warmup))],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(out)
+
+
+def main(runs: int) -> None:
+    """Collect samples for both modes and print medians."""
+    results = {mode: [_sample(mode) for _ in range(runs)] for mode in (False, True)}
+    labels = list(results[False][0])
+    rows = [
+        [label] + [
+            fmt_seconds(statistics.median(s[label] for s in results[mode]))
+            for mode in (False, True)
+        ]
+        for label in labels
+    ]
+    print_table(f"median of {runs} cold starts", ["", "no warm-up", "warm-up"], rows)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "--child":
+        print(json.dumps(asyncio.run(_child(sys.argv[2] == "1"))))
+    else:
+        main(int(sys.argv[1]) if len(sys.argv) > 1 else 7)
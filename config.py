@@ -1,7 +1,14 @@
 """Application configuration for MEDirect Edge."""
 
+import os
+import typing
+from pathlib import Path
+from typing import Mapping
+
 from pydantic import BaseModel
 
+ENV_PREFIX = "MEDIRECT_"
+
 
 class Settings(BaseModel):
     """Application settings with sensible defaults."""
@@ -11,3 +18,209 @@ class Settings(BaseModel):
     debug: bool = False
     host: str = "0.0.0.0"
     port: int = 8000
+
+    # HTTP server run by ``python main.py``. server_profile "dev" is one
+    # uvicorn process with its defaults. "production" uses uvloop and
+    # httptools when installed, keeps idle connections open for
+    # server_keepalive_seconds (longer than a load balancer's idle timeout,
+    # so the balancer closes them first), queues up to server_backlog
+    # unaccepted connections and answers 503 past server_limit_concurrency
+    # open connections (0: no limit). Its server_workers processes (0: one
+    # per core) run under a supervisor. A worker that has served
+    # server_max_requests requests (plus up to server_max_requests_jitter,
+    # so workers do not recycle together; 0 never) is replaced. SIGHUP
+    # replaces every worker in turn, each old one finishing its in-flight
+    # requests within server_graceful_timeout seconds. Workers do not share
+    # memory, so several or recycled workers need the "sqlite" case and
+    # idempotency backends, with tenancy, SLA tracking and repo_seed_demo
+    # off; other per-worker state is listed in api/server.py. A reload,
+    # like a restart, starts in-memory state afresh.
+    # uvicorn speaks HTTP/1.1; terminate HTTP/2 at the proxy in front.
+    server_profile: str = "dev"
+    server_workers: int = 1
+    server_backlog: int = 4096
+    server_keepalive_seconds: int = 75
+    server_limit_concurrency: int = 0
+    server_max_requests: int = 0
+    server_max_requests_jitter: int = 0
+    server_graceful_timeout: int = 30
+
+    # Response encoding: "auto" picks orjson when installed, else stdlib json.
+    json_encoder: str = "auto"
+
+    # Response compression
+    compression_enabled: bool = True
+    compression_minimum_size: int = 1024
+    compression_encodings: tuple[str, ...] = ("br", "gzip")
+    compression_gzip_level: int = 6
+    compression_brotli_quality: int = 4
+
+    # Per-client token-bucket rate limiting (keyed by X-API-Key, else peer address)
+    rate_limit_enabled: bool = True
+    rate_limit_per_second: float = 50.0
+    rate_limit_burst: float = 100.0
+    rate_limit_max_clients: int = 10_000
+
+    # Adaptive (CoDel-style) concurrency limiting with 503 load shedding
+    load_shedding_enabled: bool = True
+    load_shedding_max_concurrency: int = 256
+    load_shedding_target_delay: float = 0.01
+    load_shedding_interval: float = 0.1
+    load_shedding_max_queue: int = 1024
+
+    # Idempotency-Key support: "memory" or "sqlite"
+    idempotency_backend: str = "memory"
+    idempotency_ttl_seconds: float = 24 * 60 * 60
+    idempotency_max_entries: int = 100_000
+    idempotency_sqlite_path: str = "idempotency.db"
+
+    # Background job queue for post-assignment side effects
+    job_queue_capacity: int = 10_000
+    job_workers: int = 4
+    job_max_attempts: int = 5
+    job_retry_base_delay: float = 0.1
+    job_retry_max_delay: float = 5.0
+    job_drain_timeout: float = 10.0
+
+    # Change feed (SSE) of case updates
+    change_feed_history: int = 10_000
+    change_feed_buffer: int = 256
+    change_feed_heartbeat_seconds: float = 15.0
+
+    # Case repository, built once at startup as metrics → cache → batching
+    # → backend.
+    # repo_backend: "memory", "sharded" (repo_shards hash partitions with
+    # independent locks and indexes), "sqlite" (repo_sqlite_path) or
+    # "snapshot" (read-only memory-mapped repo_snapshot_path plus an
+    # in-memory write overlay).
+    # repo_cache: "off" or "lru:<max entries>".
+    # repo_batching coalesces the get_by_id calls of one event-loop tick
+    # into a single get_many of at most repo_batch_max_ids distinct ids;
+    # it pays off for backends with a per-call cost, such as "sqlite".
+    # repo_seed_demo adds two demo cases and three demo experts. Unset, it
+    # seeds only stores that start empty in every process ("memory" and
+    # "sharded"); demo experts are always kept in memory and seeded.
+    repo_backend: str = "memory"
+    repo_shards: int = 16
+    repo_sqlite_path: str = "cases.db"
+    repo_snapshot_path: str = "cases.snap"
+    repo_cache: str = "off"
+    repo_batching: bool = False
+    repo_batch_max_ids: int = 256
+    repo_metrics: bool = False
+    repo_seed_demo: bool | None = None
+
+    # Read replicas. With repo_replica_of set to a primary's base URL, this
+    # process is a read-only replica: it keeps an in-memory copy of the
+    # primary's cases in place of repo_backend, fed from the primary's
+    # /api/v1/cases:watch stream, and answers writes with 409. Every API
+    # response carries the position of the data it saw in
+    # consistency_header. A request sending that token back is answered
+    # only from data at least as new, waiting up to repo_replica_max_wait
+    # seconds before a 503. A replica starts from a full copy of the
+    # primary (GET /api/v1/cases:snapshot, read in pages of
+    # repo_replica_page_size) and copies it again after a gap
+    # the primary cannot replay, or when the primary restarted, seen by a
+    # new feed epoch; until its first copy, reads are 503s. Positions
+    # restart with the primary, so tokens issued before a restart may
+    # wait for positions the new primary has not reached. Tenancy and
+    # repo_cache are not supported on replicas. The copy is served only to
+    # requests carrying repo_replication_token, which primary and replicas
+    # must share; without one the primary serves no copy.
+    repo_replica_of: str = ""
+    repo_replica_max_wait: float = 0.5
+    repo_replica_page_size: int = 1000
+    repo_replication_token: str = ""
+    consistency_header: str = "x-consistency-token"
+
+    # Multi-tenancy. The tenant_header selects an isolated partition per
+    # tenant: its own repository (with its own repo_cache), change feed and
+    # case quota (tenant_max_cases), built on first use. Requests without
+    # the header belong to tenant_default. Each tenant also gets its own
+    # token bucket (tenant_rate_per_second, tenant_burst) and at most
+    # tenant_max_concurrency requests in flight. tenant_allowed restricts
+    # the ids accepted; empty accepts any, up to tenant_max_tenants.
+    # Requires an in-process backend ("memory" or "sharded").
+    tenancy_enabled: bool = False
+    tenant_header: str = "x-tenant-id"
+    tenant_default: str = "default"
+    tenant_allowed: tuple[str, ...] = ()
+    tenant_max_tenants: int = 1000
+    tenant_max_cases: int = 100_000
+    tenant_rate_per_second: float = 200.0
+    tenant_burst: float = 400.0
+    tenant_max_concurrency: int = 64
+
+    # SLA deadlines. A case entering or seeded in the submitted status is
+    # due sla_submitted_hours later, and one entering the assigned status
+    # sla_assigned_hours later (0 sets no deadline). Deadlines are stored
+    # with the cases and tracked again on startup. They are checked every
+    # sla_tick_seconds; missed ones are counted in sla_escalations_total
+    # and listed by GET /api/v1/cases:overdue.
+    sla_enabled: bool = True
+    sla_tick_seconds: float = 1.0
+    sla_submitted_hours: float = 24.0
+    sla_assigned_hours: float = 72.0
+
+    # Request tracing. Spans of recent requests are kept in a ring buffer
+    # (GET /debug/traces); with tracing_otlp_path set they are also appended
+    # to that file as OTLP/JSON. Off by default: the debug endpoint is not
+    # authenticated and spans carry case and expert ids.
+    tracing_enabled: bool = False
+    tracing_buffer_spans: int = 2048
+    tracing_otlp_path: str = ""
+
+    # Contract validation. contract_validation_rate of API responses are
+    # checked against contracts_dir/*.yaml after being sent (0 disables);
+    # violations are counted in metrics and listed at /debug/contracts.
+    # Bodies over contract_validation_max_body_bytes are not checked. Off
+    # by default: the debug endpoint is not authenticated and violations
+    # may quote response values.
+    contracts_dir: str = str(Path(__file__).parent / "contracts")
+    contract_validation_rate: float = 0.0
+    contract_validation_max_body_bytes: int = 65_536
+
+    # Structured JSON-lines logs, queued without blocking and written in
+    # batches by a background thread, rotated at log_max_bytes keeping
+    # log_backup_count old files. access_log_path records
+    # access_log_sample_rate of API requests plus every 5xx; audit_log_path
+    # records every case assignment. An empty path disables that log. Records
+    # arriving while log_queue_size are waiting are dropped and counted.
+    access_log_path: str = ""
+    access_log_sample_rate: float = 1.0
+    audit_log_path: str = ""
+    log_queue_size: int = 10_000
+    log_batch_size: int = 512
+    log_max_bytes: int = 50 * 1024 * 1024
+    log_backup_count: int = 5
+
+    # Startup warm-up, run in the background; /readyz reports 503 until done.
+    # warmup_requests are GET paths replayed through the full app.
+    warmup_enabled: bool = True
+    warmup_hot_ids: tuple[str, ...] = ()
+    warmup_requests: tuple[str, ...] = ("/api/v1/cases:stats",)
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] | None = None) -> "Settings":
+        """Build settings from ``MEDIRECT_<FIELD>`` environment variables.
+
+        Unset fields keep their defaults; tuple fields are comma-separated,
+        e.g. ``MEDIRECT_REPO_BACKEND=sqlite MEDIRECT_REPO_CACHE=lru:10000``.
+
+        Args:
+            environ: Variables to read. Defaults to os.environ.
+
+        Returns:
+            Validated Settings.
+        """
+        environ = os.environ if environ is None else environ
+        values: dict[str, object] = {}
+        for name, field in cls.model_fields.items():
+            raw = environ.get(ENV_PREFIX + name.upper())
+            if raw is None:
+                continue
+            if typing.get_origin(field.annotation) is tuple:
+                values[name] = tuple(item.strip() for item in raw.split(",") if item.strip())
+            else:
+                values[name] = raw
+        return cls.model_validate(values)
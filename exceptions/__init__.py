@@ -26,4 +26,19 @@ class InvalidStateError(MEDirectError):
 
 class ExternalServiceError(MEDirectError):
     """Raised when an external service call fails."""
-    pass
\ No newline at end of file
+    pass
+
+
+class ContractViolation(MEDirectError):
+    """Raised when a document does not match its OpenAPI contract."""
+    pass
+
+
+class QuotaExceededError(MEDirectError):
+    """Raised when a tenant would exceed one of its quotas."""
+    pass
+
+
+class ReplicaLagError(MEDirectError):
+    """Raised when a read replica has not caught up with a read's position."""
+    pass
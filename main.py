@@ -1,38 +1,158 @@
 """MEDirect Edge — application entry point."""
 
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 
+from api.access_log import build_structured_logs
 from api.case_routes import router as case_router
+from api.dependencies import (
+    build_assignment_side_effects,
+    build_change_feed,
+    build_contract_monitor,
+    build_expert_repository,
+    build_repository,
+    build_tracer,
+)
 from api.error_handlers import register_error_handlers
+from api.expert_routes import router as expert_router
+from api.feed_routes import router as feed_router
+from api.idempotency import build_idempotency_store
+from api.middleware import install_middleware
+from api.ops_routes import router as ops_router
+from api.replication import build_feed_follower, build_replica
+from api.responses import make_response_class
+from api.sla import build_sla_tracker, restore_deadlines, run_sla_ticker
+from api.tenancy import build_tenant_registry
+from api.warmup import Readiness, warm_up
 from config import Settings
+from utils.idempotency import IdempotencyCoordinator
+from utils.json_codec import get_json_encoder
+from utils.metrics import MetricsRegistry
+from utils.sla import SlaTracker
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Start logs, workers, warm-up, the SLA ticker and the replica's feed
+    follower; drain them on shutdown.
+
+    Warm-up runs in the background so liveness probes are answered while it
+    is in progress; readiness flips once it completes.
+    """
+    settings: Settings = app.state.settings
+    readiness: Readiness = app.state.readiness
+    for log in app.state.logs.values():
+        log.start()
+    app.state.side_effects.jobs.start()
+    ticker = None
+    if app.state.sla is not None:
+        if app.state.replica is None:
+            await restore_deadlines(app.state.sla, app.state.repo)
+        ticker = asyncio.create_task(
+            run_sla_ticker(lambda: _sla_trackers(app), settings.sla_tick_seconds)
+        )
+    follower = None
+    if app.state.follower is not None:
+        follower = asyncio.create_task(app.state.follower.run())
+    warmup = None
+    if settings.warmup_enabled:
+        warmup = asyncio.create_task(warm_up(app))
+    else:
+        readiness.mark_ready()
+    try:
+        yield
+    finally:
+        readiness.mark_stopping()
+        if warmup is not None and not warmup.done():
+            warmup.cancel()
+        if ticker is not None:
+            ticker.cancel()
+        if follower is not None:
+            follower.cancel()
+            await asyncio.gather(follower, return_exceptions=True)
+        await app.state.side_effects.jobs.drain(settings.job_drain_timeout)
+        for log in app.state.logs.values():
+            await asyncio.to_thread(log.close)
+        app.state.tracer.close()
+
+
+def _sla_trackers(app: FastAPI) -> list[SlaTracker]:
+    if app.state.tenants is None:
+        return [app.state.sla]
+    return [p.deadlines for p in app.state.tenants.partitions() if p.deadlines is not None]
 
 
 def create_app(settings: Settings | None = None) -> FastAPI:
     """Create and configure the FastAPI application.
 
     Args:
-        settings: Optional Settings override. Defaults to standard settings.
+        settings: Optional Settings override. Defaults to settings read
+            from MEDIRECT_* environment variables.
 
     Returns:
         A configured FastAPI application.
     """
     if settings is None:
-        settings = Settings()
+        settings = Settings.from_env()
 
+    encoder = get_json_encoder(settings.json_encoder)
     app = FastAPI(
         title=settings.app_name,
         debug=settings.debug,
+        lifespan=_lifespan,
+        default_response_class=make_response_class(encoder),
+    )
+
+    app.state.settings = settings
+    app.state.metrics = MetricsRegistry()
+    app.state.tracer = build_tracer(settings)
+    app.state.contracts = build_contract_monitor(settings, app.state.metrics)
+    app.state.change_feed = build_change_feed(settings)
+    app.state.replica = build_replica(settings, app.state.metrics, app.state.change_feed)
+    app.state.follower = build_feed_follower(settings, app.state.metrics, app.state.replica)
+    app.state.repo = build_repository(
+        settings, app.state.metrics, app.state.change_feed, app.state.replica
+    )
+    app.state.sla = build_sla_tracker(
+        settings, app.state.metrics, settings.tenant_default if settings.tenancy_enabled else None
+    )
+    app.state.tenants = build_tenant_registry(
+        settings, app.state.metrics, app.state.repo, app.state.change_feed, app.state.sla
+    )
+    app.state.experts = build_expert_repository(settings)
+    app.state.idempotency = IdempotencyCoordinator(build_idempotency_store(settings))
+    app.state.logs = build_structured_logs(settings, app.state.metrics)
+    app.state.side_effects = build_assignment_side_effects(
+        settings, app.state.metrics, app.state.logs.get("audit")
+    )
+    app.state.readiness = Readiness()
+    app.state.metrics.gauge("app_ready", "1 once warm-up has finished").set_function(
+        lambda: float(app.state.readiness.ready)
     )
 
     app.include_router(case_router)
-    register_error_handlers(app)
+    app.include_router(expert_router)
+    app.include_router(feed_router)
+    app.include_router(ops_router)
+    register_error_handlers(app, encoder)
+    install_middleware(
+        app,
+        settings,
+        app.state.metrics,
+        app.state.tracer,
+        app.state.contracts,
+        app.state.tenants,
+        app.state.logs.get("access"),
+        app.state.replica,
+    )
 
     return app
 
 
 if __name__ == "__main__":
-    import uvicorn
+    from api.server import serve
 
-    _settings = Settings()
-    _app = create_app(_settings)
-    uvicorn.run(_app, host=_settings.host, port=_settings.port)
+    serve(Settings.from_env())
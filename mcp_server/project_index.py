@@ -0,0 +1,208 @@
+"""In-memory index of the project, built once and kept fresh by polling.
+
+Tools answer from the index instead of the disk. For every Python file it
+holds the file's layer, the modules it imports and its line count, and it
+holds the text of every contract. A refresh stats every file and re-reads
+only the files whose size or mtime changed, so polling an unchanged tree
+costs one stat per file. Each refresh publishes a new immutable
+IndexSnapshot, so readers never see a half-updated index, even though
+refreshes run in a worker thread.
+"""
+
+import ast
+import asyncio
+import logging
+import os
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+LAYERS = ("services", "models", "schemas", "exceptions", "utils", "api", "tests")
+MAX_FILE_LINES = 300
+
+_SKIP_DIRS = {".git", "__pycache__", ".venv", "venv", ".pytest_cache", "node_modules"}
+
+
+def get_layer(path: str) -> str:
+    """Determine which architectural layer a file belongs to."""
+    parts = Path(path).parts
+    if not parts:
+        return "unknown"
+    first = parts[0]
+    if first in LAYERS:
+        return first
+    return "unknown"
+
+
+class ModuleInfo:
+    """What the index knows about one Python file."""
+
+    __slots__ = ("path", "layer", "imports", "lines", "stamp")
+
+    def __init__(
+        self, path: str, imports: tuple[str, ...], lines: int, stamp: tuple[int, int]
+    ) -> None:
+        self.path = path
+        self.layer = get_layer(path)
+        self.imports = imports
+        self.lines = lines
+        self.stamp = stamp
+
+
+def parse_imports(path: str, source: str) -> tuple[str, ...]:
+    """List the modules a file imports, with relative imports made absolute.
+
+    Args:
+        path: File path relative to the project root, e.g. ``api/main.py``.
+        source: The file's source code.
+
+    Returns:
+        Imported module names in source order; empty if it does not parse.
+    """
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return ()
+    package = Path(path).parent.parts
+    found: list[str] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            found += [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            base = package[:len(package) - node.level + 1] if node.level else ()
+            name = ".".join((*base, node.module) if node.module else base)
+            if name:
+                found.append(name)
+    return tuple(dict.fromkeys(found))
+
+
+class IndexSnapshot:
+    """An immutable view of the project at one refresh."""
+
+    def __init__(
+        self, generation: int, modules: dict[str, ModuleInfo], contracts: dict[str, str]
+    ) -> None:
+        self.generation = generation
+        self.modules = modules
+        self.contracts = contracts
+        self.by_layer: dict[str, list[ModuleInfo]] = {}
+        for info in sorted(modules.values(), key=lambda m: m.path):
+            self.by_layer.setdefault(info.layer, []).append(info)
+        # Tool answers derived from this snapshot, memoized by the tools.
+        self.memo: dict[tuple, str] = {}
+
+
+class ProjectIndex:
+    """The project's files, imports, line counts and contracts, in memory."""
+
+    def __init__(self, root: Path, poll_interval: float = 1.0) -> None:
+        """Create an empty index; call start() or refresh() to fill it.
+
+        Args:
+            root: Project root directory.
+            poll_interval: Seconds between polls for changed files.
+        """
+        self.root = root
+        self.poll_interval = poll_interval
+        self.snapshot = IndexSnapshot(0, {}, {})
+        self._contract_stamps: dict[str, tuple[int, int]] = {}
+        self._ready = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def refresh(self) -> int:
+        """Rescan the tree, re-reading only changed files.
+
+        Returns:
+            Number of files added, changed or removed; a new snapshot is
+            published only when it is non-zero.
+        """
+        old = self.snapshot
+        modules: dict[str, ModuleInfo] = {}
+        changed = 0
+        for rel, stamp in self._walk():
+            info = old.modules.get(rel)
+            if info is None or info.stamp != stamp:
+                source = (self.root / rel).read_text(errors="replace")
+                info = ModuleInfo(rel, parse_imports(rel, source), len(source.splitlines()), stamp)
+                changed += 1
+            modules[rel] = info
+        changed += len(old.modules.keys() - modules.keys())
+        contracts, contracts_changed = self._scan_contracts(old.contracts)
+        changed += contracts_changed
+        if changed or not old.generation:
+            self.snapshot = IndexSnapshot(old.generation + 1, modules, contracts)
+        return changed
+
+    async def start(self) -> None:
+        """Build the index and keep it fresh in a background task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop polling."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def ready(self) -> IndexSnapshot:
+        """Wait for the first build, starting it if needed, then return the snapshot.
+
+        If the first build failed, the snapshot is still empty.
+        """
+        if not self._ready.is_set():
+            await self.start()
+            await self._ready.wait()
+        return self.snapshot
+
+    async def _run(self) -> None:
+        try:
+            await self._poll()
+        finally:
+            self._ready.set()
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            await self._poll()
+
+    async def _poll(self) -> None:
+        """Refresh once; a failed refresh keeps the previous snapshot."""
+        try:
+            await asyncio.to_thread(self.refresh)
+        except Exception:
+            logger.exception(
+                "Refreshing the project index failed; keeping generation %d",
+                self.snapshot.generation,
+            )
+
+    def _walk(self):
+        """Yield (relative path, (mtime_ns, size)) for every Python file."""
+        stack = [self.root]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _SKIP_DIRS and not entry.name.startswith("."):
+                            stack.append(Path(entry.path))
+                    elif entry.name.endswith(".py"):
+                        st = entry.stat()
+                        rel = Path(entry.path).relative_to(self.root).as_posix()
+                        yield rel, (st.st_mtime_ns, st.st_size)
+
+    def _scan_contracts(self, old: dict[str, str]) -> tuple[dict[str, str], int]:
+        contracts: dict[str, str] = {}
+        stamps: dict[str, tuple[int, int]] = {}
+        changed = 0
+        for path in sorted((self.root / "contracts").glob("*.yaml")):
+            st = path.stat()
+            stamps[path.stem] = (st.st_mtime_ns, st.st_size)
+            if path.stem in old and self._contract_stamps.get(path.stem) == stamps[path.stem]:
+                contracts[path.stem] = old[path.stem]
+            else:
+                contracts[path.stem] = path.read_text()
+                changed += 1
+        changed += len(old.keys() - contracts.keys())
+        self._contract_stamps = stamps
+        return contracts, changed
@@ -6,14 +6,19 @@ Exposes tools for architectural validation, contract retrieval,
 and module boundary checks.
 
 No separate infrastructure — runs locally, dies when session ends.
+
+State lives in a ProjectIndex, built in the background as soon as the
+server starts and kept fresh by polling, so tool calls answer from memory.
 """
 
+import asyncio
 from pathlib import Path
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
+from mcp_server.project_index import ProjectIndex
 from mcp_server.tools.validate_architecture import validate_architecture
 from mcp_server.tools.get_contracts import get_contracts
 from mcp_server.tools.get_module_boundaries import get_module_boundaries
@@ -21,6 +26,7 @@ from mcp_server.tools.get_module_boundaries import get_module_boundaries
 PROJECT_ROOT = Path(__file__).parent.parent
 
 server = Server("constitution")
+index = ProjectIndex(PROJECT_ROOT)
 
 
 @server.list_tools()
@@ -31,7 +37,8 @@ async def list_tools() -> list[Tool]:
             name="validate_architecture",
             description=(
                 "Validates a Python file path and its imports against module boundary rules. "
-                "Call this BEFORE writing or modifying any Python file."
+                "Call this BEFORE writing or modifying any Python file. Without imports, "
+                "an existing file's current imports are checked."
             ),
             inputSchema={
                 "type": "object",
@@ -82,20 +89,18 @@ async def list_tools() -> list[Tool]:
 
 @server.call_tool()
 async def call_tool(name: str, arguments: dict) -> list[TextContent]:
-    """Route tool calls to implementations."""
+    """Route tool calls to implementations, answering from the project index."""
+    snapshot = await index.ready()
     if name == "validate_architecture":
         result = validate_architecture(
-            project_root=PROJECT_ROOT,
+            index=snapshot,
             file_path=arguments["file_path"],
             imports=arguments.get("imports", [])
         )
     elif name == "get_contracts":
-        result = get_contracts(
-            project_root=PROJECT_ROOT,
-            domain=arguments["domain"]
-        )
+        result = get_contracts(index=snapshot, domain=arguments["domain"])
     elif name == "get_module_boundaries":
-        result = get_module_boundaries(module=arguments["module"])
+        result = get_module_boundaries(index=snapshot, module=arguments["module"])
     else:
         result = f"Unknown tool: {name}"
 
@@ -103,13 +108,20 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
 
 
 async def main():
-    """Entry point — Claude Code connects via stdio."""
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream, write_stream, server.create_initialization_options()
-        )
+    """Entry point — Claude Code connects via stdio.
+
+    The index starts building before the handshake, so it is usually warm
+    by the first tool call.
+    """
+    await index.start()
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream, write_stream, server.create_initialization_options()
+            )
+    finally:
+        await index.stop()
 
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(main())
\ No newline at end of file
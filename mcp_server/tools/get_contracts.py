@@ -1,29 +1,26 @@
 """Returns OpenAPI contracts for a given service domain."""
 
-from pathlib import Path
+from mcp_server.project_index import IndexSnapshot
 
 
-def get_contracts(project_root: Path, domain: str) -> str:
-    """Load and return the OpenAPI contract for a domain.
+def get_contracts(index: IndexSnapshot, domain: str) -> str:
+    """Return the OpenAPI contract for a domain from the project index.
 
     Args:
-        project_root: Absolute path to project root.
+        index: Current project index snapshot.
         domain: Service domain name (e.g. 'case', 'report').
 
     Returns:
         The contract YAML content, or an error message.
     """
-    contracts_dir = project_root / "contracts"
-    contract_file = contracts_dir / f"{domain}.yaml"
-
-    if contract_file.exists():
-        content = contract_file.read_text()
+    content = index.contracts.get(domain)
+    if content is not None:
         return f"Contract for '{domain}':\n\n{content}"
 
-    available = [f.stem for f in contracts_dir.glob("*.yaml")]
+    available = list(index.contracts)
     if available:
         return (
             f"No contract found for '{domain}'. "
             f"Available contracts: {', '.join(available)}"
         )
-    return f"No contracts found in {contracts_dir}."
\ No newline at end of file
+    return "No contracts found in contracts/."
@@ -1,4 +1,7 @@
-"""Returns import rules for a given module."""
+"""Returns import rules for a given module, with its current state from the index."""
+
+from mcp_server.project_index import MAX_FILE_LINES, IndexSnapshot
+from mcp_server.tools.validate_architecture import validate_architecture
 
 BOUNDARIES: dict[str, dict] = {
     "services": {
@@ -35,20 +38,34 @@ BOUNDARIES: dict[str, dict] = {
 }
 
 
-def get_module_boundaries(module: str) -> str:
-    """Return import rules for a module.
+def get_module_boundaries(index: IndexSnapshot, module: str) -> str:
+    """Return import rules for a module and how its files currently fare.
 
     Args:
+        index: Current project index snapshot.
         module: Module name (e.g. 'services', 'models').
 
     Returns:
-        Human-readable boundary rules.
+        Human-readable boundary rules followed by the module's indexed
+        file count, oversized files and current violations.
     """
     rules = BOUNDARIES.get(module)
     if not rules:
         available = ", ".join(BOUNDARIES.keys())
         return f"Unknown module '{module}'. Available: {available}"
 
+    key = ("boundaries", module)
+    result = index.memo.get(key)
+    if result is not None:
+        return result
+    files = index.by_layer.get(module, [])
+    oversized = [f"{m.path} ({m.lines})" for m in files if m.lines > MAX_FILE_LINES]
+    violations = [
+        line
+        for m in files
+        for line in validate_architecture(index, m.path).splitlines()
+        if line.startswith(("BLOCK", "WARN"))
+    ]
     lines = [
         f"Module boundaries for '{module}/':",
         "",
@@ -56,5 +73,11 @@ def get_module_boundaries(module: str) -> str:
         f"  Cannot import from: {', '.join(rules['cannot_import'])}",
         "",
         f"  Notes: {rules['notes']}",
+        "",
+        f"  Indexed: {len(files)} files, {sum(m.lines for m in files)} lines",
+        f"  Over {MAX_FILE_LINES} lines: {', '.join(oversized) or 'none'}",
+        "  Current findings:" if violations else "  Current findings: none",
+        *(f"    {line}" for line in violations),
     ]
-    return "\n".join(lines)
\ No newline at end of file
+    result = index.memo[key] = "\n".join(lines)
+    return result
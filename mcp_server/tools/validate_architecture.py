@@ -5,9 +5,12 @@ Checks that:
 - Files are placed in valid module directories
 - Imports respect the one-way dependency flow
 - Cross-service imports are blocked (use contracts instead)
+
+Imports and line counts come from the project index, so a check never
+touches the disk.
 """
 
-from pathlib import Path
+from mcp_server.project_index import MAX_FILE_LINES, IndexSnapshot, get_layer
 
 LAYER_RULES: dict[str, dict[str, str]] = {
     "services": {
@@ -43,32 +46,35 @@ LAYER_RULES: dict[str, dict[str, str]] = {
 }
 
 
-def get_layer(path: str) -> str:
-    """Determine which architectural layer a file belongs to."""
-    parts = Path(path).parts
-    if not parts:
-        return "unknown"
-    first = parts[0]
-    if first in ("services", "models", "schemas", "exceptions", "utils", "api", "tests"):
-        return first
-    return "unknown"
-
-
 def validate_architecture(
-    project_root: Path,
+    index: IndexSnapshot,
     file_path: str,
     imports: list[str] | None = None,
 ) -> str:
     """Validate a file against architectural rules.
 
     Args:
-        project_root: Absolute path to project root.
+        index: Current project index snapshot.
         file_path: Relative path of the file being checked.
-        imports: List of import module paths found in the file.
+        imports: Import module paths to check. Defaults to the imports the
+            index parsed from the file, if it exists.
 
     Returns:
         Human-readable validation result.
     """
+    if imports:
+        return _validate(index, file_path, imports)
+    # Checks of indexed imports only change with the snapshot; memoize them.
+    key = ("validate", file_path)
+    result = index.memo.get(key)
+    if result is None:
+        info = index.modules.get(file_path)
+        result = _validate(index, file_path, list(info.imports) if info else [])
+        index.memo[key] = result
+    return result
+
+
+def _validate(index: IndexSnapshot, file_path: str, imports: list[str]) -> str:
     findings: list[str] = []
     source_layer = get_layer(file_path)
 
@@ -81,7 +87,7 @@ def validate_architecture(
     if source_layer == "tests":
         return "PASS — Test files have no import restrictions."
 
-    for imp in (imports or []):
+    for imp in imports:
         target_layer = get_layer(imp.replace(".", "/"))
         rules = LAYER_RULES.get(source_layer, {})
         verdict = rules.get(target_layer)
@@ -99,13 +105,11 @@ def validate_architecture(
             )
 
     # File length check
-    full_path = project_root / file_path
-    if full_path.exists():
-        lines = full_path.read_text().splitlines()
-        if len(lines) > 300:
-            findings.append(
-                f"WARN: {file_path} is {len(lines)} lines (max 300). Consider splitting."
-            )
+    info = index.modules.get(file_path)
+    if info is not None and info.lines > MAX_FILE_LINES:
+        findings.append(
+            f"WARN: {file_path} is {info.lines} lines (max {MAX_FILE_LINES}). Consider splitting."
+        )
 
     if not findings:
         return "PASS — No architectural violations found."
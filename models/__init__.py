@@ -1,10 +1,41 @@
 """Domain models for MEDirect Edge. Pure data — no business logic."""
 
-from datetime import datetime
+from datetime import date, datetime, timezone
 from enum import Enum
-from typing import Optional
+from typing import Annotated, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import AfterValidator, BaseModel, Field
+
+UTC = timezone.utc
+
+
+def utc_now() -> datetime:
+    """Return the current time as an aware UTC datetime."""
+    return datetime.now(UTC)
+
+
+def as_utc(value: datetime) -> datetime:
+    """Normalize a datetime to UTC, treating a naive value as UTC.
+
+    Args:
+        value: Any datetime.
+
+    Returns:
+        The same instant with ``tzinfo=timezone.utc``.
+    """
+    if value.tzinfo is UTC:
+        return value
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
+
+# Timestamps are aware datetimes in UTC, so pydantic's native serializer
+# emits ISO-8601 (``2026-01-15T10:30:00Z``). Naive input is taken as UTC.
+UtcDatetime = Annotated[datetime, AfterValidator(as_utc)]
+
+# On-call windows are hours of the week in UTC: 0 is Monday 00:00-01:00.
+HOURS_PER_WEEK = 7 * 24
 
 
 class CaseStatus(str, Enum):
@@ -22,7 +53,18 @@ class Case(BaseModel):
     referrer_id: str
     expert_id: Optional[str] = None
     status: CaseStatus = CaseStatus.DRAFT
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: UtcDatetime = Field(default_factory=utc_now)
+    # SLA deadline of the current status; None when the status has none.
+    due_at: Optional[UtcDatetime] = None
+
+
+class CaseEscalation(BaseModel):
+    """A case whose SLA deadline passed while it stayed in one status."""
+
+    case_id: str
+    status: CaseStatus
+    due_at: UtcDatetime
+    escalated_at: UtcDatetime = Field(default_factory=utc_now)
 
 
 class CaseAssignment(BaseModel):
@@ -30,4 +72,55 @@ class CaseAssignment(BaseModel):
 
     case_id: str
     expert_id: str
-    assigned_at: datetime = Field(default_factory=datetime.utcnow)
\ No newline at end of file
+    assigned_at: UtcDatetime = Field(default_factory=utc_now)
+
+
+class CasePage(BaseModel):
+    """A bounded slice of cases from a query."""
+
+    items: list[Case]
+    has_more: bool = False
+
+
+class CaseBatch(BaseModel):
+    """Result of looking up many cases by id at once."""
+
+    items: list[Case]
+    missing: list[str] = Field(default_factory=list)
+
+
+class CaseStatistics(BaseModel):
+    """Aggregate case counts by status, assigned expert and creation day."""
+
+    total: int = 0
+    by_status: dict[CaseStatus, int] = Field(default_factory=dict)
+    by_expert: dict[str, int] = Field(default_factory=dict)
+    by_day: dict[date, int] = Field(default_factory=dict)
+
+
+class CaseStatsRebuild(BaseModel):
+    """Outcome of recomputing statistics from the stored cases."""
+
+    stats: CaseStatistics
+    drifted: bool = False
+
+
+class Expert(BaseModel):
+    """A medical expert who can be assigned cases."""
+
+    id: str
+    name: str
+    specialties: list[str] = Field(default_factory=list)
+    active: bool = True
+    max_open_cases: int = Field(default=10, ge=0)
+    open_cases: int = Field(default=0, ge=0)
+    on_call_hours: list[Annotated[int, Field(ge=0, lt=HOURS_PER_WEEK)]] = Field(
+        default_factory=list
+    )
+
+
+class ExpertPage(BaseModel):
+    """A bounded slice of experts from a query."""
+
+    items: list[Expert]
+    has_more: bool = False
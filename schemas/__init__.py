@@ -1,11 +1,23 @@
 """API request/response schemas for MEDirect Edge."""
 
-from datetime import datetime
-from typing import Optional
+from datetime import date
+from typing import Annotated, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
-from models import Case, CaseAssignment, CaseStatus
+from models import (
+    HOURS_PER_WEEK,
+    Case,
+    CaseAssignment,
+    CaseBatch,
+    CasePage,
+    CaseStatistics,
+    CaseStatsRebuild,
+    CaseStatus,
+    Expert,
+    ExpertPage,
+    UtcDatetime,
+)
 
 
 class CaseResponse(BaseModel):
@@ -15,7 +27,8 @@ class CaseResponse(BaseModel):
     referrer_id: str
     expert_id: Optional[str]
     status: CaseStatus
-    created_at: datetime
+    created_at: UtcDatetime
+    due_at: Optional[UtcDatetime]
 
     @classmethod
     def from_model(cls, case: Case) -> "CaseResponse":
@@ -33,6 +46,7 @@ class CaseResponse(BaseModel):
             expert_id=case.expert_id,
             status=case.status,
             created_at=case.created_at,
+            due_at=case.due_at,
         )
 
 
@@ -41,7 +55,7 @@ class CaseAssignmentResponse(BaseModel):
 
     case_id: str
     expert_id: str
-    assigned_at: datetime
+    assigned_at: UtcDatetime
 
     @classmethod
     def from_model(cls, assignment: CaseAssignment) -> "CaseAssignmentResponse":
@@ -60,12 +74,196 @@ class CaseAssignmentResponse(BaseModel):
         )
 
 
+class CaseSearchResponse(BaseModel):
+    """Response schema for a case search."""
+
+    items: list[CaseResponse]
+    has_more: bool
+
+    @classmethod
+    def from_model(cls, page: CasePage) -> "CaseSearchResponse":
+        """Convert a CasePage to a search response.
+
+        Args:
+            page: The page of domain cases.
+
+        Returns:
+            A CaseSearchResponse instance.
+        """
+        return cls(
+            items=[CaseResponse.from_model(case) for case in page.items],
+            has_more=page.has_more,
+        )
+
+
+class CaseSnapshotResponse(BaseModel):
+    """Response schema for one page of a full copy of the case store."""
+
+    epoch: str
+    position: int
+    items: list[CaseResponse]
+    next_cursor: str | None = None
+
+
+class BatchGetRequest(BaseModel):
+    """Request body for fetching many cases by id."""
+
+    ids: list[str] = Field(min_length=1)
+
+
+class BatchGetResponse(BaseModel):
+    """Response schema for a batched case lookup."""
+
+    items: list[CaseResponse]
+    missing: list[str]
+
+    @classmethod
+    def from_model(cls, batch: CaseBatch) -> "BatchGetResponse":
+        """Convert a CaseBatch to a batch response.
+
+        Args:
+            batch: The domain lookup result.
+
+        Returns:
+            A BatchGetResponse instance.
+        """
+        return cls(
+            items=[CaseResponse.from_model(case) for case in batch.items],
+            missing=batch.missing,
+        )
+
+
+class CaseStatsResponse(BaseModel):
+    """Response schema for aggregate case statistics."""
+
+    total: int
+    by_status: dict[CaseStatus, int]
+    by_expert: dict[str, int]
+    by_day: dict[date, int]
+
+    @classmethod
+    def from_model(cls, stats: CaseStatistics) -> "CaseStatsResponse":
+        """Convert CaseStatistics to a stats response.
+
+        Args:
+            stats: The domain statistics.
+
+        Returns:
+            A CaseStatsResponse instance.
+        """
+        return cls(
+            total=stats.total,
+            by_status=stats.by_status,
+            by_expert=stats.by_expert,
+            by_day=stats.by_day,
+        )
+
+
+class CaseStatsRebuildResponse(BaseModel):
+    """Response schema for a statistics rebuild."""
+
+    stats: CaseStatsResponse
+    drifted: bool
+
+    @classmethod
+    def from_model(cls, rebuild: CaseStatsRebuild) -> "CaseStatsRebuildResponse":
+        """Convert a CaseStatsRebuild to a rebuild response.
+
+        Args:
+            rebuild: The domain rebuild outcome.
+
+        Returns:
+            A CaseStatsRebuildResponse instance.
+        """
+        return cls(
+            stats=CaseStatsResponse.from_model(rebuild.stats),
+            drifted=rebuild.drifted,
+        )
+
+
 class AssignExpertRequest(BaseModel):
     """Request body for assigning an expert to a case."""
 
     expert_id: str
 
 
+class ExpertRequest(BaseModel):
+    """Request body for creating or replacing an expert."""
+
+    name: str
+    specialties: list[str] = Field(default_factory=list)
+    active: bool = True
+    max_open_cases: int = Field(default=10, ge=0)
+    on_call_hours: list[Annotated[int, Field(ge=0, lt=HOURS_PER_WEEK)]] = Field(
+        default_factory=list
+    )
+
+    def to_model(self, expert_id: str) -> Expert:
+        """Build the Expert domain model for the given id.
+
+        Args:
+            expert_id: Id from the request path.
+
+        Returns:
+            An Expert with no open cases.
+        """
+        return Expert(id=expert_id, **self.model_dump())
+
+
+class ExpertResponse(BaseModel):
+    """Response schema for an expert resource."""
+
+    id: str
+    name: str
+    specialties: list[str]
+    active: bool
+    max_open_cases: int
+    open_cases: int
+    on_call_hours: list[int]
+
+    @classmethod
+    def from_model(cls, expert: Expert) -> "ExpertResponse":
+        """Convert an Expert domain model to an ExpertResponse schema.
+
+        Args:
+            expert: The domain Expert model.
+
+        Returns:
+            An ExpertResponse instance.
+        """
+        return cls(
+            id=expert.id,
+            name=expert.name,
+            specialties=expert.specialties,
+            active=expert.active,
+            max_open_cases=expert.max_open_cases,
+            open_cases=expert.open_cases,
+            on_call_hours=expert.on_call_hours,
+        )
+
+
+class ExpertListResponse(BaseModel):
+    """Response schema for an availability query."""
+
+    items: list[ExpertResponse]
+    has_more: bool
+
+    @classmethod
+    def from_model(cls, page: ExpertPage) -> "ExpertListResponse":
+        """Convert an ExpertPage to a list response.
+
+        Args:
+            page: The page of domain experts.
+
+        Returns:
+            An ExpertListResponse instance.
+        """
+        return cls(
+            items=[ExpertResponse.from_model(expert) for expert in page.items],
+            has_more=page.has_more,
+        )
+
+
 class ErrorResponse(BaseModel):
     """Standard error response shape."""
 
@@ -1,9 +1,24 @@
 """Case service — orchestrates case operations via injected repository."""
 
-from typing import Protocol
+from contextlib import AbstractAsyncContextManager
+from datetime import datetime
+from typing import Protocol, Sequence
 
-from models import Case, CaseAssignment, CaseStatus
-from exceptions import NotFoundError, InvalidStateError
+from models import (
+    Case,
+    CaseAssignment,
+    CaseBatch,
+    CasePage,
+    CaseStatistics,
+    CaseStatsRebuild,
+    CaseStatus,
+    utc_now,
+)
+from exceptions import NotFoundError, InvalidStateError, ValidationError
+from utils.tracing import traced
+
+MAX_SEARCH_LIMIT = 500
+MAX_BATCH_GET = 100
 
 
 class CaseRepository(Protocol):
@@ -11,8 +26,54 @@ class CaseRepository(Protocol):
 
     async def get_by_id(self, case_id: str) -> Case | None: ...
 
+    async def get_many(self, case_ids: Sequence[str]) -> dict[str, Case]: ...
+
     async def save(self, case: Case) -> None: ...
 
+    def lock(self, case_id: str) -> AbstractAsyncContextManager: ...
+
+    async def search(
+        self,
+        referrer_id: str | None = None,
+        expert_id: str | None = None,
+        limit: int = 50,
+    ) -> list[Case]: ...
+
+    async def stats(self) -> CaseStatistics: ...
+
+    async def rebuild_stats(self) -> CaseStatistics: ...
+
+    async def page_by_id(self, after: str | None, limit: int) -> list[Case]: ...
+
+    async def with_deadlines(self) -> list[Case]: ...
+
+
+class AssignmentListener(Protocol):
+    """Notified after an assignment is saved.
+
+    Implementations must return quickly — schedule work, don't perform it.
+    """
+
+    def on_assigned(self, case: Case, assignment: CaseAssignment) -> None: ...
+
+
+class ExpertReservations(Protocol):
+    """Checks and reserves an expert's case capacity on assignment."""
+
+    async def reserve(self, expert_id: str) -> None: ...
+
+    async def release(self, expert_id: str) -> None: ...
+
+
+class DeadlineScheduler(Protocol):
+    """Sets SLA deadlines on status transitions and tracks them until they pass."""
+
+    def due_at(self, status: CaseStatus, since: datetime) -> datetime | None: ...
+
+    def schedule(self, case: Case) -> None: ...
+
+    def overdue(self, limit: int) -> list[str]: ...
+
 
 class CaseService:
     """Manages case lifecycle operations.
@@ -21,9 +82,34 @@ class CaseService:
     keeping the service decoupled from any specific persistence layer.
     """
 
-    def __init__(self, case_repo: CaseRepository) -> None:
+    def __init__(
+        self,
+        case_repo: CaseRepository,
+        listeners: Sequence[AssignmentListener] = (),
+        experts: ExpertReservations | None = None,
+        deadlines: DeadlineScheduler | None = None,
+    ) -> None:
         self._case_repo = case_repo
+        self._listeners = listeners
+        self._experts = experts
+        self._deadlines = deadlines
 
+    @traced("CaseService.find_case")
+    async def find_case(self, case_id: str) -> Case | None:
+        """Look up a case by its ID without raising for a miss.
+
+        Callers that expect misses, such as the GET route under scanner
+        traffic, use this to avoid building an exception per lookup.
+
+        Args:
+            case_id: Unique identifier of the case.
+
+        Returns:
+            The matching Case model, or None if it does not exist.
+        """
+        return await self._case_repo.get_by_id(case_id)
+
+    @traced("CaseService.get_case")
     async def get_case(self, case_id: str) -> Case:
         """Retrieve a case by its ID.
 
@@ -41,11 +127,42 @@ class CaseService:
             raise NotFoundError(f"Case '{case_id}' not found")
         return case
 
+    @traced("CaseService.get_cases")
+    async def get_cases(self, case_ids: Sequence[str]) -> CaseBatch:
+        """Retrieve many cases in a single repository round trip.
+
+        Duplicate ids are looked up once; results keep first-seen order.
+
+        Args:
+            case_ids: Ids to look up (1 to MAX_BATCH_GET distinct ids).
+
+        Returns:
+            The found cases and the ids that do not exist.
+
+        Raises:
+            ValidationError: If no ids or too many ids are given.
+        """
+        unique = list(dict.fromkeys(case_ids))
+        if not 1 <= len(unique) <= MAX_BATCH_GET:
+            raise ValidationError(f"Provide between 1 and {MAX_BATCH_GET} case ids")
+        found = await self._case_repo.get_many(unique)
+        return CaseBatch(
+            items=[found[i] for i in unique if i in found],
+            missing=[i for i in unique if i not in found],
+        )
+
+    @traced("CaseService.assign_expert")
     async def assign_expert(self, case_id: str, expert_id: str) -> CaseAssignment:
         """Assign an expert to a case.
 
         The case must be in SUBMITTED status. Cases in DRAFT or COMPLETED
-        status cannot be assigned.
+        status cannot be assigned. The status check and the save run under
+        the repository's lock for the case, so concurrent assignments of the
+        same case cannot both succeed. With expert reservations configured,
+        the expert must exist, be active and have spare capacity; one unit
+        of capacity is taken and handed back if the save fails. With
+        deadlines configured, the case gets the ASSIGNED status's deadline
+        and is rescheduled once saved.
 
         Args:
             case_id: Unique identifier of the case.
@@ -56,18 +173,123 @@ class CaseService:
 
         Raises:
             NotFoundError: If no case exists with the given ID.
-            InvalidStateError: If the case is not in SUBMITTED status.
+            ValidationError: If the expert does not exist.
+            InvalidStateError: If the case is not in SUBMITTED status, or
+                the expert is inactive or at capacity.
+        """
+        async with self._case_repo.lock(case_id):
+            case = await self.get_case(case_id)
+
+            if case.status != CaseStatus.SUBMITTED:
+                raise InvalidStateError(
+                    f"Case '{case_id}' is in '{case.status.value}' status "
+                    f"and cannot be assigned"
+                )
+
+            if self._experts is not None:
+                await self._experts.reserve(expert_id)
+            self._enter_status(case, CaseStatus.ASSIGNED)
+            case.expert_id = expert_id
+            try:
+                await self._case_repo.save(case)
+            except BaseException:
+                if self._experts is not None:
+                    await self._experts.release(expert_id)
+                raise
+            if self._deadlines is not None:
+                self._deadlines.schedule(case)
+
+        assignment = CaseAssignment(case_id=case.id, expert_id=expert_id)
+        for listener in self._listeners:
+            listener.on_assigned(case, assignment)
+        return assignment
+
+    @traced("CaseService.search_cases")
+    async def search_cases(
+        self,
+        referrer_id: str | None = None,
+        expert_id: str | None = None,
+        limit: int = 50,
+    ) -> CasePage:
+        """Find cases by referrer and/or expert id.
+
+        Each pattern is an exact id or a prefix ending in ``*``, e.g.
+        ``"ref-1*"``. When both are given a case must match both.
+
+        Args:
+            referrer_id: Referrer id pattern.
+            expert_id: Expert id pattern.
+            limit: Maximum number of cases to return (1-500).
+
+        Returns:
+            Up to ``limit`` matching cases and whether more exist.
+
+        Raises:
+            ValidationError: If no pattern is given, a pattern is malformed,
+                or the limit is out of range.
         """
-        case = await self.get_case(case_id)
+        if referrer_id is None and expert_id is None:
+            raise ValidationError("Provide a referrer_id or expert_id pattern")
+        if not 1 <= limit <= MAX_SEARCH_LIMIT:
+            raise ValidationError(f"limit must be between 1 and {MAX_SEARCH_LIMIT}")
+        cases = await self._case_repo.search(
+            referrer_id=referrer_id, expert_id=expert_id, limit=limit + 1
+        )
+        return CasePage(items=cases[:limit], has_more=len(cases) > limit)
 
-        if case.status != CaseStatus.SUBMITTED:
-            raise InvalidStateError(
-                f"Case '{case_id}' is in '{case.status.value}' status "
-                f"and cannot be assigned"
-            )
+    @traced("CaseService.list_overdue")
+    async def list_overdue(self, limit: int = 50) -> CasePage:
+        """List cases past their SLA deadline, most overdue first.
 
-        case.status = CaseStatus.ASSIGNED
-        case.expert_id = expert_id
-        await self._case_repo.save(case)
+        Args:
+            limit: Maximum number of cases to return (1-500).
+
+        Returns:
+            Up to ``limit`` overdue cases and whether more exist; empty
+            when no deadlines are tracked.
+
+        Raises:
+            ValidationError: If the limit is out of range.
+        """
+        if not 1 <= limit <= MAX_SEARCH_LIMIT:
+            raise ValidationError(f"limit must be between 1 and {MAX_SEARCH_LIMIT}")
+        if self._deadlines is None:
+            return CasePage(items=[])
+        ids = self._deadlines.overdue(limit + 1)
+        found = await self._case_repo.get_many(ids)
+        cases = [found[i] for i in ids if i in found]
+        return CasePage(items=cases[:limit], has_more=len(cases) > limit)
+
+    @traced("CaseService.get_stats")
+    async def get_stats(self) -> CaseStatistics:
+        """Return case counts per status, expert and creation day.
+
+        The repository maintains these on every write, so this does not
+        depend on the number of stored cases.
+
+        Returns:
+            The current aggregate statistics.
+        """
+        return await self._case_repo.stats()
+
+    @traced("CaseService.rebuild_stats")
+    async def rebuild_stats(self) -> CaseStatsRebuild:
+        """Recompute statistics from the stored cases.
+
+        Used to verify the incremental counters and to recover them if they
+        ever diverge from the data.
+
+        Returns:
+            The recomputed statistics and whether they differed from the
+            incrementally maintained ones.
+        """
+        before = await self._case_repo.stats()
+        after = await self._case_repo.rebuild_stats()
+        return CaseStatsRebuild(stats=after, drifted=before != after)
 
-        return CaseAssignment(case_id=case.id, expert_id=expert_id)
+    def _enter_status(self, case: Case, status: CaseStatus) -> None:
+        """Move case to status, replacing its deadline with the new status's."""
+        case.status = status
+        case.due_at = (
+            None if self._deadlines is None else self._deadlines.due_at(status, utc_now())
+        )
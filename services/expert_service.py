@@ -0,0 +1,108 @@
+"""Expert service — manages experts and availability queries via an injected repository."""
+
+from datetime import datetime
+from typing import Protocol
+
+from exceptions import NotFoundError, ValidationError
+from models import Expert, ExpertPage
+from utils.timestamps import hour_of_week
+from utils.tracing import traced
+
+MAX_AVAILABLE_LIMIT = 100
+
+
+class ExpertRepository(Protocol):
+    """Interface that any expert repository implementation must satisfy."""
+
+    async def get_by_id(self, expert_id: str) -> Expert | None: ...
+
+    async def save(self, expert: Expert) -> None: ...
+
+    async def find_available(
+        self, specialty: str, hour: int | None = None, limit: int = 20
+    ) -> list[Expert]: ...
+
+
+class ExpertService:
+    """Manages expert records and answers availability queries.
+
+    Uses constructor injection for the repository dependency,
+    keeping the service decoupled from any specific persistence layer.
+    """
+
+    def __init__(self, expert_repo: ExpertRepository) -> None:
+        self._expert_repo = expert_repo
+
+    @traced("ExpertService.find_expert")
+    async def find_expert(self, expert_id: str) -> Expert | None:
+        """Look up an expert by ID without raising for a miss.
+
+        Args:
+            expert_id: Unique identifier of the expert.
+
+        Returns:
+            The matching Expert model, or None if it does not exist.
+        """
+        return await self._expert_repo.get_by_id(expert_id)
+
+    @traced("ExpertService.get_expert")
+    async def get_expert(self, expert_id: str) -> Expert:
+        """Retrieve an expert by ID.
+
+        Args:
+            expert_id: Unique identifier of the expert.
+
+        Returns:
+            The matching Expert model.
+
+        Raises:
+            NotFoundError: If no expert exists with the given ID.
+        """
+        expert = await self._expert_repo.get_by_id(expert_id)
+        if expert is None:
+            raise NotFoundError(f"Expert '{expert_id}' not found")
+        return expert
+
+    @traced("ExpertService.save_expert")
+    async def save_expert(self, expert: Expert) -> Expert:
+        """Create or replace an expert's profile.
+
+        The open case count is owned by assignments, so an existing
+        expert's count is carried over rather than taken from the input.
+
+        Args:
+            expert: The expert's new profile.
+
+        Returns:
+            The saved Expert.
+        """
+        existing = await self._expert_repo.get_by_id(expert.id)
+        expert.open_cases = existing.open_cases if existing is not None else 0
+        await self._expert_repo.save(expert)
+        return expert
+
+    @traced("ExpertService.find_available")
+    async def find_available(
+        self,
+        specialty: str,
+        at: datetime | None = None,
+        limit: int = 20,
+    ) -> ExpertPage:
+        """Find active experts below capacity with a specialty.
+
+        Args:
+            specialty: Required specialty.
+            at: If given, only experts on call at this instant are returned.
+            limit: Maximum number of experts to return (1-100).
+
+        Returns:
+            Up to ``limit`` available experts and whether more exist.
+
+        Raises:
+            ValidationError: If the limit is out of range.
+        """
+        if not 1 <= limit <= MAX_AVAILABLE_LIMIT:
+            raise ValidationError(f"limit must be between 1 and {MAX_AVAILABLE_LIMIT}")
+        hour = hour_of_week(at) if at is not None else None
+        experts = await self._expert_repo.find_available(specialty, hour, limit + 1)
+        return ExpertPage(items=experts[:limit], has_more=len(experts) > limit)
@@ -0,0 +1,76 @@
+"""Integration tests for the structured access and audit logs."""
+
+import json
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from config import Settings
+from main import create_app
+
+
+def _lines(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def _app(tmp_path, **overrides):
+    return create_app(Settings(
+        access_log_path=str(tmp_path / "access.log"),
+        audit_log_path=str(tmp_path / "audit.log"),
+        warmup_enabled=False,
+        **overrides,
+    ))
+
+
+async def _requests(app) -> None:
+    transport = ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            await client.get("/api/v1/cases/case-001")
+            await client.get("/api/v1/cases/missing")
+            await client.post("/api/v1/cases/case-001/assign", json={"expert_id": "exp-300"})
+            await client.get("/healthz")
+
+
+class TestStructuredLogs:
+    """Records written by the time the lifespan exits."""
+
+    @pytest.mark.asyncio
+    async def test_access_records_describe_each_api_request(self, tmp_path):
+        """Every API request is logged with its route, status and trace id."""
+        app = _app(tmp_path, tracing_enabled=True)
+
+        await _requests(app)
+
+        records = _lines(tmp_path / "access.log")
+        assert [(r["method"], r["route"], r["status"]) for r in records] == [
+            ("GET", "/api/v1/cases/{case_id}", 200),
+            ("GET", "/api/v1/cases/{case_id}", 404),
+            ("POST", "/api/v1/cases/{case_id}/assign", 200),
+        ]
+        assert all(r["event"] == "http.request" for r in records)
+        assert all(len(r["trace_id"]) == 32 and r["duration_ms"] >= 0 for r in records)
+        assert records[0]["bytes"] > 0
+
+    @pytest.mark.asyncio
+    async def test_assignments_are_audited(self, tmp_path):
+        """An assignment writes one audit line with the new status and deadline."""
+        app = _app(tmp_path)
+
+        await _requests(app)
+
+        (record,) = _lines(tmp_path / "audit.log")
+        assert record["event"] == "case.assigned"
+        assert (record["case_id"], record["expert_id"]) == ("case-001", "exp-300")
+        assert record["status"] == "assigned"
+        assert record["due_at"] is not None
+
+    @pytest.mark.asyncio
+    async def test_sampling_skips_successful_requests(self, tmp_path):
+        """With a zero sample rate, requests below 500 are not logged."""
+        app = _app(tmp_path, access_log_sample_rate=0.0)
+
+        await _requests(app)
+
+        assert (tmp_path / "access.log").read_text() == ""
+        assert len(_lines(tmp_path / "audit.log")) == 1
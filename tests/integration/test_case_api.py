@@ -1,17 +1,18 @@
 """Integration tests for case API endpoints via FastAPI TestClient."""
 
+from datetime import datetime, timedelta
+
 import pytest
 from httpx import ASGITransport, AsyncClient
 
+from config import Settings
 from main import create_app
-from api.dependencies import _get_repo
 from models import Case, CaseStatus
 
 
 @pytest.fixture
 def app():
-    """Create a fresh app for each test, clearing the repo cache."""
-    _get_repo.cache_clear()
+    """Create a fresh app, with its own repository, for each test."""
     return create_app()
 
 
@@ -44,6 +45,7 @@ class TestGetCase:
 
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
+        assert response.headers["content-type"] == "application/json"
 
     @pytest.mark.asyncio
     async def test_get_case_response_matches_schema(self, client):
@@ -57,6 +59,14 @@ class TestGetCase:
         assert "status" in data
         assert "created_at" in data
 
+    @pytest.mark.asyncio
+    async def test_created_at_is_utc_iso8601(self, client):
+        """created_at is an ISO-8601 date-time in UTC."""
+        data = (await client.get("/api/v1/cases/case-001")).json()
+
+        parsed = datetime.fromisoformat(data["created_at"])
+        assert parsed.utcoffset() == timedelta(0)
+
 
 class TestAssignExpert:
     """POST /api/v1/cases/{case_id}/assign endpoint tests."""
@@ -118,3 +128,156 @@ class TestAssignExpert:
         )
 
         assert response.status_code == 422
+
+
+class TestSearchCases:
+    """GET /api/v1/cases:search endpoint tests."""
+
+    @pytest.mark.asyncio
+    async def test_search_by_referrer_prefix(self, client):
+        """A referrer prefix returns the matching seeded case."""
+        response = await client.get("/api/v1/cases:search", params={"referrer_id": "ref-1*"})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [c["id"] for c in data["items"]] == ["case-001"]
+        assert data["has_more"] is False
+
+    @pytest.mark.asyncio
+    async def test_search_reports_has_more(self, client):
+        """has_more is set when the limit truncates the results."""
+        response = await client.get(
+            "/api/v1/cases:search", params={"referrer_id": "ref-*", "limit": 1}
+        )
+
+        assert len(response.json()["items"]) == 1
+        assert response.json()["has_more"] is True
+
+    @pytest.mark.asyncio
+    async def test_search_without_pattern_returns_422(self, client):
+        """A search with no pattern is rejected."""
+        response = await client.get("/api/v1/cases:search")
+
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_search_finds_newly_assigned_expert(self, client):
+        """Assignments are searchable by expert id immediately."""
+        await client.post("/api/v1/cases/case-001/assign", json={"expert_id": "exp-300"})
+        response = await client.get("/api/v1/cases:search", params={"expert_id": "exp-3*"})
+
+        assert [c["id"] for c in response.json()["items"]] == ["case-001"]
+
+
+class TestBatchGetCases:
+    """POST /api/v1/cases:batchGet endpoint tests."""
+
+    @pytest.mark.asyncio
+    async def test_batch_get_returns_found_and_missing(self, client):
+        """Found cases are returned in order and misses are listed."""
+        response = await client.post(
+            "/api/v1/cases:batchGet",
+            json={"ids": ["case-002", "nope", "case-001"]},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [c["id"] for c in data["items"]] == ["case-002", "case-001"]
+        assert data["missing"] == ["nope"]
+
+    @pytest.mark.asyncio
+    async def test_batch_get_empty_ids_returns_422(self, client):
+        """An empty id list is rejected."""
+        response = await client.post("/api/v1/cases:batchGet", json={"ids": []})
+
+        assert response.status_code == 422
+
+
+class TestCaseStats:
+    """GET /api/v1/cases:stats and POST /api/v1/cases:rebuildStats tests."""
+
+    @pytest.mark.asyncio
+    async def test_stats_reflect_seed_and_assignment(self, client):
+        """Assigning a case moves it between status buckets."""
+        await client.post("/api/v1/cases/case-001/assign", json={"expert_id": "exp-300"})
+
+        response = await client.get("/api/v1/cases:stats")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 2
+        assert data["by_status"]["assigned"] == 1
+        assert data["by_status"]["submitted"] == 0
+        assert data["by_expert"] == {"exp-300": 1}
+        assert sum(data["by_day"].values()) == 2
+
+    @pytest.mark.asyncio
+    async def test_rebuild_reports_no_drift(self, client):
+        """Rebuilding consistent counters returns the same numbers."""
+        live = (await client.get("/api/v1/cases:stats")).json()
+
+        response = await client.post("/api/v1/cases:rebuildStats")
+
+        assert response.status_code == 200
+        assert response.json() == {"stats": live, "drifted": False}
+
+
+class TestOverdueCases:
+    """GET /api/v1/cases:overdue tests."""
+
+    @pytest.mark.asyncio
+    async def test_assigned_case_becomes_overdue(self, app, client):
+        """An assigned case gets a deadline and is listed once it passes."""
+        await client.post("/api/v1/cases/case-001/assign", json={"expert_id": "exp-300"})
+        case = (await client.get("/api/v1/cases/case-001")).json()
+        due_at = datetime.fromisoformat(case["due_at"])
+
+        assert (await client.get("/api/v1/cases:overdue")).json()["items"] == []
+        app.state.sla.advance((due_at + timedelta(seconds=1)).timestamp())
+        response = await client.get("/api/v1/cases:overdue")
+
+        assert response.status_code == 200
+        assert [c["id"] for c in response.json()["items"]] == ["case-001"]
+        assert response.json()["has_more"] is False
+
+    @pytest.mark.asyncio
+    async def test_unassigned_submitted_case_becomes_overdue(self, app, client):
+        """A submitted case is due even if nobody assigns it."""
+        case = (await client.get("/api/v1/cases/case-001")).json()
+        due_at = datetime.fromisoformat(case["due_at"])
+
+        async with app.router.lifespan_context(app):
+            app.state.sla.advance((due_at + timedelta(seconds=1)).timestamp())
+            response = await client.get("/api/v1/cases:overdue")
+
+        assert [c["id"] for c in response.json()["items"]] == ["case-001"]
+
+    @pytest.mark.asyncio
+    async def test_stored_deadlines_are_tracked_after_a_restart(self, tmp_path):
+        """A new process tracks the deadlines saved in a durable store."""
+        settings = Settings(
+            repo_backend="sqlite",
+            repo_sqlite_path=str(tmp_path / "cases.db"),
+            repo_seed_demo=True,
+            warmup_enabled=False,
+        )
+        before = create_app(settings)
+        async with AsyncClient(transport=ASGITransport(app=before), base_url="http://test") as c:
+            await c.post("/api/v1/cases/case-001/assign", json={"expert_id": "exp-300"})
+            case = (await c.get("/api/v1/cases/case-001")).json()
+        due_at = datetime.fromisoformat(case["due_at"])
+
+        after = create_app(settings)
+        async with after.router.lifespan_context(after), \
+                AsyncClient(transport=ASGITransport(app=after), base_url="http://test") as c:
+            after.state.sla.advance((due_at + timedelta(seconds=1)).timestamp())
+            response = await c.get("/api/v1/cases:overdue")
+
+        assert [c["id"] for c in response.json()["items"]] == ["case-001"]
+
+    @pytest.mark.asyncio
+    async def test_overdue_limit_out_of_range_returns_422(self, client):
+        """limit must be between 1 and 500."""
+        response = await client.get("/api/v1/cases:overdue?limit=0")
+
+        assert response.status_code == 422
@@ -0,0 +1,111 @@
+"""Integration tests for response compression and encoder wiring."""
+
+import pytest
+from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+
+from api.compression import negotiate_encoding
+from config import Settings
+from main import create_app
+
+
+def _build_app(**overrides):
+    """Create an app with extra routes returning large and streamed bodies."""
+    app = create_app(Settings(**overrides))
+    router = APIRouter()
+
+    @router.get("/big")
+    async def big() -> dict:
+        return {"items": [{"id": f"case-{i:05d}", "status": "submitted"} for i in range(500)]}
+
+    @router.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks():
+            for i in range(3):
+                yield b"chunk-%d " % i * 200
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    app.include_router(router)
+    return app
+
+
+async def _get(app, path, accept="gzip"):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        return await ac.get(path, headers={"Accept-Encoding": accept})
+
+
+class TestCompressionMiddleware:
+    """CompressionMiddleware behaviour through the full app."""
+
+    @pytest.mark.asyncio
+    async def test_small_response_is_not_compressed(self):
+        """Bodies under the threshold should be sent unencoded."""
+        response = await _get(_build_app(), "/api/v1/cases/case-001")
+
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+        assert response.json()["id"] == "case-001"
+
+    @pytest.mark.asyncio
+    async def test_large_response_is_gzipped(self):
+        """Bodies over the threshold should be gzip encoded."""
+        response = await _get(_build_app(), "/big")
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "accept-encoding" in response.headers["vary"].lower()
+        assert int(response.headers["content-length"]) < len(response.content)
+        assert len(response.json()["items"]) == 500
+
+    @pytest.mark.asyncio
+    async def test_streaming_response_is_compressed_per_chunk(self):
+        """Streamed bodies should be compressed without a content-length."""
+        response = await _get(_build_app(), "/stream")
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert response.text.startswith("chunk-0")
+
+    @pytest.mark.asyncio
+    async def test_identity_client_gets_plain_body(self):
+        """Clients that do not accept gzip should get the raw body."""
+        response = await _get(_build_app(), "/big", accept="identity")
+
+        assert "content-encoding" not in response.headers
+
+    @pytest.mark.asyncio
+    async def test_compression_can_be_disabled(self):
+        """compression_enabled=False should bypass the middleware."""
+        response = await _get(_build_app(compression_enabled=False), "/big")
+
+        assert "content-encoding" not in response.headers
+
+    @pytest.mark.asyncio
+    async def test_stdlib_encoder_serves_same_payload(self):
+        """Switching the encoder should not change the response document."""
+        fast = (await _get(_build_app(), "/api/v1/cases/case-001")).json()
+        slow = (await _get(_build_app(json_encoder="stdlib"), "/api/v1/cases/case-001")).json()
+
+        assert fast.keys() == slow.keys()
+        timestamps = ("created_at", "due_at")
+        assert {k: v for k, v in fast.items() if k not in timestamps} == {
+            k: v for k, v in slow.items() if k not in timestamps
+        }
+
+
+class TestNegotiateEncoding:
+    """Accept-Encoding negotiation."""
+
+    def test_respects_server_preference(self):
+        """Server order wins among accepted encodings."""
+        assert negotiate_encoding("gzip, br", ("br", "gzip")) == "br"
+
+    def test_zero_quality_is_refused(self):
+        """q=0 means the client refuses the encoding."""
+        assert negotiate_encoding("gzip;q=0, *;q=0", ("gzip",)) is None
+
+    def test_wildcard_accepts_anything(self):
+        """A bare wildcard accepts any encoding."""
+        assert negotiate_encoding("*", ("gzip",)) == "gzip"
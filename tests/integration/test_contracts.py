@@ -0,0 +1,83 @@
+"""Integration tests keeping the API and contracts/ in agreement."""
+
+import copy
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from config import Settings
+from main import create_app
+from utils.contract_diff import diff_openapi
+from utils.contracts import ContractSet
+
+CONTRACTS = ContractSet.load(Settings().contracts_dir)
+
+
+async def _client(app):
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+class TestContractDrift:
+    """The generated OpenAPI document matches the hand-written contracts."""
+
+    def test_app_matches_contracts(self):
+        """Every contract operation is served as declared, and nothing more."""
+        assert diff_openapi(CONTRACTS.documents, create_app().openapi()) == []
+
+    def test_drift_is_reported(self):
+        """A contract change the app does not follow shows up in the diff."""
+        documents = copy.deepcopy(CONTRACTS.documents)
+        case = documents[0]["components"]["schemas"]["Case"]
+        case["properties"]["status"]["enum"].append("archived")
+
+        differences = diff_openapi(documents, create_app().openapi())
+
+        assert differences
+        assert any("status.enum" in line for line in differences)
+
+
+class TestContractValidationMiddleware:
+    """Sampled responses are checked against the contracts."""
+
+    @pytest.mark.asyncio
+    async def test_conforming_responses_are_counted(self):
+        """At a sample rate of 1, every covered response is checked."""
+        app = create_app(Settings(contract_validation_rate=1.0))
+        async with await _client(app) as client:
+            await client.get("/api/v1/cases/case-001")
+            await client.get("/api/v1/cases/missing")
+            await client.get("/api/v1/cases:search", params={"referrer_id": "ref-*"})
+            debug = (await client.get("/debug/contracts")).json()
+
+        checks = app.state.metrics.counter("contract_checks_total", "")
+        assert checks.value(result="ok") == 3
+        assert debug == {"sample_rate": 1.0, "violations": []}
+
+    @pytest.mark.asyncio
+    async def test_violation_is_recorded_without_touching_the_response(self):
+        """A response that breaks its contract is still sent, and recorded."""
+        app = create_app(Settings(contract_validation_rate=1.0))
+
+        @app.get("/api/v1/experts/{expert_id}", include_in_schema=False)
+        async def broken(expert_id: str) -> dict:
+            return {"id": expert_id}
+
+        app.router.routes.insert(0, app.router.routes.pop())
+        async with await _client(app) as client:
+            response = await client.get("/api/v1/experts/exp-1")
+            violations = (await client.get("/debug/contracts")).json()["violations"]
+
+        assert response.json() == {"id": "exp-1"}
+        assert len(violations) == 1
+        assert violations[0]["path"] == "/api/v1/experts/{expert_id}"
+        assert "missing required property" in violations[0]["error"]
+
+    @pytest.mark.asyncio
+    async def test_off_by_default(self):
+        """With the default zero rate no monitor is built and the debug endpoint is absent."""
+        app = create_app()
+        async with await _client(app) as client:
+            response = await client.get("/debug/contracts")
+
+        assert app.state.contracts is None
+        assert response.status_code == 404
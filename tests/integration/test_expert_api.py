@@ -0,0 +1,95 @@
+"""Integration tests for the /experts endpoints and expert-checked assignment."""
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from main import create_app
+
+
+@pytest.fixture
+async def client():
+    """Async test client for a fresh app with demo experts."""
+    transport = ASGITransport(app=create_app())
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+
+class TestExperts:
+    """GET/PUT /api/v1/experts/{expert_id} and GET /api/v1/experts:available."""
+
+    @pytest.mark.asyncio
+    async def test_get_expert(self, client):
+        """Seeded experts are returned; unknown ids are 404."""
+        response = await client.get("/api/v1/experts/exp-200")
+
+        assert response.status_code == 200
+        assert response.json()["specialties"] == ["psychiatry", "neurology"]
+        assert (await client.get("/api/v1/experts/exp-404")).status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_put_expert(self, client):
+        """PUT creates an expert that availability queries then find."""
+        response = await client.put(
+            "/api/v1/experts/exp-900",
+            json={"name": "Dr. New", "specialties": ["cardiology"], "on_call_hours": [0, 1]},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["open_cases"] == 0
+        found = await client.get("/api/v1/experts:available", params={"specialty": "cardiology"})
+        assert [e["id"] for e in found.json()["items"]] == ["exp-900"]
+
+    @pytest.mark.asyncio
+    async def test_put_rejects_out_of_range_hours(self, client):
+        """On-call hours must be 0-167."""
+        response = await client.put(
+            "/api/v1/experts/exp-900", json={"name": "Dr. New", "on_call_hours": [168]}
+        )
+
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_available_on_call(self, client):
+        """'at' keeps only experts on call at that instant (Saturday: always-on only)."""
+        response = await client.get(
+            "/api/v1/experts:available",
+            params={"specialty": "neurology", "at": "2026-01-10T12:00:00Z"},
+        )
+
+        assert response.status_code == 200
+        assert [e["id"] for e in response.json()["items"]] == ["exp-300"]
+        assert response.json()["has_more"] is False
+
+
+class TestAssignmentChecksExpert:
+    """POST /api/v1/cases/{case_id}/assign validates the expert."""
+
+    @pytest.mark.asyncio
+    async def test_unknown_expert_returns_422(self, client):
+        """An unregistered expert id is rejected."""
+        response = await client.post(
+            "/api/v1/cases/case-001/assign", json={"expert_id": "exp-404"}
+        )
+
+        assert response.status_code == 422
+        assert "exp-404" in response.json()["detail"]
+
+    @pytest.mark.asyncio
+    async def test_inactive_expert_returns_409(self, client):
+        """A deactivated expert cannot take cases."""
+        await client.put("/api/v1/experts/exp-100", json={"name": "Dr. Hale", "active": False})
+
+        response = await client.post(
+            "/api/v1/cases/case-001/assign", json={"expert_id": "exp-100"}
+        )
+
+        assert response.status_code == 409
+
+    @pytest.mark.asyncio
+    async def test_assignment_counts_toward_capacity(self, client):
+        """The expert's open case count rises with an assignment."""
+        await client.post("/api/v1/cases/case-001/assign", json={"expert_id": "exp-100"})
+
+        response = await client.get("/api/v1/experts/exp-100")
+
+        assert response.json()["open_cases"] == 1
@@ -0,0 +1,92 @@
+"""Integration tests for Idempotency-Key on POST /cases/{case_id}/assign."""
+
+import asyncio
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from api.dependencies import get_case_service
+from config import Settings
+from main import create_app
+from services.case_service import CaseService
+
+ASSIGN = "/api/v1/cases/case-001/assign"
+
+
+class CountingService(CaseService):
+    """CaseService that counts assignment attempts."""
+
+    calls = 0
+
+    async def assign_expert(self, case_id, expert_id):
+        CountingService.calls += 1
+        await asyncio.sleep(0.01)
+        return await super().assign_expert(case_id, expert_id)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+async def client(request, tmp_path):
+    """Client for an app using each idempotency backend."""
+    CountingService.calls = 0
+    app = create_app(Settings(
+        idempotency_backend=request.param,
+        idempotency_sqlite_path=str(tmp_path / "idem.db"),
+    ))
+    app.dependency_overrides[get_case_service] = lambda: CountingService(app.state.repo)
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+
+def _post(client, key, expert="exp-200"):
+    return client.post(ASSIGN, json={"expert_id": expert}, headers={"Idempotency-Key": key})
+
+
+class TestIdempotentAssign:
+    """Idempotency-Key semantics on assign_expert."""
+
+    @pytest.mark.asyncio
+    async def test_retry_replays_success_instead_of_409(self, client):
+        """A retried assignment returns the original 200, not a conflict."""
+        first = await _post(client, "retry-1")
+        second = await _post(client, "retry-1")
+
+        assert first.status_code == second.status_code == 200
+        assert second.json() == first.json()
+        assert second.headers["idempotent-replayed"] == "true"
+        assert CountingService.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_duplicates_execute_once(self, client):
+        """Concurrent requests with one key reach the service once."""
+        responses = await asyncio.gather(*(_post(client, "burst") for _ in range(5)))
+
+        assert {r.status_code for r in responses} == {200}
+        assert CountingService.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_key_reused_with_different_body_returns_422(self, client):
+        """The same key with a different expert is rejected."""
+        await _post(client, "reuse")
+        response = await _post(client, "reuse", expert="exp-999")
+
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_domain_errors_are_replayed(self, client):
+        """A recorded 404 is replayed for the same key."""
+        url = "/api/v1/cases/no-such-case/assign"
+        headers = {"Idempotency-Key": "missing"}
+        first = await client.post(url, json={"expert_id": "e"}, headers=headers)
+        second = await client.post(url, json={"expert_id": "e"}, headers=headers)
+
+        assert first.status_code == second.status_code == 404
+        assert second.json()["detail"] == first.json()["detail"]
+
+    @pytest.mark.asyncio
+    async def test_without_key_behaviour_is_unchanged(self, client):
+        """Requests without the header still conflict on repeat."""
+        await client.post(ASSIGN, json={"expert_id": "exp-200"})
+        response = await client.post(ASSIGN, json={"expert_id": "exp-200"})
+
+        assert response.status_code == 409
@@ -0,0 +1,111 @@
+"""Overload harness for rate limiting and load shedding.
+
+Drives far more concurrent requests than the server can run and checks
+that admitted requests keep a bounded p99 while the excess is shed.
+"""
+
+import asyncio
+import time
+
+import pytest
+from fastapi import APIRouter
+from httpx import ASGITransport, AsyncClient
+
+from benchmarks._harness import percentile
+from config import Settings
+from main import create_app
+
+SERVICE_TIME = 0.01
+
+
+def _overload_app(**overrides):
+    """App with a slow endpoint under the API prefix."""
+    settings = Settings(**{"rate_limit_enabled": False, **overrides})
+    app = create_app(settings)
+    router = APIRouter(prefix=settings.api_prefix)
+
+    @router.get("/slow")
+    async def slow() -> dict:
+        await asyncio.sleep(SERVICE_TIME)
+        return {"ok": True}
+
+    app.include_router(router)
+    return app
+
+
+async def _fire(app, n, path="/api/v1/slow", headers=None):
+    """Send n concurrent requests; return (status, latency) pairs."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        async def one():
+            start = time.perf_counter()
+            response = await ac.get(path, headers=headers)
+            return response, time.perf_counter() - start
+
+        return await asyncio.gather(*(one() for _ in range(n)))
+
+
+class TestLoadShedding:
+    """Adaptive concurrency limiting under overload."""
+
+    @pytest.mark.asyncio
+    async def test_p99_stays_bounded_under_overload(self):
+        """Admitted p99 is bounded by the queue interval, not the backlog."""
+        app = _overload_app(
+            load_shedding_max_concurrency=4,
+            load_shedding_target_delay=0.005,
+            load_shedding_interval=0.05,
+        )
+        results = await _fire(app, 400)
+
+        ok = [lat for resp, lat in results if resp.status_code == 200]
+        shed = [resp for resp, _ in results if resp.status_code == 503]
+        unbounded_p99 = 400 / 4 * SERVICE_TIME
+
+        assert ok and shed
+        assert all(resp.headers["retry-after"] == "1" for resp in shed)
+        assert percentile(ok, 99) < unbounded_p99 / 2
+
+    @pytest.mark.asyncio
+    async def test_shedding_is_reported_in_metrics(self):
+        """Shed requests and queue delay appear in /metrics."""
+        app = _overload_app(load_shedding_max_concurrency=1, load_shedding_interval=0.005)
+        await _fire(app, 20)
+        text = (await _fire(app, 1, path="/metrics"))[0][0].text
+
+        assert "loadshed_rejected_total" in text
+        assert "loadshed_queue_delay_seconds_count" in text
+        assert app.state.metrics.get("loadshed_rejected_total").value() > 0
+
+    @pytest.mark.asyncio
+    async def test_non_api_paths_are_not_limited(self):
+        """Operational endpoints bypass the limiter."""
+        app = _overload_app(load_shedding_max_concurrency=1, load_shedding_max_queue=0)
+        results = await _fire(app, 10, path="/metrics")
+
+        assert all(resp.status_code == 200 for resp, _ in results)
+
+
+class TestRateLimiting:
+    """Per-client token buckets through the full app."""
+
+    @pytest.mark.asyncio
+    async def test_exhausted_client_gets_429(self):
+        """A client over its burst receives 429 with Retry-After."""
+        app = _overload_app(rate_limit_enabled=True, rate_limit_burst=5, rate_limit_per_second=1)
+        results = await _fire(app, 8, headers={"X-API-Key": "noisy"})
+        codes = sorted(resp.status_code for resp, _ in results)
+
+        assert codes.count(200) == 5
+        assert codes.count(429) == 3
+        limited = next(resp for resp, _ in results if resp.status_code == 429)
+        assert int(limited.headers["retry-after"]) >= 1
+
+    @pytest.mark.asyncio
+    async def test_other_client_is_unaffected(self):
+        """Exhausting one API key leaves another key's bucket intact."""
+        app = _overload_app(rate_limit_enabled=True, rate_limit_burst=2, rate_limit_per_second=1)
+        await _fire(app, 5, headers={"X-API-Key": "noisy"})
+        results = await _fire(app, 2, headers={"X-API-Key": "quiet"})
+
+        assert all(resp.status_code == 200 for resp, _ in results)
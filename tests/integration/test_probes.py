@@ -0,0 +1,86 @@
+"""Integration tests for startup warm-up and the health probes."""
+
+import asyncio
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from config import Settings
+from main import create_app
+
+
+async def _get(app, path):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        return await ac.get(path)
+
+
+async def _wait_until_settled(app, timeout=2.0):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while app.state.readiness.status in ("starting", "warming"):
+        assert loop.time() < deadline, "warm-up did not finish"
+        await asyncio.sleep(0.01)
+
+
+class TestProbes:
+    """/healthz and /readyz behaviour across the app lifecycle."""
+
+    @pytest.mark.asyncio
+    async def test_healthz_is_always_ok(self):
+        """Liveness does not depend on warm-up."""
+        response = await _get(create_app(), "/healthz")
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "ok"}
+
+    @pytest.mark.asyncio
+    async def test_not_ready_before_startup(self):
+        """Without a started lifespan the app reports 503."""
+        response = await _get(create_app(), "/readyz")
+
+        assert response.status_code == 503
+        assert response.json()["status"] == "starting"
+
+    @pytest.mark.asyncio
+    async def test_ready_after_warmup(self):
+        """Warm-up loads the hot ids into the cache, then readiness flips."""
+        app = create_app(Settings(
+            warmup_hot_ids=("case-001", "missing"), repo_cache="lru:10"
+        ))
+        async with app.router.lifespan_context(app):
+            await _wait_until_settled(app)
+            response = await _get(app, "/readyz")
+
+            assert response.status_code == 200
+            assert response.json()["warmup_seconds"] >= 0
+            assert len(app.state.repo) == 1
+            assert "app_ready 1\n" in app.state.metrics.render_prometheus()
+
+        assert app.state.readiness.status == "stopping"
+
+    @pytest.mark.asyncio
+    async def test_warmup_disabled_is_ready_immediately(self):
+        """With warm-up off the app is ready as soon as it starts."""
+        app = create_app(Settings(warmup_enabled=False))
+        async with app.router.lifespan_context(app):
+            assert (await _get(app, "/readyz")).status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_failed_warmup_stays_unready(self):
+        """A warm-up error is reported and readiness never flips."""
+        app = create_app()
+
+        def broken_openapi():
+            raise RuntimeError("schema build failed")
+
+        app.openapi = broken_openapi
+        async with app.router.lifespan_context(app):
+            await _wait_until_settled(app)
+            response = await _get(app, "/readyz")
+
+        assert response.status_code == 503
+        assert response.json() == {
+            "status": "failed",
+            "detail": "RuntimeError: schema build failed",
+        }
@@ -0,0 +1,207 @@
+"""Integration tests for read replicas and consistency tokens."""
+
+import asyncio
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from config import Settings
+from exceptions import ValidationError
+from main import create_app
+from models import Case
+from utils.change_feed import EPOCH_HEADER, REPLICATION_TOKEN_HEADER
+from utils.feed_follower import FeedFollower
+from utils.metrics import MetricsRegistry
+
+TOKEN = "x-consistency-token"
+SECRET = "replicas-only"
+COPY = {REPLICATION_TOKEN_HEADER: SECRET}
+
+
+async def _copy(replica, to_primary) -> None:
+    """Load the primary's snapshot into the replica a case per page, as its follower would."""
+    follower = FeedFollower(
+        replica.state.replica, "http://primary/api/v1/cases:watch",
+        "http://primary/api/v1/cases:snapshot", MetricsRegistry(), client=to_primary,
+        token=SECRET, page_size=1,
+    )
+    await follower.copy_primary()
+
+
+async def _replicate(primary, replica) -> None:
+    """Apply the primary's changes the replica has not seen, as its follower would."""
+    feed = primary.state.change_feed
+    sub = feed.subscribe(after_seq=replica.state.replica.applied)
+    for event in await sub.next_batch(0):
+        await replica.state.replica.apply(event.seq, Case.model_validate_json(event.data))
+    feed.unsubscribe(sub)
+
+
+@pytest.fixture
+async def apps():
+    primary = create_app(Settings(warmup_enabled=False, repo_replication_token=SECRET))
+    replica = create_app(Settings(
+        repo_replica_of="http://primary.invalid", repo_replica_max_wait=0.05,
+        repo_replication_token=SECRET, warmup_enabled=False,
+    ))
+    async with primary.router.lifespan_context(primary):
+        async with AsyncClient(transport=ASGITransport(app=primary),
+                               base_url="http://primary") as to_primary, \
+                AsyncClient(transport=ASGITransport(app=replica),
+                            base_url="http://replica") as to_replica:
+            await _copy(replica, to_primary)
+            yield primary, replica, to_primary, to_replica
+
+
+class TestBootstrap:
+    """Replicas start from a full copy of the primary."""
+
+    @pytest.mark.asyncio
+    async def test_snapshot_holds_every_case_and_its_position(self, apps):
+        """The copy covers cases saved before the replica started."""
+        primary, replica, to_primary, to_replica = apps
+        await to_primary.post("/api/v1/cases/case-001/assign", json={"expert_id": "exp-300"})
+
+        snapshot = await to_primary.get("/api/v1/cases:snapshot", headers=COPY)
+
+        body = snapshot.json()
+        assert (body["epoch"], body["position"]) == (primary.state.change_feed.epoch, 1)
+        assert snapshot.headers[EPOCH_HEADER] == body["epoch"]
+        assert {case["id"]: case["status"] for case in body["items"]} == {
+            "case-001": "assigned", "case-002": "draft",
+        }
+        assert body["next_cursor"] is None
+
+    @pytest.mark.asyncio
+    async def test_pages_keep_the_position_of_the_first(self, apps):
+        """The cursor carries the copy's position past later writes."""
+        _, _, to_primary, _ = apps
+        url = "/api/v1/cases:snapshot"
+
+        first = (await to_primary.get(url, params={"limit": 1}, headers=COPY)).json()
+        await to_primary.post("/api/v1/cases/case-001/assign", json={"expert_id": "exp-300"})
+        second = (await to_primary.get(
+            url, params={"limit": 1, "cursor": first["next_cursor"]}, headers=COPY
+        )).json()
+        last = (await to_primary.get(
+            url, params={"limit": 1, "cursor": second["next_cursor"]}, headers=COPY
+        )).json()
+
+        assert [page["position"] for page in (first, second, last)] == [0, 0, 0]
+        assert [c["id"] for page in (first, second) for c in page["items"]] == [
+            "case-001", "case-002",
+        ]
+        assert (last["items"], last["next_cursor"]) == ([], None)
+
+    @pytest.mark.asyncio
+    async def test_snapshot_is_only_served_to_replicas(self, apps):
+        """Copies need the shared token, and a primary without one serves none."""
+        _, _, to_primary, _ = apps
+        url = "/api/v1/cases:snapshot"
+        unconfigured = create_app(Settings(warmup_enabled=False))
+        async with AsyncClient(transport=ASGITransport(app=unconfigured),
+                               base_url="http://other") as to_other:
+            disabled = await to_other.get(url, headers=COPY)
+
+        missing = await to_primary.get(url)
+        wrong = await to_primary.get(url, headers={REPLICATION_TOKEN_HEADER: "guess"})
+
+        assert (missing.status_code, wrong.status_code, disabled.status_code) == (403, 403, 404)
+
+    def test_replica_needs_the_replication_token(self):
+        """A replica without the token could never copy its primary."""
+        with pytest.raises(ValidationError):
+            create_app(Settings(repo_replica_of="http://primary.invalid"))
+
+    @pytest.mark.asyncio
+    async def test_cursor_from_another_epoch_is_refused(self, apps):
+        """A copy begun before the primary restarted must start over."""
+        _, _, to_primary, _ = apps
+        url = "/api/v1/cases:snapshot"
+        first = (await to_primary.get(url, params={"limit": 1}, headers=COPY)).json()
+        restarted = create_app(Settings(warmup_enabled=False, repo_replication_token=SECRET))
+        async with AsyncClient(transport=ASGITransport(app=restarted),
+                               base_url="http://primary") as to_restarted:
+            response = await to_restarted.get(
+                url, params={"cursor": first["next_cursor"]}, headers=COPY
+            )
+
+        assert response.status_code == 409
+
+    @pytest.mark.asyncio
+    async def test_replica_is_unavailable_before_its_copy(self):
+        """Without a copy a replica answers 503 rather than 404s for existing cases."""
+        replica = create_app(Settings(repo_replica_of="http://primary.invalid",
+                                      repo_replication_token=SECRET, warmup_enabled=False))
+        async with AsyncClient(transport=ASGITransport(app=replica),
+                               base_url="http://replica") as to_replica:
+            response = await to_replica.get("/api/v1/cases/case-002")
+
+        assert response.status_code == 503
+
+    @pytest.mark.asyncio
+    async def test_copied_replica_serves_the_primarys_cases(self, apps):
+        """Cases the primary held at startup are readable on the replica."""
+        _, _, _, to_replica = apps
+
+        response = await to_replica.get("/api/v1/cases/case-002")
+
+        assert (response.status_code, response.json()["status"]) == (200, "draft")
+
+
+class TestReadYourWrites:
+    """Tokens issued by the primary and honoured by replicas."""
+
+    @pytest.mark.asyncio
+    async def test_write_token_waits_for_the_replica(self, apps):
+        """A read carrying a write's token is not answered from older data."""
+        primary, replica, to_primary, to_replica = apps
+        written = await to_primary.post(
+            "/api/v1/cases/case-001/assign", json={"expert_id": "exp-300"}
+        )
+        token = written.headers[TOKEN]
+
+        lagging = await to_replica.get("/api/v1/cases/case-001", headers={TOKEN: token})
+        stale = await to_replica.get("/api/v1/cases/case-001")
+        await _replicate(primary, replica)
+        fresh = await to_replica.get("/api/v1/cases/case-001", headers={TOKEN: token})
+
+        assert token == "1"
+        assert lagging.status_code == 503
+        assert (stale.json()["status"], stale.headers[TOKEN]) == ("submitted", "0")
+        assert (fresh.json()["status"], fresh.headers[TOKEN]) == ("assigned", "1")
+
+    @pytest.mark.asyncio
+    async def test_read_completes_when_the_change_arrives(self, apps):
+        """A read shortly behind its token waits rather than failing."""
+        primary, replica, to_primary, to_replica = apps
+        replica.state.replica.max_wait = 1.0
+        await to_primary.post("/api/v1/cases/case-001/assign", json={"expert_id": "exp-300"})
+
+        read = asyncio.create_task(
+            to_replica.get("/api/v1/cases/case-001", headers={TOKEN: "1"})
+        )
+        await asyncio.sleep(0.01)
+        await _replicate(primary, replica)
+
+        assert (await read).json()["expert_id"] == "exp-300"
+
+    @pytest.mark.asyncio
+    async def test_replica_rejects_writes(self, apps):
+        """Writes sent to a replica are refused rather than diverging."""
+        _, _, _, to_replica = apps
+
+        response = await to_replica.post(
+            "/api/v1/cases/case-001/assign", json={"expert_id": "exp-300"}
+        )
+
+        assert response.status_code == 409
+
+    @pytest.mark.asyncio
+    async def test_malformed_token_is_rejected(self, apps):
+        """Tokens are non-negative integers."""
+        _, _, to_primary, _ = apps
+
+        response = await to_primary.get("/api/v1/cases/case-001", headers={TOKEN: "-1"})
+
+        assert response.status_code == 422
@@ -0,0 +1,73 @@
+"""Integration tests for post-assignment background jobs."""
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from config import Settings
+from main import create_app
+from utils.assignment_effects import (
+    InMemoryAuditSink,
+    LocalExpertNotifier,
+    LogExpertNotifier,
+    NullAuditSink,
+)
+
+
+@pytest.fixture
+def app():
+    """Fresh app with fast retries, recording notifications and audit records."""
+    app = create_app(Settings(job_retry_base_delay=0.001, job_retry_max_delay=0.002))
+    app.state.side_effects.notifier = LocalExpertNotifier()
+    app.state.side_effects.audit = InMemoryAuditSink()
+    return app
+
+
+async def _assign(app, case_id="case-001"):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        return await ac.post(f"/api/v1/cases/{case_id}/assign", json={"expert_id": "exp-200"})
+
+
+class TestAssignmentSideEffects:
+    """Assignments enqueue notify/audit/stats jobs drained at shutdown."""
+
+    def test_default_wiring_keeps_no_records(self):
+        """Without an audit log, notifications are logged and audit records dropped."""
+        effects = create_app(Settings()).state.side_effects
+
+        assert isinstance(effects.notifier, LogExpertNotifier)
+        assert isinstance(effects.audit, NullAuditSink)
+
+    @pytest.mark.asyncio
+    async def test_side_effects_complete_by_shutdown(self, app):
+        """All three jobs have run once the lifespan exits."""
+        effects = app.state.side_effects
+        async with app.router.lifespan_context(app):
+            response = await _assign(app)
+            assert response.status_code == 200
+
+        assert [a.case_id for a in effects.notifier.sent] == ["case-001"]
+        assert effects.audit.records[0]["expert_id"] == "exp-200"
+        assert effects.stats.per_expert["exp-200"] == 1
+
+    @pytest.mark.asyncio
+    async def test_transient_notifier_failures_are_retried(self, app):
+        """A notifier that fails twice still delivers."""
+        effects = app.state.side_effects
+        effects.notifier.fail_times = 2
+        async with app.router.lifespan_context(app):
+            await _assign(app)
+
+        assert len(effects.notifier.sent) == 1
+        assert not effects.jobs.dead_letters
+
+    @pytest.mark.asyncio
+    async def test_rejected_assignment_enqueues_nothing(self, app):
+        """A 409 assignment has no side effects."""
+        effects = app.state.side_effects
+        async with app.router.lifespan_context(app):
+            response = await _assign(app, case_id="case-002")
+            assert response.status_code == 409
+
+        assert effects.notifier.sent == []
+        assert app.state.metrics.get("jobs_completed_total").samples() == []
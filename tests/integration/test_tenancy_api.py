@@ -0,0 +1,157 @@
+"""Integration tests for tenant isolation and per-tenant quotas."""
+
+import asyncio
+import time
+
+import pytest
+from fastapi import APIRouter
+from httpx import ASGITransport, AsyncClient
+
+from config import Settings
+from main import create_app
+from models import Case, CaseStatus
+
+
+def _tenant_app(**overrides):
+    """Tenancy-enabled app with a slow endpoint under the API prefix."""
+    settings = Settings(**{"tenancy_enabled": True, "rate_limit_enabled": False, **overrides})
+    app = create_app(settings)
+    router = APIRouter(prefix=settings.api_prefix)
+
+    @router.get("/slow")
+    async def slow() -> dict:
+        await asyncio.sleep(0.01)
+        return {"ok": True}
+
+    app.include_router(router)
+    return app
+
+
+async def _client(app):
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+def _as(tenant: str) -> dict[str, str]:
+    return {"X-Tenant-ID": tenant}
+
+
+class TestTenantIsolation:
+    """Each tenant reads and writes only its own partition."""
+
+    @pytest.mark.asyncio
+    async def test_tenants_do_not_see_each_others_cases(self):
+        """Demo cases live in the default tenant; acme's case only in acme."""
+        app = _tenant_app()
+        app.state.tenants.get("acme").repo.seed([
+            Case(id="case-a1", referrer_id="ref-100", status=CaseStatus.SUBMITTED),
+        ])
+        async with await _client(app) as client:
+            default = await client.get("/api/v1/cases/case-001")
+            hidden = await client.get("/api/v1/cases/case-001", headers=_as("acme"))
+            own = await client.get("/api/v1/cases/case-a1", headers=_as("acme"))
+            search = await client.get(
+                "/api/v1/cases:search", params={"referrer_id": "ref-100"}, headers=_as("acme")
+            )
+
+        assert default.status_code == 200
+        assert hidden.status_code == 404
+        assert own.status_code == 200
+        assert [c["id"] for c in search.json()["items"]] == ["case-a1"]
+
+    @pytest.mark.asyncio
+    async def test_idempotency_keys_are_scoped_per_tenant(self):
+        """The same key in two tenants runs two separate assignments."""
+        app = _tenant_app()
+        app.state.tenants.get("acme").repo.seed([
+            Case(id="case-001", referrer_id="ref-1", status=CaseStatus.SUBMITTED),
+        ])
+        headers = {"Idempotency-Key": "k-1"}
+        async with await _client(app) as client:
+            first = await client.post(
+                "/api/v1/cases/case-001/assign", json={"expert_id": "exp-300"}, headers=headers
+            )
+            second = await client.post(
+                "/api/v1/cases/case-001/assign",
+                json={"expert_id": "exp-300"},
+                headers={**headers, **_as("acme")},
+            )
+
+        assert first.status_code == second.status_code == 200
+        assert "idempotent-replayed" not in second.headers
+
+    @pytest.mark.asyncio
+    async def test_overdue_cases_are_tracked_per_tenant(self):
+        """Each partition has its own SLA tracker; the ticker advances all of them."""
+        app = _tenant_app()
+        app.state.tenants.get("acme").repo.seed([
+            Case(id="case-a1", referrer_id="ref-100", status=CaseStatus.SUBMITTED),
+        ])
+        async with await _client(app) as client:
+            await client.post(
+                "/api/v1/cases/case-a1/assign", json={"expert_id": "exp-300"}, headers=_as("acme")
+            )
+            for partition in app.state.tenants.partitions():
+                partition.deadlines.advance(time.time() + 73 * 3600)
+            acme = await client.get("/api/v1/cases:overdue", headers=_as("acme"))
+            default = await client.get("/api/v1/cases:overdue")
+
+        assert [c["id"] for c in acme.json()["items"]] == ["case-a1"]
+        assert default.json()["items"] == []
+
+    @pytest.mark.asyncio
+    async def test_unresolvable_tenants_are_rejected(self):
+        """Malformed ids get 422 and ids outside the allow-list 404."""
+        app = _tenant_app(tenant_allowed=("acme",))
+        async with await _client(app) as client:
+            malformed = await client.get("/api/v1/cases/case-001", headers=_as("Not/Valid"))
+            unknown = await client.get("/api/v1/cases/case-001", headers=_as("globex"))
+            allowed = await client.get("/api/v1/cases/case-001", headers=_as("acme"))
+
+        assert malformed.status_code == 422
+        assert unknown.status_code == 404
+        assert allowed.status_code == 404
+        assert allowed.json() == {"detail": "Case not found"}
+
+    @pytest.mark.asyncio
+    async def test_header_is_ignored_when_tenancy_is_disabled(self):
+        """Without tenancy every request uses the single shared store."""
+        app = create_app(Settings(rate_limit_enabled=False))
+        async with await _client(app) as client:
+            response = await client.get("/api/v1/cases/case-001", headers=_as("acme"))
+
+        assert app.state.tenants is None
+        assert response.status_code == 200
+
+
+class TestTenantQuotas:
+    """A noisy tenant exhausts only its own request quotas."""
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_is_per_tenant(self):
+        """Once acme's bucket is empty, acme gets 429 and globex is still served."""
+        app = _tenant_app(tenant_burst=3, tenant_rate_per_second=0.1)
+        async with await _client(app) as client:
+            noisy = [
+                (await client.get("/api/v1/slow", headers=_as("acme"))).status_code
+                for _ in range(5)
+            ]
+            quiet = await client.get("/api/v1/slow", headers=_as("globex"))
+
+        assert noisy == [200, 200, 200, 429, 429]
+        assert quiet.status_code == 200
+        requests = app.state.metrics.counter("tenant_requests_total", "")
+        assert requests.value(tenant="acme", result="rate_limited") == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap_is_per_tenant(self):
+        """Concurrent requests beyond acme's cap get 429 without delaying globex."""
+        app = _tenant_app(tenant_max_concurrency=2)
+        async with await _client(app) as client:
+            responses = await asyncio.gather(
+                *(client.get("/api/v1/slow", headers=_as("acme")) for _ in range(5)),
+                *(client.get("/api/v1/slow", headers=_as("globex")) for _ in range(2)),
+            )
+
+        acme = sorted(r.status_code for r in responses[:5])
+        assert acme == [200, 200, 429, 429, 429]
+        assert all(r.status_code == 200 for r in responses[5:])
@@ -0,0 +1,63 @@
+"""Integration tests for request tracing across API, service and repository."""
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from config import Settings
+from main import create_app
+
+TRACE_ID = "0af7651916cd43dd8448eb211c80319c"
+TRACEPARENT = f"00-{TRACE_ID}-b7ad6b7169203331-01"
+
+
+async def _client(app):
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+class TestRequestTracing:
+    """Spans recorded for API requests."""
+
+    @pytest.mark.asyncio
+    async def test_assignment_trace_covers_every_layer(self):
+        """An assignment yields route, dependency, service and repository spans."""
+        app = create_app(Settings(tracing_enabled=True))
+        async with await _client(app) as client:
+            response = await client.post(
+                "/api/v1/cases/case-001/assign",
+                json={"expert_id": "exp-200"},
+                headers={"traceparent": TRACEPARENT},
+            )
+            spans = (await client.get("/debug/traces", params={"trace_id": TRACE_ID})).json()["spans"]
+
+        assert response.headers["traceparent"].startswith(f"00-{TRACE_ID}-")
+        by_name = {s["name"]: s for s in spans}
+        root = by_name["POST /api/v1/cases/{case_id}/assign"]
+        assert root["parentSpanId"] == "b7ad6b7169203331"
+        assert by_name["get_case_service"]["parentSpanId"] == root["spanId"]
+        service = by_name["CaseService.assign_expert"]
+        assert service["parentSpanId"] == root["spanId"]
+        for child in ("CaseService.get_case", "ExpertRepository.reserve", "CaseRepository.save"):
+            assert child in by_name
+        assert by_name["CaseRepository.save"]["parentSpanId"] == service["spanId"]
+        assert {"key": "http.status_code", "value": {"intValue": "200"}} in root["attributes"]
+
+    @pytest.mark.asyncio
+    async def test_new_trace_without_header(self):
+        """Requests without traceparent start a fresh trace."""
+        app = create_app(Settings(tracing_enabled=True))
+        async with await _client(app) as client:
+            response = await client.get("/api/v1/cases/case-001")
+
+        trace_id = response.headers["traceparent"].split("-")[1]
+        assert trace_id != TRACE_ID and int(trace_id, 16)
+
+    @pytest.mark.asyncio
+    async def test_tracing_off_by_default(self):
+        """By default no header is added and the debug endpoint is 404."""
+        app = create_app()
+        async with await _client(app) as client:
+            response = await client.get("/api/v1/cases/case-001")
+            debug = await client.get("/debug/traces")
+
+        assert "traceparent" not in response.headers
+        assert debug.status_code == 404
@@ -0,0 +1,108 @@
+"""Integration tests for the GET /api/v1/cases:watch SSE stream."""
+
+import asyncio
+
+import pytest
+
+from config import Settings
+from main import create_app
+from models import CaseStatus
+
+
+async def _open_stream(app, query=b"", headers=()):
+    """Start a streaming request on the raw ASGI app.
+
+    Returns the running task, a queue of body chunks and a disconnect callback.
+    """
+    chunks: asyncio.Queue = asyncio.Queue()
+    disconnected = asyncio.Event()
+    started = asyncio.get_running_loop().create_future()
+
+    async def receive():
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            started.set_result(message)
+        elif message.get("body"):
+            await chunks.put(message["body"])
+
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": "/api/v1/cases:watch",
+        "raw_path": b"/api/v1/cases:watch", "query_string": query, "root_path": "",
+        "headers": [(b"host", b"test"), *headers], "client": ("1.2.3.4", 1234),
+        "server": ("test", 80),
+    }
+    task = asyncio.create_task(app(scope, receive, send))
+    start = await asyncio.wait_for(started, 1)
+    return task, start, chunks, disconnected.set
+
+
+async def _next_text(chunks) -> str:
+    return (await asyncio.wait_for(chunks.get(), 1)).decode()
+
+
+@pytest.fixture
+def app():
+    """Fresh app with a short heartbeat."""
+    return create_app(Settings(change_feed_heartbeat_seconds=0.05))
+
+
+class TestWatchCases:
+    """SSE change stream tests."""
+
+    @pytest.mark.asyncio
+    async def test_assignment_is_streamed(self, app):
+        """An assignment appears as a case event with a sequence id."""
+        task, start, chunks, disconnect = await _open_stream(app)
+        assert dict(start["headers"])[b"content-type"].startswith(b"text/event-stream")
+
+        repo = app.state.repo
+        case = await repo.get_by_id("case-001")
+        case.status, case.expert_id = CaseStatus.ASSIGNED, "exp-9"
+        await repo.save(case)
+
+        text = await _next_text(chunks)
+        assert text.startswith("id: 1\nevent: case\n")
+        assert '"expert_id":"exp-9"' in text
+        disconnect()
+        await asyncio.wait_for(task, 1)
+        assert app.state.change_feed.subscriber_count == 0
+
+    @pytest.mark.asyncio
+    async def test_idle_stream_sends_keepalive(self, app):
+        """With no changes, the stream emits comment heartbeats."""
+        task, _, chunks, disconnect = await _open_stream(app)
+
+        assert await _next_text(chunks) == ": keepalive\n\n"
+        disconnect()
+        await asyncio.wait_for(task, 1)
+
+    @pytest.mark.asyncio
+    async def test_resume_with_last_event_id(self, app):
+        """Last-Event-ID replays only later changes."""
+        repo = app.state.repo
+        case = await repo.get_by_id("case-002")
+        for _ in range(3):
+            await repo.save(case)
+
+        task, _, chunks, disconnect = await _open_stream(
+            app, headers=[(b"last-event-id", b"2")]
+        )
+
+        assert (await _next_text(chunks)).startswith("id: 3\n")
+        disconnect()
+        await asyncio.wait_for(task, 1)
+
+    @pytest.mark.asyncio
+    async def test_status_filter(self, app):
+        """A status filter suppresses non-matching changes."""
+        repo = app.state.repo
+        task, _, chunks, disconnect = await _open_stream(app, query=b"status=assigned")
+        await repo.save(await repo.get_by_id("case-002"))  # draft: filtered out
+
+        assert await _next_text(chunks) == ": keepalive\n\n"
+        disconnect()
+        await asyncio.wait_for(task, 1)
@@ -0,0 +1,137 @@
+"""Tests for the token-bucket, CoDel and per-key concurrency admission primitives."""
+
+import asyncio
+
+import pytest
+
+from utils.admission import CoDelLimiter, KeyedConcurrencyLimiter, TokenBucketLimiter
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTokenBucketLimiter:
+    """TokenBucketLimiter specification."""
+
+    def test_burst_then_reject(self):
+        """A client may spend its burst, then must wait for refill."""
+        clock = FakeClock()
+        limiter = TokenBucketLimiter(rate=10, burst=3, clock=clock)
+
+        assert [limiter.acquire("a") for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert limiter.acquire("a") == pytest.approx(0.1)
+
+    def test_refills_over_time(self):
+        """Tokens refill at the configured rate."""
+        clock = FakeClock()
+        limiter = TokenBucketLimiter(rate=10, burst=1, clock=clock)
+        limiter.acquire("a")
+
+        clock.now = 0.1
+        assert limiter.acquire("a") == 0.0
+
+    def test_clients_are_isolated(self):
+        """One client's exhaustion does not affect another."""
+        limiter = TokenBucketLimiter(rate=1, burst=1, clock=FakeClock())
+        limiter.acquire("a")
+
+        assert limiter.acquire("a") > 0
+        assert limiter.acquire("b") == 0.0
+
+    def test_tracked_clients_are_bounded(self):
+        """The least recently seen client is evicted past max_keys."""
+        limiter = TokenBucketLimiter(rate=1, burst=1, max_keys=2, clock=FakeClock())
+        for key in ("a", "b", "c"):
+            limiter.acquire(key)
+
+        assert len(limiter) == 2
+
+
+class TestCoDelLimiter:
+    """CoDelLimiter specification."""
+
+    @pytest.mark.asyncio
+    async def test_admits_up_to_max_concurrency_immediately(self):
+        """Slots below the limit are granted without queueing."""
+        limiter = CoDelLimiter(max_concurrency=2)
+
+        assert await limiter.acquire() == 0.0
+        assert await limiter.acquire() == 0.0
+        assert limiter.in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_release_hands_slot_to_waiter(self):
+        """A queued waiter is admitted when a holder releases."""
+        limiter = CoDelLimiter(max_concurrency=1, interval=1.0)
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert limiter.queue_depth == 1
+
+        limiter.release()
+
+        assert await waiter is not None
+        assert limiter.in_flight == 1
+        assert limiter.queue_depth == 0
+
+    @pytest.mark.asyncio
+    async def test_waiter_is_shed_after_interval(self):
+        """A waiter that never gets a slot is shed and leaves the queue."""
+        limiter = CoDelLimiter(max_concurrency=1, interval=0.01)
+        await limiter.acquire()
+
+        assert await limiter.acquire() is None
+        assert limiter.queue_depth == 0
+
+    @pytest.mark.asyncio
+    async def test_slot_handed_over_as_the_timeout_fires_is_kept(self, monkeypatch):
+        """A waiter given a slot in the same tick its timeout fires is admitted."""
+        limiter = CoDelLimiter(max_concurrency=1, interval=1.0)
+        await limiter.acquire()
+
+        async def release_then_time_out(future, timeout):
+            limiter.release()
+            raise asyncio.TimeoutError
+
+        monkeypatch.setattr(asyncio, "wait_for", release_then_time_out)
+        delay = await limiter.acquire()
+        limiter.release()
+
+        assert delay is not None
+        assert (limiter.in_flight, limiter.queue_depth) == (0, 0)
+
+    @pytest.mark.asyncio
+    async def test_full_queue_sheds_immediately(self):
+        """Arrivals beyond max_queue are shed without waiting."""
+        limiter = CoDelLimiter(max_concurrency=1, max_queue=0)
+        await limiter.acquire()
+
+        assert await limiter.acquire() is None
+
+
+class TestKeyedConcurrencyLimiter:
+    """KeyedConcurrencyLimiter specification."""
+
+    def test_caps_each_key_independently(self):
+        """A key at its cap is rejected while other keys are still admitted."""
+        limiter = KeyedConcurrencyLimiter(max_per_key=2)
+
+        assert [limiter.try_acquire("a") for _ in range(3)] == [True, True, False]
+        assert limiter.try_acquire("b") is True
+        assert limiter.in_flight("a") == 2
+
+    def test_release_frees_slot_and_forgets_idle_keys(self):
+        """Released slots are reusable; idle keys hold no memory."""
+        limiter = KeyedConcurrencyLimiter(max_per_key=1)
+        limiter.try_acquire("a")
+        limiter.release("a")
+
+        assert len(limiter) == 0
+        assert limiter.try_acquire("a") is True
@@ -0,0 +1,101 @@
+"""Tests for the read-coalescing repository decorator."""
+
+import asyncio
+
+import pytest
+
+from models import Case
+from utils.batching_repo import BatchingCaseRepository
+from utils.in_memory_repo import InMemoryCaseRepository
+from utils.metrics import MetricsRegistry
+
+
+class CountingRepo(InMemoryCaseRepository):
+    """In-memory store recording every get_many call."""
+
+    def __init__(self, fail: Exception | None = None):
+        super().__init__()
+        self.calls: list[list[str]] = []
+        self.fail = fail
+
+    async def get_many(self, case_ids):
+        self.calls.append(list(case_ids))
+        await asyncio.sleep(0)
+        if self.fail is not None:
+            raise self.fail
+        return await super().get_many(case_ids)
+
+
+def _repo(inner, **kwargs):
+    inner.seed([Case(id=f"case-{i}", referrer_id="ref-1") for i in range(10)])
+    return BatchingCaseRepository(inner, **kwargs)
+
+
+class TestBatchingCaseRepository:
+    """Coalescing of concurrent get_by_id calls."""
+
+    @pytest.mark.asyncio
+    async def test_one_tick_is_one_deduplicated_get_many(self):
+        """Concurrent reads share one backend call; each id is fetched once."""
+        inner = CountingRepo()
+        metrics = MetricsRegistry()
+        repo = _repo(inner, metrics=metrics)
+
+        results = await asyncio.gather(
+            *(repo.get_by_id(i) for i in ["case-1", "case-2", "case-1", "missing", "case-1"])
+        )
+
+        assert inner.calls == [["case-1", "case-2", "missing"]]
+        assert [c.id if c else None for c in results] == [
+            "case-1", "case-2", "case-1", None, "case-1"
+        ]
+        assert results[0] is results[2]
+        reads = metrics.get("repo_batch_reads_total")
+        assert (reads.value(result="queued"), reads.value(result="coalesced")) == (3, 2)
+        assert metrics.get("repo_batch_loads_total").value() == 1
+
+    @pytest.mark.asyncio
+    async def test_sequential_reads_are_separate_batches(self):
+        """A read issued after the previous batch was sent opens a new one."""
+        inner = CountingRepo()
+        repo = _repo(inner)
+
+        await repo.get_by_id("case-1")
+        await repo.get_by_id("case-1")
+
+        assert inner.calls == [["case-1"], ["case-1"]]
+
+    @pytest.mark.asyncio
+    async def test_full_batch_is_sent_at_once(self):
+        """Reaching max_batch flushes immediately and starts a new batch."""
+        inner = CountingRepo()
+        repo = _repo(inner, max_batch=4)
+
+        await asyncio.gather(*(repo.get_by_id(f"case-{i}") for i in range(10)))
+
+        assert [len(call) for call in inner.calls] == [4, 4, 2]
+
+    @pytest.mark.asyncio
+    async def test_backend_errors_reach_every_waiter(self):
+        """A failed batch raises the backend's error in every coalesced read."""
+        repo = _repo(CountingRepo(fail=RuntimeError("backend down")))
+
+        results = await asyncio.gather(
+            repo.get_by_id("case-1"), repo.get_by_id("case-1"), repo.get_by_id("case-2"),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_reader_does_not_cancel_the_others(self):
+        """Cancelling one waiter leaves the shared read running for the rest."""
+        repo = _repo(CountingRepo())
+        first = asyncio.ensure_future(repo.get_by_id("case-3"))
+        second = asyncio.ensure_future(repo.get_by_id("case-3"))
+        await asyncio.sleep(0)
+
+        first.cancel()
+
+        assert (await second).id == "case-3"
+        assert first.cancelled()
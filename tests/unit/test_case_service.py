@@ -13,11 +13,13 @@ Architecture:
 """
 
 import pytest
-from unittest.mock import AsyncMock
+from contextlib import nullcontext
+from unittest.mock import AsyncMock, MagicMock, Mock
 from datetime import datetime
 
-from models import Case, CaseStatus, CaseAssignment
-from exceptions import NotFoundError, InvalidStateError
+from models import Case, CaseStatus, CaseAssignment, CaseStatistics
+from exceptions import NotFoundError, InvalidStateError, ValidationError
+from services.case_service import MAX_BATCH_GET, CaseService
 
 
 class TestCaseService:
@@ -37,12 +39,12 @@ class TestCaseService:
             created_at=datetime(2026, 1, 15),
         )
         repo.save.return_value = None
+        repo.lock = MagicMock(return_value=nullcontext())
         return repo
 
     @pytest.fixture
     def service(self, mock_repo):
         """Service constructed with injected dependencies — no global state."""
-        from services.case_service import CaseService
         return CaseService(case_repo=mock_repo)
 
     # --- SUCCESS CONDITIONS ---
@@ -89,6 +91,12 @@ class TestCaseService:
             await service.get_case("case-999")
         assert "case-999" in str(exc.value)
 
+    @pytest.mark.asyncio
+    async def test_find_case_returns_none_for_missing_case(self, service, mock_repo):
+        """find_case reports a miss as None instead of raising."""
+        mock_repo.get_by_id.return_value = None
+        assert await service.find_case("case-999") is None
+
     @pytest.mark.asyncio
     async def test_assign_expert_to_completed_case_raises_invalid_state(
         self, service, mock_repo
@@ -150,4 +158,130 @@ class TestCaseService:
             if "from services." in line and "case_service" not in line
         ]
         assert len(lines_with_service_imports) == 0, \
-            "Service imports another service — use contracts instead"
\ No newline at end of file
+            "Service imports another service — use contracts instead"
+
+    # --- SEARCH ---
+
+    @pytest.mark.asyncio
+    async def test_search_cases_requests_one_extra_for_has_more(self, service, mock_repo):
+        """search_cases over-fetches by one to report has_more."""
+        mock_repo.search.return_value = [mock_repo.get_by_id.return_value] * 3
+
+        page = await service.search_cases(referrer_id="ref-1*", limit=2)
+
+        mock_repo.search.assert_called_once_with(
+            referrer_id="ref-1*", expert_id=None, limit=3
+        )
+        assert len(page.items) == 2
+        assert page.has_more is True
+
+    @pytest.mark.asyncio
+    async def test_search_cases_requires_a_pattern(self, service):
+        """At least one of referrer_id/expert_id must be given."""
+        with pytest.raises(ValidationError):
+            await service.search_cases()
+
+    # --- LISTENERS ---
+
+    @pytest.mark.asyncio
+    async def test_assign_expert_notifies_listeners(self, mock_repo):
+        """Listeners receive the saved case and assignment."""
+        listener = Mock()
+        service = CaseService(case_repo=mock_repo, listeners=[listener])
+
+        assignment = await service.assign_expert(case_id="case-001", expert_id="exp-200")
+
+        listener.on_assigned.assert_called_once()
+        case_arg, assignment_arg = listener.on_assigned.call_args[0]
+        assert case_arg.status == CaseStatus.ASSIGNED
+        assert assignment_arg == assignment
+
+    @pytest.mark.asyncio
+    async def test_failed_assignment_does_not_notify(self, mock_repo):
+        """Listeners are not called when the assignment is rejected."""
+        mock_repo.get_by_id.return_value = Case(
+            id="case-001", referrer_id="ref-100", status=CaseStatus.DRAFT
+        )
+        listener = Mock()
+        service = CaseService(case_repo=mock_repo, listeners=[listener])
+
+        with pytest.raises(InvalidStateError):
+            await service.assign_expert(case_id="case-001", expert_id="exp-200")
+        listener.on_assigned.assert_not_called()
+
+    # --- BATCH GET ---
+
+    @pytest.mark.asyncio
+    async def test_get_cases_uses_one_repo_call_and_reports_missing(
+        self, service, mock_repo
+    ):
+        """get_cases dedupes ids, calls get_many once and lists misses."""
+        case = mock_repo.get_by_id.return_value
+        mock_repo.get_many.return_value = {"case-001": case}
+
+        batch = await service.get_cases(["case-001", "case-404", "case-001"])
+
+        mock_repo.get_many.assert_called_once_with(["case-001", "case-404"])
+        assert [c.id for c in batch.items] == ["case-001"]
+        assert batch.missing == ["case-404"]
+
+    @pytest.mark.asyncio
+    async def test_get_cases_rejects_too_many_ids(self, service):
+        """More than MAX_BATCH_GET distinct ids is a validation error."""
+        with pytest.raises(ValidationError):
+            await service.get_cases([f"c-{i}" for i in range(MAX_BATCH_GET + 1)])
+
+    # --- STATS ---
+
+    @pytest.mark.asyncio
+    async def test_rebuild_stats_reports_drift(self, service, mock_repo):
+        """rebuild_stats flags drift when recomputed counts differ."""
+        mock_repo.stats.return_value = CaseStatistics(total=3)
+        mock_repo.rebuild_stats.return_value = CaseStatistics(total=2)
+
+        result = await service.rebuild_stats()
+
+        assert result.drifted is True
+        assert result.stats.total == 2
+
+    # --- LOCKING ---
+
+    @pytest.mark.asyncio
+    async def test_assign_holds_the_case_lock(self, service, mock_repo):
+        """assign_expert reads and saves under the repository's case lock."""
+        await service.assign_expert("case-001", "exp-200")
+
+        mock_repo.lock.assert_called_once_with("case-001")
+
+    # --- SLA DEADLINES ---
+
+    @pytest.mark.asyncio
+    async def test_assign_sets_and_reschedules_the_deadline(self, mock_repo):
+        """Assignment takes the ASSIGNED deadline and reschedules after the save."""
+        due = datetime(2026, 1, 20, 9)
+        deadlines = Mock()
+        deadlines.due_at.return_value = due
+        service = CaseService(case_repo=mock_repo, deadlines=deadlines)
+
+        await service.assign_expert("case-001", "exp-200")
+
+        assert deadlines.due_at.call_args[0][0] == CaseStatus.ASSIGNED
+        saved = mock_repo.save.call_args[0][0]
+        assert saved.due_at == due
+        deadlines.schedule.assert_called_once_with(saved)
+
+    @pytest.mark.asyncio
+    async def test_list_overdue_keeps_deadline_order(self, mock_repo):
+        """Overdue ids are fetched in one call and returned most overdue first."""
+        deadlines = Mock()
+        deadlines.overdue.return_value = ["c-2", "c-gone", "c-1"]
+        mock_repo.get_many.return_value = {
+            i: Case(id=i, referrer_id="ref-1") for i in ("c-1", "c-2")
+        }
+        service = CaseService(case_repo=mock_repo, deadlines=deadlines)
+
+        page = await service.list_overdue(limit=1)
+
+        deadlines.overdue.assert_called_once_with(2)
+        assert [c.id for c in page.items] == ["c-2"]
+        assert page.has_more is True
@@ -0,0 +1,192 @@
+"""Stateful property tests of CaseService against a reference model.
+
+Hypothesis drives long random sequences of reads, batch reads,
+assignments and searches through the service over several thousand seeded
+cases, for each repository configuration. After every step the
+repository's statistics must match the model's; on teardown the
+incremental statistics must agree with a full rebuild.
+"""
+
+import asyncio
+from collections import Counter
+
+import pytest
+from hypothesis import HealthCheck, settings
+from hypothesis import strategies as st
+from hypothesis.stateful import RuleBasedStateMachine, invariant, rule
+
+from api.repositories import build_case_repository
+from config import Settings
+from exceptions import InvalidStateError, NotFoundError
+from models import Case, CaseStatus
+from services.case_service import CaseService
+from utils.change_feed import ChangeFeed
+from utils.metrics import MetricsRegistry
+
+N_CASES = 5_000
+REFERRERS = 40
+EXPERTS = [f"exp-{i}" for i in range(12)]
+_STATUS_CYCLE = [CaseStatus.COMPLETED, CaseStatus.SUBMITTED, CaseStatus.DRAFT,
+                 CaseStatus.ASSIGNED, CaseStatus.SUBMITTED, CaseStatus.SUBMITTED]
+
+CONFIGS = {
+    "Memory": {"repo_backend": "memory"},
+    "MemoryLru": {"repo_backend": "memory", "repo_cache": "lru:64"},
+    "Sharded": {"repo_backend": "sharded", "repo_shards": 8},
+    "SqliteBatchingLru": {
+        "repo_backend": "sqlite", "repo_batching": True, "repo_cache": "lru:64",
+    },
+}
+
+case_ids = st.one_of(
+    st.integers(0, N_CASES - 1).map(lambda i: f"case-{i:05d}"),
+    st.sampled_from(["case-missing", f"case-{N_CASES:05d}"]),
+)
+
+
+def dataset(n: int) -> list[Case]:
+    """Cases over REFERRERS referrers, assigned or completed ones with an expert."""
+    cases = []
+    for i in range(n):
+        status = _STATUS_CYCLE[i % len(_STATUS_CYCLE)]
+        has_expert = status in (CaseStatus.ASSIGNED, CaseStatus.COMPLETED)
+        cases.append(Case(
+            id=f"case-{i:05d}",
+            referrer_id=f"ref-{i % REFERRERS:02d}",
+            expert_id=EXPERTS[i % len(EXPERTS)] if has_expert else None,
+            status=status,
+        ))
+    return cases
+
+
+def _view(case: Case) -> tuple:
+    return case.referrer_id, case.expert_id, case.status
+
+
+SEED = dataset(N_CASES)
+SEED_VIEWS = {case.id: _view(case) for case in SEED}
+
+
+class CaseServiceMachine(RuleBasedStateMachine):
+    """CaseService over one repository configuration, mirrored by plain dicts.
+
+    The model maps each case id to its (referrer, expert, status) and keeps
+    the indexes and counters needed to answer every rule in time
+    independent of the dataset size.
+    """
+
+    config: dict = {}
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.loop = asyncio.new_event_loop()
+        repo = build_case_repository(
+            Settings(**self.config, repo_sqlite_path=":memory:"), MetricsRegistry(), ChangeFeed()
+        )
+        repo.seed([case.model_copy() for case in SEED])
+        self.service = CaseService(repo)
+        self.model = dict(SEED_VIEWS)
+        self.statuses = Counter(view[2] for view in SEED_VIEWS.values())
+        self.experts = Counter(view[1] for view in SEED_VIEWS.values() if view[1])
+        self.by_referrer: dict[str, set[str]] = {}
+        self.by_expert: dict[str, set[str]] = {}
+        for case_id, (referrer_id, expert_id, _) in SEED_VIEWS.items():
+            self.by_referrer.setdefault(referrer_id, set()).add(case_id)
+            if expert_id is not None:
+                self.by_expert.setdefault(expert_id, set()).add(case_id)
+
+    def run(self, coro):
+        return self.loop.run_until_complete(coro)
+
+    @rule(case_id=case_ids)
+    def find_case(self, case_id):
+        found = self.run(self.service.find_case(case_id))
+        expected = self.model.get(case_id)
+        assert (found and _view(found)) == expected
+
+    @rule(ids=st.lists(case_ids, min_size=1, max_size=20))
+    def get_cases(self, ids):
+        batch = self.run(self.service.get_cases(ids))
+        unique = list(dict.fromkeys(ids))
+        assert [_view(c) for c in batch.items] == [
+            self.model[i] for i in unique if i in self.model
+        ]
+        assert batch.missing == [i for i in unique if i not in self.model]
+
+    @rule(case_id=case_ids, expert_id=st.sampled_from(EXPERTS))
+    def assign_expert(self, case_id, expert_id):
+        expected = self.model.get(case_id)
+        if expected is None:
+            with pytest.raises(NotFoundError):
+                self.run(self.service.assign_expert(case_id, expert_id))
+        elif expected[2] != CaseStatus.SUBMITTED:
+            with pytest.raises(InvalidStateError):
+                self.run(self.service.assign_expert(case_id, expert_id))
+        else:
+            self.run(self.service.assign_expert(case_id, expert_id))
+            self.model[case_id] = (expected[0], expert_id, CaseStatus.ASSIGNED)
+            self.statuses.update({CaseStatus.SUBMITTED: -1, CaseStatus.ASSIGNED: 1})
+            self.experts[expert_id] += 1
+            self.by_expert.setdefault(expert_id, set()).add(case_id)
+
+    @rule(
+        referrer=st.none() | st.integers(0, REFERRERS - 1),
+        prefix=st.booleans(),
+        expert_id=st.none() | st.sampled_from(EXPERTS),
+        limit=st.integers(1, 60),
+    )
+    def search_cases(self, referrer, prefix, expert_id, limit):
+        if referrer is None and expert_id is None:
+            expert_id = EXPERTS[0]
+        pattern, matches = None, None
+        if referrer is not None:
+            pattern = f"ref-{referrer // 10}*" if prefix else f"ref-{referrer:02d}"
+            matches = set().union(*(
+                ids for ref, ids in self.by_referrer.items()
+                if ref == pattern or (prefix and ref.startswith(pattern[:-1]))
+            ))
+        if expert_id is not None:
+            experts = self.by_expert.get(expert_id, set())
+            matches = experts if matches is None else matches & experts
+
+        page = self.run(self.service.search_cases(pattern, expert_id, limit))
+
+        ids = [case.id for case in page.items]
+        assert len(set(ids)) == len(ids) == min(limit, len(matches))
+        assert set(ids) <= matches
+        assert page.has_more == (len(matches) > limit)
+        assert all(_view(case) == self.model[case.id] for case in page.items)
+
+    @invariant()
+    def stats_match_the_model(self):
+        stats = self.run(self.service.get_stats())
+        assert stats.total == len(self.model)
+        assert stats.by_status == {status: self.statuses[status] for status in CaseStatus}
+        assert stats.by_expert == dict(sorted(self.experts.items()))
+
+    def teardown(self) -> None:
+        try:
+            assert not self.run(self.service.rebuild_stats()).drifted
+        finally:
+            self.loop.close()
+
+
+_SETTINGS = settings(
+    max_examples=8,
+    stateful_step_count=40,
+    deadline=None,
+    suppress_health_check=[HealthCheck.too_slow],
+)
+
+
+def _test_case(name: str) -> type:
+    machine = type(f"CaseService{name}Machine", (CaseServiceMachine,), {"config": CONFIGS[name]})
+    test_case = machine.TestCase
+    test_case.settings = _SETTINGS
+    return test_case
+
+
+TestCaseServiceMemory = _test_case("Memory")
+TestCaseServiceMemoryLru = _test_case("MemoryLru")
+TestCaseServiceSharded = _test_case("Sharded")
+TestCaseServiceSqliteBatchingLru = _test_case("SqliteBatchingLru")
@@ -0,0 +1,82 @@
+"""Tests for incrementally maintained case statistics."""
+
+from datetime import date, datetime
+
+from models import Case, CaseStatus
+from utils.case_stats import CaseStatsCounter
+
+
+def _case(case_id: str, status=CaseStatus.SUBMITTED, expert_id=None, day=15) -> Case:
+    return Case(
+        id=case_id,
+        referrer_id="ref-1",
+        expert_id=expert_id,
+        status=status,
+        created_at=datetime(2026, 1, day, 9, 30),
+    )
+
+
+class TestCaseStatsCounter:
+    """CaseStatsCounter specification."""
+
+    def test_counts_new_cases(self):
+        """Each new case adds one to its status and day."""
+        counter = CaseStatsCounter()
+        counter.apply(_case("c1"))
+        counter.apply(_case("c2", status=CaseStatus.DRAFT, day=16))
+
+        stats = counter.snapshot()
+
+        assert stats.total == 2
+        assert stats.by_status[CaseStatus.SUBMITTED] == 1
+        assert stats.by_status[CaseStatus.COMPLETED] == 0
+        assert stats.by_day == {date(2026, 1, 15): 1, date(2026, 1, 16): 1}
+        assert stats.by_expert == {}
+
+    def test_resave_applies_status_delta(self):
+        """Re-saving a mutated case moves its count instead of adding one."""
+        counter = CaseStatsCounter()
+        case = _case("c1")
+        counter.apply(case)
+        case.status = CaseStatus.ASSIGNED
+        case.expert_id = "exp-1"
+        counter.apply(case)
+
+        stats = counter.snapshot()
+
+        assert stats.total == 1
+        assert stats.by_status[CaseStatus.SUBMITTED] == 0
+        assert stats.by_status[CaseStatus.ASSIGNED] == 1
+        assert stats.by_expert == {"exp-1": 1}
+
+    def test_reassignment_drops_empty_expert(self):
+        """An expert whose count reaches zero disappears from by_expert."""
+        counter = CaseStatsCounter()
+        case = _case("c1", status=CaseStatus.ASSIGNED, expert_id="exp-1")
+        counter.apply(case)
+        case.expert_id = "exp-2"
+        counter.apply(case)
+
+        assert counter.snapshot().by_expert == {"exp-2": 1}
+
+    def test_snapshot_is_cached_until_change(self):
+        """Unchanged counters return the same snapshot object."""
+        counter = CaseStatsCounter()
+        counter.apply(_case("c1"))
+        first = counter.snapshot()
+
+        assert counter.snapshot() is first
+        counter.apply(_case("c2"))
+        assert counter.snapshot() is not first
+
+    def test_rebuild_matches_incremental(self):
+        """A rebuild from the same cases reproduces the live counters."""
+        cases = [_case(f"c{i}", expert_id=f"exp-{i % 3}", day=1 + i % 5) for i in range(20)]
+        counter = CaseStatsCounter()
+        for case in cases:
+            counter.apply(case)
+        live = counter.snapshot()
+
+        counter.rebuild(cases)
+
+        assert counter.snapshot() == live
@@ -0,0 +1,105 @@
+"""Tests for the in-process change feed."""
+
+import asyncio
+
+import pytest
+
+from models import Case, CaseStatus
+from utils.change_feed import ChangeFeed
+
+
+def _case(case_id="case-1", referrer="ref-1", status=CaseStatus.SUBMITTED):
+    return Case(id=case_id, referrer_id=referrer, status=status)
+
+
+class TestChangeFeed:
+    """ChangeFeed specification."""
+
+    def test_publish_assigns_increasing_sequence(self):
+        """Every publish gets the next sequence number."""
+        feed = ChangeFeed()
+
+        assert [feed.publish(_case()).seq for _ in range(3)] == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_filters_by_status_and_referrer(self):
+        """Subscribers only receive matching changes."""
+        feed = ChangeFeed()
+        by_status = feed.subscribe(status=CaseStatus.ASSIGNED)
+        by_ref = feed.subscribe(referrer_id="ref-2")
+        everything = feed.subscribe()
+
+        feed.publish(_case("a", "ref-1", CaseStatus.ASSIGNED))
+        feed.publish(_case("b", "ref-2", CaseStatus.SUBMITTED))
+
+        assert [e.case_id for e in await by_status.next_batch(0)] == ["a"]
+        assert [e.case_id for e in await by_ref.next_batch(0)] == ["b"]
+        assert [e.case_id for e in await everything.next_batch(0)] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_event_is_a_snapshot(self):
+        """Mutating the case after publish does not change the event."""
+        feed = ChangeFeed()
+        sub = feed.subscribe()
+        case = _case()
+        feed.publish(case)
+        case.status = CaseStatus.COMPLETED
+
+        (event,) = await sub.next_batch(0)
+        assert event.status == CaseStatus.SUBMITTED
+        assert b'"submitted"' in event.data
+
+    @pytest.mark.asyncio
+    async def test_resume_replays_after_sequence(self):
+        """Subscribing with after_seq replays later matching events."""
+        feed = ChangeFeed()
+        for i in range(5):
+            feed.publish(_case(f"c{i}"))
+
+        sub = feed.subscribe(after_seq=3)
+
+        assert [e.seq for e in await sub.next_batch(0)] == [4, 5]
+        assert not sub.missed
+
+    @pytest.mark.asyncio
+    async def test_resume_beyond_history_sets_missed(self):
+        """A resume point older than the history is flagged."""
+        feed = ChangeFeed(history=2)
+        for i in range(5):
+            feed.publish(_case(f"c{i}"))
+
+        sub = feed.subscribe(after_seq=1)
+
+        assert sub.missed
+        assert [e.seq for e in await sub.next_batch(0)] == [4, 5]
+
+    def test_slow_consumer_is_dropped(self):
+        """A subscriber whose buffer overflows is closed and removed."""
+        feed = ChangeFeed(max_buffer=2)
+        sub = feed.subscribe()
+        for _ in range(3):
+            feed.publish(_case())
+
+        assert sub.dropped and sub.closed
+        assert feed.subscriber_count == 0
+
+    @pytest.mark.asyncio
+    async def test_waiting_consumer_is_woken(self):
+        """next_batch returns as soon as an event is published."""
+        feed = ChangeFeed()
+        sub = feed.subscribe()
+        waiter = asyncio.create_task(sub.next_batch(5))
+        await asyncio.sleep(0)
+
+        feed.publish(_case())
+
+        assert len(await asyncio.wait_for(waiter, 1)) == 1
+
+    def test_unsubscribe_is_idempotent(self):
+        """Unsubscribing twice leaves the count consistent."""
+        feed = ChangeFeed()
+        sub = feed.subscribe(referrer_id="ref-1")
+        feed.unsubscribe(sub)
+        feed.unsubscribe(sub)
+
+        assert feed.subscriber_count == 0
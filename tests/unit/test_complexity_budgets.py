@@ -0,0 +1,96 @@
+"""Per-operation cost budgets: CaseService calls must not slow down with size.
+
+Each operation is timed against the same backend seeded with SMALL and
+with LARGE cases. The large store is fifty times the size, so a lookup or
+search that became a scan would run tens of times slower. Each operation
+may take at most BUDGET times as long, which leaves room for cache
+effects and timer noise. Costs are the best of several rounds.
+"""
+
+import random
+import time
+
+import pytest
+
+from api.repositories import build_case_repository
+from config import Settings
+from models import Case, CaseStatus
+from services.case_service import CaseService
+from utils.change_feed import ChangeFeed
+from utils.metrics import MetricsRegistry
+
+SMALL, LARGE = 1_000, 50_000
+BUDGET = 4.0
+CALLS, ROUNDS = 40, 5
+REFERRERS = 40
+EXPERTS = [f"exp-{i}" for i in range(12)]
+
+BACKENDS = {
+    "memory": {"repo_backend": "memory"},
+    "sharded": {"repo_backend": "sharded", "repo_shards": 8},
+    "sqlite": {"repo_backend": "sqlite"},
+}
+
+
+def _service(backend: str, n: int) -> CaseService:
+    """A service over n cases; every other case is submitted and assignable."""
+    repo = build_case_repository(
+        Settings(**BACKENDS[backend], repo_sqlite_path=":memory:"), MetricsRegistry(), ChangeFeed()
+    )
+    repo.seed([
+        Case(
+            id=f"case-{i:06d}",
+            referrer_id=f"ref-{i % REFERRERS:02d}",
+            expert_id=None if i % 2 else EXPERTS[i % len(EXPERTS)],
+            status=CaseStatus.SUBMITTED if i % 2 else CaseStatus.ASSIGNED,
+        )
+        for i in range(n)
+    ])
+    return CaseService(repo)
+
+
+def _operations(n: int, rng: random.Random) -> dict:
+    """One zero-argument coroutine factory per operation, drawing fresh arguments."""
+    ids = [f"case-{i:06d}" for i in range(n)]
+    submitted = iter(rng.sample(ids[1::2], CALLS * ROUNDS))
+    return {
+        "find_case": lambda s: s.find_case(rng.choice(ids)),
+        "get_cases": lambda s: s.get_cases(rng.sample(ids, 20)),
+        "assign_expert": lambda s: s.assign_expert(next(submitted), rng.choice(EXPERTS)),
+        "search referrer": lambda s: s.search_cases(
+            referrer_id=f"ref-{rng.randrange(REFERRERS):02d}", limit=20
+        ),
+        "search referrer prefix": lambda s: s.search_cases(
+            referrer_id=f"ref-{rng.randrange(4)}*", limit=20
+        ),
+        "search expert": lambda s: s.search_cases(expert_id=rng.choice(EXPERTS), limit=20),
+        "get_stats": lambda s: s.get_stats(),
+    }
+
+
+async def _cost(service: CaseService, call) -> float:
+    """Best per-call seconds over ROUNDS rounds of CALLS calls."""
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        for _ in range(CALLS):
+            await call(service)
+        best = min(best, (time.perf_counter() - start) / CALLS)
+    return best
+
+
+@pytest.mark.parametrize("backend", list(BACKENDS))
+@pytest.mark.asyncio
+async def test_operation_cost_does_not_grow_with_dataset_size(backend):
+    """Every operation on LARGE cases stays within BUDGET times its cost on SMALL."""
+    small, large = _service(backend, SMALL), _service(backend, LARGE)
+    small_ops, large_ops = _operations(SMALL, random.Random(1)), _operations(LARGE, random.Random(1))
+
+    over_budget = {}
+    for name in small_ops:
+        small_cost = await _cost(small, small_ops[name])
+        large_cost = await _cost(large, large_ops[name])
+        if large_cost > small_cost * BUDGET:
+            over_budget[name] = f"{large_cost / small_cost:.1f}x"
+
+    assert over_budget == {}
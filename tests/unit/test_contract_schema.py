@@ -0,0 +1,75 @@
+"""Tests for compiling OpenAPI schemas into validators."""
+
+import pytest
+
+from exceptions import ContractViolation, ValidationError
+from utils.contract_schema import SchemaCompiler
+
+COMPONENTS = {
+    "Case": {
+        "type": "object",
+        "required": ["id", "status"],
+        "properties": {
+            "id": {"type": "string", "pattern": "^case-"},
+            "status": {"type": "string", "enum": ["draft", "assigned"]},
+            "expert_id": {"type": "string", "nullable": True},
+            "created_at": {"type": "string", "format": "date-time"},
+        },
+        "additionalProperties": False,
+    },
+    "Page": {
+        "type": "object",
+        "properties": {
+            "items": {"type": "array", "maxItems": 2, "items": {"$ref": "#/components/schemas/Case"}},
+            "count": {"type": "integer", "minimum": 0},
+        },
+    },
+}
+
+
+def _validator(name: str):
+    return SchemaCompiler(COMPONENTS).compile({"$ref": f"#/components/schemas/{name}"})
+
+
+def _violation(name: str, document) -> str:
+    with pytest.raises(ContractViolation) as info:
+        _validator(name)(document, "$")
+    return info.value.message
+
+
+class TestSchemaCompiler:
+    """Validators accept conforming documents and name the failing path."""
+
+    def test_conforming_document_passes(self):
+        """A valid nested document raises nothing."""
+        _validator("Page")({
+            "items": [
+                {"id": "case-1", "status": "draft", "expert_id": None,
+                 "created_at": "2024-01-01T00:00:00Z"},
+            ],
+            "count": 1,
+        }, "$")
+
+    @pytest.mark.parametrize("document, expected", [
+        ({"items": [{"id": "case-1"}]}, "$.items[0]: missing required property 'status'"),
+        ({"items": [{"id": "case-1", "status": "closed"}]}, "$.items[0].status: 'closed'"),
+        ({"items": [{"id": "x", "status": "draft"}]}, "$.items[0].id: 'x' does not match"),
+        ({"items": [{"id": "case-1", "status": "draft", "extra": 1}]}, "unexpected property 'extra'"),
+        ({"items": [{"id": "case-1", "status": "draft", "created_at": "soon"}]}, "not a valid date-time"),
+        ({"count": -1}, "$.count: value -1 is outside"),
+        ({"count": True}, "$.count: expected integer, got bool"),
+        ({"items": [{"id": "case-1", "status": "draft"}] * 3}, "$.items: item count 3"),
+    ])
+    def test_violations_name_the_path(self, document, expected):
+        """Each violation message starts at the offending value's JSON path."""
+        assert expected in _violation("Page", document)
+
+    def test_unsupported_keyword_is_rejected_at_compile_time(self):
+        """Keywords the compiler cannot check fail loudly rather than pass silently."""
+        with pytest.raises(ValidationError, match="oneOf"):
+            SchemaCompiler({}).compile({"oneOf": [{"type": "string"}]})
+
+    def test_unknown_reference_is_rejected(self):
+        """A reference to a missing component fails at compile time."""
+        with pytest.raises(ValidationError, match="Missing"):
+            SchemaCompiler({}).compile({"$ref": "#/components/schemas/Missing"})
@@ -0,0 +1,88 @@
+"""Tests for the domain error to HTTP response mapping."""
+
+import json
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+import main
+from api.error_handlers import ErrorBodies
+from api.idempotency import IDEMPOTENCY_HEADER
+from config import Settings
+from exceptions import (
+    ExternalServiceError,
+    InvalidStateError,
+    MEDirectError,
+    NotFoundError,
+    QuotaExceededError,
+    ReplicaLagError,
+    ValidationError,
+)
+from utils.json_codec import StdlibJSONEncoder
+
+ERRORS = ErrorBodies(StdlibJSONEncoder())
+
+
+class TestErrorBodies:
+    """Status codes and bodies produced by the ERROR_STATUS table."""
+
+    @pytest.mark.parametrize("exc, status", [
+        (NotFoundError("Case 'x' not found"), 404),
+        (InvalidStateError("already assigned"), 409),
+        (ValidationError("bad limit"), 422),
+        (QuotaExceededError("quota full"), 429),
+        (ReplicaLagError("replica behind"), 503),
+    ])
+    def test_mapped_errors_keep_their_message(self, exc, status):
+        """Mapped errors return their status and message as detail."""
+        code, body = ERRORS.for_error(exc)
+
+        assert code == status
+        assert json.loads(body) == {"detail": exc.message}
+
+    def test_subclasses_use_the_nearest_mapping(self):
+        """A subclass of a mapped error inherits its status."""
+        class MissingExpert(NotFoundError):
+            pass
+
+        assert ERRORS.for_error(MissingExpert("gone"))[0] == 404
+
+    @pytest.mark.parametrize("exc", [ExternalServiceError("db down"), MEDirectError("x")])
+    def test_unmapped_errors_are_opaque_500s(self, exc):
+        """Unmapped domain errors do not leak their message."""
+        assert ERRORS.for_error(exc) == (500, ERRORS.internal)
+
+
+class _TaggedEncoder(StdlibJSONEncoder):
+    """Stdlib encoding with a marker key, to tell its bodies apart."""
+
+    name = "tagged"
+
+    def dumps(self, content):
+        return super().dumps({**content, "encoder": self.name})
+
+
+class TestAppEncoder:
+    """Error bodies follow the app's configured encoder."""
+
+    @pytest.mark.asyncio
+    async def test_every_error_path_uses_the_app_encoder(self, monkeypatch):
+        """404s, handled and recorded domain errors are encoded per Settings.json_encoder."""
+        monkeypatch.setattr(main, "get_json_encoder", lambda name: _TaggedEncoder())
+        app = main.create_app(Settings(warmup_enabled=False))
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            missing_case = await client.get("/api/v1/cases/missing")
+            missing_expert = await client.get("/api/v1/experts/missing")
+            conflict = await client.post(
+                "/api/v1/cases/case-002/assign", json={"expert_id": "exp-200"}
+            )
+            recorded = await client.post(
+                "/api/v1/cases/case-002/assign",
+                json={"expert_id": "exp-200"},
+                headers={IDEMPOTENCY_HEADER: "key-1"},
+            )
+
+        for response in (missing_case, missing_expert, conflict, recorded):
+            assert response.json()["encoder"] == "tagged"
+        assert (conflict.status_code, recorded.status_code) == (409, 409)
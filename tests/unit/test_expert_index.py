@@ -0,0 +1,116 @@
+"""Tests for the expert availability index and in-memory expert repository."""
+
+import pytest
+
+from exceptions import InvalidStateError, ValidationError
+from models import Expert
+from utils.expert_index import ExpertAvailabilityIndex
+from utils.expert_repo import InMemoryExpertRepository
+
+
+def _expert(expert_id, specialties=("neurology",), hours=(), **fields) -> Expert:
+    return Expert(
+        id=expert_id, name=expert_id, specialties=list(specialties),
+        on_call_hours=list(hours), **fields,
+    )
+
+
+class TestExpertAvailabilityIndex:
+    """ExpertAvailabilityIndex specification."""
+
+    def test_find_by_specialty_in_registration_order(self):
+        """Experts with the specialty are yielded in the order they were added."""
+        index = ExpertAvailabilityIndex()
+        for expert in [
+            _expert("b"), _expert("a", ["orthopaedics"]), _expert("c", ["neurology", "psychiatry"]),
+        ]:
+            index.update(expert)
+
+        assert list(index.find("neurology")) == ["b", "c"]
+        assert list(index.find("psychiatry")) == ["c"]
+        assert list(index.find("cardiology")) == []
+
+    def test_on_call_hour_filter(self):
+        """An hour restricts results to experts on call then."""
+        index = ExpertAvailabilityIndex()
+        index.update(_expert("day", hours=range(9, 17)))
+        index.update(_expert("night", hours=range(0, 6)))
+
+        assert list(index.find("neurology", hour=10)) == ["day"]
+        assert list(index.find("neurology", hour=3)) == ["night"]
+        assert list(index.find("neurology", hour=20)) == []
+
+    @pytest.mark.parametrize("fields", [
+        {"active": False},
+        {"max_open_cases": 2, "open_cases": 2},
+    ])
+    def test_unavailable_experts_are_excluded(self, fields):
+        """Inactive and at-capacity experts are not available."""
+        index = ExpertAvailabilityIndex()
+        index.update(_expert("x", **fields))
+
+        assert not index.is_available("x")
+        assert list(index.find("neurology")) == []
+
+    def test_update_moves_bits(self):
+        """Re-indexing drops old specialties and hours and keeps the position."""
+        index = ExpertAvailabilityIndex()
+        index.update(_expert("a", hours=[1]))
+        index.update(_expert("b", hours=[1]))
+        index.update(_expert("a", ["psychiatry"], hours=[2]))
+
+        assert list(index.find("neurology")) == ["b"]
+        assert list(index.find("psychiatry", hour=2)) == ["a"]
+        assert list(index.find("psychiatry", hour=1)) == []
+        assert len(index) == 2
+
+    def test_unknown_expert_is_unavailable(self):
+        """is_available is False for ids never indexed."""
+        assert not ExpertAvailabilityIndex().is_available("nobody")
+
+
+class TestInMemoryExpertRepository:
+    """InMemoryExpertRepository reservation behaviour."""
+
+    @pytest.fixture
+    def repo(self):
+        """Repository with one expert of capacity 2."""
+        repo = InMemoryExpertRepository()
+        repo.seed([_expert("exp-1", max_open_cases=2), _expert("exp-2", active=False)])
+        return repo
+
+    @pytest.mark.asyncio
+    async def test_reserve_until_capacity(self, repo):
+        """Reservations count open cases and stop at capacity."""
+        await repo.reserve("exp-1")
+        await repo.reserve("exp-1")
+
+        with pytest.raises(InvalidStateError, match="at capacity"):
+            await repo.reserve("exp-1")
+        assert (await repo.get_by_id("exp-1")).open_cases == 2
+        assert await repo.find_available("neurology") == []
+
+    @pytest.mark.asyncio
+    async def test_release_restores_availability(self, repo):
+        """Releasing a full expert's case makes them available again."""
+        await repo.reserve("exp-1")
+        await repo.reserve("exp-1")
+        await repo.release("exp-1")
+
+        assert [e.id for e in await repo.find_available("neurology")] == ["exp-1"]
+
+    @pytest.mark.asyncio
+    async def test_reserve_rejects_unknown_and_inactive(self, repo):
+        """Unknown experts are invalid input; inactive ones are a conflict."""
+        with pytest.raises(ValidationError):
+            await repo.reserve("exp-404")
+        with pytest.raises(InvalidStateError, match="not active"):
+            await repo.reserve("exp-2")
+
+    @pytest.mark.asyncio
+    async def test_save_reindexes(self, repo):
+        """Saving a changed profile is reflected by availability queries."""
+        await repo.save(_expert("exp-2", ["psychiatry"]))
+
+        assert [e.id for e in await repo.find_available("psychiatry")] == ["exp-2"]
+        assert [e.id for e in await repo.find_available("neurology", limit=5)] == ["exp-1"]
@@ -0,0 +1,112 @@
+"""Tests for ExpertService and expert checks during case assignment."""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+
+from exceptions import InvalidStateError, NotFoundError, ValidationError
+from models import Case, CaseStatus, Expert
+from services.case_service import CaseService
+from services.expert_service import ExpertService
+from utils.expert_repo import InMemoryExpertRepository
+from utils.in_memory_repo import InMemoryCaseRepository
+
+MONDAY_10AM = datetime(2026, 1, 5, 10, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def experts():
+    """Expert repository with an office-hours and an always-on expert."""
+    repo = InMemoryExpertRepository()
+    repo.seed([
+        Expert(id="exp-1", name="A", specialties=["neurology"], on_call_hours=[10]),
+        Expert(id="exp-2", name="B", specialties=["neurology"], max_open_cases=1),
+    ])
+    return repo
+
+
+class TestExpertService:
+    """ExpertService specification."""
+
+    @pytest.mark.asyncio
+    async def test_get_expert(self, experts):
+        """Known ids return the expert; unknown ids raise NotFoundError."""
+        service = ExpertService(experts)
+
+        assert (await service.get_expert("exp-1")).name == "A"
+        with pytest.raises(NotFoundError):
+            await service.get_expert("exp-404")
+        assert await service.find_expert("exp-404") is None
+
+    @pytest.mark.asyncio
+    async def test_save_keeps_open_cases(self, experts):
+        """A replaced profile keeps the assignment-owned open case count."""
+        await experts.reserve("exp-1")
+        service = ExpertService(experts)
+
+        saved = await service.save_expert(Expert(id="exp-1", name="A2", open_cases=7))
+
+        assert (saved.name, saved.open_cases) == ("A2", 1)
+
+    @pytest.mark.asyncio
+    async def test_find_available_at_instant(self, experts):
+        """An instant restricts results to experts on call at that UTC hour."""
+        service = ExpertService(experts)
+
+        anytime = await service.find_available("neurology", limit=1)
+        monday = await service.find_available("neurology", at=MONDAY_10AM)
+
+        assert ([e.id for e in anytime.items], anytime.has_more) == (["exp-1"], True)
+        assert [e.id for e in monday.items] == ["exp-1"]
+
+    @pytest.mark.asyncio
+    async def test_find_available_rejects_bad_limit(self, experts):
+        """Limits outside 1-100 raise ValidationError."""
+        with pytest.raises(ValidationError):
+            await ExpertService(experts).find_available("neurology", limit=0)
+
+
+class TestAssignmentExpertChecks:
+    """CaseService.assign_expert with expert reservations configured."""
+
+    @pytest.fixture
+    def cases(self):
+        """Two submitted cases."""
+        repo = InMemoryCaseRepository()
+        repo.seed([
+            Case(id=f"case-{i}", referrer_id="ref-1", status=CaseStatus.SUBMITTED)
+            for i in (1, 2)
+        ])
+        return repo
+
+    @pytest.mark.asyncio
+    async def test_assignment_reserves_capacity(self, cases, experts):
+        """A successful assignment takes one unit of the expert's capacity."""
+        service = CaseService(case_repo=cases, experts=experts)
+
+        await service.assign_expert("case-1", "exp-2")
+
+        assert (await experts.get_by_id("exp-2")).open_cases == 1
+        with pytest.raises(InvalidStateError, match="at capacity"):
+            await service.assign_expert("case-2", "exp-2")
+        assert (await cases.get_by_id("case-2")).status == CaseStatus.SUBMITTED
+
+    @pytest.mark.asyncio
+    async def test_unknown_expert_is_rejected(self, cases, experts):
+        """Assigning an unknown expert raises ValidationError and changes nothing."""
+        service = CaseService(case_repo=cases, experts=experts)
+
+        with pytest.raises(ValidationError):
+            await service.assign_expert("case-1", "exp-404")
+        assert (await cases.get_by_id("case-1")).expert_id is None
+
+    @pytest.mark.asyncio
+    async def test_failed_save_releases_capacity(self, cases, experts):
+        """If the case cannot be saved the reservation is handed back."""
+        cases.save = AsyncMock(side_effect=RuntimeError("disk full"))
+        service = CaseService(case_repo=cases, experts=experts)
+
+        with pytest.raises(RuntimeError):
+            await service.assign_expert("case-1", "exp-2")
+        assert (await experts.get_by_id("exp-2")).open_cases == 0
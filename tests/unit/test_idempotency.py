@@ -0,0 +1,152 @@
+"""Tests for idempotency stores and the request coalescing coordinator."""
+
+import asyncio
+
+import pytest
+
+from exceptions import ValidationError
+from utils.idempotency import (
+    IdempotencyCoordinator,
+    InMemoryIdempotencyStore,
+    SQLiteIdempotencyStore,
+    StoredResponse,
+)
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _response(body: bytes = b"{}", status: int = 200) -> StoredResponse:
+    return StoredResponse(status_code=status, body=body, fingerprint="fp")
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store_factory(request, tmp_path):
+    """Build either store backend with a controllable clock."""
+
+    def make(ttl=60.0, max_entries=100, clock=None):
+        clock = clock or FakeClock()
+        if request.param == "memory":
+            return InMemoryIdempotencyStore(ttl, max_entries, clock=clock)
+        return SQLiteIdempotencyStore(str(tmp_path / "idem.db"), ttl, max_entries, clock=clock)
+
+    return make
+
+
+class TestIdempotencyStores:
+    """Behaviour every store backend must share."""
+
+    @pytest.mark.asyncio
+    async def test_put_then_get(self, store_factory):
+        """A recorded response is returned verbatim."""
+        store = store_factory()
+        await store.put("k", _response(b'{"a":1}'))
+
+        assert await store.get("k") == _response(b'{"a":1}')
+        assert await store.get("other") is None
+
+    @pytest.mark.asyncio
+    async def test_entries_expire_after_ttl(self, store_factory):
+        """Entries older than the TTL are not returned."""
+        clock = FakeClock()
+        store = store_factory(ttl=10.0, clock=clock)
+        await store.put("k", _response())
+
+        clock.now += 11
+        assert await store.get("k") is None
+
+    @pytest.mark.asyncio
+    async def test_memory_store_is_bounded(self):
+        """The in-memory store evicts the oldest entries past max_entries."""
+        store = InMemoryIdempotencyStore(ttl=60, max_entries=2, clock=FakeClock())
+        for key in ("a", "b", "c"):
+            await store.put(key, _response())
+
+        assert len(store) == 2
+        assert await store.get("a") is None
+
+
+class TestIdempotencyCoordinator:
+    """IdempotencyCoordinator specification."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_duplicates_execute_once(self):
+        """Duplicates arriving while the first runs share its result."""
+        coordinator = IdempotencyCoordinator(InMemoryIdempotencyStore(60, 100))
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return _response(b'{"n":1}')
+
+        results = await asyncio.gather(
+            *(coordinator.execute("k", "fp", work) for _ in range(5))
+        )
+
+        assert calls == 1
+        assert [replayed for _, replayed in results].count(False) == 1
+        assert {r.body for r, _ in results} == {b'{"n":1}'}
+
+    @pytest.mark.asyncio
+    async def test_replay_after_completion(self):
+        """A later duplicate is answered from the store."""
+        coordinator = IdempotencyCoordinator(InMemoryIdempotencyStore(60, 100))
+
+        async def work():
+            return _response()
+
+        await coordinator.execute("k", "fp", work)
+        _, replayed = await coordinator.execute("k", "fp", work)
+
+        assert replayed
+
+    @pytest.mark.asyncio
+    async def test_different_fingerprint_is_rejected(self):
+        """Reusing a key for a different request raises ValidationError."""
+        coordinator = IdempotencyCoordinator(InMemoryIdempotencyStore(60, 100))
+
+        async def work():
+            return _response()
+
+        await coordinator.execute("k", "fp-1", work)
+        with pytest.raises(ValidationError):
+            await coordinator.execute("k", "fp-2", work)
+
+    @pytest.mark.asyncio
+    async def test_server_errors_are_not_recorded(self):
+        """5xx responses may be retried, so they are not stored."""
+        coordinator = IdempotencyCoordinator(InMemoryIdempotencyStore(60, 100))
+
+        async def failing():
+            return _response(status=503)
+
+        await coordinator.execute("k", "fp", failing)
+        _, replayed = await coordinator.execute("k", "fp", failing)
+
+        assert not replayed
+
+    @pytest.mark.asyncio
+    async def test_retryable_refusals_are_not_recorded(self):
+        """A 429 releases the key, so the retry runs and its result is kept."""
+        coordinator = IdempotencyCoordinator(InMemoryIdempotencyStore(60, 100))
+        statuses = iter([429, 201])
+
+        async def work():
+            return _response(status=next(statuses))
+
+        first, _ = await coordinator.execute("k", "fp", work)
+        retried, replayed = await coordinator.execute("k", "fp", work)
+        _, replayed_again = await coordinator.execute("k", "fp", work)
+
+        assert (first.status_code, retried.status_code) == (429, 201)
+        assert not replayed
+        assert replayed_again
@@ -76,3 +76,64 @@ class TestInMemoryCaseRepository:
         await repo.save(sample_case)
         result = await repo.get_by_id("case-999")
         assert result is None
+
+    @pytest.mark.asyncio
+    async def test_search_by_referrer_prefix(self, repo):
+        """search() returns cases whose referrer matches the prefix."""
+        repo.seed([
+            Case(id="case-a", referrer_id="ref-10", status=CaseStatus.DRAFT),
+            Case(id="case-b", referrer_id="ref-20", status=CaseStatus.DRAFT),
+            Case(id="case-c", referrer_id="ref-11", status=CaseStatus.DRAFT),
+        ])
+
+        result = await repo.search(referrer_id="ref-1*")
+
+        assert [c.id for c in result] == ["case-a", "case-c"]
+
+    @pytest.mark.asyncio
+    async def test_search_sees_in_place_updates_after_save(self, repo, sample_case):
+        """Mutating a stored case then saving it re-indexes the new expert."""
+        await repo.save(sample_case)
+        stored = await repo.get_by_id("case-001")
+        stored.expert_id = "exp-7"
+        await repo.save(stored)
+
+        assert [c.id for c in await repo.search(expert_id="exp-*")] == ["case-001"]
+        stored.expert_id = "exp-8"
+        await repo.save(stored)
+        assert await repo.search(expert_id="exp-7") == []
+
+    @pytest.mark.asyncio
+    async def test_search_stops_at_limit(self, repo):
+        """search() returns at most limit cases."""
+        repo.seed([
+            Case(id=f"case-{i}", referrer_id="ref-1", status=CaseStatus.DRAFT)
+            for i in range(10)
+        ])
+
+        assert len(await repo.search(referrer_id="ref-1", limit=3)) == 3
+
+    @pytest.mark.asyncio
+    async def test_get_many_returns_found_cases_only(self, repo, sample_case):
+        """get_many() maps found ids to cases and omits missing ones."""
+        await repo.save(sample_case)
+
+        result = await repo.get_many(["case-001", "case-404"])
+
+        assert list(result) == ["case-001"]
+        assert result["case-001"].referrer_id == "ref-100"
+
+    @pytest.mark.asyncio
+    async def test_stats_follow_saves_and_rebuild_agrees(self, repo, sample_case):
+        """Statistics track status changes on save; a rebuild agrees."""
+        await repo.save(sample_case)
+        sample_case.status = CaseStatus.ASSIGNED
+        sample_case.expert_id = "exp-1"
+        await repo.save(sample_case)
+
+        stats = await repo.stats()
+
+        assert stats.total == 1
+        assert stats.by_status[CaseStatus.ASSIGNED] == 1
+        assert stats.by_status[CaseStatus.SUBMITTED] == 0
+        assert await repo.rebuild_stats() == stats
@@ -0,0 +1,94 @@
+"""Tests for the background job queue."""
+
+import asyncio
+
+import pytest
+
+from exceptions import ExternalServiceError
+from utils.job_queue import JobQueue, RetryPolicy, run_with_retry
+from utils.metrics import MetricsRegistry
+
+FAST_RETRY = RetryPolicy(max_attempts=3, base_delay=0.001, max_delay=0.002)
+
+
+class TestRunWithRetry:
+    """run_with_retry specification."""
+
+    @pytest.mark.asyncio
+    async def test_retries_until_success(self):
+        """Transient failures are retried."""
+        failures = [ConnectionError(), ConnectionError()]
+
+        async def flaky():
+            if failures:
+                raise failures.pop()
+
+        assert await run_with_retry("flaky", flaky, FAST_RETRY) == 3
+
+    @pytest.mark.asyncio
+    async def test_permanent_failure_raises_external_service_error(self):
+        """Exhausting attempts raises the domain error."""
+        async def broken():
+            raise ConnectionError("down")
+
+        with pytest.raises(ExternalServiceError) as exc:
+            await run_with_retry("broken", broken, FAST_RETRY)
+        assert "broken" in exc.value.message
+
+
+class TestJobQueue:
+    """JobQueue specification."""
+
+    @pytest.mark.asyncio
+    async def test_jobs_run_in_background_and_drain(self):
+        """Submitted jobs complete by the time drain() returns."""
+        metrics = MetricsRegistry()
+        queue = JobQueue(metrics, workers=2, retry=FAST_RETRY)
+        done = []
+
+        for i in range(10):
+            queue.submit("work", lambda i=i: asyncio.sleep(0, result=done.append(i)))
+
+        assert await queue.drain(timeout=1.0)
+        assert sorted(done) == list(range(10))
+        assert metrics.get("jobs_completed_total").value(job="work") == 10
+        assert metrics.get("jobs_latency_seconds").count(job="work") == 10
+
+    @pytest.mark.asyncio
+    async def test_failed_job_is_dead_lettered(self):
+        """A permanently failing job lands in dead_letters."""
+        metrics = MetricsRegistry()
+        queue = JobQueue(metrics, retry=FAST_RETRY)
+
+        async def broken():
+            raise ConnectionError("down")
+
+        queue.submit("broken", broken)
+        await queue.drain(timeout=1.0)
+
+        assert isinstance(queue.dead_letters[0][1], ExternalServiceError)
+        assert metrics.get("jobs_failed_total").value(job="broken") == 1
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_without_blocking(self):
+        """submit() returns False once capacity is reached."""
+        metrics = MetricsRegistry()
+        queue = JobQueue(metrics, capacity=1, workers=1)
+        gate = asyncio.Event()
+
+        queue.submit("slow", gate.wait)
+        await asyncio.sleep(0)  # let the worker take the first job
+        assert queue.submit("slow", gate.wait)
+        assert not queue.submit("slow", gate.wait)
+        assert metrics.get("jobs_dropped_total").value(job="slow") == 1
+
+        gate.set()
+        await queue.drain(timeout=1.0)
+
+    @pytest.mark.asyncio
+    async def test_no_jobs_accepted_after_drain(self):
+        """Draining closes the queue to new work."""
+        queue = JobQueue(MetricsRegistry())
+        await queue.drain()
+
+        assert not queue.submit("late", lambda: asyncio.sleep(0))
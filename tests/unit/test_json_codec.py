@@ -0,0 +1,56 @@
+"""Tests for JSON encoder selection."""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from exceptions import ValidationError
+from models import CaseStatus
+from utils.json_codec import (
+    StdlibJSONEncoder,
+    available_encoders,
+    get_json_encoder,
+)
+
+
+class TestGetJsonEncoder:
+    """Encoder resolution specification."""
+
+    def test_auto_picks_fastest_available(self):
+        """'auto' should resolve to the first available encoder."""
+        assert get_json_encoder("auto").name == available_encoders()[0]
+
+    def test_stdlib_always_available(self):
+        """The stdlib encoder must always be selectable."""
+        assert isinstance(get_json_encoder("stdlib"), StdlibJSONEncoder)
+
+    def test_unknown_name_raises_validation_error(self):
+        """Unknown encoder names should raise a domain error."""
+        with pytest.raises(ValidationError):
+            get_json_encoder("msgpack")
+
+
+class TestEncoderOutput:
+    """All encoders must produce equivalent compact JSON."""
+
+    @pytest.mark.parametrize("name", available_encoders())
+    def test_encoders_agree(self, name):
+        """Every encoder should decode back to the same document."""
+        content = {
+            "id": "case-001",
+            "status": CaseStatus.SUBMITTED,
+            "created_at": datetime(2026, 1, 15, 10, 30),
+            "expert_id": None,
+            "note": "café",
+        }
+        encoded = get_json_encoder(name).dumps(content)
+
+        assert json.loads(encoded) == {
+            "id": "case-001",
+            "status": "submitted",
+            "created_at": "2026-01-15T10:30:00",
+            "expert_id": None,
+            "note": "café",
+        }
+        assert b" " not in encoded.replace("café".encode(), b"")
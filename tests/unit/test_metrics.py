@@ -0,0 +1,41 @@
+"""Tests for the in-process metrics registry."""
+
+from utils.metrics import MetricsRegistry
+
+
+class TestMetricsRegistry:
+    """MetricsRegistry specification."""
+
+    def test_counter_with_labels(self):
+        """Counters track each label set separately."""
+        registry = MetricsRegistry()
+        counter = registry.counter("hits_total", "Hits")
+        counter.inc(route="a")
+        counter.inc(2, route="b")
+
+        assert counter.value(route="a") == 1
+        assert counter.value(route="b") == 2
+        assert registry.counter("hits_total", "Hits") is counter
+
+    def test_gauge_callback_is_read_at_collection(self):
+        """Callback gauges reflect the live value."""
+        registry = MetricsRegistry()
+        depth = [3]
+        registry.gauge("depth", "Depth").set_function(lambda: depth[0])
+        depth[0] = 7
+
+        assert "depth 7" in registry.render_prometheus()
+
+    def test_histogram_exposition(self):
+        """Histograms render cumulative buckets, sum and count."""
+        registry = MetricsRegistry()
+        hist = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+        hist.observe(0.05)
+        hist.observe(0.5)
+        text = registry.render_prometheus()
+
+        assert "# TYPE latency_seconds histogram" in text
+        assert 'latency_seconds_bucket{le="0.1"} 1' in text
+        assert 'latency_seconds_bucket{le="+Inf"} 2' in text
+        assert "latency_seconds_count 2" in text
+        assert hist.count() == 2
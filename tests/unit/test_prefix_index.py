@@ -0,0 +1,62 @@
+"""Tests for the sorted-array prefix index."""
+
+import pytest
+
+from exceptions import ValidationError
+from utils.prefix_index import PrefixIndex, parse_pattern
+
+
+@pytest.fixture
+def index():
+    """Index over a handful of referrer ids."""
+    idx = PrefixIndex()
+    for record_id, value in [
+        ("c1", "ref-1"), ("c2", "ref-10"), ("c3", "ref-2"), ("c4", "ref-1"), ("c5", "other"),
+    ]:
+        idx.update(record_id, value)
+    return idx
+
+
+class TestPrefixIndex:
+    """PrefixIndex specification."""
+
+    def test_exact_match(self, index):
+        """An exact pattern returns only that value's records."""
+        assert list(index.match("ref-1")) == ["c1", "c4"]
+
+    def test_prefix_match_is_ordered_by_value(self, index):
+        """A prefix walks values in sorted order."""
+        assert list(index.match("ref-1*")) == ["c1", "c4", "c2"]
+        assert list(index.match("ref*")) == ["c1", "c4", "c2", "c3"]
+
+    def test_update_moves_record(self, index):
+        """Re-pointing a record removes it from its old value."""
+        index.update("c1", "ref-2")
+
+        assert list(index.match("ref-1")) == ["c4"]
+        assert list(index.match("ref-2")) == ["c3", "c1"]
+
+    def test_none_unindexes_and_drops_empty_values(self, index):
+        """Removing the last record of a value removes the value."""
+        index.update("c5", None)
+
+        assert list(index.match("o*")) == []
+        assert index.value_of("c5") is None
+
+    def test_filter_applies_pattern_to_candidates(self, index):
+        """filter() keeps candidates whose value matches."""
+        assert list(index.filter(["c1", "c2", "c3", "zz"], "ref-1*")) == ["c1", "c2"]
+
+    def test_match_is_lazy(self, index):
+        """Consumers can stop early without materialising every hit."""
+        it = index.match("ref*")
+        assert next(it) == "c1"
+
+
+class TestParsePattern:
+    """Pattern parsing."""
+
+    def test_inner_wildcard_is_rejected(self):
+        """Only a trailing wildcard is supported."""
+        with pytest.raises(ValidationError):
+            parse_pattern("ref-*-1")
@@ -0,0 +1,148 @@
+"""Tests for the MCP server's project index and the tools answering from it."""
+
+import asyncio
+import os
+
+import pytest
+
+from mcp_server.project_index import ProjectIndex, parse_imports
+from mcp_server.tools.get_contracts import get_contracts
+from mcp_server.tools.get_module_boundaries import get_module_boundaries
+from mcp_server.tools.validate_architecture import validate_architecture
+
+
+@pytest.fixture
+def project(tmp_path):
+    """A small project tree with one boundary violation."""
+    (tmp_path / "models").mkdir()
+    (tmp_path / "models" / "case.py").write_text("from services.case_service import X\n")
+    (tmp_path / "services").mkdir()
+    (tmp_path / "services" / "case_service.py").write_text("import models.case\n\nx = 1\n")
+    (tmp_path / "contracts").mkdir()
+    (tmp_path / "contracts" / "case.yaml").write_text("openapi: 3.0.3\n")
+    (tmp_path / ".venv").mkdir()
+    (tmp_path / ".venv" / "ignored.py").write_text("")
+    return tmp_path
+
+
+def _touch(path, text):
+    path.write_text(text)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+class TestParseImports:
+    """parse_imports specification."""
+
+    def test_absolute_and_relative_imports(self):
+        """Relative imports resolve against the file's package."""
+        source = "import os\nfrom . import sibling\nfrom ..models import Case\nfrom utils.x import y\n"
+
+        assert parse_imports("api/v1/routes.py", source) == (
+            "os", "api.v1", "api.models", "utils.x",
+        )
+
+    def test_unparseable_file_has_no_imports(self):
+        """A syntax error yields no imports rather than failing the index."""
+        assert parse_imports("api/broken.py", "def (:\n") == ()
+
+
+class TestProjectIndex:
+    """ProjectIndex specification."""
+
+    def test_build_indexes_files_and_contracts(self, project):
+        """Python files outside skipped directories and contracts are indexed."""
+        index = ProjectIndex(project)
+
+        assert index.refresh() == 3
+        snapshot = index.snapshot
+        assert sorted(snapshot.modules) == ["models/case.py", "services/case_service.py"]
+        assert snapshot.modules["services/case_service.py"].lines == 3
+        assert snapshot.contracts == {"case": "openapi: 3.0.3\n"}
+
+    def test_refresh_rereads_only_changes(self, project):
+        """Unchanged files keep their entry; edits and deletions publish a new snapshot."""
+        index = ProjectIndex(project)
+        index.refresh()
+        first = index.snapshot
+        unchanged = first.modules["models/case.py"]
+
+        assert index.refresh() == 0
+        assert index.snapshot is first
+
+        _touch(project / "services" / "case_service.py", "import utils.x\n")
+        (project / "contracts" / "case.yaml").unlink()
+        assert index.refresh() == 2
+        second = index.snapshot
+        assert second.generation == first.generation + 1
+        assert second.modules["models/case.py"] is unchanged
+        assert second.modules["services/case_service.py"].imports == ("utils.x",)
+        assert second.contracts == {}
+        assert first.modules["services/case_service.py"].imports == ("models.case",)
+
+    @pytest.mark.asyncio
+    async def test_ready_builds_in_background(self, project):
+        """ready() starts the build if needed and returns the first snapshot."""
+        index = ProjectIndex(project, poll_interval=60)
+        try:
+            snapshot = await index.ready()
+        finally:
+            await index.stop()
+
+        assert "models/case.py" in snapshot.modules
+
+
+    @pytest.mark.asyncio
+    async def test_failed_refreshes_do_not_stop_polling(self, project, monkeypatch):
+        """ready() returns after a failed first build, and later polls still run."""
+        index = ProjectIndex(project, poll_interval=0.01)
+        real_refresh, calls = index.refresh, []
+
+        def flaky_refresh():
+            calls.append(len(calls))
+            if len(calls) <= 2:
+                raise PermissionError("tree is being replaced")
+            return real_refresh()
+
+        monkeypatch.setattr(index, "refresh", flaky_refresh)
+        try:
+            first = await asyncio.wait_for(index.ready(), 1)
+            while index.snapshot.generation == 0:
+                await asyncio.sleep(0.01)
+        finally:
+            await index.stop()
+
+        assert first.modules == {}
+        assert "models/case.py" in index.snapshot.modules
+
+
+class TestToolsFromIndex:
+    """Tools answer from an index snapshot."""
+
+    def test_validate_uses_indexed_imports(self, project):
+        """Without explicit imports, the file's parsed imports are checked."""
+        index = ProjectIndex(project)
+        index.refresh()
+
+        result = validate_architecture(index.snapshot, "models/case.py")
+
+        assert result.startswith("BLOCK: models/case.py (models) imports 'services.case_service'")
+
+    def test_boundaries_report_current_findings(self, project):
+        """Module boundaries include the module's indexed files and findings."""
+        index = ProjectIndex(project)
+        index.refresh()
+
+        result = get_module_boundaries(index.snapshot, "models")
+
+        assert "Indexed: 1 files, 1 lines" in result
+        assert "    BLOCK: models/case.py" in result
+
+    def test_contracts_come_from_the_index(self, project):
+        """Contracts are served from the snapshot, not the disk."""
+        index = ProjectIndex(project)
+        index.refresh()
+        (project / "contracts" / "case.yaml").unlink()
+
+        assert get_contracts(index.snapshot, "case").startswith("Contract for 'case'")
+        assert "Available contracts: case" in get_contracts(index.snapshot, "report")
@@ -0,0 +1,221 @@
+"""Tests for the read replica and the change-stream follower feeding it."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from exceptions import InvalidStateError, ReplicaLagError
+from models import Case, CaseStatus
+from utils.change_feed import EPOCH_HEADER, ChangeFeed
+from utils.feed_follower import FeedFollower
+from utils.in_memory_repo import InMemoryCaseRepository
+from utils.metrics import MetricsRegistry
+from utils.replication import CaseReplica, read_position
+
+
+def _case(case_id: str, status: CaseStatus = CaseStatus.SUBMITTED) -> Case:
+    return Case(id=case_id, referrer_id="ref-1", status=status)
+
+
+@pytest.fixture
+def metrics():
+    return MetricsRegistry()
+
+
+@pytest.fixture
+def replica(metrics):
+    replica = CaseReplica(InMemoryCaseRepository(), max_wait=0.05, metrics=metrics)
+    replica.load("epoch-1", 0, [])
+    return replica
+
+
+class _Primary:
+    """A primary's /cases:snapshot and /cases:watch over one change feed."""
+
+    def __init__(self) -> None:
+        self.feed = ChangeFeed()
+        self.cases: dict[str, Case] = {}
+        self.reset_next = False
+        self.requests: list[tuple[str, str | None]] = []
+
+    def save(self, case: Case) -> None:
+        self.cases[case.id] = case
+        self.feed.publish(case)
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        resume = request.headers.get("Last-Event-ID")
+        self.requests.append((request.url.path.rsplit(":", 1)[1], resume))
+        headers = {EPOCH_HEADER: self.feed.epoch}
+        if resume is None:
+            return httpx.Response(200, headers=headers, json={
+                "epoch": self.feed.epoch,
+                "position": self.feed.last_seq,
+                "items": [case.model_dump(mode="json") for case in self.cases.values()],
+                "next_cursor": None,
+            })
+        body = b""
+        if self.reset_next:
+            self.reset_next = False
+            body = b"event: reset\ndata: {}\n\n"
+        sub = self.feed.subscribe(after_seq=int(resume))
+        body += b"".join(
+            b"id: %d\nevent: case\ndata: %s\n\n" % (e.seq, e.data)
+            for e in await sub.next_batch(0)
+        )
+        self.feed.unsubscribe(sub)
+        return httpx.Response(200, headers=headers, content=body)
+
+    def follower(self, replica: CaseReplica, metrics: MetricsRegistry) -> FeedFollower:
+        client = httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+        return FeedFollower(
+            replica, "http://primary/api/v1/cases:watch",
+            "http://primary/api/v1/cases:snapshot", metrics, client=client,
+        )
+
+
+class TestCaseReplica:
+    """Applying changes and position-gated reads."""
+
+    @pytest.mark.asyncio
+    async def test_applies_changes_in_order_once(self, replica):
+        """Changes at or below the position are ignored, so replays are harmless."""
+        await replica.apply(1, _case("case-1"))
+        await replica.apply(2, _case("case-1", CaseStatus.ASSIGNED))
+        await replica.apply(1, _case("case-1"))
+
+        assert replica.applied == 2
+        assert (await replica.get_by_id("case-1")).status == CaseStatus.ASSIGNED
+        assert (await replica.stats()).by_status[CaseStatus.ASSIGNED] == 1
+
+    @pytest.mark.asyncio
+    async def test_read_waits_for_its_position(self, replica, metrics):
+        """A read behind its position is answered once the change arrives."""
+        token = read_position.set(1)
+        try:
+            read = asyncio.create_task(replica.get_by_id("case-1"))
+            await asyncio.sleep(0)
+            await replica.apply(1, _case("case-1"))
+
+            assert (await read).id == "case-1"
+        finally:
+            read_position.reset(token)
+        assert metrics.get("replica_reads_total").value(result="waited") == 1
+
+    @pytest.mark.asyncio
+    async def test_read_gives_up_after_max_wait(self, replica, metrics):
+        """A position not reached within max_wait is a ReplicaLagError."""
+        token = read_position.set(5)
+        try:
+            with pytest.raises(ReplicaLagError):
+                await replica.search(referrer_id="ref-1")
+        finally:
+            read_position.reset(token)
+        assert metrics.get("replica_reads_total").value(result="lagging") == 1
+
+    @pytest.mark.asyncio
+    async def test_timed_out_waits_do_not_pile_up(self, replica):
+        """Abandoned waits are dropped while the replica stays behind."""
+        pending = asyncio.create_task(replica.wait_for(100, 10))
+        for position in range(2, 50):
+            assert not await replica.wait_for(position, 0)
+
+        assert len(replica._waiters) <= 3
+        await replica.apply(100, _case("case-1"))
+        assert await pending
+        assert replica._waiters == []
+
+    @pytest.mark.asyncio
+    async def test_reads_fail_until_a_copy_is_loaded(self, metrics):
+        """A replica without a copy of its primary answers nothing."""
+        replica = CaseReplica(InMemoryCaseRepository(), metrics=metrics)
+
+        with pytest.raises(ReplicaLagError):
+            await replica.get_by_id("case-1")
+        replica.load("epoch-1", 3, [_case("case-1")])
+
+        assert (await replica.get_by_id("case-1")).id == "case-1"
+        assert replica.applied == 3
+
+    @pytest.mark.asyncio
+    async def test_load_replaces_the_copy(self, replica):
+        """Cases of an earlier copy or change are gone after a load."""
+        await replica.apply(1, _case("case-1"))
+
+        replica.load("epoch-2", 1, [_case("case-2")])
+
+        assert await replica.get_by_id("case-1") is None
+        assert (await replica.stats()).total == 1
+        assert replica.epoch == "epoch-2"
+
+    @pytest.mark.asyncio
+    async def test_rejects_writes(self, replica):
+        """Saves belong to the primary."""
+        with pytest.raises(InvalidStateError):
+            await replica.save(_case("case-1"))
+
+    @pytest.mark.asyncio
+    async def test_republishes_to_its_own_feed(self, metrics):
+        """Watchers of the replica's process see the applied changes."""
+        feed = ChangeFeed()
+        replica = CaseReplica(InMemoryCaseRepository(change_feed=feed), metrics=metrics)
+
+        await replica.apply(7, _case("case-1"))
+
+        assert feed.last_seq == 1
+
+
+class TestFeedFollower:
+    """Copying the primary and following its event stream."""
+
+    @pytest.mark.asyncio
+    async def test_copies_the_primary_then_follows_from_its_position(self, metrics):
+        """Cases older than the stream come from the copy; later ones are applied."""
+        primary = _Primary()
+        primary.save(_case("case-old"))
+        replica = CaseReplica(InMemoryCaseRepository(), metrics=metrics)
+        follower = primary.follower(replica, metrics)
+
+        await follower.follow_once()
+        primary.save(_case("case-new"))
+        await follower.follow_once()
+
+        assert set(await replica.get_many(["case-old", "case-new"])) == {"case-old", "case-new"}
+        assert primary.requests == [("snapshot", None), ("watch", "1"), ("watch", "1")]
+        assert replica.applied == 2
+        assert metrics.get("replica_copies_total").value() == 1
+
+    @pytest.mark.asyncio
+    async def test_reset_copies_the_primary_again(self, metrics):
+        """Changes the primary could not replay are recovered from a new copy."""
+        primary = _Primary()
+        replica = CaseReplica(InMemoryCaseRepository(), metrics=metrics)
+        follower = primary.follower(replica, metrics)
+        await follower.follow_once()
+        primary.save(_case("case-1"))
+        primary.reset_next = True
+
+        await follower.follow_once()
+
+        assert (await replica.get_by_id("case-1")).id == "case-1"
+        assert metrics.get("replica_resets_total").value() == 1
+        assert metrics.get("replica_copies_total").value() == 2
+
+    @pytest.mark.asyncio
+    async def test_primary_restart_copies_the_new_epoch(self, metrics):
+        """A stream from a new feed epoch means the positions started over."""
+        primary = _Primary()
+        for i in range(3):
+            primary.save(_case(f"case-{i}"))
+        replica = CaseReplica(InMemoryCaseRepository(), metrics=metrics)
+        follower = primary.follower(replica, metrics)
+        await follower.follow_once()
+
+        restarted = _Primary()
+        restarted.save(_case("case-0", CaseStatus.ASSIGNED))
+        follower._client = httpx.AsyncClient(transport=httpx.MockTransport(restarted.handler))
+        await follower.follow_once()
+
+        assert (replica.epoch, replica.applied) == (restarted.feed.epoch, 1)
+        assert (await replica.get_by_id("case-0")).status == CaseStatus.ASSIGNED
+        assert await replica.get_by_id("case-1") is None
@@ -0,0 +1,153 @@
+"""Tests for the repository backend registry and settings from environment."""
+
+import pytest
+
+from api.dependencies import build_repository
+from api.repositories import (
+    available_backends,
+    build_case_repository,
+    parse_cache_spec,
+    register_backend,
+)
+from config import Settings
+from exceptions import ValidationError
+from models import Case, CaseStatus
+from utils.change_feed import ChangeFeed
+from utils.in_memory_repo import InMemoryCaseRepository
+from utils.metrics import MetricsRegistry
+from utils.repo_decorators import CachingCaseRepository, MeteredCaseRepository
+from utils.sharded_repo import ShardedCaseRepository
+
+
+class TestBuildCaseRepository:
+    """Backend selection and decorator stacking."""
+
+    def test_builtin_backends(self):
+        """memory, sharded and sqlite are registered."""
+        assert {"memory", "sharded", "sqlite"} <= set(available_backends())
+
+    def test_default_is_bare_memory_store(self):
+        """Without cache or metrics no decorators are added."""
+        assert isinstance(build_case_repository(Settings()), InMemoryCaseRepository)
+
+    def test_chain_order(self):
+        """Metrics wrap the cache, which wraps the backend."""
+        repo = build_case_repository(
+            Settings(repo_backend="sharded", repo_shards=2, repo_cache="lru:5", repo_metrics=True),
+            MetricsRegistry(),
+        )
+
+        assert isinstance(repo, MeteredCaseRepository)
+        assert isinstance(repo.inner, CachingCaseRepository)
+        assert repo.inner.max_entries == 5
+        assert isinstance(repo.inner.inner, ShardedCaseRepository)
+        assert repo.inner.inner.shard_count == 2
+
+    def test_metrics_need_a_registry(self):
+        """repo_metrics without a registry leaves latency unrecorded."""
+        repo = build_case_repository(Settings(repo_metrics=True))
+
+        assert isinstance(repo, InMemoryCaseRepository)
+
+    def test_unknown_backend(self):
+        """An unregistered name lists the available ones."""
+        with pytest.raises(ValidationError, match="available: memory"):
+            build_case_repository(Settings(repo_backend="redis"))
+
+    def test_register_backend(self, monkeypatch):
+        """Registered factories are selectable by name."""
+        monkeypatch.setattr("api.repositories._BACKENDS", {})
+        register_backend("custom")(lambda settings, feed: InMemoryCaseRepository(feed))
+
+        assert available_backends() == ["custom"]
+        assert isinstance(
+            build_case_repository(Settings(repo_backend="custom")), InMemoryCaseRepository
+        )
+
+    @pytest.mark.parametrize("spec, expected", [("off", None), ("", None), ("lru:100", 100)])
+    def test_cache_spec(self, spec, expected):
+        """Valid cache specs parse to a size or None."""
+        assert parse_cache_spec(spec) == expected
+
+    @pytest.mark.parametrize("spec", ["lru", "lru:0", "lru:x", "lfu:10"])
+    def test_bad_cache_spec(self, spec):
+        """Malformed cache specs are rejected."""
+        with pytest.raises(ValidationError):
+            parse_cache_spec(spec)
+
+    @pytest.mark.asyncio
+    async def test_cache_and_latency_metrics(self):
+        """Cache hits, misses, size and per-operation latency are exported."""
+        metrics = MetricsRegistry()
+        repo = build_case_repository(
+            Settings(repo_cache="lru:1", repo_metrics=True), metrics
+        )
+        repo.seed([Case(id="a", referrer_id="r"), Case(id="b", referrer_id="r")])
+
+        await repo.get_by_id("a")
+        await repo.get_by_id("a")
+        await repo.get_by_id("b")
+
+        text = metrics.render_prometheus()
+        assert "repo_cache_hits_total 1" in text
+        assert "repo_cache_misses_total 2" in text
+        assert "repo_cache_entries 1" in text
+        assert 'repo_operation_seconds_count{operation="get_by_id"} 3' in text
+
+
+class TestDemoSeed:
+    """Demo cases never overwrite a durable store."""
+
+    @pytest.mark.asyncio
+    async def test_durable_backends_are_not_seeded_by_default(self, tmp_path):
+        """A fresh sqlite database starts empty; memory gets the demo cases."""
+        sqlite = Settings(repo_backend="sqlite", repo_sqlite_path=str(tmp_path / "cases.db"))
+
+        durable = build_repository(sqlite, MetricsRegistry(), ChangeFeed())
+        memory = build_repository(Settings(), MetricsRegistry(), ChangeFeed())
+
+        assert (await durable.stats()).total == 0
+        assert (await memory.stats()).total == 2
+
+    @pytest.mark.asyncio
+    async def test_seeding_keeps_stored_cases(self, tmp_path):
+        """Reopening a seeded database keeps the changes saved since."""
+        settings = Settings(
+            repo_backend="sqlite",
+            repo_sqlite_path=str(tmp_path / "cases.db"),
+            repo_seed_demo=True,
+        )
+        repo = build_repository(settings, MetricsRegistry(), ChangeFeed())
+        case = await repo.get_by_id("case-001")
+        await repo.save(case.model_copy(update={"status": CaseStatus.COMPLETED}))
+
+        reopened = build_repository(settings, MetricsRegistry(), ChangeFeed())
+
+        assert (await reopened.get_by_id("case-001")).status == CaseStatus.COMPLETED
+        assert (await reopened.stats()).by_status[CaseStatus.COMPLETED] == 1
+
+
+class TestSettingsFromEnv:
+    """Settings.from_env parsing."""
+
+    def test_reads_prefixed_variables(self):
+        """Values are validated into the field types; others keep defaults."""
+        settings = Settings.from_env({
+            "MEDIRECT_REPO_BACKEND": "sqlite",
+            "MEDIRECT_REPO_CACHE": "lru:10000",
+            "MEDIRECT_REPO_METRICS": "on",
+            "MEDIRECT_REPO_SHARDS": "8",
+            "MEDIRECT_WARMUP_HOT_IDS": "case-001, case-002",
+            "REPO_BACKEND": "ignored",
+        })
+
+        assert settings.repo_backend == "sqlite"
+        assert settings.repo_cache == "lru:10000"
+        assert settings.repo_metrics is True
+        assert settings.repo_shards == 8
+        assert settings.warmup_hot_ids == ("case-001", "case-002")
+        assert settings.port == 8000
+
+    def test_empty_environment_is_default(self):
+        """No variables means default settings."""
+        assert Settings.from_env({}) == Settings()
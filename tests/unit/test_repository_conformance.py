@@ -0,0 +1,228 @@
+"""Conformance suite every registered repository backend must pass.
+
+Each configuration is built through the registry, so decorators are
+exercised in the same chain the app uses.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from api.repositories import build_case_repository
+from config import Settings
+from exceptions import InvalidStateError
+from models import Case, CaseStatus
+from services.case_service import CaseService
+from utils.change_feed import ChangeFeed
+from utils.metrics import MetricsRegistry
+from utils.snapshot_format import write_snapshot
+
+CONFIGS = {
+    "memory": {"repo_backend": "memory"},
+    "sharded": {"repo_backend": "sharded", "repo_shards": 4},
+    "sqlite": {"repo_backend": "sqlite"},
+    "snapshot": {"repo_backend": "snapshot"},
+    "memory+lru": {"repo_backend": "memory", "repo_cache": "lru:8"},
+    "sqlite+lru+metrics": {
+        "repo_backend": "sqlite", "repo_cache": "lru:8", "repo_metrics": True,
+    },
+    "sqlite+batching+lru": {
+        "repo_backend": "sqlite", "repo_batching": True, "repo_cache": "lru:8",
+    },
+    "sharded+batching": {"repo_backend": "sharded", "repo_shards": 4, "repo_batching": True},
+}
+
+
+def _cases(n: int = 60) -> list[Case]:
+    return [
+        Case(
+            id=f"case-{i:03d}",
+            referrer_id=f"ref-{i % 7}",
+            expert_id=f"exp-{i % 4}" if i % 3 else None,
+            status=CaseStatus.SUBMITTED if i % 2 else CaseStatus.DRAFT,
+            created_at=datetime(2026, 1, 1 + i % 5, 12, tzinfo=timezone.utc),
+            due_at=datetime(2026, 1, 10, i % 24, tzinfo=timezone.utc) if i % 2 else None,
+        )
+        for i in range(n)
+    ]
+
+
+@pytest.fixture(params=list(CONFIGS))
+def repo(request, tmp_path):
+    """A seeded repository for each backend configuration."""
+    settings = Settings(
+        **CONFIGS[request.param],
+        repo_sqlite_path=str(tmp_path / "cases.db"),
+        repo_snapshot_path=str(tmp_path / "cases.snap"),
+    )
+    cases = _cases()
+    if settings.repo_backend == "snapshot":
+        # Most cases come from the mapped file, the rest from the overlay.
+        write_snapshot(settings.repo_snapshot_path, cases[:40])
+        cases = cases[40:]
+    repo = build_case_repository(settings, MetricsRegistry(), ChangeFeed())
+    repo.seed(cases)
+    return repo
+
+
+def _feed(repo) -> ChangeFeed:
+    while not hasattr(repo, "change_feed"):
+        repo = repo.inner
+    return repo.change_feed
+
+
+class TestRepositoryConformance:
+    """Behaviour shared by every CaseRepository backend."""
+
+    @pytest.mark.asyncio
+    async def test_get_by_id(self, repo):
+        """Seeded cases round-trip with aware UTC timestamps; unknown ids are None."""
+        case = await repo.get_by_id("case-012")
+
+        assert case.referrer_id == "ref-5"
+        assert case.status == CaseStatus.DRAFT
+        assert case.created_at == datetime(2026, 1, 3, 12, tzinfo=timezone.utc)
+        assert case.created_at.tzinfo is not None
+        assert await repo.get_by_id("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_due_at_round_trips(self, repo):
+        """Deadlines are stored to the microsecond; cases without one stay None."""
+        found = await repo.get_many(["case-013", "case-041", "case-012"])
+        found["case-012"].due_at = datetime(2026, 2, 1, 8, 0, 0, 123456, tzinfo=timezone.utc)
+        await repo.save(found["case-012"])
+
+        assert found["case-013"].due_at == datetime(2026, 1, 10, 13, tzinfo=timezone.utc)
+        assert found["case-041"].due_at == datetime(2026, 1, 10, 17, tzinfo=timezone.utc)
+        saved = await repo.get_by_id("case-012")
+        assert saved.due_at == datetime(2026, 2, 1, 8, 0, 0, 123456, tzinfo=timezone.utc)
+        assert (await repo.get_by_id("case-014")).due_at is None
+
+    @pytest.mark.asyncio
+    async def test_page_by_id_walks_every_case_once(self, repo):
+        """Pages follow id order, show saved changes and include new cases."""
+        updated = await repo.get_by_id("case-007")
+        updated.status = CaseStatus.ASSIGNED
+        await repo.save(updated)
+        await repo.save(Case(id="case-0205", referrer_id="ref-1"))
+
+        pages, after = [], None
+        while page := await repo.page_by_id(after, 7):
+            pages.append(page)
+            after = page[-1].id
+
+        ids = [case.id for page in pages for case in page]
+        assert ids == sorted({f"case-{i:03d}" for i in range(60)} | {"case-0205"})
+        assert all(len(page) == 7 for page in pages[:-1])
+        walked = {case.id: case for page in pages for case in page}
+        assert walked["case-007"].status == CaseStatus.ASSIGNED
+
+    @pytest.mark.asyncio
+    async def test_with_deadlines_tracks_saves(self, repo):
+        """Exactly the current cases with a deadline are returned."""
+        found = await repo.get_many(["case-012", "case-013"])
+        found["case-012"].due_at = datetime(2026, 2, 1, tzinfo=timezone.utc)
+        found["case-013"].due_at = None
+        for case in found.values():
+            await repo.save(case)
+
+        expected = {f"case-{i:03d}" for i in range(1, 60, 2)} - {"case-013"} | {"case-012"}
+        cases = await repo.with_deadlines()
+        assert sorted(c.id for c in cases) == sorted(expected)
+        assert all(c.due_at is not None for c in cases)
+
+    @pytest.mark.asyncio
+    async def test_get_many(self, repo):
+        """Only found ids are returned; an empty request is empty."""
+        await repo.get_by_id("case-001")  # warm a cache, if any
+
+        found = await repo.get_many(["case-001", "case-030", "missing"])
+
+        assert set(found) == {"case-001", "case-030"}
+        assert found["case-030"].referrer_id == "ref-2"
+        assert await repo.get_many([]) == {}
+
+    @pytest.mark.asyncio
+    async def test_save_is_visible_and_published(self, repo):
+        """A saved change is read back, searchable and sent to the change feed."""
+        case = await repo.get_by_id("case-004")
+        case.status, case.expert_id = CaseStatus.ASSIGNED, "exp-new"
+        await repo.save(case)
+
+        again = await repo.get_by_id("case-004")
+        assert (again.status, again.expert_id) == (CaseStatus.ASSIGNED, "exp-new")
+        assert [c.id for c in await repo.search(expert_id="exp-new")] == ["case-004"]
+        assert _feed(repo).last_seq == 1
+
+    @pytest.mark.parametrize("query", [
+        {"referrer_id": "ref-3"},
+        {"referrer_id": "ref-*"},
+        {"expert_id": "exp-1"},
+        {"referrer_id": "ref-2", "expert_id": "exp-*"},
+        {},
+    ])
+    @pytest.mark.asyncio
+    async def test_search_matches_reference(self, repo, query):
+        """Results match a brute-force filter and follow the driving field."""
+        def matches(case, field):
+            pattern = query.get(field)
+            value = getattr(case, field)
+            if pattern is None:
+                return True
+            if pattern.endswith("*"):
+                return value is not None and value.startswith(pattern[:-1])
+            return value == pattern
+
+        expected = {
+            c.id for c in _cases()
+            if matches(c, "referrer_id") and matches(c, "expert_id")
+        }
+        results = await repo.search(**query, limit=100)
+
+        assert {c.id for c in results} == expected
+        driving = "referrer_id" if "referrer_id" in query else "expert_id"
+        if query:
+            keys = [getattr(c, driving) for c in results]
+            assert keys == sorted(keys)
+        assert len(await repo.search(**query, limit=3)) == min(3, len(expected))
+
+    @pytest.mark.asyncio
+    async def test_stats_track_saves(self, repo):
+        """Incremental statistics agree with a full rebuild."""
+        case = await repo.get_by_id("case-001")
+        case.status, case.expert_id = CaseStatus.ASSIGNED, "exp-9"
+        await repo.save(case)
+        await repo.save(Case(id="case-new", referrer_id="ref-0"))
+
+        stats = await repo.stats()
+
+        assert stats.total == 61
+        assert stats.by_status[CaseStatus.ASSIGNED] == 1
+        assert stats.by_expert["exp-9"] == 1
+        assert await repo.rebuild_stats() == stats
+
+    @pytest.mark.asyncio
+    async def test_stats_count_the_last_microsecond_on_its_day(self, repo):
+        """Creation days are not rounded into the next day."""
+        late = datetime(2026, 1, 1, 23, 59, 59, 999999, tzinfo=timezone.utc)
+        await repo.save(Case(id="case-late", referrer_id="ref-0", created_at=late))
+
+        stats = await repo.stats()
+
+        assert stats.by_day[late.date()] == 13
+        assert await repo.rebuild_stats() == stats
+
+    @pytest.mark.asyncio
+    async def test_lock_serializes_assignments(self, repo):
+        """Concurrent assignments of one case: exactly one wins."""
+        service = CaseService(case_repo=repo)
+
+        results = await asyncio.gather(
+            service.assign_expert("case-001", "exp-a"),
+            service.assign_expert("case-001", "exp-b"),
+            return_exceptions=True,
+        )
+
+        assert sum(isinstance(r, InvalidStateError) for r in results) == 1
+        assert (await repo.get_by_id("case-001")).status == CaseStatus.ASSIGNED
@@ -1,6 +1,6 @@
 """Tests for API schemas — serialization and from_model converters."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 
 from models import Case, CaseAssignment, CaseStatus
 from schemas import (
@@ -29,7 +29,7 @@ class TestCaseResponse:
         assert response.referrer_id == "ref-100"
         assert response.expert_id == "exp-200"
         assert response.status == CaseStatus.ASSIGNED
-        assert response.created_at == datetime(2026, 1, 15)
+        assert response.created_at == datetime(2026, 1, 15, tzinfo=timezone.utc)
 
     def test_from_model_handles_none_expert(self):
         """from_model should preserve None expert_id."""
@@ -75,7 +75,7 @@ class TestCaseAssignmentResponse:
 
         assert response.case_id == "case-001"
         assert response.expert_id == "exp-200"
-        assert response.assigned_at == datetime(2026, 1, 15, 10, 30)
+        assert response.assigned_at == datetime(2026, 1, 15, 10, 30, tzinfo=timezone.utc)
 
 
 class TestAssignExpertRequest:
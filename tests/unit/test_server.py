@@ -0,0 +1,75 @@
+"""Tests for the uvicorn server profiles."""
+
+import pytest
+
+from api import server
+from api.server import server_config
+from config import Settings
+from exceptions import ValidationError
+
+
+class TestServerConfig:
+    """Settings mapped onto uvicorn's configuration."""
+
+    def test_dev_profile_keeps_uvicorn_defaults(self):
+        """The dev profile only sets the address and the app factory."""
+        config = server_config(Settings(port=9000))
+
+        assert (config.app, config.factory, config.port) == ("main:create_app", True, 9000)
+        assert (config.workers, config.timeout_keep_alive, config.backlog) == (1, 5, 2048)
+        assert config.limit_max_requests is None
+
+    def test_production_profile_applies_tuning(self):
+        """Keep-alive, backlog, limits and recycling come from settings."""
+        config = server_config(Settings(
+            server_profile="production",
+            repo_backend="sqlite",
+            idempotency_backend="sqlite",
+            sla_enabled=False,
+            server_workers=4,
+            server_limit_concurrency=500,
+            server_max_requests=10_000,
+            server_max_requests_jitter=1_000,
+        ))
+
+        assert (config.workers, config.timeout_keep_alive, config.backlog) == (4, 75, 4096)
+        assert (config.limit_concurrency, config.timeout_graceful_shutdown) == (500, 30)
+        assert (config.limit_max_requests, config.limit_max_requests_jitter) == (10_000, 1_000)
+        assert config.access_log is False
+
+    def test_production_profile_falls_back_without_speedups(self, monkeypatch):
+        """Without uvloop and httptools the stdlib loop and h11 are used."""
+        monkeypatch.setattr(server, "find_spec", lambda name: None)
+
+        config = server_config(Settings(server_profile="production"))
+
+        assert (config.loop, config.http) == ("asyncio", "h11")
+
+    @pytest.mark.parametrize("workers", [
+        {"server_workers": 2},
+        {"server_max_requests": 1000},
+    ])
+    @pytest.mark.parametrize("local", [
+        {"repo_backend": "memory"},
+        {"idempotency_backend": "memory"},
+        {"tenancy_enabled": True},
+        {"sla_enabled": True},
+        {"repo_seed_demo": True},
+    ])
+    def test_process_local_state_needs_one_lasting_worker(self, workers, local):
+        """Workers would each keep their own cases, keys, quotas, deadlines or seed."""
+        shared = {"repo_backend": "sqlite", "idempotency_backend": "sqlite", "sla_enabled": False}
+
+        with pytest.raises(ValidationError):
+            server_config(Settings(server_profile="production", **workers, **{**shared, **local}))
+
+    def test_one_lasting_worker_may_keep_state_in_memory(self):
+        """A single worker that is never recycled holds all of the state."""
+        config = server_config(Settings(server_profile="production", repo_seed_demo=True))
+
+        assert (config.workers, config.limit_max_requests) == (1, None)
+
+    def test_unknown_profile_is_rejected(self):
+        """Only the defined profiles are accepted."""
+        with pytest.raises(ValidationError):
+            server_config(Settings(server_profile="turbo"))
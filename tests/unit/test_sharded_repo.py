@@ -0,0 +1,106 @@
+"""Tests for the hash-sharded in-memory repository."""
+
+import asyncio
+
+import pytest
+
+from exceptions import InvalidStateError, ValidationError
+from models import Case, CaseStatus
+from services.case_service import CaseService
+from utils.in_memory_repo import InMemoryCaseRepository
+from utils.sharded_repo import ShardedCaseRepository
+
+
+def _cases(n: int = 200) -> list[Case]:
+    return [
+        Case(
+            id=f"case-{i:04d}",
+            referrer_id=f"ref-{i % 17}",
+            expert_id=f"exp-{i % 5}" if i % 3 else None,
+            status=CaseStatus.SUBMITTED,
+        )
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def repos():
+    """A sharded and an unsharded repository holding the same cases."""
+    cases = _cases()
+    sharded, plain = ShardedCaseRepository(shards=8), InMemoryCaseRepository()
+    sharded.seed(cases)
+    plain.seed([c.model_copy() for c in cases])
+    return sharded, plain
+
+
+class TestShardedCaseRepository:
+    """ShardedCaseRepository specification."""
+
+    def test_rejects_zero_shards(self):
+        """At least one shard is required."""
+        with pytest.raises(ValidationError):
+            ShardedCaseRepository(shards=0)
+
+    def test_cases_spread_across_shards(self):
+        """Shard choice is stable and uses every shard."""
+        repo = ShardedCaseRepository(shards=8)
+
+        assert {repo.shard_of(c.id) for c in _cases()} == set(range(8))
+        assert repo.shard_of("case-0001") == repo.shard_of("case-0001")
+
+    @pytest.mark.asyncio
+    async def test_point_and_batch_reads(self, repos):
+        """get_by_id and get_many route to the owning shards."""
+        sharded, _ = repos
+
+        assert (await sharded.get_by_id("case-0042")).referrer_id == "ref-8"
+        found = await sharded.get_many(["case-0001", "case-0150", "nope"])
+        assert set(found) == {"case-0001", "case-0150"}
+
+    @pytest.mark.parametrize("query", [
+        {"referrer_id": "ref-1*"},
+        {"expert_id": "exp-*"},
+        {"referrer_id": "ref-3", "expert_id": "exp-2"},
+    ])
+    @pytest.mark.asyncio
+    async def test_search_matches_unsharded_order(self, repos, query):
+        """Merged shard walks return what a single store would, in order."""
+        sharded, plain = repos
+        field = "referrer_id" if "referrer_id" in query else "expert_id"
+
+        got = await sharded.search(limit=30, **query)
+        want = await plain.search(limit=30, **query)
+
+        assert [getattr(c, field) for c in got] == [getattr(c, field) for c in want]
+        assert len(got) == len(want)
+
+    @pytest.mark.asyncio
+    async def test_stats_sum_over_shards(self, repos):
+        """Summed shard statistics equal a single store's statistics."""
+        sharded, plain = repos
+
+        assert await sharded.stats() == await plain.stats()
+        assert await sharded.rebuild_stats() == await plain.stats()
+
+    def test_locks_are_per_shard(self):
+        """Cases in different shards get different locks."""
+        repo = ShardedCaseRepository(shards=8)
+        by_shard = {repo.shard_of(c.id): c.id for c in _cases()}
+
+        assert repo.lock(by_shard[0]) is not repo.lock(by_shard[1])
+        assert repo.lock(by_shard[0]) is repo.lock(by_shard[0])
+
+    @pytest.mark.asyncio
+    async def test_concurrent_assignments_of_one_case(self):
+        """Only one of several concurrent assignments of a case succeeds."""
+        repo = ShardedCaseRepository(shards=4)
+        repo.seed(_cases(4))
+        service = CaseService(case_repo=repo)
+
+        results = await asyncio.gather(
+            *(service.assign_expert("case-0001", f"exp-{i}") for i in range(5)),
+            return_exceptions=True,
+        )
+
+        assert sum(not isinstance(r, Exception) for r in results) == 1
+        assert sum(isinstance(r, InvalidStateError) for r in results) == 4
@@ -0,0 +1,107 @@
+"""Tests for SLA deadline tracking."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from models import Case, CaseStatus
+from utils.metrics import MetricsRegistry
+from utils.sla import SlaPolicy, SlaTracker
+
+T0 = datetime(2026, 3, 1, 9, tzinfo=timezone.utc)
+
+
+def _case(case_id: str, due_in: float | None, status=CaseStatus.ASSIGNED) -> Case:
+    due_at = None if due_in is None else T0 + timedelta(seconds=due_in)
+    return Case(id=case_id, referrer_id="ref-1", status=status, due_at=due_at)
+
+
+class Recorder:
+    def __init__(self):
+        self.escalations = []
+
+    def on_escalated(self, escalation):
+        self.escalations.append(escalation)
+
+
+@pytest.fixture
+def metrics():
+    return MetricsRegistry()
+
+
+@pytest.fixture
+def tracker(metrics):
+    policy = SlaPolicy({CaseStatus.ASSIGNED: timedelta(hours=2)})
+    return SlaTracker(policy, metrics, tick_seconds=1.0, clock=T0.timestamp)
+
+
+class TestSlaPolicy:
+    """Deadlines per status."""
+
+    def test_due_at(self):
+        """Listed statuses get a deadline; others and non-positive ones get none."""
+        policy = SlaPolicy({
+            CaseStatus.ASSIGNED: timedelta(hours=2),
+            CaseStatus.IN_PROGRESS: timedelta(0),
+        })
+
+        assert policy.due_at(CaseStatus.ASSIGNED, T0) == T0 + timedelta(hours=2)
+        assert policy.due_at(CaseStatus.IN_PROGRESS, T0) is None
+        assert policy.due_at(CaseStatus.SUBMITTED, T0) is None
+
+
+class TestSlaTracker:
+    """Scheduling, escalation and the overdue index."""
+
+    def test_escalates_when_the_deadline_passes(self, metrics):
+        """Cases escalate once, on the first advance at or past their deadline."""
+        recorder = Recorder()
+        tracker = SlaTracker(
+            SlaPolicy({}), metrics, listeners=(recorder,), clock=T0.timestamp
+        )
+        tracker.schedule(_case("case-1", 30))
+        tracker.schedule(_case("case-2", 90))
+
+        assert tracker.advance(T0.timestamp() + 29) == []
+        escalated = tracker.advance(T0.timestamp() + 60)
+
+        assert [e.case_id for e in escalated] == ["case-1"]
+        assert escalated[0].status == CaseStatus.ASSIGNED
+        assert escalated[0].due_at == T0 + timedelta(seconds=30)
+        assert recorder.escalations == escalated
+        assert tracker.advance(T0.timestamp() + 60) == []
+        assert len(tracker) == 1
+        assert metrics.get("sla_escalations_total").value(status="assigned") == 1
+
+    def test_overdue_is_ordered_by_deadline(self, tracker):
+        """The index lists escalated cases earliest deadline first."""
+        for case_id, due_in in [("c", 50), ("a", 10), ("b", 30), ("later", 500)]:
+            tracker.schedule(_case(case_id, due_in))
+
+        tracker.advance(T0.timestamp() + 100)
+
+        assert tracker.overdue(10) == ["a", "b", "c"]
+        assert tracker.overdue(2) == ["a", "b"]
+
+    def test_reschedule_leaves_the_overdue_index(self, tracker, metrics):
+        """A new deadline or none at all removes a case from both structures."""
+        tracker.schedule(_case("a", 10))
+        tracker.schedule(_case("b", 20))
+        tracker.schedule(_case("pending", 300))
+        tracker.advance(T0.timestamp() + 60)
+
+        tracker.schedule(_case("a", 1000))
+        tracker.schedule(_case("b", None, CaseStatus.COMPLETED))
+        tracker.schedule(_case("pending", None, CaseStatus.COMPLETED))
+
+        assert tracker.overdue(10) == []
+        assert len(tracker) == 1
+        assert metrics.get("sla_pending").value() == 1
+        assert [e.case_id for e in tracker.advance(T0.timestamp() + 1000)] == ["a"]
+
+    def test_past_deadline_escalates_on_next_tick(self, tracker):
+        """Scheduling a deadline already missed escalates it on the next advance."""
+        tracker.schedule(_case("stale", -3600))
+
+        assert [e.case_id for e in tracker.advance()] == ["stale"]
+        assert tracker.overdue(1) == ["stale"]
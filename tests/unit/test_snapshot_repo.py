@@ -0,0 +1,104 @@
+"""Tests for the memory-mapped snapshot format and its write overlay."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from exceptions import ValidationError
+from models import Case, CaseStatus
+from utils.snapshot_format import write_snapshot
+from utils.snapshot_repo import SnapshotCaseRepository
+
+
+def _case(case_id: str, **fields) -> Case:
+    fields.setdefault("referrer_id", "ref-1")
+    fields.setdefault("created_at", datetime(2026, 3, 1, 9, 30, tzinfo=timezone.utc))
+    return Case(id=case_id, **fields)
+
+
+@pytest.fixture
+def path(tmp_path):
+    """Path of a snapshot holding a handful of cases."""
+    path = str(tmp_path / "cases.snap")
+    write_snapshot(path, [
+        _case("case-b", expert_id="exp-1", status=CaseStatus.ASSIGNED),
+        _case("case-ä", referrer_id="ref-ü"),
+        _case("case-a", status=CaseStatus.SUBMITTED),
+    ])
+    return path
+
+
+class TestSnapshotFormat:
+    """Round trips through the file format."""
+
+    @pytest.mark.asyncio
+    async def test_records_round_trip(self, path):
+        """Every field, non-ASCII text and missing experts decode unchanged."""
+        repo = SnapshotCaseRepository(path)
+
+        assert await repo.get_by_id("case-b") == _case(
+            "case-b", expert_id="exp-1", status=CaseStatus.ASSIGNED
+        )
+        assert (await repo.get_by_id("case-ä")).referrer_id == "ref-ü"
+        assert (await repo.get_by_id("case-a")).expert_id is None
+        assert await repo.get_by_id("case-c") is None
+        assert await repo.get_by_id("") is None
+
+    @pytest.mark.asyncio
+    async def test_stats_are_stored(self, path):
+        """Opening reads stored statistics, which agree with a full rebuild."""
+        repo = SnapshotCaseRepository(path)
+        stats = await repo.stats()
+
+        assert stats.total == 3
+        assert stats.by_expert == {"exp-1": 1}
+        assert await repo.rebuild_stats() == stats
+
+    @pytest.mark.asyncio
+    async def test_missing_file_is_empty(self, tmp_path):
+        """A snapshot that was never written opens as an empty store."""
+        repo = SnapshotCaseRepository(str(tmp_path / "none.snap"))
+
+        assert await repo.get_by_id("case-a") is None
+        assert (await repo.stats()).total == 0
+
+    def test_rejects_foreign_files(self, tmp_path):
+        """Files that are not snapshots fail with a domain error."""
+        other = tmp_path / "cases.db"
+        other.write_bytes(b"SQLite format 3\x00" + bytes(100))
+
+        with pytest.raises(ValidationError):
+            SnapshotCaseRepository(str(other))
+
+
+class TestOverlay:
+    """Writes shadow snapshot records without touching the file."""
+
+    @pytest.mark.asyncio
+    async def test_save_shadows_snapshot_record(self, path):
+        """A saved case replaces its snapshot record in reads, scans and stats."""
+        repo = SnapshotCaseRepository(path)
+        case = await repo.get_by_id("case-a")
+        case.status, case.expert_id = CaseStatus.ASSIGNED, "exp-1"
+        await repo.save(case)
+
+        assert (await repo.get_by_id("case-a")).expert_id == "exp-1"
+        assert [c.id for c in await repo.search(expert_id="exp-1")] == ["case-b", "case-a"]
+        assert sorted(c.id for c in repo.scan()) == ["case-a", "case-b", "case-ä"]
+        stats = await repo.stats()
+        assert stats.by_expert == {"exp-1": 2}
+        assert stats.by_status[CaseStatus.SUBMITTED] == 0
+        assert await repo.rebuild_stats() == stats
+        assert await SnapshotCaseRepository(path).get_by_id("case-a") != case
+
+    @pytest.mark.asyncio
+    async def test_compaction_folds_overlay_into_new_file(self, path, tmp_path):
+        """write_snapshot(scan()) persists the overlay."""
+        repo = SnapshotCaseRepository(path)
+        repo.seed([_case("case-new", referrer_id="ref-2")])
+        compacted = str(tmp_path / "next.snap")
+
+        assert write_snapshot(compacted, repo.scan()) == 4
+        reopened = SnapshotCaseRepository(compacted)
+        assert (await reopened.get_by_id("case-new")).referrer_id == "ref-2"
+        assert await reopened.stats() == await repo.stats()
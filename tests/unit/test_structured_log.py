@@ -0,0 +1,95 @@
+"""Tests for the queued JSON-lines log writer."""
+
+import json
+import logging
+
+import pytest
+
+from utils.json_codec import StdlibJSONEncoder
+from utils.metrics import MetricsRegistry
+from utils.structured_log import StructuredLog
+
+
+def _lines(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+@pytest.fixture
+def metrics():
+    return MetricsRegistry()
+
+
+class TestStructuredLog:
+    """Formatting, batching, rotation and back-pressure of StructuredLog."""
+
+    def test_writes_one_json_line_per_record(self, tmp_path, metrics):
+        """emit() and the stdlib logger both produce JSON lines with their fields."""
+        log = StructuredLog("audit", str(tmp_path / "audit.log"), StdlibJSONEncoder(), metrics)
+        log.start()
+
+        log.emit("case.assigned", case_id="case-1", expert_id="exp-1")
+        log.logger.info("note %s", "ok", extra={"fields": {"n": 2}})
+        log.logger.debug("below the level")
+        log.close()
+
+        first, second = _lines(tmp_path / "audit.log")
+        assert first["event"] == "case.assigned"
+        assert (first["log"], first["case_id"], first["expert_id"]) == ("audit", "case-1", "exp-1")
+        assert first["ts"].endswith("+00:00")
+        assert (second["event"], second["n"]) == ("note ok", 2)
+        assert metrics.get("log_records_written_total").value(log="audit") == 2
+
+    def test_full_queue_drops_instead_of_blocking(self, tmp_path, metrics):
+        """Before the writer starts, records beyond the queue size are dropped."""
+        log = StructuredLog(
+            "access", str(tmp_path / "access.log"), StdlibJSONEncoder(), metrics, queue_size=3
+        )
+
+        for n in range(5):
+            log.emit("http.request", n=n)
+        log.start()
+        log.close()
+
+        assert [line["n"] for line in _lines(tmp_path / "access.log")] == [0, 1, 2]
+        assert metrics.get("log_records_dropped_total").value(log="access") == 2
+
+    def test_unencodable_records_are_dropped(self, tmp_path, metrics):
+        """A record that cannot be encoded is counted and the writer keeps going."""
+        log = StructuredLog("access", str(tmp_path / "a.log"), StdlibJSONEncoder(), metrics)
+        log.start()
+
+        log.emit("bad", value=object())
+        log.emit("good")
+        log.close()
+
+        assert [line["event"] for line in _lines(tmp_path / "a.log")] == ["good"]
+        assert metrics.get("log_records_dropped_total").value(log="access") == 1
+
+    def test_rotates_by_size(self, tmp_path, metrics):
+        """Crossing max_bytes moves the file to .1, shifting older backups."""
+        path = tmp_path / "access.log"
+        log = StructuredLog(
+            "access", str(path), StdlibJSONEncoder(), metrics,
+            batch_size=1, max_bytes=200, backup_count=2,
+        )
+        log.start()
+
+        for n in range(12):
+            log.emit("http.request", n=n, padding="x" * 40)
+        log.close()
+
+        files = sorted(p.name for p in tmp_path.iterdir())
+        assert files == ["access.log", "access.log.1", "access.log.2"]
+        kept = _lines(tmp_path / "access.log.2") + _lines(tmp_path / "access.log.1") + (
+            _lines(path) if path.stat().st_size else []
+        )
+        numbers = [line["n"] for line in kept]
+        assert numbers == sorted(numbers) and numbers[-1] == 11
+        assert all(p.stat().st_size <= 200 + 100 for p in tmp_path.iterdir())
+
+    def test_logger_is_private_to_the_log(self, tmp_path, metrics):
+        """Records never reach the root logger's handlers."""
+        log = StructuredLog("access", str(tmp_path / "a.log"), StdlibJSONEncoder(), metrics)
+
+        assert log.logger is not logging.getLogger("access")
+        assert log.logger.parent is None
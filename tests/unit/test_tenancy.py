@@ -0,0 +1,135 @@
+"""Tests for tenant partitions and the per-tenant case quota."""
+
+import asyncio
+
+import pytest
+
+from exceptions import NotFoundError, QuotaExceededError, ValidationError
+from models import Case
+from utils.change_feed import ChangeFeed
+from utils.in_memory_repo import InMemoryCaseRepository
+from utils.tenancy import QuotaCaseRepository, TenantPartition, TenantRegistry
+
+
+def _case(case_id: str) -> Case:
+    return Case(id=case_id, referrer_id="ref-1")
+
+
+def _partition(tenant: str) -> TenantPartition:
+    return TenantPartition(tenant, InMemoryCaseRepository(), ChangeFeed())
+
+
+class _YieldingRepository(InMemoryCaseRepository):
+    """Yields to the event loop inside every save, and can be made to fail."""
+
+    fail = False
+
+    async def save(self, case: Case) -> None:
+        await asyncio.sleep(0)
+        if self.fail:
+            raise OSError("disk full")
+        await super().save(case)
+
+
+class TestQuotaCaseRepository:
+    """QuotaCaseRepository specification."""
+
+    @pytest.mark.asyncio
+    async def test_new_cases_beyond_quota_are_rejected(self):
+        """Saving a new id into a full repository raises and stores nothing."""
+        repo = QuotaCaseRepository(InMemoryCaseRepository(), max_cases=2)
+        await repo.save(_case("c1"))
+        await repo.save(_case("c2"))
+
+        with pytest.raises(QuotaExceededError):
+            await repo.save(_case("c3"))
+        assert await repo.get_by_id("c3") is None
+
+    @pytest.mark.asyncio
+    async def test_updates_are_allowed_when_full(self):
+        """Rewriting a stored case does not count against the quota."""
+        repo = QuotaCaseRepository(InMemoryCaseRepository(), max_cases=1)
+        await repo.save(_case("c1"))
+
+        await repo.save(Case(id="c1", referrer_id="ref-2"))
+
+        assert (await repo.get_by_id("c1")).referrer_id == "ref-2"
+        assert len(repo) == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_new_cases_respect_the_quota(self):
+        """Saves that await the backend at once cannot all take the last place."""
+        repo = QuotaCaseRepository(_YieldingRepository(), max_cases=2)
+
+        results = await asyncio.gather(
+            *(repo.save(_case(f"c{i}")) for i in range(5)), return_exceptions=True
+        )
+
+        assert [r is None for r in results] == [True, True, False, False, False]
+        assert (await repo.stats()).total == len(repo) == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_save_gives_its_place_back(self):
+        """A new case the backend did not store does not count."""
+        inner = _YieldingRepository()
+        repo = QuotaCaseRepository(inner, max_cases=1)
+        inner.fail = True
+
+        with pytest.raises(OSError):
+            await repo.save(_case("c1"))
+        inner.fail = False
+        await repo.save(_case("c2"))
+
+        assert len(repo) == 1
+
+    def test_seed_is_all_or_nothing(self):
+        """A seed that would overflow the quota stores none of its cases."""
+        repo = QuotaCaseRepository(InMemoryCaseRepository(), max_cases=2)
+        repo.seed([_case("c1")])
+
+        with pytest.raises(QuotaExceededError):
+            repo.seed([_case("c1"), _case("c2"), _case("c3")])
+        repo.seed([_case("c1"), _case("c2")])
+        assert len(repo) == 2
+
+
+class TestTenantRegistry:
+    """TenantRegistry specification."""
+
+    def test_partitions_are_created_once_per_tenant(self):
+        """Each tenant gets its own partition, reused on later lookups."""
+        registry = TenantRegistry(_partition, _partition("default"))
+
+        a = registry.get("acme")
+        assert registry.get("acme") is a
+        assert registry.get("globex").repo is not a.repo
+        assert registry.get(None) is registry.default
+        assert registry.tenants() == ["acme", "default", "globex"]
+
+    @pytest.mark.parametrize("tenant", ["", "Acme", "a/b", "x" * 64])
+    def test_malformed_ids_are_rejected(self, tenant):
+        """Ids outside TENANT_ID never create a partition."""
+        registry = TenantRegistry(_partition, _partition("default"))
+
+        with pytest.raises(ValidationError):
+            registry.get(tenant)
+        assert len(registry) == 1
+
+    def test_allow_list(self):
+        """With an allow-list, other tenants are unknown."""
+        registry = TenantRegistry(
+            _partition, _partition("default"), allowed=frozenset({"acme"})
+        )
+
+        registry.get("acme")
+        with pytest.raises(NotFoundError):
+            registry.get("globex")
+
+    def test_partition_count_is_bounded(self):
+        """No partition is created past max_tenants; existing ones still resolve."""
+        registry = TenantRegistry(_partition, _partition("default"), max_tenants=2)
+        registry.get("acme")
+
+        with pytest.raises(QuotaExceededError):
+            registry.get("globex")
+        assert registry.get("acme").tenant == "acme"
@@ -0,0 +1,75 @@
+"""Tests for the hierarchical timer wheel."""
+
+import random
+
+import pytest
+
+from utils.timer_wheel import TimerWheel
+
+
+class TestTimerWheel:
+    """Firing order and bookkeeping of TimerWheel."""
+
+    def test_fires_at_the_scheduled_tick(self):
+        """A timer fires on the advance that reaches its tick, not before."""
+        wheel = TimerWheel(now=100)
+        wheel.schedule("a", 105)
+
+        assert wheel.advance(104) == []
+        assert wheel.advance(105) == [("a", 105)]
+        assert len(wheel) == 0
+
+    def test_past_ticks_fire_on_next_advance(self):
+        """Timers at or before the current tick are due immediately."""
+        wheel = TimerWheel(now=50)
+        wheel.schedule("late", 10)
+
+        assert "late" in wheel
+        assert wheel.advance(50) == [("late", 10)]
+
+    def test_reschedule_and_cancel(self):
+        """Scheduling a key again moves its timer; cancel removes it."""
+        wheel = TimerWheel()
+        wheel.schedule("a", 10)
+        wheel.schedule("a", 70_000)
+        wheel.schedule("b", 20)
+
+        assert wheel.cancel("b") is True
+        assert wheel.cancel("b") is False
+        assert wheel.advance(69_999) == []
+        assert wheel.advance(70_000) == [("a", 70_000)]
+
+    def test_far_timers_beyond_the_span(self):
+        """Timers past the last level's span park and still fire on time."""
+        wheel = TimerWheel()
+        wheel.schedule("far", 2**33 + 5)
+
+        assert wheel.advance(2**33) == []
+        assert wheel.advance(2**33 + 5) == [("far", 2**33 + 5)]
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_a_sorted_reference(self, seed):
+        """Random schedules, cancels and advances fire exactly the due timers, in order."""
+        rng = random.Random(seed)
+        wheel = TimerWheel(now=rng.randrange(10**6))
+        start = wheel.now
+        expected = {}
+        for key in range(1000):
+            scale = rng.choice([10, 1000, 100_000, 10**7])
+            expected[key] = start + int(rng.expovariate(1 / scale))
+            wheel.schedule(key, expected[key])
+        for key in rng.sample(range(1000), 200):
+            wheel.cancel(key)
+            del expected[key]
+
+        fired, now = [], start
+        while now < start + 3 * 10**7:
+            previous, now = now, now + rng.choice([1, 7, 300, 50_000, 10**6])
+            batch = wheel.advance(now)
+            assert all(previous < tick <= now or tick <= start for _, tick in batch)
+            assert [tick for _, tick in batch] == sorted(tick for _, tick in batch)
+            fired += batch
+
+        assert dict(fired) == {k: t for k, t in expected.items() if t <= now}
+        assert len(fired) == len(dict(fired))
+        assert len(wheel) == len(expected) - len(fired)
@@ -0,0 +1,53 @@
+"""Tests for timezone-aware UTC timestamps."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from pydantic import BaseModel
+
+from models import Case, CaseAssignment, UtcDatetime, as_utc
+
+
+class _Stamped(BaseModel):
+    at: UtcDatetime
+
+
+class TestUtcTimestamps:
+    """UtcDatetime specification."""
+
+    def test_naive_input_is_taken_as_utc(self):
+        """A naive datetime gains a UTC tzinfo without shifting."""
+        stamped = _Stamped(at=datetime(2026, 1, 15, 10, 30))
+
+        assert stamped.at == datetime(2026, 1, 15, 10, 30, tzinfo=timezone.utc)
+        assert stamped.at.tzinfo is timezone.utc
+
+    def test_other_offsets_are_converted(self):
+        """An aware datetime in another zone is converted to UTC."""
+        plus_two = timezone(timedelta(hours=2))
+        stamped = _Stamped(at=datetime(2026, 1, 15, 12, 30, tzinfo=plus_two))
+
+        assert stamped.at.tzinfo is timezone.utc
+        assert stamped.at.hour == 10
+
+    @pytest.mark.parametrize("value, expected", [
+        (datetime(2026, 1, 15, 10, 30), '{"at":"2026-01-15T10:30:00Z"}'),
+        ("2026-01-15T10:30:00.5+00:00", '{"at":"2026-01-15T10:30:00.500000Z"}'),
+    ])
+    def test_json_is_iso8601_utc(self, value, expected):
+        """Serialized timestamps are ISO-8601 with a Z suffix."""
+        assert _Stamped(at=value).model_dump_json() == expected
+
+    def test_as_utc_returns_utc_values_unchanged(self):
+        """Values already in UTC are passed through as-is."""
+        value = datetime(2026, 1, 15, tzinfo=timezone.utc)
+
+        assert as_utc(value) is value
+
+    def test_model_defaults_are_aware(self):
+        """Default created_at and assigned_at are aware UTC datetimes."""
+        case = Case(id="c1", referrer_id="r1")
+        assignment = CaseAssignment(case_id="c1", expert_id="e1")
+
+        assert case.created_at.tzinfo is timezone.utc
+        assert assignment.assigned_at.tzinfo is timezone.utc
@@ -0,0 +1,203 @@
+"""Tests for spans, trace context propagation and exporters."""
+
+import asyncio
+import json
+
+import pytest
+
+from utils.json_codec import StdlibJSONEncoder
+from utils.trace_exporters import OtlpJsonFileExporter, RingBufferExporter
+from utils.tracing import (
+    NOOP_SPAN,
+    Traced,
+    Tracer,
+    current_span,
+    parse_traceparent,
+    start_span,
+    traced,
+)
+
+TRACEPARENT = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+
+
+@pytest.fixture
+def buffer():
+    """Ring buffer exporter capturing finished spans."""
+    return RingBufferExporter(capacity=100)
+
+
+@pytest.fixture
+def tracer(buffer):
+    """Tracer exporting to the ring buffer."""
+    return Tracer([buffer])
+
+
+class TestTraceparent:
+    """W3C traceparent parsing and formatting."""
+
+    def test_parse_valid(self):
+        """Version 00 headers yield ids and the sampled flag."""
+        assert parse_traceparent(TRACEPARENT) == (
+            0x0AF7651916CD43DD8448EB211C80319C, 0xB7AD6B7169203331, True
+        )
+
+    @pytest.mark.parametrize("header", [
+        None,
+        "",
+        "garbage",
+        "ff-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01",
+        "00-00000000000000000000000000000000-b7ad6b7169203331-01",
+        "00-0af7651916cd43dd8448eb211c80319c-0000000000000000-01",
+        TRACEPARENT + "-extra",
+    ])
+    def test_parse_invalid(self, header):
+        """Malformed, forbidden-version and all-zero ids are ignored."""
+        assert parse_traceparent(header) is None
+
+    def test_continues_incoming_trace(self, tracer):
+        """A root span adopts the caller's trace id and parent span."""
+        with tracer.start_trace("GET /x", TRACEPARENT) as span:
+            pass
+
+        assert span.traceparent.startswith("00-0af7651916cd43dd8448eb211c80319c-")
+        assert span.parent_id == 0xB7AD6B7169203331
+        assert parse_traceparent(span.traceparent)[1] == span.span_id
+
+
+class TestSpans:
+    """Span nesting, errors and the no-op path."""
+
+    def test_children_nest_under_the_active_span(self, tracer, buffer):
+        """start_span parents to the current span and restores it on exit."""
+        with tracer.start_trace("root") as root:
+            with start_span("child", key="v") as child:
+                assert current_span() is child
+            assert current_span() is root
+
+        assert current_span() is None
+        assert [s.name for s in buffer.spans()] == ["child", "root"]
+        assert child.parent_id == root.span_id and child.trace_id == root.trace_id
+        assert child.attributes == {"key": "v"}
+        assert child.duration_ns >= 0
+
+    def test_no_trace_means_no_span(self):
+        """Outside a trace start_span returns the shared no-op span."""
+        assert start_span("x") is NOOP_SPAN
+
+    def test_error_is_recorded(self, tracer):
+        """An exception marks the span as failed and propagates."""
+        with pytest.raises(ValueError):
+            with tracer.start_trace("root") as span:
+                raise ValueError("boom")
+
+        assert span.to_otlp()["status"] == {"code": 2, "message": "ValueError: boom"}
+
+    def test_unsampled_trace_is_not_exported(self, tracer, buffer):
+        """A caller that opted out of sampling produces no exported spans."""
+        with tracer.start_trace("root", TRACEPARENT[:-2] + "00"):
+            with start_span("child"):
+                pass
+
+        assert buffer.spans() == []
+
+    @pytest.mark.asyncio
+    async def test_context_follows_tasks(self, tracer, buffer):
+        """Tasks created inside a span inherit it as their parent."""
+        async def work():
+            with start_span("task"):
+                await asyncio.sleep(0)
+
+        with tracer.start_trace("root") as root:
+            await asyncio.gather(work(), work())
+
+        assert [s.parent_id for s in buffer.spans(root.trace_id)][:2] == [root.span_id] * 2
+
+
+class TestTracedWrappers:
+    """Traced proxy and traced decorator."""
+
+    class Repo:
+        def __init__(self):
+            self.items = [1, 2]
+
+        def __len__(self):
+            return len(self.items)
+
+        async def get(self, key):
+            return key
+
+        def seed(self, items):
+            self.items = items
+
+    @pytest.mark.asyncio
+    async def test_proxy_wraps_coroutine_methods(self, tracer, buffer):
+        """Async methods get spans; sync methods, attributes and len pass through."""
+        repo = Traced(self.Repo(), "Repo")
+        repo.seed([1, 2, 3])
+
+        with tracer.start_trace("root"):
+            assert await repo.get("k") == "k"
+
+        assert len(repo) == 3
+        assert repo.items == [1, 2, 3]
+        assert [s.name for s in buffer.spans()] == ["Repo.get", "root"]
+
+    @pytest.mark.asyncio
+    async def test_decorator(self, tracer, buffer):
+        """@traced functions are spans inside a trace and plain calls outside."""
+        @traced("op")
+        async def op():
+            return 1
+
+        assert await op() == 1
+        with tracer.start_trace("root"):
+            await op()
+
+        assert [s.name for s in buffer.spans()] == ["op", "root"]
+
+
+class TestExporters:
+    """Ring buffer and OTLP/JSON file exporters."""
+
+    def test_ring_buffer_keeps_latest(self, tracer):
+        """Old spans are evicted beyond capacity; trace_id filters."""
+        small = RingBufferExporter(capacity=2)
+        tracer.exporters = [small]
+        for name in "abc":
+            with tracer.start_trace(name) as span:
+                pass
+
+        assert [s.name for s in small.spans()] == ["b", "c"]
+        assert [s.name for s in small.spans(span.trace_id)] == ["c"]
+
+    def test_otlp_file_batches(self, tmp_path):
+        """Spans are written as OTLP TracesData lines, in batches and on close."""
+        path = tmp_path / "traces.jsonl"
+        exporter = OtlpJsonFileExporter(str(path), StdlibJSONEncoder(), "svc", batch_size=2)
+        tracer = Tracer([exporter])
+        with tracer.start_trace("root", TRACEPARENT, **{"http.status_code": 200}):
+            with start_span("a"):
+                pass
+            with start_span("b", ok=True, ratio=0.5):
+                pass
+        exporter.close()
+
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert len(lines) == 2
+        resource = lines[0]["resourceSpans"][0]
+        assert resource["resource"]["attributes"] == [
+            {"key": "service.name", "value": {"stringValue": "svc"}}
+        ]
+        spans = [s for line in lines
+                 for s in line["resourceSpans"][0]["scopeSpans"][0]["spans"]]
+        assert [s["name"] for s in spans] == ["a", "b", "root"]
+        assert spans[2]["traceId"] == "0af7651916cd43dd8448eb211c80319c"
+        assert spans[2]["parentSpanId"] == "b7ad6b7169203331"
+        assert spans[2]["kind"] == 2
+        assert spans[2]["attributes"] == [
+            {"key": "http.status_code", "value": {"intValue": "200"}}
+        ]
+        assert spans[1]["attributes"] == [
+            {"key": "ok", "value": {"boolValue": True}},
+            {"key": "ratio", "value": {"doubleValue": 0.5}},
+        ]
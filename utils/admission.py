@@ -0,0 +1,210 @@
+"""Admission control primitives: per-client token buckets and a CoDel queue.
+
+Both are framework-agnostic; api.admission adapts them to ASGI middleware.
+"""
+
+import asyncio
+import math
+import time
+from collections import OrderedDict, deque
+from typing import Callable
+
+
+class TokenBucketLimiter:
+    """Per-key token buckets refilled lazily on access.
+
+    Buckets are kept in LRU order and the least recently seen client is
+    evicted once ``max_keys`` is reached, bounding memory under key churn.
+    An evicted client simply starts again with a full bucket.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float,
+        max_keys: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.max_keys = max_keys
+        self._clock = clock
+        self._buckets: OrderedDict[str, list[float]] = OrderedDict()
+
+    def acquire(self, key: str, cost: float = 1.0) -> float:
+        """Try to take ``cost`` tokens from the key's bucket.
+
+        Args:
+            key: Client identity (API key or address).
+            cost: Tokens the request consumes.
+
+        Returns:
+            0.0 if admitted, otherwise the seconds until enough tokens refill.
+        """
+        now = self._clock()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = [self.burst, now]
+            self._buckets[key] = bucket
+            if len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+            tokens, last = bucket
+            bucket[0] = min(self.burst, tokens + (now - last) * self.rate)
+            bucket[1] = now
+
+        if bucket[0] >= cost:
+            bucket[0] -= cost
+            return 0.0
+        return (cost - bucket[0]) / self.rate
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+class CoDelLimiter:
+    """Concurrency limiter whose queue timeout adapts to queueing delay.
+
+    Up to ``max_concurrency`` holders run at once; the rest wait in a FIFO
+    queue. Following CoDel, if the *minimum* queueing delay observed over
+    an ``interval`` exceeds ``target``, the queue is standing rather than
+    absorbing a burst: waiters then get only ``target`` seconds before being
+    shed instead of the full ``interval``. This keeps the latency of
+    admitted requests bounded while a short burst is still queued normally.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        target: float = 0.005,
+        interval: float = 0.1,
+        max_queue: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_concurrency = max_concurrency
+        self.target = target
+        self.interval = interval
+        self.max_queue = max_queue
+        self._clock = clock
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self._overloaded = False
+        self._interval_end = clock() + interval
+        self._min_delay = math.inf
+
+    @property
+    def in_flight(self) -> int:
+        """Number of current slot holders."""
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of waiters still queued."""
+        return len(self._waiters)
+
+    @property
+    def overloaded(self) -> bool:
+        """Whether the queue is currently judged to be standing."""
+        return self._overloaded
+
+    async def acquire(self) -> float | None:
+        """Wait for a slot.
+
+        Returns:
+            The queueing delay in seconds if admitted, or None if shed.
+        """
+        if self._in_flight < self.max_concurrency and not self._waiters:
+            self._in_flight += 1
+            self._record(0.0)
+            return 0.0
+        if len(self._waiters) >= self.max_queue:
+            return None
+
+        enqueued = self._clock()
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        timeout = self.target if self._overloaded else self.interval
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            # release() may hand over the slot as the timeout fires; a
+            # waiter that got one keeps it rather than leaking it.
+            if not waiter.done() or waiter.cancelled():
+                self._record(self._clock() - enqueued)
+                return None
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+        finally:
+            if not waiter.done() or waiter.cancelled():
+                self._discard(waiter)
+        delay = self._clock() - enqueued
+        self._record(delay)
+        return delay
+
+    def release(self) -> None:
+        """Free a slot, handing it straight to the oldest live waiter."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._in_flight -= 1
+
+    def _discard(self, waiter: asyncio.Future) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def _record(self, delay: float) -> None:
+        now = self._clock()
+        self._min_delay = min(self._min_delay, delay)
+        if now >= self._interval_end:
+            self._overloaded = self._min_delay > self.target
+            self._min_delay = math.inf
+            self._interval_end = now + self.interval
+
+
+class KeyedConcurrencyLimiter:
+    """Caps requests in flight per key, rejecting rather than queueing.
+
+    A key's counter exists only while it has requests in flight, so memory
+    is bounded by concurrency, not by the number of keys ever seen.
+    """
+
+    def __init__(self, max_per_key: int) -> None:
+        self.max_per_key = max_per_key
+        self._in_flight: dict[str, int] = {}
+
+    def try_acquire(self, key: str) -> bool:
+        """Take a slot for key if it has one free.
+
+        Args:
+            key: Identity the cap applies to, e.g. a tenant id.
+
+        Returns:
+            True if admitted; the caller must then call release(key).
+        """
+        current = self._in_flight.get(key, 0)
+        if current >= self.max_per_key:
+            return False
+        self._in_flight[key] = current + 1
+        return True
+
+    def release(self, key: str) -> None:
+        """Free a slot taken by try_acquire()."""
+        current = self._in_flight[key] - 1
+        if current:
+            self._in_flight[key] = current
+        else:
+            del self._in_flight[key]
+
+    def in_flight(self, key: str) -> int:
+        """Number of requests key currently has in flight."""
+        return self._in_flight.get(key, 0)
+
+    def __len__(self) -> int:
+        return len(self._in_flight)
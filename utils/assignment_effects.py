@@ -0,0 +1,136 @@
+"""Post-assignment side effects, run as background jobs.
+
+Satisfies the AssignmentListener protocol defined in services.case_service:
+``on_assigned`` only enqueues, so request latency does not include the
+notification, audit write or stats update.
+"""
+
+import logging
+from collections import Counter
+from typing import Protocol
+
+from models import Case, CaseAssignment
+from utils.job_queue import JobQueue
+from utils.structured_log import StructuredLog
+
+logger = logging.getLogger(__name__)
+
+
+class ExpertNotifier(Protocol):
+    """Delivers assignment notifications to experts."""
+
+    async def notify_assigned(self, assignment: CaseAssignment) -> None: ...
+
+
+class AuditSink(Protocol):
+    """Persists audit records of state changes."""
+
+    async def record_assignment(self, case: Case, assignment: CaseAssignment) -> None: ...
+
+
+class LogExpertNotifier:
+    """Notifier that logs each delivery and keeps nothing."""
+
+    async def notify_assigned(self, assignment: CaseAssignment) -> None:
+        """Log the notification."""
+        logger.info("Expert %s assigned case %s", assignment.expert_id, assignment.case_id)
+
+
+class LocalExpertNotifier:
+    """Test notifier that records every delivery in memory.
+
+    ``fail_times`` makes the next N deliveries raise, for exercising retries.
+    ``sent`` is never trimmed, so this is for tests only.
+    """
+
+    def __init__(self, fail_times: int = 0) -> None:
+        self.sent: list[CaseAssignment] = []
+        self.fail_times = fail_times
+
+    async def notify_assigned(self, assignment: CaseAssignment) -> None:
+        """Record the notification, or fail while failures remain."""
+        if self.fail_times > 0:
+            self.fail_times -= 1
+            raise ConnectionError("notification endpoint unavailable")
+        self.sent.append(assignment)
+
+
+def _audit_record(case: Case, assignment: CaseAssignment) -> dict:
+    return {
+        "event": "case.assigned",
+        "case_id": case.id,
+        "referrer_id": case.referrer_id,
+        "expert_id": assignment.expert_id,
+        "status": case.status.value,
+        "due_at": None if case.due_at is None else case.due_at.isoformat(),
+        "at": assignment.assigned_at.isoformat(),
+    }
+
+
+class NullAuditSink:
+    """Audit sink that drops every record, for when no audit log is configured."""
+
+    async def record_assignment(self, case: Case, assignment: CaseAssignment) -> None:
+        """Discard the record."""
+
+
+class InMemoryAuditSink:
+    """Test audit sink keeping every record in a list, never trimmed."""
+
+    def __init__(self) -> None:
+        self.records: list[dict] = []
+
+    async def record_assignment(self, case: Case, assignment: CaseAssignment) -> None:
+        """Append an audit record for the assignment."""
+        self.records.append(_audit_record(case, assignment))
+
+
+class LogAuditSink:
+    """Audit sink writing one JSON line per record to a StructuredLog."""
+
+    def __init__(self, log: StructuredLog) -> None:
+        self.log = log
+
+    async def record_assignment(self, case: Case, assignment: CaseAssignment) -> None:
+        """Queue an audit line for the assignment."""
+        record = _audit_record(case, assignment)
+        self.log.emit(record.pop("event"), **record)
+
+
+class AssignmentStats:
+    """Running assignment counts per expert."""
+
+    def __init__(self) -> None:
+        self.per_expert: Counter[str] = Counter()
+
+    async def record(self, assignment: CaseAssignment) -> None:
+        """Count one assignment for its expert."""
+        self.per_expert[assignment.expert_id] += 1
+
+
+class AssignmentSideEffects:
+    """Enqueues notify, audit and stats jobs for every assignment."""
+
+    def __init__(
+        self,
+        jobs: JobQueue,
+        notifier: ExpertNotifier,
+        audit: AuditSink,
+        stats: AssignmentStats,
+    ) -> None:
+        self.jobs = jobs
+        self.notifier = notifier
+        self.audit = audit
+        self.stats = stats
+
+    def on_assigned(self, case: Case, assignment: CaseAssignment) -> None:
+        """Schedule the side effects of a successful assignment.
+
+        Args:
+            case: The case as saved after assignment.
+            assignment: The assignment result.
+        """
+        snapshot = case.model_copy()
+        self.jobs.submit("notify_expert", lambda: self.notifier.notify_assigned(assignment))
+        self.jobs.submit("audit_assignment", lambda: self.audit.record_assignment(snapshot, assignment))
+        self.jobs.submit("assignment_stats", lambda: self.stats.record(assignment))
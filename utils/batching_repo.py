@@ -0,0 +1,137 @@
+"""CaseRepository decorator that coalesces concurrent reads into batches."""
+
+import asyncio
+from contextlib import AbstractAsyncContextManager
+from typing import Any, Optional, Sequence
+
+from models import Case, CaseStatistics
+from utils.metrics import MetricsRegistry
+
+
+class BatchingCaseRepository:
+    """Answers the get_by_id calls of one event-loop tick with one get_many.
+
+    Satisfies the CaseRepository protocol of services.case_service by
+    delegation. The first read of a tick schedules a flush with
+    ``call_soon``, which runs after every callback already ready, so reads
+    issued by the other requests woken in the same tick join the batch.
+    Reads of an id already in the batch share its future, so a hot id is
+    fetched once however many requests want it. A batch reaching
+    ``max_batch`` ids is flushed at once. Every waiter receives the same
+    Case instance, as with an in-memory backend. Only get_by_id is
+    batched; other calls pass straight through.
+    """
+
+    def __init__(
+        self,
+        inner: Any,
+        max_batch: int = 256,
+        metrics: MetricsRegistry | None = None,
+        labels: dict[str, str] | None = None,
+    ) -> None:
+        self.inner = inner
+        self.max_batch = max_batch
+        self._pending: dict[str, asyncio.Future] = {}
+        self._flush_handle: asyncio.Handle | None = None
+        self._loads: set[asyncio.Task] = set()
+        self._labels = labels or {}
+        self._reads = self._batches = None
+        if metrics is not None:
+            self._reads = metrics.counter(
+                "repo_batch_reads_total", "get_by_id calls by whether they joined a pending read"
+            )
+            self._batches = metrics.counter(
+                "repo_batch_loads_total", "Batched get_many calls sent to the backend"
+            )
+
+    def lock(self, case_id: str) -> AbstractAsyncContextManager:
+        """Delegate to the backend's lock."""
+        return self.inner.lock(case_id)
+
+    async def get_by_id(self, case_id: str) -> Optional[Case]:
+        """Read case_id in this tick's batch, joining a pending read of it if any."""
+        future = self._pending.get(case_id)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._pending[case_id] = loop.create_future()
+            if len(self._pending) >= self.max_batch:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = loop.call_soon(self._flush)
+            self._count(self._reads, result="queued")
+        else:
+            self._count(self._reads, result="coalesced")
+        # Shielded: a cancelled caller must not cancel the other waiters.
+        return await asyncio.shield(future)
+
+    async def get_many(self, case_ids: Sequence[str]) -> dict[str, Case]:
+        """Delegate to the backend."""
+        return await self.inner.get_many(case_ids)
+
+    async def save(self, case: Case) -> None:
+        """Delegate to the backend."""
+        await self.inner.save(case)
+
+    def seed(self, cases: list[Case]) -> None:
+        """Delegate to the backend."""
+        self.inner.seed(cases)
+
+    async def search(
+        self,
+        referrer_id: str | None = None,
+        expert_id: str | None = None,
+        limit: int = 50,
+    ) -> list[Case]:
+        """Delegate to the backend."""
+        return await self.inner.search(
+            referrer_id=referrer_id, expert_id=expert_id, limit=limit
+        )
+
+    async def stats(self) -> CaseStatistics:
+        """Delegate to the backend."""
+        return await self.inner.stats()
+
+    async def rebuild_stats(self) -> CaseStatistics:
+        """Delegate to the backend."""
+        return await self.inner.rebuild_stats()
+
+    async def page_by_id(self, after: str | None, limit: int) -> list[Case]:
+        """Delegate to the backend."""
+        return await self.inner.page_by_id(after, limit)
+
+    async def with_deadlines(self) -> list[Case]:
+        """Delegate to the backend."""
+        return await self.inner.with_deadlines()
+
+    def _flush(self) -> None:
+        """Start loading the pending ids; later reads open a new batch."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, {}
+        task = asyncio.get_running_loop().create_task(self._load(batch))
+        self._loads.add(task)
+        task.add_done_callback(self._loads.discard)
+
+    async def _load(self, batch: dict[str, asyncio.Future]) -> None:
+        self._count(self._batches)
+        try:
+            found = await self.inner.get_many(list(batch))
+        except asyncio.CancelledError:
+            for future in batch.values():
+                future.cancel()
+            raise
+        except Exception as exc:
+            # Raised to every waiter; shield() marks it retrieved for the
+            # waiters that were cancelled.
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for case_id, future in batch.items():
+            if not future.done():
+                future.set_result(found.get(case_id))
+
+    def _count(self, counter: Any, **labels: str) -> None:
+        if counter is not None:
+            counter.inc(**labels, **self._labels)
@@ -0,0 +1,112 @@
+"""Incrementally maintained case statistics.
+
+Every write applies the delta between a case's previous and current
+contribution (status, expert, creation day), so reading the aggregates never
+scans the store. The counters remember each case's last contribution, which
+keeps deltas correct even though the service mutates cases in place.
+"""
+
+from collections import Counter
+from datetime import date
+from typing import Iterable
+
+from models import Case, CaseStatistics, CaseStatus
+
+_Contribution = tuple[CaseStatus, str | None, date]
+
+
+class CaseStatsCounter:
+    """Running counts of cases per status, expert and creation day."""
+
+    def __init__(self) -> None:
+        self._by_status: Counter[CaseStatus] = Counter()
+        self._by_expert: Counter[str] = Counter()
+        self._by_day: Counter[date] = Counter()
+        self._contribution: dict[str, _Contribution] = {}
+        self._snapshot: CaseStatistics | None = None
+
+    def apply(self, case: Case) -> None:
+        """Account for a saved case, replacing its previous contribution.
+
+        Args:
+            case: The case as just written.
+        """
+        new = (case.status, case.expert_id, case.created_at.date())
+        old = self._contribution.get(case.id)
+        if old == new:
+            return
+        if old is not None:
+            self._adjust(old, -1)
+        self._adjust(new, 1)
+        self._contribution[case.id] = new
+        self._snapshot = None
+
+    def rebuild(self, cases: Iterable[Case]) -> None:
+        """Discard all counts and recompute them from the given cases.
+
+        Args:
+            cases: Every stored case.
+        """
+        self._by_status.clear()
+        self._by_expert.clear()
+        self._by_day.clear()
+        self._contribution.clear()
+        self._snapshot = None
+        for case in cases:
+            self.apply(case)
+
+    def snapshot(self) -> CaseStatistics:
+        """Return the current aggregates.
+
+        The snapshot is cached until the next change, so repeated reads cost
+        nothing beyond returning it. Every status is listed, zeros included.
+        """
+        if self._snapshot is None:
+            self._snapshot = CaseStatistics(
+                total=len(self._contribution),
+                by_status={status: self._by_status[status] for status in CaseStatus},
+                by_expert=dict(sorted(self._by_expert.items())),
+                by_day=dict(sorted(self._by_day.items())),
+            )
+        return self._snapshot
+
+    def _adjust(self, contribution: _Contribution, delta: int) -> None:
+        status, expert_id, day = contribution
+        self._bump(self._by_status, status, delta)
+        if expert_id is not None:
+            self._bump(self._by_expert, expert_id, delta)
+        self._bump(self._by_day, day, delta)
+
+    @staticmethod
+    def _bump(counter: Counter, key, delta: int) -> None:
+        count = counter[key] + delta
+        if count:
+            counter[key] = count
+        else:
+            del counter[key]
+
+
+def merge_statistics(parts: Iterable[CaseStatistics]) -> CaseStatistics:
+    """Sum statistics computed over disjoint sets of cases.
+
+    Args:
+        parts: Per-partition statistics, e.g. one per repository shard.
+
+    Returns:
+        The combined statistics, with keys sorted as in a single snapshot.
+    """
+    by_status: Counter[CaseStatus] = Counter()
+    by_expert: Counter[str] = Counter()
+    by_day: Counter[date] = Counter()
+    total = 0
+    for part in parts:
+        total += part.total
+        by_status.update(part.by_status)
+        by_expert.update(part.by_expert)
+        by_day.update(part.by_day)
+    return CaseStatistics(
+        total=total,
+        by_status={status: by_status[status] for status in CaseStatus},
+        by_expert=dict(sorted(by_expert.items())),
+        by_day=dict(sorted(by_day.items())),
+    )
@@ -0,0 +1,220 @@
+"""In-process pub/sub change feed of case updates.
+
+Each published change gets a monotonically increasing sequence number and
+is encoded to JSON once, then shared by every subscriber and by the replay
+history. Subscribers are indexed by their most selective filter so a
+publish touches only subscribers that can match, not every open stream.
+"""
+
+import asyncio
+import secrets
+from collections import deque
+from itertools import islice
+from typing import Iterable
+
+from models import Case, CaseStatus
+
+#: Response header carrying the epoch of the feed a stream or copy came from.
+EPOCH_HEADER = "x-feed-epoch"
+#: Request header carrying the shared secret that lets a replica copy the store.
+REPLICATION_TOKEN_HEADER = "x-replication-token"
+
+
+class ChangeEvent:
+    """One published case change."""
+
+    __slots__ = ("seq", "case_id", "status", "referrer_id", "data")
+
+    def __init__(self, seq: int, case: Case) -> None:
+        self.seq = seq
+        self.case_id = case.id
+        self.status = case.status
+        self.referrer_id = case.referrer_id
+        self.data = case.model_dump_json().encode()
+
+
+class Subscriber:
+    """A filtered, bounded event buffer for one consumer.
+
+    Idle subscribers hold no future and an empty list, keeping the cost of
+    thousands of idle streams to a few hundred bytes each.
+    """
+
+    __slots__ = ("status", "referrer_id", "max_buffer", "closed", "dropped",
+                 "missed", "_buffer", "_waiter")
+
+    def __init__(
+        self, status: CaseStatus | None, referrer_id: str | None, max_buffer: int
+    ) -> None:
+        self.status = status
+        self.referrer_id = referrer_id
+        self.max_buffer = max_buffer
+        self.closed = False
+        self.dropped = False
+        self.missed = False
+        self._buffer: list[ChangeEvent] = []
+        self._waiter: asyncio.Future | None = None
+
+    def matches(self, event: ChangeEvent) -> bool:
+        """Whether the event passes this subscriber's filters."""
+        return (self.status is None or event.status == self.status) and (
+            self.referrer_id is None or event.referrer_id == self.referrer_id
+        )
+
+    def offer(self, event: ChangeEvent) -> None:
+        """Buffer an event; close the subscriber if it has fallen too far behind."""
+        if self.closed:
+            return
+        if len(self._buffer) >= self.max_buffer:
+            self.dropped = True
+            self.close()
+            return
+        self._buffer.append(event)
+        self._wake()
+
+    def preload(self, events: list[ChangeEvent]) -> None:
+        """Seed the buffer with replayed events (at most max_buffer)."""
+        self._buffer.extend(events[-self.max_buffer:])
+        self._wake()
+
+    def close(self) -> None:
+        """Stop delivery and wake a waiting consumer."""
+        self.closed = True
+        self._wake()
+
+    async def next_batch(self, timeout: float) -> list[ChangeEvent]:
+        """Wait up to timeout for events and take everything buffered.
+
+        Args:
+            timeout: Seconds to wait when the buffer is empty.
+
+        Returns:
+            Buffered events, oldest first; empty on timeout or close.
+        """
+        if not self._buffer and not self.closed:
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await asyncio.wait_for(self._waiter, timeout)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                self._waiter = None
+        batch, self._buffer = self._buffer, []
+        return batch
+
+    def _wake(self) -> None:
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+
+class ChangeFeed:
+    """Sequence-numbered broadcast of case changes with bounded replay.
+
+    Sequence numbers restart with every feed. Its random ``epoch`` tells a
+    follower that a position it holds came from an earlier feed, such as
+    one of a primary process that has since restarted.
+    """
+
+    def __init__(self, history: int = 10_000, max_buffer: int = 256) -> None:
+        self.epoch = secrets.token_hex(8)
+        self._seq = 0
+        self._history: deque[ChangeEvent] = deque(maxlen=history)
+        self._max_buffer = max_buffer
+        self._by_referrer: dict[str, set[Subscriber]] = {}
+        self._by_status: dict[CaseStatus, set[Subscriber]] = {}
+        self._unfiltered: set[Subscriber] = set()
+        self._count = 0
+
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the most recent event (0 if none)."""
+        return self._seq
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of open subscriptions."""
+        return self._count
+
+    def publish(self, case: Case) -> ChangeEvent:
+        """Record a change and deliver it to matching subscribers.
+
+        Args:
+            case: The case as just saved. It is snapshotted immediately.
+
+        Returns:
+            The published event.
+        """
+        self._seq += 1
+        event = ChangeEvent(self._seq, case)
+        self._history.append(event)
+        for sub in self._candidates(event):
+            if sub.matches(event):
+                sub.offer(event)
+                if sub.dropped:
+                    self.unsubscribe(sub)
+        return event
+
+    def subscribe(
+        self,
+        status: CaseStatus | None = None,
+        referrer_id: str | None = None,
+        after_seq: int | None = None,
+    ) -> Subscriber:
+        """Open a subscription, optionally replaying events after after_seq.
+
+        If events after after_seq are no longer retained, or more of them
+        match than fit in the buffer, only the newest are replayed and the
+        subscriber's ``missed`` flag is set so the consumer re-reads state.
+
+        Args:
+            status: Only deliver cases in this status.
+            referrer_id: Only deliver cases from this referrer.
+            after_seq: Resume point — the last sequence number already seen.
+
+        Returns:
+            The new subscriber.
+        """
+        sub = Subscriber(status, referrer_id, self._max_buffer)
+        if after_seq is not None and after_seq < self._seq:
+            oldest = self._history[0].seq if self._history else self._seq + 1
+            sub.missed = after_seq < oldest - 1
+            start = max(0, after_seq - oldest + 1)
+            backlog = [e for e in islice(self._history, start, None) if sub.matches(e)]
+            if len(backlog) > self._max_buffer:
+                backlog = backlog[-self._max_buffer:]
+                sub.missed = True
+            sub.preload(backlog)
+        self._index(sub).add(sub)
+        self._count += 1
+        return sub
+
+    def unsubscribe(self, sub: Subscriber) -> None:
+        """Close and forget a subscriber (safe to call twice)."""
+        bucket = self._index(sub)
+        if sub in bucket:
+            bucket.discard(sub)
+            self._count -= 1
+            self._prune(sub)
+        sub.close()
+
+    def _candidates(self, event: ChangeEvent) -> Iterable[Subscriber]:
+        groups = [
+            self._by_referrer.get(event.referrer_id),
+            self._by_status.get(event.status),
+            self._unfiltered,
+        ]
+        return [sub for group in groups if group for sub in group]
+
+    def _index(self, sub: Subscriber) -> set[Subscriber]:
+        if sub.referrer_id is not None:
+            return self._by_referrer.setdefault(sub.referrer_id, set())
+        if sub.status is not None:
+            return self._by_status.setdefault(sub.status, set())
+        return self._unfiltered
+
+    def _prune(self, sub: Subscriber) -> None:
+        if sub.referrer_id is not None:
+            if not self._by_referrer.get(sub.referrer_id):
+                self._by_referrer.pop(sub.referrer_id, None)
+        elif sub.status is not None and not self._by_status.get(sub.status):
+            self._by_status.pop(sub.status, None)
@@ -0,0 +1,169 @@
+"""Structural diff between OpenAPI contracts and a generated OpenAPI document.
+
+Both sides are normalized before comparing, so only differences that change
+what a client may send or receive are reported: references are inlined,
+annotations (titles, descriptions, defaults) dropped, pydantic's
+``anyOf: [X, null]`` read as OpenAPI 3.0 ``nullable``, integer exclusive
+bounds turned into inclusive ones, and lists that are sets (``required``,
+``enum``) sorted. Compared per contract operation: existence, query and
+header parameters, the JSON request body and JSON 2xx responses. Error
+responses are not compared because routes do not declare their bodies.
+"""
+
+from typing import Any, Callable
+
+from utils.contract_schema import COMPONENT_PREFIX
+from utils.contracts import HTTP_METHODS, JSON_CONTENT
+
+_IGNORED = {"title", "description", "default", "example", "examples", "propertyNames"}
+
+Resolver = Callable[[str], dict[str, Any]]
+
+
+def diff_openapi(
+    contracts: list[dict[str, Any]], generated: dict[str, Any], path_prefix: str = "/api/"
+) -> list[str]:
+    """List every difference between the contracts and a generated document.
+
+    Args:
+        contracts: Parsed contract documents, the source of truth.
+        generated: The application's document, e.g. ``app.openapi()``.
+        path_prefix: Generated operations under this prefix must appear in
+            a contract; others (ops endpoints) are ignored.
+
+    Returns:
+        One human-readable line per difference; empty when they agree.
+    """
+    app_resolve = _resolver(generated)
+    app_paths = generated.get("paths", {})
+    differences, declared = [], set()
+    for document in contracts:
+        resolve = _resolver(document)
+        for path, item in document.get("paths", {}).items():
+            for method in HTTP_METHODS:
+                if method not in item:
+                    continue
+                where = f"{method.upper()} {path}"
+                declared.add((method, path))
+                app_operation = app_paths.get(path, {}).get(method)
+                if app_operation is None:
+                    differences.append(f"{where}: in the contract but not served")
+                    continue
+                differences += _diff_operation(
+                    where, item[method], resolve, app_operation, app_resolve
+                )
+    for path, item in app_paths.items():
+        if not path.startswith(path_prefix):
+            continue
+        for method in HTTP_METHODS:
+            if method in item and (method, path) not in declared:
+                differences.append(f"{method.upper()} {path}: served but not in any contract")
+    return differences
+
+
+def _diff_operation(
+    where: str,
+    contract: dict[str, Any],
+    resolve: Resolver,
+    app: dict[str, Any],
+    app_resolve: Resolver,
+) -> list[str]:
+    differences = []
+    params = _parameters(contract, resolve)
+    app_params = _parameters(app, app_resolve)
+    for key in sorted(params.keys() | app_params.keys()):
+        label = f"{where} {key[0]} parameter '{key[1]}'"
+        differences += _diff_value(label, params.get(key), app_params.get(key))
+
+    differences += _diff_value(
+        f"{where} request body",
+        _json_schema(contract.get("requestBody", {}), resolve),
+        _json_schema(app.get("requestBody", {}), app_resolve),
+    )
+    responses = contract.get("responses", {})
+    app_responses = app.get("responses", {})
+    for status in sorted(s for s in responses.keys() | app_responses.keys() if s.startswith("2")):
+        differences += _diff_value(
+            f"{where} {status} response",
+            _json_schema(responses.get(status, {}), resolve),
+            _json_schema(app_responses.get(status, {}), app_resolve),
+        )
+    return differences
+
+
+def _diff_value(where: str, expected: Any, actual: Any) -> list[str]:
+    """Recursively compare normalized values, naming each differing path."""
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        differences = []
+        for key in sorted(expected.keys() | actual.keys()):
+            differences += _diff_value(f"{where}.{key}", expected.get(key), actual.get(key))
+        return differences
+    if expected != actual:
+        return [f"{where}: contract {expected!r}, app {actual!r}"]
+    return []
+
+
+def _parameters(operation: dict[str, Any], resolve: Resolver) -> dict[tuple[str, str], Any]:
+    """Query and header parameters keyed by (location, name).
+
+    Path parameters are implied by the path template. Nullability is
+    dropped because a missing parameter cannot be told from a null one.
+    """
+    params = {}
+    for param in operation.get("parameters", []):
+        if param.get("in") not in ("query", "header"):
+            continue
+        schema = normalize_schema(param.get("schema", {}), resolve)
+        schema.pop("nullable", None)
+        params[param["in"], param["name"]] = {
+            "required": bool(param.get("required", False)), "schema": schema,
+        }
+    return params
+
+
+def _json_schema(holder: dict[str, Any], resolve: Resolver) -> dict[str, Any] | None:
+    schema = holder.get("content", {}).get(JSON_CONTENT, {}).get("schema")
+    return None if schema is None else normalize_schema(schema, resolve)
+
+
+def _resolver(document: dict[str, Any]) -> Resolver:
+    components = document.get("components", {}).get("schemas", {})
+    return lambda ref: components[ref[len(COMPONENT_PREFIX):]]
+
+
+def normalize_schema(schema: dict[str, Any], resolve: Resolver) -> dict[str, Any]:
+    """Reduce a schema to the parts that affect validation.
+
+    Args:
+        schema: OpenAPI 3.0 or 3.1 schema object.
+        resolve: Looks up a ``#/components/schemas/`` reference.
+
+    Returns:
+        A comparable schema with references inlined.
+    """
+    if "$ref" in schema:
+        return normalize_schema(resolve(schema["$ref"]), resolve)
+    variants = schema.get("anyOf")
+    if variants is not None and {"type": "null"} in variants and len(variants) == 2:
+        (inner,) = [v for v in variants if v != {"type": "null"}]
+        rest = {k: v for k, v in schema.items() if k != "anyOf"}
+        return {**normalize_schema({**rest, **inner}, resolve), "nullable": True}
+
+    out: dict[str, Any] = {}
+    for key, value in schema.items():
+        if key in _IGNORED or (key == "nullable" and not value):
+            continue
+        if key == "properties":
+            out[key] = {name: normalize_schema(sub, resolve) for name, sub in value.items()}
+        elif key in ("items", "additionalProperties") and isinstance(value, dict):
+            out[key] = normalize_schema(value, resolve)
+        elif key in ("required", "enum"):
+            out[key] = sorted(value, key=repr)
+        else:
+            out[key] = value
+    if out.get("type") == "integer":
+        if "exclusiveMinimum" in out:
+            out["minimum"] = out.pop("exclusiveMinimum") + 1
+        if "exclusiveMaximum" in out:
+            out["maximum"] = out.pop("exclusiveMaximum") - 1
+    return out
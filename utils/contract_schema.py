@@ -0,0 +1,198 @@
+"""Compiles OpenAPI 3.0 schema objects into validation closures.
+
+A schema is walked once, at compile time, into one closure per node, so
+checking a document costs a few calls per value and never re-reads the
+schema. The supported subset is what contracts/ uses: type, nullable, enum,
+format (date-time, date), pattern, required, properties,
+additionalProperties, items, min/maxItems, min/maxLength, minimum/maximum
+and local ``#/components/schemas/`` references. Anything else that would
+change what a schema accepts is rejected when compiling, so a contract can
+never be silently half-checked.
+"""
+
+import re
+from datetime import date, datetime
+from typing import Any, Callable, Mapping
+
+from exceptions import ContractViolation, ValidationError
+
+# Checks a value found at a JSON path, raising ContractViolation if invalid.
+Validator = Callable[[Any, str], None]
+
+COMPONENT_PREFIX = "#/components/schemas/"
+
+_TYPES: dict[str, tuple[type, ...]] = {
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "array": (list,),
+    "object": (dict,),
+}
+_FORMATS: dict[str, Callable[[str], Any]] = {
+    "date-time": lambda v: datetime.fromisoformat(v.replace("Z", "+00:00")),
+    "date": date.fromisoformat,
+}
+_ANNOTATIONS = {"description", "default", "example", "title", "readOnly", "writeOnly"}
+_SUPPORTED = _ANNOTATIONS | {
+    "$ref", "type", "nullable", "enum", "format", "pattern", "required",
+    "properties", "additionalProperties", "items", "minItems", "maxItems",
+    "minLength", "maxLength", "minimum", "maximum",
+}
+
+
+class SchemaCompiler:
+    """Compiles schemas of one contract document, sharing its components."""
+
+    def __init__(self, components: Mapping[str, dict]) -> None:
+        self._components = components
+        self._compiled: dict[str, Validator] = {}
+
+    def compile(self, schema: dict) -> Validator:
+        """Compile a schema object.
+
+        Args:
+            schema: OpenAPI 3.0 schema object.
+
+        Returns:
+            A validator taking the value and its JSON path, e.g. ``"$"``.
+
+        Raises:
+            ValidationError: If the schema uses an unsupported keyword,
+                type or format, or references a missing component.
+        """
+        ref = schema.get("$ref")
+        if ref is not None:
+            return self._reference(ref)
+        unsupported = set(schema) - _SUPPORTED
+        if unsupported:
+            raise ValidationError(f"Unsupported schema keywords: {sorted(unsupported)}")
+        checks = [check for check in self._checks(schema) if check is not None]
+        nullable = schema.get("nullable", False)
+
+        if len(checks) == 1 and not nullable:
+            return checks[0]
+
+        def validate(value: Any, path: str) -> None:
+            if value is None and nullable:
+                return
+            for check in checks:
+                check(value, path)
+        return validate
+
+    def _reference(self, ref: str) -> Validator:
+        if not ref.startswith(COMPONENT_PREFIX):
+            raise ValidationError(f"Only local component references are supported: '{ref}'")
+        name = ref[len(COMPONENT_PREFIX):]
+        compiled = self._compiled.get(name)
+        if compiled is None:
+            if name not in self._components:
+                raise ValidationError(f"Unknown schema component '{name}'")
+            # Late-bound so self-referencing components compile.
+            self._compiled[name] = lambda value, path: self._compiled[name](value, path)
+            compiled = self._compiled[name] = self.compile(self._components[name])
+        return compiled
+
+    def _checks(self, schema: dict) -> list[Validator | None]:
+        kind = schema.get("type")
+        return [
+            _type_check(kind) if kind is not None else None,
+            _enum_check(schema["enum"]) if "enum" in schema else None,
+            _format_check(schema["format"]) if kind == "string" and "format" in schema else None,
+            _pattern_check(schema["pattern"]) if "pattern" in schema else None,
+            _range_check(schema, "minLength", "maxLength", len, "length"),
+            _range_check(schema, "minItems", "maxItems", len, "item count"),
+            _range_check(schema, "minimum", "maximum", lambda v: v, "value"),
+            self._items_check(schema["items"]) if "items" in schema else None,
+            self._object_check(schema) if kind == "object" else None,
+        ]
+
+    def _items_check(self, items: dict) -> Validator:
+        item = self.compile(items)
+
+        def check(value: list, path: str) -> None:
+            for i, element in enumerate(value):
+                item(element, f"{path}[{i}]")
+        return check
+
+    def _object_check(self, schema: dict) -> Validator | None:
+        required = tuple(schema.get("required", ()))
+        properties = {
+            name: self.compile(sub) for name, sub in schema.get("properties", {}).items()
+        }
+        extra = schema.get("additionalProperties", True)
+        extra_check = self.compile(extra) if isinstance(extra, dict) else None
+        if not required and not properties and extra is True:
+            return None
+
+        def check(value: dict, path: str) -> None:
+            for name in required:
+                if name not in value:
+                    raise ContractViolation(f"{path}: missing required property '{name}'")
+            for name, item in value.items():
+                sub = properties.get(name)
+                if sub is not None:
+                    sub(item, f"{path}.{name}")
+                elif extra_check is not None:
+                    extra_check(item, f"{path}.{name}")
+                elif extra is False:
+                    raise ContractViolation(f"{path}: unexpected property '{name}'")
+        return check
+
+
+def _type_check(kind: str) -> Validator:
+    expected = _TYPES.get(kind)
+    if expected is None:
+        raise ValidationError(f"Unsupported schema type '{kind}'")
+    # bool is an int subclass, but JSON booleans are not numbers.
+    reject_bool = kind in ("integer", "number")
+
+    def check(value: Any, path: str) -> None:
+        if not isinstance(value, expected) or (reject_bool and isinstance(value, bool)):
+            raise ContractViolation(f"{path}: expected {kind}, got {type(value).__name__}")
+    return check
+
+
+def _enum_check(values: list) -> Validator:
+    allowed = frozenset(values)
+
+    def check(value: Any, path: str) -> None:
+        if value not in allowed:
+            raise ContractViolation(f"{path}: {value!r} is not one of {sorted(allowed)}")
+    return check
+
+
+def _format_check(name: str) -> Validator | None:
+    parse = _FORMATS.get(name)
+    if parse is None:
+        return None
+
+    def check(value: str, path: str) -> None:
+        try:
+            parse(value)
+        except ValueError:
+            raise ContractViolation(f"{path}: {value!r} is not a valid {name}") from None
+    return check
+
+
+def _pattern_check(pattern: str) -> Validator:
+    search = re.compile(pattern).search
+
+    def check(value: str, path: str) -> None:
+        if search(value) is None:
+            raise ContractViolation(f"{path}: {value!r} does not match '{pattern}'")
+    return check
+
+
+def _range_check(
+    schema: dict, low_key: str, high_key: str, measure: Callable[[Any], Any], what: str
+) -> Validator | None:
+    low, high = schema.get(low_key), schema.get(high_key)
+    if low is None and high is None:
+        return None
+
+    def check(value: Any, path: str) -> None:
+        size = measure(value)
+        if (low is not None and size < low) or (high is not None and size > high):
+            raise ContractViolation(f"{path}: {what} {size} is outside [{low}, {high}]")
+    return check
@@ -0,0 +1,111 @@
+"""OpenAPI contracts loaded once and compiled into response validators."""
+
+from pathlib import Path
+from typing import Any, Iterator
+
+import yaml
+
+from exceptions import ContractViolation, ValidationError
+from utils.contract_schema import SchemaCompiler, Validator
+
+HTTP_METHODS = ("get", "put", "post", "delete", "patch")
+JSON_CONTENT = "application/json"
+
+# Declared response statuses of one operation; None means "no JSON body".
+StatusValidators = dict[str, Validator | None]
+
+
+class ContractSet:
+    """The operations of one or more OpenAPI documents, compiled for checking.
+
+    Operations are keyed by upper-case method and path template exactly as
+    written in the contract, e.g. ``("GET", "/api/v1/cases/{case_id}")``,
+    which is also how the router names a matched route.
+    """
+
+    def __init__(self, documents: list[dict[str, Any]]) -> None:
+        """Compile every operation's JSON response schemas.
+
+        Args:
+            documents: Parsed OpenAPI 3.0 documents.
+
+        Raises:
+            ValidationError: If a schema cannot be compiled.
+        """
+        self.documents = documents
+        self._responses: dict[tuple[str, str], StatusValidators] = {}
+        for document in documents:
+            compiler = SchemaCompiler(document.get("components", {}).get("schemas", {}))
+            for method, path, operation in _operations(document):
+                self._responses[method.upper(), path] = {
+                    status: _compile_content(compiler, response, f"{method.upper()} {path}")
+                    for status, response in operation.get("responses", {}).items()
+                }
+
+    @classmethod
+    def load(cls, directory: str) -> "ContractSet":
+        """Parse and compile every ``*.yaml`` contract in a directory.
+
+        Args:
+            directory: Directory holding the OpenAPI files.
+
+        Returns:
+            The compiled contracts.
+
+        Raises:
+            ValidationError: If the directory has no contracts or a schema
+                cannot be compiled.
+        """
+        paths = sorted(Path(directory).glob("*.yaml"))
+        if not paths:
+            raise ValidationError(f"No contracts found in '{directory}'")
+        return cls([yaml.safe_load(path.read_text()) for path in paths])
+
+    def covers(self, method: str, path: str) -> bool:
+        """Whether the contracts declare an operation."""
+        return (method, path) in self._responses
+
+    def validate_response(self, method: str, path: str, status: int, body: Any) -> None:
+        """Check a decoded JSON response against its operation's contract.
+
+        Args:
+            method: Upper-case HTTP method.
+            path: Route path template.
+            status: Response status code.
+            body: Decoded JSON body, or None if the response had none.
+
+        Raises:
+            ContractViolation: If the operation is undeclared, the status
+                is undeclared, or the body does not match the schema.
+        """
+        statuses = self._responses.get((method, path))
+        if statuses is None:
+            raise ContractViolation(f"{method} {path} is not in any contract")
+        key = str(status)
+        if key not in statuses:
+            key = "default"
+            if key not in statuses:
+                raise ContractViolation(f"{method} {path}: status {status} is not declared")
+        validator = statuses[key]
+        if validator is not None and body is not None:
+            validator(body, "$")
+
+
+def _operations(document: dict[str, Any]) -> Iterator[tuple[str, str, dict[str, Any]]]:
+    """Yield (method, path, operation) for every operation in a document."""
+    for path, item in document.get("paths", {}).items():
+        for method in HTTP_METHODS:
+            if method in item:
+                yield method, path, item[method]
+
+
+def _compile_content(
+    compiler: SchemaCompiler, response: dict[str, Any], where: str
+) -> Validator | None:
+    schema = response.get("content", {}).get(JSON_CONTENT, {}).get("schema")
+    if schema is None:
+        return None
+    try:
+        return compiler.compile(schema)
+    except ValidationError as exc:
+        raise ValidationError(f"{where}: {exc.message}") from exc
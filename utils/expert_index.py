@@ -0,0 +1,124 @@
+"""Bitset index of expert availability by specialty and on-call hour."""
+
+from typing import Iterator
+
+from models import HOURS_PER_WEEK, Expert
+
+# Experts per bitset block. Small blocks keep each bit operation to a few
+# machine words; a query stops at the first blocks that yield enough hits.
+BLOCK_BITS = 512
+
+
+def _set(blocks: dict[int, int], position: int) -> None:
+    block, offset = divmod(position, BLOCK_BITS)
+    blocks[block] = blocks.get(block, 0) | 1 << offset
+
+
+def _unset(blocks: dict[int, int], position: int) -> None:
+    block, offset = divmod(position, BLOCK_BITS)
+    remaining = blocks.get(block, 0) & ~(1 << offset)
+    if remaining:
+        blocks[block] = remaining
+    else:
+        blocks.pop(block, None)
+
+
+class ExpertAvailabilityIndex:
+    """Answers "which experts can take a case" without scanning experts.
+
+    Each expert is given a fixed bit position. The index keeps a bitset per
+    specialty and per hour of the week, whose set bits are the experts with
+    that specialty or on call in that hour, plus a bitset of experts that
+    are active and below capacity. Bitsets are split into blocks of
+    BLOCK_BITS so a query ANDs and walks only the blocks it needs.
+    """
+
+    def __init__(self) -> None:
+        self._positions: dict[str, int] = {}
+        self._ids: list[str] = []
+        self._entries: dict[str, tuple[frozenset[str], frozenset[int]]] = {}
+        self._specialties: dict[str, dict[int, int]] = {}
+        self._hours: list[dict[int, int]] = [{} for _ in range(HOURS_PER_WEEK)]
+        self._available: dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def update(self, expert: Expert) -> None:
+        """Index an expert, or re-index it after a change.
+
+        Args:
+            expert: The expert's current state.
+        """
+        position = self._positions.get(expert.id)
+        if position is None:
+            position = self._positions[expert.id] = len(self._ids)
+            self._ids.append(expert.id)
+        entry = (frozenset(expert.specialties), frozenset(expert.on_call_hours))
+        old = self._entries.get(expert.id)
+        if entry != old:
+            if old is not None:
+                for specialty in old[0]:
+                    blocks = self._specialties[specialty]
+                    _unset(blocks, position)
+                    if not blocks:
+                        del self._specialties[specialty]
+                for hour in old[1]:
+                    _unset(self._hours[hour], position)
+            for specialty in entry[0]:
+                _set(self._specialties.setdefault(specialty, {}), position)
+            for hour in entry[1]:
+                _set(self._hours[hour], position)
+            self._entries[expert.id] = entry
+        self._mark(expert, position)
+
+    def update_availability(self, expert: Expert) -> None:
+        """Re-index only whether an already indexed expert can take cases.
+
+        Cheaper than update() when just the open case count changed.
+
+        Args:
+            expert: The expert's current state.
+        """
+        self._mark(expert, self._positions[expert.id])
+
+    def is_available(self, expert_id: str) -> bool:
+        """Whether the expert is active and below capacity."""
+        position = self._positions.get(expert_id)
+        if position is None:
+            return False
+        block, offset = divmod(position, BLOCK_BITS)
+        return bool(self._available.get(block, 0) >> offset & 1)
+
+    def find(self, specialty: str, hour: int | None = None) -> Iterator[str]:
+        """Yield available experts with a specialty, in registration order.
+
+        Args:
+            specialty: Required specialty.
+            hour: Hour of the week the expert must be on call, or None for
+                any time.
+
+        Returns:
+            An iterator over matching expert ids.
+        """
+        blocks = self._specialties.get(specialty)
+        if not blocks:
+            return
+        available = self._available
+        on_call = self._hours[hour] if hour is not None else None
+        ids = self._ids
+        for block in sorted(blocks):
+            bits = blocks[block] & available.get(block, 0)
+            if on_call is not None:
+                bits &= on_call.get(block, 0)
+            base = block * BLOCK_BITS
+            while bits:
+                lowest = bits & -bits
+                yield ids[base + lowest.bit_length() - 1]
+                bits ^= lowest
+
+    def _mark(self, expert: Expert, position: int) -> None:
+        if expert.active and expert.open_cases < expert.max_open_cases:
+            _set(self._available, position)
+        else:
+            _unset(self._available, position)
@@ -0,0 +1,104 @@
+"""In-memory expert repository with an availability index."""
+
+from itertools import islice
+from typing import Optional
+
+from exceptions import InvalidStateError, ValidationError
+from models import Expert
+from utils.expert_index import ExpertAvailabilityIndex
+
+
+class InMemoryExpertRepository:
+    """Dict-backed ExpertRepository implementation.
+
+    Satisfies the ExpertRepository protocol defined in services.expert_service
+    and the ExpertReservations protocol used by CaseService. The availability
+    index is updated on every write, including each reservation, so lookups
+    and "find an available expert" queries never scan the store.
+
+    reserve() checks and increments an expert's open case count with no
+    await in between, so concurrent assignments on one event loop cannot
+    overshoot its capacity.
+    """
+
+    def __init__(self) -> None:
+        self._store: dict[str, Expert] = {}
+        self._index = ExpertAvailabilityIndex()
+
+    async def get_by_id(self, expert_id: str) -> Optional[Expert]:
+        """Retrieve an expert by ID.
+
+        Args:
+            expert_id: The unique identifier of the expert.
+
+        Returns:
+            The Expert if found, otherwise None.
+        """
+        return self._store.get(expert_id)
+
+    async def save(self, expert: Expert) -> None:
+        """Persist an expert and re-index its availability.
+
+        Args:
+            expert: The Expert model to save.
+        """
+        self._store[expert.id] = expert
+        self._index.update(expert)
+
+    def seed(self, experts: list[Expert]) -> None:
+        """Pre-populate the store with seed data.
+
+        Args:
+            experts: List of Expert models to add to the store.
+        """
+        for expert in experts:
+            self._store[expert.id] = expert
+            self._index.update(expert)
+
+    async def find_available(
+        self, specialty: str, hour: int | None = None, limit: int = 20
+    ) -> list[Expert]:
+        """Find active experts below capacity with a specialty.
+
+        Args:
+            specialty: Required specialty.
+            hour: Hour of the week the expert must be on call, or None.
+            limit: Maximum number of experts to return.
+
+        Returns:
+            Matching experts in registration order.
+        """
+        store = self._store
+        return [store[i] for i in islice(self._index.find(specialty, hour), limit)]
+
+    async def reserve(self, expert_id: str) -> None:
+        """Take one unit of an expert's case capacity.
+
+        Args:
+            expert_id: The expert being assigned a case.
+
+        Raises:
+            ValidationError: If no expert exists with the given ID.
+            InvalidStateError: If the expert is inactive or at capacity.
+        """
+        expert = self._store.get(expert_id)
+        if expert is None:
+            raise ValidationError(f"Expert '{expert_id}' does not exist")
+        if not self._index.is_available(expert_id):
+            reason = "is not active" if not expert.active else (
+                f"is at capacity ({expert.max_open_cases} open cases)"
+            )
+            raise InvalidStateError(f"Expert '{expert_id}' {reason}")
+        expert.open_cases += 1
+        self._index.update_availability(expert)
+
+    async def release(self, expert_id: str) -> None:
+        """Return one unit of an expert's case capacity.
+
+        Args:
+            expert_id: The expert whose case closed or was not assigned.
+        """
+        expert = self._store.get(expert_id)
+        if expert is not None and expert.open_cases > 0:
+            expert.open_cases -= 1
+            self._index.update_availability(expert)
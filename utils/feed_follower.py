@@ -0,0 +1,175 @@
+"""Client side of the /cases:watch stream, applying changes to a replica.
+
+The follower first loads a full copy of the primary's cases from its
+/cases:snapshot, page by page, then keeps one Server-Sent Events connection to the
+primary open and resumes with Last-Event-ID after any disconnect, so no
+change retained by the primary is applied twice or skipped. Two events
+make it copy the primary again: a ``reset`` event, announcing changes the
+primary could not replay, and a stream from another feed epoch, meaning
+the primary restarted and its positions started over.
+"""
+
+import asyncio
+import logging
+from typing import AsyncIterator
+
+import httpx
+
+from models import Case
+from utils.change_feed import EPOCH_HEADER, REPLICATION_TOKEN_HEADER
+from utils.metrics import MetricsRegistry
+from utils.replication import CaseReplica
+
+logger = logging.getLogger(__name__)
+
+
+async def parse_events(lines: AsyncIterator[str]) -> AsyncIterator[tuple[str, str, str | None]]:
+    """Group SSE lines into events.
+
+    Args:
+        lines: Response lines without their line endings.
+
+    Yields:
+        ``(event type, data, id)`` per event; comments are skipped.
+    """
+    event, data, event_id = "message", [], None
+    async for line in lines:
+        if not line:
+            if data:
+                yield event, "\n".join(data), event_id
+            event, data, event_id = "message", [], None
+            continue
+        name, _, value = line.partition(":")
+        value = value[1:] if value.startswith(" ") else value
+        if name == "event":
+            event = value
+        elif name == "data":
+            data.append(value)
+        elif name == "id":
+            event_id = value
+
+
+class FeedFollower:
+    """Applies a primary's case changes to a CaseReplica until cancelled.
+
+    Connections that fail or end are retried after ``retry_seconds``.
+    Reconnects are counted in ``replica_reconnects_total``, unreplayable
+    gaps in ``replica_resets_total`` and full copies in
+    ``replica_copies_total``.
+    """
+
+    def __init__(
+        self,
+        replica: CaseReplica,
+        watch_url: str,
+        snapshot_url: str,
+        metrics: MetricsRegistry,
+        retry_seconds: float = 1.0,
+        client: httpx.AsyncClient | None = None,
+        token: str = "",
+        page_size: int = 1000,
+    ) -> None:
+        """Create a follower; nothing connects until run().
+
+        Args:
+            replica: Replica the changes are applied to.
+            watch_url: Full URL of the primary's /api/v1/cases:watch.
+            snapshot_url: Full URL of the primary's /api/v1/cases:snapshot.
+            metrics: Registry for the reconnect, reset and copy counters.
+            retry_seconds: Pause before reconnecting.
+            client: HTTP client to use; one without timeouts by default.
+            token: Replication token the primary requires for copies.
+            page_size: Cases requested per page of a copy.
+        """
+        self.replica = replica
+        self.watch_url = watch_url
+        self.snapshot_url = snapshot_url
+        self.retry_seconds = retry_seconds
+        self.token = token
+        self.page_size = page_size
+        self._client = client or httpx.AsyncClient(timeout=None)
+        self._reconnects = metrics.counter(
+            "replica_reconnects_total", "Times the replica reconnected to its primary"
+        )
+        self._resets = metrics.counter(
+            "replica_resets_total", "Change-stream gaps the primary could not replay"
+        )
+        self._copies = metrics.counter(
+            "replica_copies_total", "Full copies of the primary loaded by the replica"
+        )
+
+    async def run(self) -> None:
+        """Follow the primary until cancelled, then close the client."""
+        try:
+            while True:
+                try:
+                    await self.follow_once()
+                except (httpx.HTTPError, KeyError, ValueError) as exc:
+                    logger.warning("Replica lost its primary at %s: %s", self.watch_url, exc)
+                await asyncio.sleep(self.retry_seconds)
+                self._reconnects.inc()
+        finally:
+            await self._client.aclose()
+
+    async def follow_once(self) -> None:
+        """Apply changes from one connection until the primary ends it.
+
+        The primary is copied first when the replica holds no current copy,
+        and again whenever the stream shows the copy went out of date.
+
+        Raises:
+            httpx.HTTPError: If a request fails or is refused.
+            KeyError: If the copy lacks a field.
+            ValueError: If a response does not hold valid cases.
+        """
+        stale = self.replica.epoch is None
+        while True:
+            if stale:
+                await self.copy_primary()
+            stale = await self._follow_stream()
+            if not stale:
+                return
+
+    async def copy_primary(self) -> None:
+        """Replace the replica's contents with a full copy of the primary.
+
+        The pages are collected first and loaded together, so the replica
+        never serves a partial copy. A primary that restarts between pages
+        refuses the next one, and the copy starts over on the next attempt.
+
+        Raises:
+            httpx.HTTPError: If a request fails or is refused.
+            KeyError: If a page lacks a field.
+            ValueError: If a response does not hold valid cases.
+        """
+        headers = {REPLICATION_TOKEN_HEADER: self.token}
+        params: dict = {"limit": self.page_size}
+        cases: list[Case] = []
+        while True:
+            response = await self._client.get(self.snapshot_url, params=params, headers=headers)
+            response.raise_for_status()
+            body = response.json()
+            cases += (Case.model_validate(item) for item in body["items"])
+            if body["next_cursor"] is None:
+                break
+            params["cursor"] = body["next_cursor"]
+        self.replica.load(body["epoch"], body["position"], cases)
+        self._copies.inc()
+
+    async def _follow_stream(self) -> bool:
+        """Apply one connection's changes; return whether to copy the primary again."""
+        headers = {"Last-Event-ID": str(self.replica.applied)}
+        async with self._client.stream("GET", self.watch_url, headers=headers) as response:
+            response.raise_for_status()
+            if response.headers.get(EPOCH_HEADER) != self.replica.epoch:
+                logger.warning("Primary at %s restarted; copying it again", self.watch_url)
+                self.replica.forget()
+                return True
+            async for event, data, event_id in parse_events(response.aiter_lines()):
+                if event == "case" and event_id is not None:
+                    await self.replica.apply(int(event_id), Case.model_validate_json(data))
+                elif event == "reset":
+                    self._resets.inc()
+                    logger.warning("Replica missed changes; copying the primary again")
+                    return True
+        return False
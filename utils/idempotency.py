@@ -0,0 +1,239 @@
+"""Idempotency-key stores and in-flight request coalescing."""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Protocol
+
+from pydantic import BaseModel
+
+from exceptions import ValidationError
+
+# Statuses that tell the client to try again later, e.g. 429 from a tenant
+# quota; recording them would replay the refusal for the whole TTL.
+RETRYABLE_STATUSES = frozenset({408, 425, 429})
+
+
+class StoredResponse(BaseModel):
+    """A serialized response recorded under an idempotency key."""
+
+    status_code: int
+    body: bytes
+    fingerprint: str
+
+
+class IdempotencyStore(Protocol):
+    """Interface for a bounded, TTL-evicting key → response store."""
+
+    async def get(self, key: str) -> StoredResponse | None: ...
+
+    async def put(self, key: str, response: StoredResponse) -> None: ...
+
+
+class InMemoryIdempotencyStore:
+    """OrderedDict-backed store; oldest entries are evicted first.
+
+    With a single TTL, insertion order is also expiry order, so expired
+    entries are trimmed from the front in amortised O(1).
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        max_entries: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, StoredResponse]] = OrderedDict()
+
+    async def get(self, key: str) -> StoredResponse | None:
+        """Return the live response for key, if any."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= self._clock():
+            del self._entries[key]
+            return None
+        return entry[1]
+
+    async def put(self, key: str, response: StoredResponse) -> None:
+        """Record a response, evicting expired and overflow entries."""
+        now = self._clock()
+        self._entries.pop(key, None)
+        self._entries[key] = (now + self._ttl, response)
+        while self._entries:
+            oldest_key, (expires_at, _) = next(iter(self._entries.items()))
+            if expires_at > now and len(self._entries) <= self._max_entries:
+                break
+            del self._entries[oldest_key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteIdempotencyStore:
+    """Durable store in a SQLite file, queried off the event loop.
+
+    Expired rows are ignored on read; expiry and the ``max_entries`` bound
+    are enforced in one batch every ``_PURGE_EVERY`` writes.
+    """
+
+    _PURGE_EVERY = 256
+
+    def __init__(
+        self,
+        path: str,
+        ttl: float,
+        max_entries: int,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._puts = 0
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS idempotency ("
+            " key TEXT PRIMARY KEY, fingerprint TEXT NOT NULL,"
+            " status_code INTEGER NOT NULL, body BLOB NOT NULL,"
+            " expires_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idempotency_expiry ON idempotency (expires_at)"
+        )
+        self._conn.commit()
+
+    async def get(self, key: str) -> StoredResponse | None:
+        """Return the live response for key, if any."""
+        return await asyncio.to_thread(self._get, key)
+
+    async def put(self, key: str, response: StoredResponse) -> None:
+        """Record a response; periodically purge expired and overflow rows."""
+        await asyncio.to_thread(self._put, key, response)
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _get(self, key: str) -> StoredResponse | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fingerprint, status_code, body FROM idempotency"
+                " WHERE key = ? AND expires_at > ?",
+                (key, self._clock()),
+            ).fetchone()
+        if row is None:
+            return None
+        return StoredResponse(fingerprint=row[0], status_code=row[1], body=row[2])
+
+    def _put(self, key: str, response: StoredResponse) -> None:
+        now = self._clock()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO idempotency VALUES (?, ?, ?, ?, ?)",
+                (key, response.fingerprint, response.status_code, response.body,
+                 now + self._ttl),
+            )
+            self._puts += 1
+            if self._puts % self._PURGE_EVERY == 0:
+                self._purge(now)
+            self._conn.commit()
+
+    def _purge(self, now: float) -> None:
+        self._conn.execute("DELETE FROM idempotency WHERE expires_at <= ?", (now,))
+        self._conn.execute(
+            "DELETE FROM idempotency WHERE key IN ("
+            " SELECT key FROM idempotency ORDER BY expires_at DESC LIMIT -1 OFFSET ?)",
+            (self._max_entries,),
+        )
+
+
+class IdempotencyCoordinator:
+    """Executes each idempotency key at most once at a time.
+
+    Concurrent duplicates await the first execution instead of running
+    their own. Final responses are recorded and replayed for later
+    duplicates; server errors and RETRYABLE_STATUSES are not, so a retry
+    with the same key runs again.
+    """
+
+    def __init__(self, store: IdempotencyStore) -> None:
+        self._store = store
+        self._in_flight: dict[str, asyncio.Future] = {}
+
+    async def execute(
+        self,
+        key: str,
+        fingerprint: str,
+        fn: Callable[[], Awaitable[StoredResponse]],
+    ) -> tuple[StoredResponse, bool]:
+        """Run fn once for key, or return the recorded/in-flight result.
+
+        Args:
+            key: The client-supplied idempotency key.
+            fingerprint: Digest of the request the key was sent with.
+            fn: Produces the response when the key is new.
+
+        Returns:
+            The response and whether it was replayed rather than executed.
+
+        Raises:
+            ValidationError: If the key was first used with a different request.
+        """
+        replay = await self._lookup(key)
+        if replay is not None:
+            return self._check(replay, fingerprint), True
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            response = await fn()
+            response.fingerprint = fingerprint
+            if self._is_final(response.status_code):
+                await self._store.put(key, response)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()  # mark retrieved when nobody is waiting
+            raise
+        finally:
+            del self._in_flight[key]
+        future.set_result(response)
+        return response, False
+
+    async def _lookup(self, key: str) -> StoredResponse | None:
+        while True:
+            pending = self._in_flight.get(key)
+            if pending is None:
+                stored = await self._store.get(key)
+                if stored is not None:
+                    return stored
+                pending = self._in_flight.get(key)  # may have started during the await
+            if pending is None:
+                return None
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The original caller went away; look again and maybe run it ourselves.
+
+    @staticmethod
+    def _is_final(status_code: int) -> bool:
+        return status_code < 500 and status_code not in RETRYABLE_STATUSES
+
+    @staticmethod
+    def _check(response: StoredResponse, fingerprint: str) -> StoredResponse:
+        if response.fingerprint != fingerprint:
+            raise ValidationError("Idempotency-Key was already used for a different request")
+        return response
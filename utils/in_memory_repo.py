@@ -1,8 +1,14 @@
 """In-memory case repository for development and testing."""
 
-from typing import Optional
+import asyncio
+import bisect
+from itertools import islice
+from typing import Iterator, Optional, Sequence
 
-from models import Case
+from models import Case, CaseStatistics
+from utils.case_stats import CaseStatsCounter
+from utils.change_feed import ChangeFeed
+from utils.prefix_index import PrefixIndex
 
 
 class InMemoryCaseRepository:
@@ -10,10 +16,35 @@ class InMemoryCaseRepository:
 
     Satisfies the CaseRepository protocol defined in services.case_service.
     Useful for local development and integration tests without a real database.
+    Secondary prefix indexes over referrer_id and expert_id are maintained on
+    every write so searches never scan the store, and aggregate statistics
+    are updated in the same step. If a change feed is given, every save is
+    published to it. A single store-wide lock serializes read-modify-write
+    sequences; see ShardedCaseRepository for a partitioned alternative.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, change_feed: ChangeFeed | None = None) -> None:
+        self.change_feed = change_feed
         self._store: dict[str, Case] = {}
+        self._referrer_index = PrefixIndex()
+        self._expert_index = PrefixIndex()
+        self._stats = CaseStatsCounter()
+        self._due: set[str] = set()
+        self._ids: list[str] = []
+        self._lock = asyncio.Lock()
+
+    def lock(self, case_id: str) -> asyncio.Lock:
+        """Return the lock guarding read-modify-write of case_id.
+
+        Every case shares one lock in this implementation.
+
+        Args:
+            case_id: The case about to be updated.
+
+        Returns:
+            An asyncio lock to hold across the read and the save.
+        """
+        return self._lock
 
     async def get_by_id(self, case_id: str) -> Optional[Case]:
         """Retrieve a case by ID from the in-memory store.
@@ -26,13 +57,30 @@ class InMemoryCaseRepository:
         """
         return self._store.get(case_id)
 
+    async def get_many(self, case_ids: Sequence[str]) -> dict[str, Case]:
+        """Retrieve several cases in one pass over the ids.
+
+        Args:
+            case_ids: Ids to look up.
+
+        Returns:
+            Found cases keyed by id; missing ids are absent.
+        """
+        store = self._store
+        return {i: case for i in case_ids if (case := store.get(i)) is not None}
+
     async def save(self, case: Case) -> None:
         """Persist a case to the in-memory store.
 
         Args:
             case: The Case model to save.
         """
+        if case.id not in self._store:
+            bisect.insort(self._ids, case.id)
         self._store[case.id] = case
+        self._index(case)
+        if self.change_feed is not None:
+            self.change_feed.publish(case)
 
     def seed(self, cases: list[Case]) -> None:
         """Pre-populate the store with seed data.
@@ -40,5 +88,96 @@ class InMemoryCaseRepository:
         Args:
             cases: List of Case models to add to the store.
         """
+        new = {case.id for case in cases} - self._store.keys()
         for case in cases:
             self._store[case.id] = case
+            self._index(case)
+        if new:
+            self._ids.extend(new)
+            self._ids.sort()
+
+    async def search(
+        self,
+        referrer_id: str | None = None,
+        expert_id: str | None = None,
+        limit: int = 50,
+    ) -> list[Case]:
+        """Find cases by exact or trailing-``*`` prefix patterns.
+
+        The first given pattern drives an index walk; the other, if any, is
+        checked per candidate. The walk stops as soon as ``limit`` hits are found.
+
+        Args:
+            referrer_id: Pattern for referrer_id, e.g. ``"ref-1*"``.
+            expert_id: Pattern for expert_id.
+            limit: Maximum number of cases to return.
+
+        Returns:
+            Matching cases ordered by the driving field's value.
+        """
+        return list(islice(self.scan(referrer_id, expert_id), limit))
+
+    def scan(
+        self, referrer_id: str | None = None, expert_id: str | None = None
+    ) -> Iterator[Case]:
+        """Lazily yield cases matching the patterns, as search() orders them.
+
+        Args:
+            referrer_id: Pattern for referrer_id.
+            expert_id: Pattern for expert_id.
+
+        Returns:
+            An iterator over matching cases.
+        """
+        if referrer_id is not None:
+            ids = self._referrer_index.match(referrer_id)
+            if expert_id is not None:
+                ids = self._expert_index.filter(ids, expert_id)
+        elif expert_id is not None:
+            ids = self._expert_index.match(expert_id)
+        else:
+            ids = iter(self._store)
+        store = self._store
+        return (store[case_id] for case_id in ids)
+
+    async def stats(self) -> CaseStatistics:
+        """Return the incrementally maintained case statistics."""
+        return self._stats.snapshot()
+
+    async def rebuild_stats(self) -> CaseStatistics:
+        """Recompute the statistics with a full scan of the store.
+
+        Returns:
+            The freshly computed statistics.
+        """
+        self._stats.rebuild(self._store.values())
+        return self._stats.snapshot()
+
+    async def page_by_id(self, after: str | None, limit: int) -> list[Case]:
+        """Return up to limit cases with ids after ``after``, in id order.
+
+        Args:
+            after: Last id of the previous page; None starts at the first id.
+            limit: Maximum number of cases to return.
+
+        Returns:
+            The page of cases.
+        """
+        ids = self._ids
+        start = 0 if after is None else bisect.bisect_right(ids, after)
+        store = self._store
+        return [store[case_id] for case_id in ids[start:start + limit]]
+
+    async def with_deadlines(self) -> list[Case]:
+        """Return the cases that have a deadline, read from their own index."""
+        store = self._store
+        return [store[case_id] for case_id in self._due]
+
+    def _index(self, case: Case) -> None:
+        self._referrer_index.update(case.id, case.referrer_id)
+        self._expert_index.update(case.id, case.expert_id)
+        self._stats.apply(case)
+        if case.due_at is None:
+            self._due.discard(case.id)
+        else:
+            self._due.add(case.id)
@@ -0,0 +1,164 @@
+"""Bounded in-process asyncio job queue with retrying workers."""
+
+import asyncio
+import random
+import time
+from collections import deque
+from typing import Awaitable, Callable
+
+from pydantic import BaseModel
+
+from exceptions import ExternalServiceError
+from utils.metrics import MetricsRegistry
+
+JobFn = Callable[[], Awaitable[None]]
+
+
+class RetryPolicy(BaseModel):
+    """Exponential backoff with full jitter."""
+
+    max_attempts: int = 5
+    base_delay: float = 0.1
+    max_delay: float = 5.0
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait before retry number ``attempt`` (1-based)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+async def run_with_retry(name: str, fn: JobFn, policy: RetryPolicy) -> int:
+    """Run fn until it succeeds or the policy's attempts are exhausted.
+
+    Args:
+        name: Job name, used in the failure message.
+        fn: The job body.
+        policy: Retry policy.
+
+    Returns:
+        The number of attempts it took.
+
+    Raises:
+        ExternalServiceError: If every attempt failed.
+    """
+    for attempt in range(1, policy.max_attempts + 1):
+        try:
+            await fn()
+            return attempt
+        except Exception as exc:
+            if attempt == policy.max_attempts:
+                raise ExternalServiceError(
+                    f"Job '{name}' failed after {attempt} attempts: {exc}"
+                ) from exc
+            await asyncio.sleep(policy.delay(attempt))
+    return policy.max_attempts
+
+
+class JobQueue:
+    """Fire-and-forget job queue drained by a fixed pool of workers.
+
+    ``submit`` never blocks the caller: when the queue is at capacity the
+    job is dropped and counted. Jobs that exhaust their retries end up in
+    ``dead_letters`` (the most recent 1000) with the ExternalServiceError
+    that ended them.
+    """
+
+    def __init__(
+        self,
+        metrics: MetricsRegistry,
+        capacity: int = 10_000,
+        workers: int = 4,
+        retry: RetryPolicy | None = None,
+    ) -> None:
+        self._capacity = capacity
+        self._worker_count = workers
+        self._retry = retry or RetryPolicy()
+        self._queue: asyncio.Queue | None = None
+        self._workers: list[asyncio.Task] = []
+        self._accepting = True
+        self.dead_letters: deque[tuple[str, ExternalServiceError]] = deque(maxlen=1000)
+        self._latency = metrics.histogram(
+            "jobs_latency_seconds", "Time from submit to job completion"
+        )
+        self._completed = metrics.counter("jobs_completed_total", "Jobs that succeeded")
+        self._failed = metrics.counter("jobs_failed_total", "Jobs that exhausted retries")
+        self._retried = metrics.counter("jobs_retried_total", "Job retry attempts")
+        self._dropped = metrics.counter("jobs_dropped_total", "Jobs rejected by a full queue")
+        metrics.gauge("jobs_queue_depth", "Jobs waiting for a worker").set_function(
+            lambda: self.depth
+        )
+
+    @property
+    def depth(self) -> int:
+        """Number of jobs waiting for a worker."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def start(self) -> None:
+        """Spawn the worker pool on the running loop (idempotent)."""
+        if self._workers:
+            return
+        self._queue = asyncio.Queue(self._capacity)
+        self._accepting = True
+        self._workers = [
+            asyncio.create_task(self._work(), name=f"job-worker-{i}")
+            for i in range(self._worker_count)
+        ]
+
+    def submit(self, name: str, fn: JobFn) -> bool:
+        """Enqueue a job without waiting.
+
+        Args:
+            name: Job name, used as a metrics label.
+            fn: Zero-argument coroutine function to run.
+
+        Returns:
+            True if queued, False if the queue is full or draining.
+        """
+        if not self._accepting:
+            self._dropped.inc(job=name)
+            return False
+        self.start()
+        try:
+            self._queue.put_nowait((name, fn, time.perf_counter()))
+        except asyncio.QueueFull:
+            self._dropped.inc(job=name)
+            return False
+        return True
+
+    async def drain(self, timeout: float = 10.0) -> bool:
+        """Stop accepting jobs, finish queued ones, then stop the workers.
+
+        Args:
+            timeout: Seconds to wait for the backlog before cancelling.
+
+        Returns:
+            True if every queued job finished within the timeout.
+        """
+        self._accepting = False
+        if not self._workers:
+            return True
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+            drained = True
+        except asyncio.TimeoutError:
+            drained = False
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        return drained
+
+    async def _work(self) -> None:
+        while True:
+            name, fn, submitted = await self._queue.get()
+            try:
+                attempts = await run_with_retry(name, fn, self._retry)
+                self._completed.inc(job=name)
+                if attempts > 1:
+                    self._retried.inc(attempts - 1, job=name)
+            except ExternalServiceError as exc:
+                self._failed.inc(job=name)
+                self._retried.inc(self._retry.max_attempts - 1, job=name)
+                self.dead_letters.append((name, exc))
+            finally:
+                self._latency.observe(time.perf_counter() - submitted, job=name)
+                self._queue.task_done()
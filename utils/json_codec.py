@@ -0,0 +1,109 @@
+"""JSON encoder selection — orjson when installed, stdlib json otherwise."""
+
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Protocol
+
+from exceptions import ValidationError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+class JSONEncoder(Protocol):
+    """Interface for a compact, UTF-8 JSON encoder."""
+
+    name: str
+
+    def dumps(self, content: Any) -> bytes: ...
+
+
+def _default(value: Any) -> Any:
+    """Fallback for types the stdlib encoder does not handle natively."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class StdlibJSONEncoder:
+    """Encoder backed by the standard library ``json`` module."""
+
+    name = "stdlib"
+
+    def dumps(self, content: Any) -> bytes:
+        """Encode content as compact UTF-8 JSON.
+
+        Args:
+            content: JSON-compatible Python data.
+
+        Returns:
+            The encoded bytes.
+        """
+        return json.dumps(
+            content,
+            ensure_ascii=False,
+            allow_nan=False,
+            separators=(",", ":"),
+            default=_default,
+        ).encode("utf-8")
+
+
+class OrjsonJSONEncoder:
+    """Encoder backed by orjson, serializing datetimes and enums natively."""
+
+    name = "orjson"
+
+    def dumps(self, content: Any) -> bytes:
+        """Encode content as compact UTF-8 JSON.
+
+        Args:
+            content: JSON-compatible Python data.
+
+        Returns:
+            The encoded bytes.
+        """
+        return orjson.dumps(content, default=_default)
+
+
+def available_encoders() -> list[str]:
+    """List the encoder names usable in this environment.
+
+    Returns:
+        Encoder names, fastest first.
+    """
+    names = ["stdlib"]
+    if orjson is not None:
+        names.insert(0, "orjson")
+    return names
+
+
+def get_json_encoder(name: str = "auto") -> JSONEncoder:
+    """Resolve an encoder by name.
+
+    Args:
+        name: ``"auto"`` (orjson if installed, else stdlib), ``"orjson"``
+            or ``"stdlib"``.
+
+    Returns:
+        The selected encoder.
+
+    Raises:
+        ValidationError: If the name is unknown or orjson is requested
+            but not installed.
+    """
+    if name == "auto":
+        name = available_encoders()[0]
+    if name == "stdlib":
+        return StdlibJSONEncoder()
+    if name == "orjson":
+        if orjson is None:
+            raise ValidationError("JSON encoder 'orjson' requested but not installed")
+        return OrjsonJSONEncoder()
+    raise ValidationError(f"Unknown JSON encoder '{name}'")
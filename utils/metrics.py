@@ -0,0 +1,170 @@
+"""Minimal in-process metrics registry with Prometheus text exposition."""
+
+import bisect
+from typing import Callable
+
+LabelKey = tuple[tuple[str, str], ...]
+
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+)
+
+
+def _key(labels: dict[str, str]) -> LabelKey:
+    return tuple(sorted(labels.items()))
+
+
+def _fmt_labels(key: LabelKey) -> str:
+    parts = [f'{k}="{v}"' for k, v in key]
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class Counter:
+    """Monotonically increasing value, optionally split by labels."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str) -> None:
+        self.name = name
+        self.help = help_text
+        self._values: dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase the counter for the given label set."""
+        key = _key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Return the current value for the given label set."""
+        return self._values.get(_key(labels), 0.0)
+
+    def samples(self) -> list[tuple[str, LabelKey, float]]:
+        """Return (suffix, labels, value) tuples for exposition."""
+        return [("", key, value) for key, value in self._values.items()]
+
+
+class Gauge(Counter):
+    """Value that can go up and down, or be read from a callback."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str) -> None:
+        super().__init__(name, help_text)
+        self._callbacks: dict[LabelKey, Callable[[], float]] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set the gauge for the given label set."""
+        self._values[_key(labels)] = value
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        """Decrease the gauge for the given label set."""
+        self.inc(-amount, **labels)
+
+    def set_function(self, fn: Callable[[], float], **labels: str) -> None:
+        """Read the gauge from fn at collection time instead of storing it."""
+        self._callbacks[_key(labels)] = fn
+
+    def value(self, **labels: str) -> float:
+        """Return the current value for the given label set."""
+        key = _key(labels)
+        if key in self._callbacks:
+            return float(self._callbacks[key]())
+        return self._values.get(key, 0.0)
+
+    def samples(self) -> list[tuple[str, LabelKey, float]]:
+        """Return (suffix, labels, value) tuples for exposition."""
+        stored = super().samples()
+        return stored + [("", key, float(fn())) for key, fn in self._callbacks.items()]
+
+
+class Histogram:
+    """Cumulative-bucket histogram of observed values."""
+
+    kind = "histogram"
+
+    def __init__(
+        self, name: str, help_text: str, buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> None:
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(sorted(buckets))
+        self._counts: dict[LabelKey, list[int]] = {}
+        self._sums: dict[LabelKey, float] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record one observation for the given label set."""
+        key = _key(labels)
+        counts = self._counts.get(key)
+        if counts is None:
+            counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+            self._sums[key] = 0.0
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        self._sums[key] += value
+
+    def count(self, **labels: str) -> int:
+        """Return the number of observations for the given label set."""
+        return sum(self._counts.get(_key(labels), ()))
+
+    def total(self, **labels: str) -> float:
+        """Return the sum of observations for the given label set."""
+        return self._sums.get(_key(labels), 0.0)
+
+    def samples(self) -> list[tuple[str, LabelKey, float]]:
+        """Return (suffix, labels, value) tuples for exposition."""
+        out: list[tuple[str, LabelKey, float]] = []
+        for key, counts in self._counts.items():
+            running = 0
+            for bound, n in zip(self.buckets + (float("inf"),), counts):
+                running += n
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                out.append(("_bucket", key + (("le", le),), running))
+            out.append(("_sum", key, self._sums[key]))
+            out.append(("_count", key, running))
+        return out
+
+
+class MetricsRegistry:
+    """Owns every metric of one application instance."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Counter | Gauge | Histogram] = {}
+
+    def counter(self, name: str, help_text: str) -> Counter:
+        """Get or create a counter."""
+        return self._get_or_create(Counter, name, help_text)
+
+    def gauge(self, name: str, help_text: str) -> Gauge:
+        """Get or create a gauge."""
+        return self._get_or_create(Gauge, name, help_text)
+
+    def histogram(
+        self, name: str, help_text: str, buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        """Get or create a histogram."""
+        if name not in self._metrics:
+            self._metrics[name] = Histogram(name, help_text, buckets)
+        return self._metrics[name]
+
+    def get(self, name: str) -> Counter | Gauge | Histogram | None:
+        """Look up a registered metric by name."""
+        return self._metrics.get(name)
+
+    def render_prometheus(self) -> str:
+        """Render every metric in the Prometheus text exposition format.
+
+        Returns:
+            The exposition text, newline terminated.
+        """
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for suffix, key, value in metric.samples():
+                lines.append(f"{metric.name}{suffix}{_fmt_labels(key)} {value:g}")
+        return "\n".join(lines) + "\n"
+
+    def _get_or_create(self, cls: type, name: str, help_text: str):
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = cls(name, help_text)
+        return metric
@@ -0,0 +1,118 @@
+"""Sorted-array secondary index supporting exact and prefix lookups."""
+
+import bisect
+from typing import Iterable, Iterator
+
+from exceptions import ValidationError
+
+WILDCARD = "*"
+
+
+def parse_pattern(pattern: str) -> tuple[str, bool]:
+    """Split a search pattern into its literal part and a prefix flag.
+
+    Args:
+        pattern: ``"ref-1*"`` for a prefix match, ``"ref-1"`` for exact.
+
+    Returns:
+        The literal text and whether it is a prefix.
+
+    Raises:
+        ValidationError: If the wildcard appears anywhere but the end.
+    """
+    is_prefix = pattern.endswith(WILDCARD)
+    literal = pattern[:-1] if is_prefix else pattern
+    if WILDCARD in literal:
+        raise ValidationError(f"Wildcard is only supported at the end: '{pattern}'")
+    return literal, is_prefix
+
+
+class PrefixIndex:
+    """Maps an attribute value to the ids of the records carrying it.
+
+    Distinct values are kept in a sorted list so that a prefix query is a
+    binary search followed by a contiguous walk; postings are insertion-
+    ordered dicts used as ordered sets. The index remembers each record's
+    current value, so updates need only the new value even when the caller
+    mutated the record in place.
+    """
+
+    def __init__(self) -> None:
+        self._keys: list[str] = []
+        self._postings: dict[str, dict[str, None]] = {}
+        self._value_of: dict[str, str] = {}
+
+    def update(self, record_id: str, value: str | None) -> None:
+        """Point record_id at value, removing any previous value.
+
+        Args:
+            record_id: Id of the indexed record.
+            value: New attribute value, or None to unindex the record.
+        """
+        old = self._value_of.get(record_id)
+        if old == value:
+            return
+        if old is not None:
+            postings = self._postings[old]
+            del postings[record_id]
+            if not postings:
+                del self._postings[old]
+                del self._keys[bisect.bisect_left(self._keys, old)]
+        if value is None:
+            self._value_of.pop(record_id, None)
+            return
+        self._value_of[record_id] = value
+        postings = self._postings.get(value)
+        if postings is None:
+            postings = self._postings[value] = {}
+            bisect.insort(self._keys, value)
+        postings[record_id] = None
+
+    def value_of(self, record_id: str) -> str | None:
+        """Return the value currently indexed for record_id."""
+        return self._value_of.get(record_id)
+
+    def match(self, pattern: str) -> Iterator[str]:
+        """Lazily yield ids of records matching an exact or prefix pattern.
+
+        Results are ordered by value, then by first insertion, and are
+        produced on demand so callers can stop after ``limit`` hits.
+
+        Args:
+            pattern: Search pattern; see parse_pattern().
+
+        Yields:
+            Matching record ids.
+        """
+        literal, is_prefix = parse_pattern(pattern)
+        if not is_prefix:
+            yield from self._postings.get(literal, ())
+            return
+        keys = self._keys
+        for i in range(bisect.bisect_left(keys, literal), len(keys)):
+            key = keys[i]
+            if not key.startswith(literal):
+                return
+            yield from self._postings[key]
+
+    def filter(self, record_ids: Iterable[str], pattern: str) -> Iterator[str]:
+        """Lazily keep the ids whose indexed value matches pattern.
+
+        Args:
+            record_ids: Candidate ids, typically from another index's match().
+            pattern: Search pattern; see parse_pattern().
+
+        Yields:
+            Candidate ids whose value matches.
+        """
+        literal, is_prefix = parse_pattern(pattern)
+        value_of = self._value_of
+        for record_id in record_ids:
+            value = value_of.get(record_id)
+            if value is not None and (
+                value.startswith(literal) if is_prefix else value == literal
+            ):
+                yield record_id
+
+    def __len__(self) -> int:
+        return len(self._value_of)
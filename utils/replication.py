@@ -0,0 +1,222 @@
+"""Read replicas of the case store, fed from the primary's change stream.
+
+Every save on the primary is published to its change feed with a sequence
+number. A CaseReplica starts from a full copy of the primary's cases
+taken at some position of one feed *epoch*, applies later changes in
+order to its own in-memory store and remembers the newest number
+applied, its *position*. Reads
+are served from the replica, possibly behind the primary. A read that
+must reflect a given position, such as the client's own last write,
+sets ``read_position`` for the request. The replica then waits a
+bounded time for that position before answering, so a client never sees
+its own assignment disappear.
+"""
+
+import asyncio
+import heapq
+from contextlib import AbstractAsyncContextManager
+from contextvars import ContextVar
+from itertools import count
+from typing import Optional, Sequence
+
+from exceptions import InvalidStateError, ReplicaLagError
+from models import Case, CaseStatistics
+from utils.in_memory_repo import InMemoryCaseRepository
+from utils.metrics import MetricsRegistry
+
+#: Lowest primary position the current request's reads must reflect.
+read_position: ContextVar[int] = ContextVar("read_position", default=0)
+
+
+class CaseReplica:
+    """Read-only CaseRepository following a primary's change feed.
+
+    Satisfies the CaseRepository protocol of services.case_service. Reads
+    first wait until ``read_position`` has been applied, for at most
+    ``max_wait`` seconds, and raise ReplicaLagError past that, or at once
+    while the replica holds no copy of its primary. Saves raise
+    InvalidStateError: writes belong to the primary. Copies are loaded
+    through ``load`` and changes applied through ``apply``, normally by a
+    FeedFollower. Reads are counted in
+    ``replica_reads_total`` by whether they were current, had to wait, or
+    gave up.
+    """
+
+    def __init__(
+        self,
+        store: InMemoryCaseRepository,
+        max_wait: float = 0.5,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        """Create a replica that holds no copy yet.
+
+        Args:
+            store: Local copy the changes are applied to. Its own change
+                feed, if any, republishes them to this process's watchers.
+            max_wait: Longest a read waits for its position, in seconds.
+            metrics: Registry for the read counter and position gauge, if any.
+        """
+        self.store = store
+        self.max_wait = max_wait
+        self.applied = 0
+        self.epoch: str | None = None
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        # Waiters that gave up; their entries are dropped in bulk.
+        self._abandoned = 0
+        self._order = count()
+        self._reads = None
+        if metrics is not None:
+            self._reads = metrics.counter(
+                "replica_reads_total", "Replica reads by whether they had to wait for a position"
+            )
+            metrics.gauge(
+                "replica_position", "Newest primary change applied by this replica"
+            ).set_function(lambda: float(self.applied))
+
+    def load(self, epoch: str, position: int, cases: list[Case]) -> None:
+        """Replace the local copy with a full copy of the primary.
+
+        Watchers of this process's own feed are not sent the copied cases.
+
+        Args:
+            epoch: Epoch of the primary's feed the copy was taken from.
+            position: Feed position the copy includes every change up to.
+            cases: Every case the primary held.
+        """
+        store = InMemoryCaseRepository(change_feed=self.store.change_feed)
+        store.seed(cases)
+        self.store = store
+        self.epoch = epoch
+        self.applied = position
+        self._wake(position)
+
+    def forget(self) -> None:
+        """Mark the copy as out of date; reads fail until the next load()."""
+        self.epoch = None
+
+    async def apply(self, seq: int, case: Case) -> None:
+        """Apply one change from the primary, ignoring ones already applied.
+
+        Args:
+            seq: The change's sequence number on the primary.
+            case: The case as the primary saved it.
+        """
+        if seq <= self.applied:
+            return
+        await self.store.save(case)
+        self.applied = seq
+        self._wake(seq)
+
+    async def wait_for(self, position: int, timeout: float) -> bool:
+        """Wait until position has been applied.
+
+        A wait that times out or is cancelled leaves its entry behind; once
+        such entries are half the queue, the queue is rebuilt without them.
+
+        Args:
+            position: Primary sequence number to wait for.
+            timeout: Longest wait, in seconds.
+
+        Returns:
+            Whether the position was reached in time.
+        """
+        if position <= self.applied:
+            return True
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (position, next(self._order), future))
+        try:
+            await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            if future.cancelled():
+                self._abandon()
+        return True
+
+    def lock(self, case_id: str) -> AbstractAsyncContextManager:
+        """Delegate to the local store's lock."""
+        return self.store.lock(case_id)
+
+    async def get_by_id(self, case_id: str) -> Optional[Case]:
+        """Read case_id once the request's position is applied."""
+        await self._catch_up()
+        return await self.store.get_by_id(case_id)
+
+    async def get_many(self, case_ids: Sequence[str]) -> dict[str, Case]:
+        """Read case_ids once the request's position is applied."""
+        await self._catch_up()
+        return await self.store.get_many(case_ids)
+
+    async def save(self, case: Case) -> None:
+        """Reject the write; replicas only change through apply().
+
+        Raises:
+            InvalidStateError: Always.
+        """
+        raise InvalidStateError("This instance is a read replica; send writes to the primary")
+
+    def seed(self, cases: list[Case]) -> None:
+        """Add cases to the local store; load() replaces them."""
+        self.store.seed(cases)
+
+    async def search(
+        self,
+        referrer_id: str | None = None,
+        expert_id: str | None = None,
+        limit: int = 50,
+    ) -> list[Case]:
+        """Search the local store once the request's position is applied."""
+        await self._catch_up()
+        return await self.store.search(referrer_id, expert_id, limit)
+
+    async def stats(self) -> CaseStatistics:
+        """Statistics of the local store once the request's position is applied."""
+        await self._catch_up()
+        return await self.store.stats()
+
+    async def rebuild_stats(self) -> CaseStatistics:
+        """Delegate to the local store."""
+        return await self.store.rebuild_stats()
+
+    async def page_by_id(self, after: str | None, limit: int) -> list[Case]:
+        """Delegate to the local store."""
+        return await self.store.page_by_id(after, limit)
+
+    async def with_deadlines(self) -> list[Case]:
+        """Delegate to the local store."""
+        return await self.store.with_deadlines()
+
+    def _wake(self, position: int) -> None:
+        waiters = self._waiters
+        while waiters and waiters[0][0] <= position:
+            future = heapq.heappop(waiters)[2]
+            if future.cancelled():
+                self._abandoned -= 1
+            elif not future.done():
+                future.set_result(None)
+
+    def _abandon(self) -> None:
+        self._abandoned += 1
+        if self._abandoned * 2 > len(self._waiters):
+            self._waiters = [entry for entry in self._waiters if not entry[2].cancelled()]
+            heapq.heapify(self._waiters)
+            self._abandoned = 0
+
+    async def _catch_up(self) -> None:
+        if self.epoch is None:
+            self._count("lagging")
+            raise ReplicaLagError("Replica has not copied its primary yet")
+        position = read_position.get()
+        if position <= self.applied:
+            self._count("current")
+        elif await self.wait_for(position, self.max_wait):
+            self._count("waited")
+        else:
+            self._count("lagging")
+            raise ReplicaLagError(
+                f"Replica is at position {self.applied}, behind the requested {position}"
+            )
+
+    def _count(self, result: str) -> None:
+        if self._reads is not None:
+            self._reads.inc(result=result)
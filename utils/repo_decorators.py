@@ -0,0 +1,237 @@
+"""Stackable CaseRepository decorators: read-through cache and metrics.
+
+Each decorator wraps any object satisfying the CaseRepository protocol of
+services.case_service and satisfies it itself, so they compose in any
+order around any backend.
+"""
+
+import time
+from collections import OrderedDict
+from contextlib import AbstractAsyncContextManager
+from typing import Any, Optional, Sequence
+
+from models import Case, CaseStatistics
+from utils.metrics import MetricsRegistry
+
+
+class CachingCaseRepository:
+    """LRU read-through, write-through cache of cases by id.
+
+    Hits return the cached instance, so an in-place update followed by
+    save() keeps the cache current. A failed save evicts the case, since
+    the cached copy may hold changes the backend rejected. ``labels`` are
+    added to the cache metrics, e.g. the tenant a partition serves.
+    """
+
+    def __init__(
+        self,
+        inner: Any,
+        max_entries: int,
+        metrics: MetricsRegistry | None = None,
+        labels: dict[str, str] | None = None,
+    ) -> None:
+        self.inner = inner
+        self.max_entries = max_entries
+        self._cache: OrderedDict[str, Case] = OrderedDict()
+        self._hits = self._misses = None
+        self._labels = labels or {}
+        if metrics is not None:
+            self._hits = metrics.counter("repo_cache_hits_total", "Case cache hits")
+            self._misses = metrics.counter("repo_cache_misses_total", "Case cache misses")
+            metrics.gauge("repo_cache_entries", "Cases held in the cache").set_function(
+                lambda: len(self._cache), **self._labels
+            )
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def lock(self, case_id: str) -> AbstractAsyncContextManager:
+        """Delegate to the backend's lock."""
+        return self.inner.lock(case_id)
+
+    async def get_by_id(self, case_id: str) -> Optional[Case]:
+        """Return the cached case, loading it from the backend on a miss."""
+        case = self._cache.get(case_id)
+        if case is not None:
+            self._cache.move_to_end(case_id)
+            self._count(hits=1)
+            return case
+        self._count(misses=1)
+        case = await self.inner.get_by_id(case_id)
+        if case is not None:
+            self._put(case)
+        return case
+
+    async def get_many(self, case_ids: Sequence[str]) -> dict[str, Case]:
+        """Serve cached ids and fetch only the rest, in one backend call."""
+        found: dict[str, Case] = {}
+        missing: list[str] = []
+        for case_id in case_ids:
+            case = self._cache.get(case_id)
+            if case is None:
+                missing.append(case_id)
+            else:
+                self._cache.move_to_end(case_id)
+                found[case_id] = case
+        self._count(hits=len(found), misses=len(missing))
+        if missing:
+            loaded = await self.inner.get_many(missing)
+            for case in loaded.values():
+                self._put(case)
+            found.update(loaded)
+        return found
+
+    async def save(self, case: Case) -> None:
+        """Write through to the backend, then cache the saved case."""
+        try:
+            await self.inner.save(case)
+        except BaseException:
+            self._cache.pop(case.id, None)
+            raise
+        self._put(case)
+
+    def seed(self, cases: list[Case]) -> None:
+        """Seed the backend and drop any cached copies of those cases."""
+        self.inner.seed(cases)
+        for case in cases:
+            self._cache.pop(case.id, None)
+
+    async def search(
+        self,
+        referrer_id: str | None = None,
+        expert_id: str | None = None,
+        limit: int = 50,
+    ) -> list[Case]:
+        """Delegate to the backend."""
+        return await self.inner.search(
+            referrer_id=referrer_id, expert_id=expert_id, limit=limit
+        )
+
+    async def stats(self) -> CaseStatistics:
+        """Delegate to the backend."""
+        return await self.inner.stats()
+
+    async def rebuild_stats(self) -> CaseStatistics:
+        """Delegate to the backend."""
+        return await self.inner.rebuild_stats()
+
+    async def page_by_id(self, after: str | None, limit: int) -> list[Case]:
+        """Delegate to the backend."""
+        return await self.inner.page_by_id(after, limit)
+
+    async def with_deadlines(self) -> list[Case]:
+        """Delegate to the backend."""
+        return await self.inner.with_deadlines()
+
+    def _put(self, case: Case) -> None:
+        self._cache[case.id] = case
+        self._cache.move_to_end(case.id)
+        if len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+
+    def _count(self, hits: int = 0, misses: int = 0) -> None:
+        if self._hits is not None:
+            if hits:
+                self._hits.inc(hits, **self._labels)
+            if misses:
+                self._misses.inc(misses, **self._labels)
+
+
+class MeteredCaseRepository:
+    """Records the latency of every repository call, labelled by operation.
+
+    ``labels`` are added to every sample, e.g. the tenant a partition serves.
+    """
+
+    def __init__(
+        self, inner: Any, metrics: MetricsRegistry, labels: dict[str, str] | None = None
+    ) -> None:
+        self.inner = inner
+        self._labels = labels or {}
+        self._latency = metrics.histogram(
+            "repo_operation_seconds", "Latency of case repository calls"
+        )
+
+    def lock(self, case_id: str) -> AbstractAsyncContextManager:
+        """Delegate to the backend's lock."""
+        return self.inner.lock(case_id)
+
+    async def get_by_id(self, case_id: str) -> Optional[Case]:
+        """Time and delegate."""
+        start = time.perf_counter()
+        try:
+            return await self.inner.get_by_id(case_id)
+        finally:
+            self._observe("get_by_id", start)
+
+    async def get_many(self, case_ids: Sequence[str]) -> dict[str, Case]:
+        """Time and delegate."""
+        start = time.perf_counter()
+        try:
+            return await self.inner.get_many(case_ids)
+        finally:
+            self._observe("get_many", start)
+
+    async def save(self, case: Case) -> None:
+        """Time and delegate."""
+        start = time.perf_counter()
+        try:
+            await self.inner.save(case)
+        finally:
+            self._observe("save", start)
+
+    def seed(self, cases: list[Case]) -> None:
+        """Delegate to the backend."""
+        self.inner.seed(cases)
+
+    async def search(
+        self,
+        referrer_id: str | None = None,
+        expert_id: str | None = None,
+        limit: int = 50,
+    ) -> list[Case]:
+        """Time and delegate."""
+        start = time.perf_counter()
+        try:
+            return await self.inner.search(
+                referrer_id=referrer_id, expert_id=expert_id, limit=limit
+            )
+        finally:
+            self._observe("search", start)
+
+    async def stats(self) -> CaseStatistics:
+        """Time and delegate."""
+        start = time.perf_counter()
+        try:
+            return await self.inner.stats()
+        finally:
+            self._observe("stats", start)
+
+    async def rebuild_stats(self) -> CaseStatistics:
+        """Time and delegate."""
+        start = time.perf_counter()
+        try:
+            return await self.inner.rebuild_stats()
+        finally:
+            self._observe("rebuild_stats", start)
+
+    async def page_by_id(self, after: str | None, limit: int) -> list[Case]:
+        """Time and delegate."""
+        start = time.perf_counter()
+        try:
+            return await self.inner.page_by_id(after, limit)
+        finally:
+            self._observe("page_by_id", start)
+
+    async def with_deadlines(self) -> list[Case]:
+        """Time and delegate."""
+        start = time.perf_counter()
+        try:
+            return await self.inner.with_deadlines()
+        finally:
+            self._observe("with_deadlines", start)
+
+    def _observe(self, operation: str, start: float) -> None:
+        self._latency.observe(
+            time.perf_counter() - start, operation=operation, **self._labels
+        )
@@ -0,0 +1,170 @@
+"""Hash-sharded in-memory case repository."""
+
+import asyncio
+import heapq
+import zlib
+from itertools import chain, islice
+from operator import attrgetter
+from typing import Callable, Iterator, Optional, Sequence
+
+from exceptions import ValidationError
+from models import Case, CaseStatistics
+from utils.case_stats import merge_statistics
+from utils.change_feed import ChangeFeed
+from utils.in_memory_repo import InMemoryCaseRepository
+
+
+class ShardedCaseRepository:
+    """CaseRepository partitioned into N independent in-memory shards.
+
+    Satisfies the CaseRepository protocol defined in services.case_service.
+    A case lives in the shard chosen by a CRC32 of its id, which is stable
+    across processes. Each shard has its own store, prefix indexes,
+    statistics and lock, so read-modify-write sequences on cases in
+    different shards do not wait for each other. Searches walk every shard's
+    index lazily and merge the streams in order; statistics are summed.
+    """
+
+    def __init__(
+        self,
+        shards: int = 16,
+        change_feed: ChangeFeed | None = None,
+        lock_factory: Callable[[], asyncio.Lock] = asyncio.Lock,
+    ) -> None:
+        if shards < 1:
+            raise ValidationError("shards must be at least 1")
+        self.change_feed = change_feed
+        self._shards = [InMemoryCaseRepository() for _ in range(shards)]
+        self._locks = [lock_factory() for _ in range(shards)]
+
+    @property
+    def shard_count(self) -> int:
+        """Number of shards."""
+        return len(self._shards)
+
+    def shard_of(self, case_id: str) -> int:
+        """Return the index of the shard holding case_id."""
+        return zlib.crc32(case_id.encode()) % len(self._shards)
+
+    def lock(self, case_id: str) -> asyncio.Lock:
+        """Return the lock of the shard holding case_id.
+
+        Args:
+            case_id: The case about to be updated.
+
+        Returns:
+            The shard's lock, to hold across the read and the save.
+        """
+        return self._locks[self.shard_of(case_id)]
+
+    async def get_by_id(self, case_id: str) -> Optional[Case]:
+        """Retrieve a case by ID from its shard.
+
+        Args:
+            case_id: The unique identifier of the case.
+
+        Returns:
+            The Case if found, otherwise None.
+        """
+        return await self._shards[self.shard_of(case_id)].get_by_id(case_id)
+
+    async def get_many(self, case_ids: Sequence[str]) -> dict[str, Case]:
+        """Retrieve several cases with one lookup per shard involved.
+
+        Args:
+            case_ids: Ids to look up.
+
+        Returns:
+            Found cases keyed by id; missing ids are absent.
+        """
+        grouped: dict[int, list[str]] = {}
+        for case_id in case_ids:
+            grouped.setdefault(self.shard_of(case_id), []).append(case_id)
+        found: dict[str, Case] = {}
+        for index, ids in grouped.items():
+            found.update(await self._shards[index].get_many(ids))
+        return found
+
+    async def save(self, case: Case) -> None:
+        """Persist a case to its shard and publish it.
+
+        Args:
+            case: The Case model to save.
+        """
+        await self._shards[self.shard_of(case.id)].save(case)
+        if self.change_feed is not None:
+            self.change_feed.publish(case)
+
+    def seed(self, cases: list[Case]) -> None:
+        """Pre-populate the shards with seed data.
+
+        Args:
+            cases: List of Case models to distribute across shards.
+        """
+        grouped: dict[int, list[Case]] = {}
+        for case in cases:
+            grouped.setdefault(self.shard_of(case.id), []).append(case)
+        for index, shard_cases in grouped.items():
+            self._shards[index].seed(shard_cases)
+
+    async def search(
+        self,
+        referrer_id: str | None = None,
+        expert_id: str | None = None,
+        limit: int = 50,
+    ) -> list[Case]:
+        """Find cases by exact or trailing-``*`` prefix patterns.
+
+        Each shard's index walk is consumed lazily and the walks are merged
+        on the driving field, so at most ``limit`` hits plus one lookahead
+        per shard are materialized.
+
+        Args:
+            referrer_id: Pattern for referrer_id, e.g. ``"ref-1*"``.
+            expert_id: Pattern for expert_id.
+            limit: Maximum number of cases to return.
+
+        Returns:
+            Matching cases ordered by the driving field's value.
+        """
+        return list(islice(self.scan(referrer_id, expert_id), limit))
+
+    def scan(
+        self, referrer_id: str | None = None, expert_id: str | None = None
+    ) -> Iterator[Case]:
+        """Lazily yield matching cases from all shards in search() order.
+
+        Args:
+            referrer_id: Pattern for referrer_id.
+            expert_id: Pattern for expert_id.
+
+        Returns:
+            An iterator over matching cases.
+        """
+        streams = [shard.scan(referrer_id, expert_id) for shard in self._shards]
+        if referrer_id is not None:
+            return heapq.merge(*streams, key=attrgetter("referrer_id"))
+        if expert_id is not None:
+            return heapq.merge(*streams, key=attrgetter("expert_id"))
+        return chain.from_iterable(streams)
+
+    async def stats(self) -> CaseStatistics:
+        """Return the statistics summed over all shards."""
+        return merge_statistics([await shard.stats() for shard in self._shards])
+
+    async def rebuild_stats(self) -> CaseStatistics:
+        """Recompute every shard's statistics with a full scan.
+
+        Returns:
+            The freshly computed statistics summed over all shards.
+        """
+        return merge_statistics([await shard.rebuild_stats() for shard in self._shards])
+
+    async def page_by_id(self, after: str | None, limit: int) -> list[Case]:
+        """Merge every shard's page of ids after ``after``; see InMemoryCaseRepository."""
+        pages = [await shard.page_by_id(after, limit) for shard in self._shards]
+        return list(islice(heapq.merge(*pages, key=attrgetter("id")), limit))
+
+    async def with_deadlines(self) -> list[Case]:
+        """Return the cases that have a deadline, from every shard."""
+        return [case for shard in self._shards for case in await shard.with_deadlines()]
@@ -0,0 +1,164 @@
+"""SLA deadlines of open cases: scheduling, escalation and overdue queries."""
+
+import math
+import time
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta
+from typing import Callable, Mapping, Protocol, Sequence
+
+from models import UTC, Case, CaseEscalation, CaseStatus
+from utils.metrics import MetricsRegistry
+from utils.timer_wheel import TimerWheel
+
+
+class EscalationListener(Protocol):
+    """Notified when a case misses its deadline.
+
+    Implementations must return quickly — schedule work, don't perform it.
+    """
+
+    def on_escalated(self, escalation: CaseEscalation) -> None: ...
+
+
+class SlaPolicy:
+    """How long a case may stay in each status before it is escalated."""
+
+    def __init__(self, turnaround: Mapping[CaseStatus, timedelta]) -> None:
+        """Create a policy.
+
+        Args:
+            turnaround: Allowed time per status; statuses not listed, or
+                listed with a non-positive time, have no deadline.
+        """
+        self.turnaround = {
+            status: allowed for status, allowed in turnaround.items() if allowed > timedelta(0)
+        }
+
+    def due_at(self, status: CaseStatus, since: datetime) -> datetime | None:
+        """Deadline of a case that entered status at since, if it has one."""
+        allowed = self.turnaround.get(status)
+        return None if allowed is None else since + allowed
+
+
+class SlaTracker:
+    """Tracks the deadlines of open cases and escalates the missed ones.
+
+    Satisfies the DeadlineScheduler protocol of services.case_service.
+    Pending deadlines sit on a TimerWheel with ``tick_seconds`` resolution,
+    so scheduling, rescheduling and each tick cost O(1) however many cases
+    are open. A case that reaches its deadline is counted in
+    ``sla_escalations_total``, passed to the listeners and added to the
+    overdue index: a list of (due_at, case id) kept sorted by deadline, so
+    the most overdue cases are read from its head. The index only holds
+    escalated cases, each until its next reschedule.
+    """
+
+    def __init__(
+        self,
+        policy: SlaPolicy,
+        metrics: MetricsRegistry,
+        tick_seconds: float = 1.0,
+        listeners: Sequence[EscalationListener] = (),
+        clock: Callable[[], float] = time.time,
+        labels: Mapping[str, str] | None = None,
+    ) -> None:
+        """Create a tracker with no deadlines.
+
+        Args:
+            policy: Turnaround allowed per status.
+            metrics: Registry the escalation counter and gauges report into.
+            tick_seconds: Resolution of the wheel; deadlines fire up to one
+                tick late.
+            listeners: Receive every escalation.
+            clock: Returns the current Unix time.
+            labels: Extra labels on the tracker's metrics, e.g. the tenant.
+        """
+        self.policy = policy
+        self.tick_seconds = tick_seconds
+        self._listeners = listeners
+        self._clock = clock
+        self._labels = dict(labels or {})
+        self._wheel = TimerWheel(self._tick(clock()))
+        self._pending: dict[str, tuple[datetime, CaseStatus]] = {}
+        self._overdue: list[tuple[datetime, str]] = []
+        self._overdue_since: dict[str, datetime] = {}
+        self._escalations = metrics.counter(
+            "sla_escalations_total", "Cases escalated for missing their SLA deadline"
+        )
+        metrics.gauge("sla_pending", "Open cases with a pending SLA deadline").set_function(
+            lambda: float(len(self._pending)), **self._labels
+        )
+        metrics.gauge("sla_overdue", "Cases past their SLA deadline").set_function(
+            lambda: float(len(self._overdue)), **self._labels
+        )
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def due_at(self, status: CaseStatus, since: datetime) -> datetime | None:
+        """Deadline for a case entering status at since; see SlaPolicy."""
+        return self.policy.due_at(status, since)
+
+    def schedule(self, case: Case) -> None:
+        """Track case's current deadline, replacing any earlier one.
+
+        A case without a deadline stops being tracked and leaves the
+        overdue index. A deadline already past escalates on the next tick.
+
+        Args:
+            case: The case as just saved.
+        """
+        self._forget(case.id)
+        if case.due_at is None:
+            return
+        self._pending[case.id] = (case.due_at, case.status)
+        self._wheel.schedule(case.id, math.ceil(case.due_at.timestamp() / self.tick_seconds))
+
+    def advance(self, now: float | None = None) -> list[CaseEscalation]:
+        """Escalate every case whose deadline has passed.
+
+        Args:
+            now: Unix time to advance to; defaults to the clock.
+
+        Returns:
+            The new escalations, earliest deadline first.
+        """
+        now = self._clock() if now is None else now
+        fired = self._wheel.advance(self._tick(now))
+        if not fired:
+            return []
+        escalated_at = datetime.fromtimestamp(now, UTC)
+        escalations = []
+        for case_id, _ in fired:
+            due_at, status = self._pending.pop(case_id)
+            insort(self._overdue, (due_at, case_id))
+            self._overdue_since[case_id] = due_at
+            escalation = CaseEscalation(
+                case_id=case_id, status=status, due_at=due_at, escalated_at=escalated_at
+            )
+            escalations.append(escalation)
+            self._escalations.inc(status=status.value, **self._labels)
+            for listener in self._listeners:
+                listener.on_escalated(escalation)
+        return escalations
+
+    def overdue(self, limit: int) -> list[str]:
+        """Ids of escalated cases, earliest deadline first.
+
+        Args:
+            limit: Maximum number of ids.
+
+        Returns:
+            Up to limit case ids.
+        """
+        return [case_id for _, case_id in self._overdue[:limit]]
+
+    def _forget(self, case_id: str) -> None:
+        if self._wheel.cancel(case_id):
+            del self._pending[case_id]
+        due_at = self._overdue_since.pop(case_id, None)
+        if due_at is not None:
+            del self._overdue[bisect_left(self._overdue, (due_at, case_id))]
+
+    def _tick(self, now: float) -> int:
+        return math.floor(now / self.tick_seconds)
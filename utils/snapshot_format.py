@@ -0,0 +1,294 @@
+"""Binary case snapshot format: the writer and a memory-mapped reader.
+
+File layout, little-endian, format version 2:
+
+    header          magic, version, record, expert-record and deadline
+                    counts, and the byte offset of every following section
+    records         fixed-width records in input order: (offset, length) of
+                    id, referrer_id and expert_id in the string table, the
+                    status, and created_at and due_at in microseconds
+                    since the epoch
+    id index        u32 record numbers sorted by id
+    referrer index  u32 record numbers sorted by referrer_id
+    expert index    u32 record numbers sorted by expert_id, for records
+                    that have one
+    deadline index  u32 record numbers of the records with a due_at
+    strings         UTF-8 string table; repeated values are stored once
+    stats           CaseStatistics of the snapshot's cases, as JSON
+
+Opening a snapshot maps the file and reads the header and statistics;
+nothing else is decoded. Lookups binary-search the mapped indexes and
+unpack single records in place, so opening costs the same for ten cases or
+ten million. UTF-8 byte order equals code point order, so the indexes sort
+exactly as Python strings do. Every section before the string table is a
+whole number of u32 words, read in place through one memoryview, so only
+little-endian hosts can open snapshots.
+"""
+
+import mmap
+import os
+import struct
+import sys
+from datetime import datetime, timedelta
+from typing import Iterable, Iterator
+
+from exceptions import ValidationError
+from models import UTC, Case, CaseStatistics, CaseStatus
+from utils.case_stats import CaseStatsCounter
+
+_MAGIC = b"MEDSNAP\x00"
+_VERSION = 2
+# magic, version, record count, expert record count, deadline count, then
+# the offsets of records, id index, referrer index, expert index, deadline
+# index, strings, stats and the stats length.
+_HEADER = struct.Struct("<8sIIII8Q")
+# Six string (offset, length) words, the status word, created_at and due_at
+# micros.
+_RECORD = struct.Struct("<IIIIIIIqq")
+_RECORD_WORDS = _RECORD.size // 4
+_NO_STRING = 0xFFFFFFFF
+_NO_DEADLINE = -(1 << 63)
+# Status codes are positions in this tuple; reordering CaseStatus needs a
+# new format version.
+_STATUSES = tuple(CaseStatus)
+_STATUS_CODES = {status: code for code, status in enumerate(_STATUSES)}
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_ONE_MICRO = timedelta(microseconds=1)
+
+_ID, _REFERRER, _EXPERT = 0, 1, 2
+
+
+def write_snapshot(path: str, cases: Iterable[Case]) -> int:
+    """Write cases to a snapshot file, replacing it atomically.
+
+    Later cases replace earlier ones with the same id.
+
+    Args:
+        path: Destination file.
+        cases: Cases to store, e.g. ``repo.scan()`` of a running store.
+
+    Returns:
+        The number of cases written.
+    """
+    unique = list({case.id: case for case in cases}.values())
+    table = bytearray()
+    interned: dict[str, tuple[int, int]] = {}
+
+    def intern(value: str | None) -> tuple[int, int]:
+        if value is None:
+            return 0, _NO_STRING
+        ref = interned.get(value)
+        if ref is None:
+            raw = value.encode()
+            ref = interned[value] = (len(table), len(raw))
+            table.extend(raw)
+        return ref
+
+    records = bytearray()
+    stats = CaseStatsCounter()
+    for case in unique:
+        micros = (case.created_at - _EPOCH) // _ONE_MICRO
+        due = _NO_DEADLINE if case.due_at is None else (case.due_at - _EPOCH) // _ONE_MICRO
+        records += _RECORD.pack(
+            *intern(case.id), *intern(case.referrer_id), *intern(case.expert_id),
+            _STATUS_CODES[case.status], micros, due,
+        )
+        stats.apply(case)
+
+    count = len(unique)
+    by_id = sorted(range(count), key=lambda n: unique[n].id)
+    by_referrer = sorted(range(count), key=lambda n: unique[n].referrer_id)
+    by_expert = sorted(
+        (n for n in range(count) if unique[n].expert_id is not None),
+        key=lambda n: unique[n].expert_id,
+    )
+    with_deadline = [n for n in range(count) if unique[n].due_at is not None]
+    stats_json = stats.snapshot().model_dump_json().encode()
+
+    sections = [
+        bytes(records),
+        struct.pack(f"<{count}I", *by_id),
+        struct.pack(f"<{count}I", *by_referrer),
+        struct.pack(f"<{len(by_expert)}I", *by_expert),
+        struct.pack(f"<{len(with_deadline)}I", *with_deadline),
+        bytes(table),
+        stats_json,
+    ]
+    offsets, position = [], _HEADER.size
+    for section in sections:
+        offsets.append(position)
+        position += len(section)
+    header = _HEADER.pack(
+        _MAGIC, _VERSION, count, len(by_expert), len(with_deadline), *offsets,
+        len(stats_json),
+    )
+
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as file:
+        file.write(header)
+        for section in sections:
+            file.write(section)
+    os.replace(tmp, path)
+    return count
+
+
+class SnapshotFile:
+    """Read access to a mapped snapshot; a missing or empty file is empty."""
+
+    def __init__(self, path: str) -> None:
+        """Map a snapshot file.
+
+        Args:
+            path: Snapshot written by write_snapshot().
+
+        Raises:
+            ValidationError: If the file is not a snapshot of this version.
+        """
+        self._file = None
+        self._map: mmap.mmap | bytes = b""
+        self._words = memoryview(b"").cast("I")
+        self._count = self._expert_count = self._deadline_count = 0
+        self._records = self._id_index = self._referrer_index = 0
+        self._expert_index = self._deadline_index = self._strings = 0
+        self.stats = CaseStatsCounter().snapshot()
+        if os.path.exists(path) and os.path.getsize(path):
+            self._open(path)
+
+    def _open(self, path: str) -> None:
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._map) < _HEADER.size:
+            self.close()
+            raise ValidationError(f"'{path}' is not a case snapshot")
+        (
+            magic, version, self._count, self._expert_count, self._deadline_count,
+            self._records, self._id_index, self._referrer_index, self._expert_index,
+            self._deadline_index, self._strings, stats_offset, stats_length,
+        ) = _HEADER.unpack_from(self._map)
+        if magic != _MAGIC or version != _VERSION:
+            self.close()
+            raise ValidationError(f"'{path}' is not a version {_VERSION} case snapshot")
+        if sys.byteorder != "little":
+            self.close()
+            raise ValidationError("Case snapshots can only be opened on little-endian hosts")
+        # Word addresses: every u32 section is read through self._words.
+        self._words = memoryview(self._map)[:self._strings].cast("I")
+        self._records //= 4
+        self._id_index //= 4
+        self._referrer_index //= 4
+        self._expert_index //= 4
+        self._deadline_index //= 4
+        self.stats = CaseStatistics.model_validate_json(
+            self._map[stats_offset:stats_offset + stats_length]
+        )
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[Case]:
+        """Decode every case in file order."""
+        return map(self.decode, range(self._count))
+
+    def close(self) -> None:
+        """Unmap the snapshot file."""
+        if self._file is not None:
+            self._words.release()
+            self._map.close()
+            self._file.close()
+            self._map, self._file = b"", None
+
+    def with_deadlines(self) -> Iterator[Case]:
+        """Decode the cases that have a deadline, from the deadline index."""
+        index = self._deadline_index
+        return (self.decode(self._words[index + n]) for n in range(self._deadline_count))
+
+    def find(self, case_id: str) -> int | None:
+        """Return the record number of case_id, if present."""
+        key = case_id.encode()
+        position = self._lower_bound(self._id_index, self._count, _ID, key)
+        if position == self._count:
+            return None
+        record = self._words[self._id_index + position]
+        return record if self._string(record, _ID) == key else None
+
+    def get(self, case_id: str) -> Case | None:
+        """Decode the case with the given id, if present."""
+        record = self.find(case_id)
+        return None if record is None else self.decode(record)
+
+    def walk(self, field: str, literal: str, is_prefix: bool) -> Iterator[Case]:
+        """Yield cases whose referrer_id or expert_id matches, in value order.
+
+        Args:
+            field: ``"referrer_id"`` or ``"expert_id"``.
+            literal: Value, or value prefix, to match.
+            is_prefix: Whether literal is a prefix.
+
+        Returns:
+            An iterator over the matching cases.
+        """
+        if field == "referrer_id":
+            index, length, column = self._referrer_index, self._count, _REFERRER
+        else:
+            index, length, column = self._expert_index, self._expert_count, _EXPERT
+        key = literal.encode()
+        position = self._lower_bound(index, length, column, key)
+        while position < length:
+            record = self._words[index + position]
+            value = self._string(record, column)
+            if not (value.startswith(key) if is_prefix else value == key):
+                return
+            yield self.decode(record)
+            position += 1
+
+    def walk_ids(self, after: str | None) -> Iterator[Case]:
+        """Yield cases in id order, starting after the id given, if any."""
+        # The first id >= after + NUL is the first id > after.
+        key = b"" if after is None else after.encode() + b"\x00"
+        position = self._lower_bound(self._id_index, self._count, _ID, key)
+        for n in range(position, self._count):
+            yield self.decode(self._words[self._id_index + n])
+
+    def decode(self, record: int) -> Case:
+        """Build the Case stored in a record."""
+        (
+            id_offset, id_length, referrer_offset, referrer_length,
+            expert_offset, expert_length, status, micros, due,
+        ) = _RECORD.unpack_from(self._map, 4 * (self._records + record * _RECORD_WORDS))
+        data, strings = self._map, self._strings
+        expert_id = None
+        if expert_length != _NO_STRING:
+            start = strings + expert_offset
+            expert_id = data[start:start + expert_length].decode()
+        start = strings + id_offset
+        case_id = data[start:start + id_length].decode()
+        start = strings + referrer_offset
+        return Case(
+            id=case_id,
+            referrer_id=data[start:start + referrer_length].decode(),
+            expert_id=expert_id,
+            status=_STATUSES[status],
+            created_at=_EPOCH + timedelta(microseconds=micros),
+            due_at=None if due == _NO_DEADLINE else _EPOCH + timedelta(microseconds=due),
+        )
+
+    def _lower_bound(self, index: int, length: int, column: int, key: bytes) -> int:
+        """First position in a mapped index whose column value is >= key."""
+        # _string() inlined: the loop body runs log2(n) times per lookup.
+        words, data, strings = self._words, self._map, self._strings
+        first_word = self._records + 2 * column
+        low, high = 0, length
+        while low < high:
+            middle = (low + high) // 2
+            word = first_word + words[index + middle] * _RECORD_WORDS
+            start = strings + words[word]
+            if data[start:start + words[word + 1]] < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _string(self, record: int, column: int) -> bytes:
+        word = self._records + record * _RECORD_WORDS + 2 * column
+        start = self._strings + self._words[word]
+        return self._map[start:start + self._words[word + 1]]
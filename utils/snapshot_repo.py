@@ -0,0 +1,261 @@
+"""Case repository serving a memory-mapped snapshot plus an in-memory overlay."""
+
+import asyncio
+import bisect
+import heapq
+from collections import Counter
+from itertools import islice
+from operator import attrgetter
+from typing import Iterator, Optional, Sequence
+
+from models import Case, CaseStatistics, CaseStatus
+from utils.case_stats import CaseStatsCounter
+from utils.change_feed import ChangeFeed
+from utils.prefix_index import parse_pattern
+from utils.snapshot_format import SnapshotFile
+
+
+def _matches(value: str | None, literal: str, is_prefix: bool) -> bool:
+    if value is None:
+        return False
+    return value.startswith(literal) if is_prefix else value == literal
+
+
+def _offset_statistics(
+    base: CaseStatistics, minus: CaseStatistics, plus: CaseStatistics
+) -> CaseStatistics:
+    """Return base - minus + plus, dropping keys whose count reaches zero."""
+    def combine(field: str) -> dict:
+        counts = Counter(getattr(base, field))
+        counts.subtract(getattr(minus, field))
+        counts.update(getattr(plus, field))
+        return {key: n for key, n in sorted(counts.items()) if n}
+
+    return CaseStatistics(
+        total=base.total - minus.total + plus.total,
+        by_status={
+            status: base.by_status.get(status, 0) - minus.by_status.get(status, 0)
+            + plus.by_status.get(status, 0)
+            for status in CaseStatus
+        },
+        by_expert=combine("by_expert"),
+        by_day=combine("by_day"),
+    )
+
+
+class SnapshotCaseRepository:
+    """CaseRepository serving a memory-mapped snapshot plus a write overlay.
+
+    Satisfies the CaseRepository protocol defined in services.case_service.
+    The snapshot file is never modified: saves and seeds go to an overlay
+    dict that shadows snapshot records with the same id, and
+    write_snapshot(path, repo.scan()) folds the overlay into a new file.
+    Searches merge a walk of the mapped referrer or expert index with the
+    matching overlay cases. Statistics are the snapshot's stored aggregates
+    adjusted by the overlay, so they too need no scan on open. A single
+    store-wide lock serializes read-modify-write sequences.
+    """
+
+    def __init__(self, path: str, change_feed: ChangeFeed | None = None) -> None:
+        """Map a snapshot file.
+
+        Args:
+            path: Snapshot written by write_snapshot(); a missing or empty
+                file opens as an empty store.
+            change_feed: Feed that saves are published to, if any.
+
+        Raises:
+            ValidationError: If the file is not a snapshot of this version.
+        """
+        self.change_feed = change_feed
+        self._snapshot = SnapshotFile(path)
+        self._lock = asyncio.Lock()
+        self._overlay: dict[str, Case] = {}
+        # Overlay ids that replace a snapshot record, as opposed to new ids.
+        self._shadowing: set[str] = set()
+        # Overlay ids new to the store, sorted for paging by id.
+        self._new_ids: list[str] = []
+        self._base_stats = self._snapshot.stats
+        self._shadowed_stats = CaseStatsCounter()
+        self._overlay_stats = CaseStatsCounter()
+        self._stats: CaseStatistics | None = None
+
+    def close(self) -> None:
+        """Unmap the snapshot file."""
+        self._snapshot.close()
+
+    def lock(self, case_id: str) -> asyncio.Lock:
+        """Return the store-wide read-modify-write lock."""
+        return self._lock
+
+    async def get_by_id(self, case_id: str) -> Optional[Case]:
+        """Retrieve a case from the overlay, else from the snapshot.
+
+        Args:
+            case_id: The unique identifier of the case.
+
+        Returns:
+            The Case if found, otherwise None.
+        """
+        return self._get(case_id)
+
+    async def get_many(self, case_ids: Sequence[str]) -> dict[str, Case]:
+        """Retrieve several cases, one binary search per overlay miss.
+
+        Args:
+            case_ids: Ids to look up.
+
+        Returns:
+            Found cases keyed by id; missing ids are absent.
+        """
+        return {i: case for i in case_ids if (case := self._get(i)) is not None}
+
+    async def save(self, case: Case) -> None:
+        """Write a case to the overlay, then update statistics and publish it.
+
+        Args:
+            case: The Case model to save.
+        """
+        self._write(case)
+        if self.change_feed is not None:
+            self.change_feed.publish(case)
+
+    def seed(self, cases: list[Case]) -> None:
+        """Add cases to the overlay.
+
+        Args:
+            cases: List of Case models to store.
+        """
+        for case in cases:
+            self._write(case)
+
+    async def search(
+        self,
+        referrer_id: str | None = None,
+        expert_id: str | None = None,
+        limit: int = 50,
+    ) -> list[Case]:
+        """Find cases by exact or trailing-``*`` prefix patterns.
+
+        Args:
+            referrer_id: Pattern for referrer_id, e.g. ``"ref-1*"``.
+            expert_id: Pattern for expert_id.
+            limit: Maximum number of cases to return.
+
+        Returns:
+            Matching cases ordered by the driving field's value.
+        """
+        return list(islice(self.scan(referrer_id, expert_id), limit))
+
+    def scan(
+        self, referrer_id: str | None = None, expert_id: str | None = None
+    ) -> Iterator[Case]:
+        """Lazily yield current cases matching the patterns, as search() orders them.
+
+        Without patterns every case is yielded: snapshot records in file
+        order, overlaid ones replaced, then cases that exist only in the
+        overlay.
+
+        Args:
+            referrer_id: Pattern for referrer_id.
+            expert_id: Pattern for expert_id.
+
+        Returns:
+            An iterator over matching cases.
+        """
+        if referrer_id is not None:
+            field, pattern, other_field, other = "referrer_id", referrer_id, "expert_id", expert_id
+        elif expert_id is not None:
+            field, pattern, other_field, other = "expert_id", expert_id, "", None
+        else:
+            return self._all()
+        literal, is_prefix = parse_pattern(pattern)
+        overlay = sorted(
+            (c for c in self._overlay.values()
+             if _matches(getattr(c, field), literal, is_prefix)),
+            key=attrgetter(field),
+        )
+        base = (
+            c for c in self._snapshot.walk(field, literal, is_prefix)
+            if c.id not in self._overlay
+        )
+        cases = heapq.merge(base, overlay, key=attrgetter(field))
+        if other is None:
+            return cases
+        other_literal, other_prefix = parse_pattern(other)
+        return (
+            c for c in cases if _matches(getattr(c, other_field), other_literal, other_prefix)
+        )
+
+    async def stats(self) -> CaseStatistics:
+        """Return the snapshot's statistics adjusted by the overlay."""
+        if self._stats is None:
+            self._stats = _offset_statistics(
+                self._base_stats,
+                self._shadowed_stats.snapshot(),
+                self._overlay_stats.snapshot(),
+            )
+        return self._stats
+
+    async def rebuild_stats(self) -> CaseStatistics:
+        """Recompute the statistics with a full scan of snapshot and overlay.
+
+        Returns:
+            The freshly computed statistics.
+        """
+        base = CaseStatsCounter()
+        base.rebuild(self._snapshot)
+        self._base_stats = base.snapshot()
+        self._shadowed_stats.rebuild(self._snapshot.get(i) for i in self._shadowing)
+        self._overlay_stats.rebuild(self._overlay.values())
+        self._stats = None
+        return await self.stats()
+
+    async def page_by_id(self, after: str | None, limit: int) -> list[Case]:
+        """Return up to limit cases with ids after ``after``, in id order.
+
+        Walks the mapped id index, with overlaid records replaced, merged
+        with the sorted ids that exist only in the overlay.
+        """
+        overlay = self._overlay
+        base = (overlay.get(c.id, c) for c in self._snapshot.walk_ids(after))
+        start = 0 if after is None else bisect.bisect_right(self._new_ids, after)
+        new = (overlay[case_id] for case_id in self._new_ids[start:start + limit])
+        return list(islice(heapq.merge(base, new, key=attrgetter("id")), limit))
+
+    async def with_deadlines(self) -> list[Case]:
+        """Return the cases that have a deadline.
+
+        Reads the snapshot's deadline index, skipping records the overlay
+        replaces, then adds the overlay's cases with a deadline.
+        """
+        overlay = self._overlay
+        cases = [c for c in self._snapshot.with_deadlines() if c.id not in overlay]
+        cases.extend(c for c in overlay.values() if c.due_at is not None)
+        return cases
+
+    def _get(self, case_id: str) -> Case | None:
+        case = self._overlay.get(case_id)
+        if case is not None:
+            return case
+        return self._snapshot.get(case_id)
+
+    def _write(self, case: Case) -> None:
+        if case.id not in self._overlay:
+            shadowed = self._snapshot.get(case.id)
+            if shadowed is not None:
+                self._shadowing.add(case.id)
+                self._shadowed_stats.apply(shadowed)
+            else:
+                bisect.insort(self._new_ids, case.id)
+        self._overlay[case.id] = case
+        self._overlay_stats.apply(case)
+        self._stats = None
+
+    def _all(self) -> Iterator[Case]:
+        overlay = self._overlay
+        for case in self._snapshot:
+            yield overlay.get(case.id, case)
+        for case_id, case in list(overlay.items()):
+            if case_id not in self._shadowing:
+                yield case
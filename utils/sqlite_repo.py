@@ -0,0 +1,266 @@
+"""Durable case repository in a SQLite file."""
+
+import asyncio
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from typing import Optional, Sequence
+
+from models import UTC, Case, CaseStatistics, CaseStatus
+from utils.change_feed import ChangeFeed
+from utils.prefix_index import parse_pattern
+
+_COLUMNS = "id, referrer_id, expert_id, status, created_at, due_at"
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_ONE_MICRO = timedelta(microseconds=1)
+_DAY_MICROS = timedelta(days=1) // _ONE_MICRO
+# Sorts after every valid UTF-8 string, closing a prefix range.
+_MAX_CHAR = "\U0010ffff"
+
+
+def _micros(moment: datetime) -> int:
+    return (moment - _EPOCH) // _ONE_MICRO
+
+
+def _to_row(case: Case) -> tuple:
+    due = None if case.due_at is None else _micros(case.due_at)
+    return (
+        case.id, case.referrer_id, case.expert_id, case.status.value,
+        _micros(case.created_at), due,
+    )
+
+
+def _from_row(row: tuple) -> Case:
+    return Case(
+        id=row[0],
+        referrer_id=row[1],
+        expert_id=row[2],
+        status=CaseStatus(row[3]),
+        created_at=_EPOCH + timedelta(microseconds=row[4]),
+        due_at=None if row[5] is None else _EPOCH + timedelta(microseconds=row[5]),
+    )
+
+
+def _pattern_clause(column: str, pattern: str) -> tuple[str, list[str]]:
+    literal, is_prefix = parse_pattern(pattern)
+    if is_prefix:
+        return f"{column} >= ? AND {column} < ?", [literal, literal + _MAX_CHAR]
+    return f"{column} = ?", [literal]
+
+
+class SQLiteCaseRepository:
+    """CaseRepository backed by a SQLite database, queried off the event loop.
+
+    Satisfies the CaseRepository protocol defined in services.case_service.
+    Prefix searches are index range scans that stop at the limit; get_many
+    is a single ``IN`` query. Saves are upserts, so a case keeps its rowid
+    and its position among equal search keys. Statistics are ``GROUP BY``
+    queries run on first read and cached until the next write, so opening a
+    large database reads nothing. One lock serializes read-modify-write
+    sequences, matching SQLite's single writer.
+    """
+
+    def __init__(self, path: str, change_feed: ChangeFeed | None = None) -> None:
+        self.change_feed = change_feed
+        self._lock = asyncio.Lock()
+        self._db_lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cases ("
+            " id TEXT PRIMARY KEY, referrer_id TEXT NOT NULL, expert_id TEXT,"
+            " status TEXT NOT NULL, created_at INTEGER NOT NULL, due_at INTEGER)"
+        )
+        # Entries of a one-column index are ordered by rowid within a value,
+        # which serves ORDER BY field, rowid without sorting the matches.
+        self._conn.execute("CREATE INDEX IF NOT EXISTS cases_by_referrer ON cases (referrer_id)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS cases_by_expert ON cases (expert_id)")
+        # Only open cases have a deadline; a partial index holds just those.
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS cases_by_due_at ON cases (due_at)"
+            " WHERE due_at IS NOT NULL"
+        )
+        self._conn.commit()
+        self._stats: CaseStatistics | None = None
+        self._writes = 0
+
+    def lock(self, case_id: str) -> asyncio.Lock:
+        """Return the database-wide read-modify-write lock."""
+        return self._lock
+
+    async def get_by_id(self, case_id: str) -> Optional[Case]:
+        """Retrieve a case by ID.
+
+        Args:
+            case_id: The unique identifier of the case.
+
+        Returns:
+            The Case if found, otherwise None.
+        """
+        rows = await asyncio.to_thread(
+            self._query, f"SELECT {_COLUMNS} FROM cases WHERE id = ?", (case_id,)
+        )
+        return _from_row(rows[0]) if rows else None
+
+    async def get_many(self, case_ids: Sequence[str]) -> dict[str, Case]:
+        """Retrieve several cases with one ``IN`` query.
+
+        Args:
+            case_ids: Ids to look up.
+
+        Returns:
+            Found cases keyed by id; missing ids are absent.
+        """
+        if not case_ids:
+            return {}
+        marks = ",".join("?" * len(case_ids))
+        rows = await asyncio.to_thread(
+            self._query, f"SELECT {_COLUMNS} FROM cases WHERE id IN ({marks})",
+            tuple(case_ids),
+        )
+        return {row[0]: _from_row(row) for row in rows}
+
+    async def save(self, case: Case) -> None:
+        """Insert or update a case, then update statistics and publish it.
+
+        Args:
+            case: The Case model to save.
+        """
+        await asyncio.to_thread(self._write, [_to_row(case)])
+        self._changed()
+        if self.change_feed is not None:
+            self.change_feed.publish(case)
+
+    def seed(self, cases: list[Case]) -> None:
+        """Insert many cases in one transaction, keeping any already stored.
+
+        Seeding a database that outlived its process leaves its cases as
+        they were saved.
+
+        Args:
+            cases: List of Case models to store.
+        """
+        self._insert_new([_to_row(case) for case in cases])
+        self._changed()
+
+    async def search(
+        self,
+        referrer_id: str | None = None,
+        expert_id: str | None = None,
+        limit: int = 50,
+    ) -> list[Case]:
+        """Find cases by exact or trailing-``*`` prefix patterns.
+
+        Args:
+            referrer_id: Pattern for referrer_id, e.g. ``"ref-1*"``.
+            expert_id: Pattern for expert_id.
+            limit: Maximum number of cases to return.
+
+        Returns:
+            Matching cases ordered by the driving field's value.
+        """
+        clauses, params, order = [], [], "rowid"
+        if expert_id is not None:
+            clause, values = _pattern_clause("expert_id", expert_id)
+            clauses.append(clause)
+            params += values
+            order = "expert_id, rowid"
+        if referrer_id is not None:
+            clause, values = _pattern_clause("referrer_id", referrer_id)
+            clauses.append(clause)
+            params += values
+            order = "referrer_id, rowid"
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = await asyncio.to_thread(
+            self._query,
+            f"SELECT {_COLUMNS} FROM cases{where} ORDER BY {order} LIMIT ?",
+            (*params, limit),
+        )
+        return [_from_row(row) for row in rows]
+
+    async def stats(self) -> CaseStatistics:
+        """Return the case statistics, cached until the next write."""
+        if self._stats is None:
+            return await self.rebuild_stats()
+        return self._stats
+
+    async def rebuild_stats(self) -> CaseStatistics:
+        """Recompute the statistics with ``GROUP BY`` queries off the event loop.
+
+        Returns:
+            The freshly computed statistics.
+        """
+        writes = self._writes
+        stats = await asyncio.to_thread(self._count)
+        if writes == self._writes:
+            self._stats = stats
+        return stats
+
+    async def page_by_id(self, after: str | None, limit: int) -> list[Case]:
+        """Return up to limit cases with ids after ``after``, along the primary key."""
+        where, params = ("", ()) if after is None else (" WHERE id > ?", (after,))
+        rows = await asyncio.to_thread(
+            self._query,
+            f"SELECT {_COLUMNS} FROM cases{where} ORDER BY id LIMIT ?",
+            (*params, limit),
+        )
+        return [_from_row(row) for row in rows]
+
+    async def with_deadlines(self) -> list[Case]:
+        """Return the cases that have a deadline, through the partial due_at index."""
+        rows = await asyncio.to_thread(
+            self._query, f"SELECT {_COLUMNS} FROM cases WHERE due_at IS NOT NULL", ()
+        )
+        return [_from_row(row) for row in rows]
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._db_lock:
+            self._conn.close()
+
+    def _changed(self) -> None:
+        self._writes += 1
+        self._stats = None
+
+    def _count(self) -> CaseStatistics:
+        by_status = dict(self._query("SELECT status, count(*) FROM cases GROUP BY status", ()))
+        by_expert = self._query(
+            "SELECT expert_id, count(*) FROM cases WHERE expert_id IS NOT NULL"
+            " GROUP BY expert_id ORDER BY expert_id", (),
+        )
+        # Floor division in integers: date() would round to milliseconds.
+        by_day = self._query(
+            "SELECT (created_at - ((created_at % ?1) + ?1) % ?1) / ?1 AS day, count(*)"
+            " FROM cases GROUP BY day ORDER BY day", (_DAY_MICROS,),
+        )
+        return CaseStatistics(
+            total=sum(by_status.values()),
+            by_status={status: by_status.get(status.value, 0) for status in CaseStatus},
+            by_expert=dict(by_expert),
+            by_day={_EPOCH.date() + timedelta(days=day): count for day, count in by_day},
+        )
+
+    def _query(self, sql: str, params: tuple) -> list[tuple]:
+        with self._db_lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def _write(self, rows: list[tuple]) -> None:
+        with self._db_lock:
+            self._conn.executemany(
+                f"INSERT INTO cases ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT (id) DO UPDATE SET referrer_id = excluded.referrer_id,"
+                " expert_id = excluded.expert_id, status = excluded.status,"
+                " created_at = excluded.created_at, due_at = excluded.due_at",
+                rows,
+            )
+            self._conn.commit()
+
+    def _insert_new(self, rows: list[tuple]) -> None:
+        with self._db_lock:
+            self._conn.executemany(
+                f"INSERT INTO cases ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT (id) DO NOTHING",
+                rows,
+            )
+            self._conn.commit()
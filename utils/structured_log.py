@@ -0,0 +1,184 @@
+"""JSON-lines log files written off the event loop.
+
+A StructuredLog is a stdlib Logger whose only handler is a QueueHandler:
+logging a record costs one LogRecord and one non-blocking queue put on the
+caller's thread. A background thread drains the queue in batches, encodes
+each record as one JSON line, writes the batch with a single call and
+rotates the file by size. When the queue is full, records are dropped and
+counted rather than making the caller wait, as are records whose fields
+cannot be encoded.
+"""
+
+import logging
+import os
+import queue
+import threading
+from datetime import datetime
+from logging.handlers import QueueHandler
+from typing import Any, Callable
+
+from models import UTC
+from utils.json_codec import JSONEncoder
+from utils.metrics import MetricsRegistry
+
+_STOP = object()
+
+
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler that never blocks and leaves formatting to the consumer.
+
+    The stock handler formats each record on the logging thread; here the
+    record is queued as is, so fields passed via ``extra`` must not be
+    mutated after logging. A full queue drops the record.
+    """
+
+    def __init__(self, records: queue.Queue, on_drop: Callable[[], None]) -> None:
+        super().__init__(records)
+        self._on_drop = on_drop
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Queue the record unformatted."""
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Put the record on the queue, or count it as dropped if full."""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self._on_drop()
+
+
+class StructuredLog:
+    """One JSON-lines file fed through a bounded queue by a writer thread.
+
+    Each line holds ``ts`` (UTC, milliseconds), ``log``, ``event`` (the
+    message) and the record's ``fields``. Written and dropped records are
+    counted in ``log_records_written_total`` and
+    ``log_records_dropped_total``, labelled with the log's name.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        path: str,
+        encoder: JSONEncoder,
+        metrics: MetricsRegistry,
+        queue_size: int = 10_000,
+        batch_size: int = 512,
+        max_bytes: int = 50 * 1024 * 1024,
+        backup_count: int = 5,
+    ) -> None:
+        """Create the log; nothing is written until start().
+
+        Args:
+            name: Log name, used in each line and as the metric label.
+            path: File to append to.
+            encoder: Encodes each line.
+            metrics: Registry the counters and queue gauge report into.
+            queue_size: Records that may wait for the writer.
+            batch_size: Most records written with one call.
+            max_bytes: Size at which the file is rotated to ``path.1``.
+            backup_count: Rotated files kept; 0 truncates instead.
+        """
+        self.name = name
+        self.path = path
+        self.batch_size = batch_size
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._encoder = encoder
+        self._queue: queue.Queue = queue.Queue(queue_size)
+        self._thread: threading.Thread | None = None
+        self._written = metrics.counter("log_records_written_total", "Log records written")
+        self._dropped = metrics.counter(
+            "log_records_dropped_total", "Log records dropped: queue full or not encodable"
+        )
+        metrics.gauge("log_queue_depth", "Log records waiting for the writer").set_function(
+            self._queue.qsize, log=name
+        )
+        self.logger = logging.Logger(name, logging.INFO)
+        self.logger.addHandler(
+            DroppingQueueHandler(self._queue, lambda: self._dropped.inc(log=name))
+        )
+
+    def emit(self, event: str, **fields: Any) -> None:
+        """Log one INFO record without the Logger's caller lookup.
+
+        Args:
+            event: Event name, the line's ``event``.
+            **fields: JSON-serializable values added to the line.
+        """
+        record = logging.LogRecord(self.name, logging.INFO, "", 0, event, None, None)
+        record.fields = fields
+        self.logger.handle(record)
+
+    def start(self) -> None:
+        """Open the file and start the writer thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name=f"log-writer-{self.name}", daemon=True
+            )
+            self._thread.start()
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Write the queued records and stop the writer thread.
+
+        Args:
+            timeout: Longest wait for the queue to drain.
+        """
+        if self._thread is None:
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        file = open(self.path, "ab")
+        try:
+            while True:
+                batch = [self._queue.get()]
+                while len(batch) < self.batch_size:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                records = [r for r in batch if r is not _STOP]
+                lines = [line for line in map(self._encode, records) if line is not None]
+                if lines:
+                    file.write(b"".join(lines))
+                    file.flush()
+                    self._written.inc(len(lines), log=self.name)
+                    if file.tell() >= self.max_bytes:
+                        file.close()
+                        self._rotate()
+                        file = open(self.path, "ab")
+                if len(records) < len(batch):
+                    return
+        finally:
+            file.close()
+
+    def _encode(self, record: logging.LogRecord) -> bytes | None:
+        line = {
+            "ts": datetime.fromtimestamp(record.created, UTC).isoformat(timespec="milliseconds"),
+            "log": self.name,
+            "event": record.getMessage(),
+            **getattr(record, "fields", {}),
+        }
+        try:
+            return self._encoder.dumps(line) + b"\n"
+        except (TypeError, ValueError):
+            self._dropped.inc(log=self.name)
+            return None
+
+    def _rotate(self) -> None:
+        """Shift ``path.N`` to ``path.N+1`` and the live file to ``path.1``."""
+        if self.backup_count <= 0:
+            os.truncate(self.path, 0)
+            return
+        for index in range(self.backup_count - 1, 0, -1):
+            older = f"{self.path}.{index}"
+            if os.path.exists(older):
+                os.replace(older, f"{self.path}.{index + 1}")
+        os.replace(self.path, f"{self.path}.1")
@@ -0,0 +1,190 @@
+"""Per-tenant partitions of the case store, and the case quota they enforce."""
+
+import re
+from contextlib import AbstractAsyncContextManager
+from typing import Any, Callable, Optional, Sequence
+
+from exceptions import NotFoundError, QuotaExceededError, ValidationError
+from models import Case, CaseStatistics
+from utils.change_feed import ChangeFeed
+
+# Tenant ids end up in metric labels and logs, so they are kept plain.
+TENANT_ID = re.compile(r"[a-z0-9][a-z0-9_-]{0,62}")
+
+
+class QuotaCaseRepository:
+    """Caps the number of distinct cases a repository may hold.
+
+    Satisfies the CaseRepository protocol of services.case_service by
+    delegation. Ids written through this decorator are remembered, so
+    updates to existing cases are always allowed and only new ids count
+    against the quota. Wrap an empty backend, since cases already in it
+    are not counted.
+    """
+
+    def __init__(self, inner: Any, max_cases: int) -> None:
+        self.inner = inner
+        self.max_cases = max_cases
+        self._ids: set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def lock(self, case_id: str) -> AbstractAsyncContextManager:
+        """Delegate to the backend's lock."""
+        return self.inner.lock(case_id)
+
+    async def get_by_id(self, case_id: str) -> Optional[Case]:
+        """Delegate to the backend."""
+        return await self.inner.get_by_id(case_id)
+
+    async def get_many(self, case_ids: Sequence[str]) -> dict[str, Case]:
+        """Delegate to the backend."""
+        return await self.inner.get_many(case_ids)
+
+    async def save(self, case: Case) -> None:
+        """Save through to the backend unless a new id would break the quota.
+
+        A new id takes its place in the quota before the save is awaited,
+        so concurrent saves of new cases cannot all pass the check; it is
+        given back if the save fails.
+
+        Raises:
+            QuotaExceededError: If the case is new and the quota is full.
+        """
+        new = case.id not in self._ids
+        if new:
+            self._admit(1)
+            self._ids.add(case.id)
+        try:
+            await self.inner.save(case)
+        except BaseException:
+            if new:
+                self._ids.discard(case.id)
+            raise
+
+    def seed(self, cases: list[Case]) -> None:
+        """Seed the backend if every new id fits in the quota.
+
+        Raises:
+            QuotaExceededError: If the new ids would exceed the quota;
+                nothing is seeded.
+        """
+        new = {case.id for case in cases} - self._ids
+        self._admit(len(new))
+        self.inner.seed(cases)
+        self._ids |= new
+
+    async def search(
+        self,
+        referrer_id: str | None = None,
+        expert_id: str | None = None,
+        limit: int = 50,
+    ) -> list[Case]:
+        """Delegate to the backend."""
+        return await self.inner.search(
+            referrer_id=referrer_id, expert_id=expert_id, limit=limit
+        )
+
+    async def stats(self) -> CaseStatistics:
+        """Delegate to the backend."""
+        return await self.inner.stats()
+
+    async def rebuild_stats(self) -> CaseStatistics:
+        """Delegate to the backend."""
+        return await self.inner.rebuild_stats()
+
+    async def page_by_id(self, after: str | None, limit: int) -> list[Case]:
+        """Delegate to the backend."""
+        return await self.inner.page_by_id(after, limit)
+
+    async def with_deadlines(self) -> list[Case]:
+        """Delegate to the backend."""
+        return await self.inner.with_deadlines()
+
+    def _admit(self, count: int) -> None:
+        if len(self._ids) + count > self.max_cases:
+            raise QuotaExceededError(
+                f"Case quota of {self.max_cases} reached ({len(self._ids)} stored)"
+            )
+
+
+class TenantPartition:
+    """One tenant's case repository, change feed and SLA deadlines."""
+
+    def __init__(
+        self, tenant: str, repo: Any, change_feed: ChangeFeed, deadlines: Any = None
+    ) -> None:
+        self.tenant = tenant
+        self.repo = repo
+        self.change_feed = change_feed
+        self.deadlines = deadlines
+
+
+class TenantRegistry:
+    """Maps tenant ids to partitions, building each one on first use.
+
+    Partitions share no state, so one tenant's writes, cache churn and
+    watchers never touch another's. The number of partitions is capped so
+    a client cycling through tenant ids cannot grow memory without bound.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[str], TenantPartition],
+        default: TenantPartition,
+        max_tenants: int = 1000,
+        allowed: frozenset[str] = frozenset(),
+    ) -> None:
+        """Create a registry holding the default tenant's partition.
+
+        Args:
+            factory: Builds an empty partition for a tenant id.
+            default: Partition of requests that name no tenant.
+            max_tenants: Maximum number of partitions, default included.
+            allowed: Tenant ids that may be used; empty accepts any.
+        """
+        self.default = default
+        self.max_tenants = max_tenants
+        self.allowed = allowed
+        self._factory = factory
+        self._partitions = {default.tenant: default}
+
+    def __len__(self) -> int:
+        return len(self._partitions)
+
+    def tenants(self) -> list[str]:
+        """Ids of the tenants that have a partition."""
+        return sorted(self._partitions)
+
+    def partitions(self) -> list[TenantPartition]:
+        """Every partition built so far, the default's included."""
+        return list(self._partitions.values())
+
+    def get(self, tenant: str | None) -> TenantPartition:
+        """Return a tenant's partition, creating it on first use.
+
+        Args:
+            tenant: Tenant id, or None for the default tenant.
+
+        Returns:
+            The tenant's partition.
+
+        Raises:
+            ValidationError: If the id is malformed.
+            NotFoundError: If an allow-list is set and omits the id.
+            QuotaExceededError: If a new partition would exceed max_tenants.
+        """
+        if tenant is None:
+            return self.default
+        partition = self._partitions.get(tenant)
+        if partition is not None:
+            return partition
+        if TENANT_ID.fullmatch(tenant) is None:
+            raise ValidationError(f"Invalid tenant id '{tenant}'")
+        if self.allowed and tenant not in self.allowed:
+            raise NotFoundError(f"Unknown tenant '{tenant}'")
+        if len(self._partitions) >= self.max_tenants:
+            raise QuotaExceededError(f"Tenant limit of {self.max_tenants} reached")
+        partition = self._partitions[tenant] = self._factory(tenant)
+        return partition
@@ -0,0 +1,140 @@
+"""Hierarchical timing wheel: O(1) schedule, cancel and per-tick expiry.
+
+Time is an integer tick count. Level ``i`` of the wheel has 256 slots of
+256**i ticks each, so four levels cover 2**32 ticks, which is 136 years
+at one-second ticks. A timer is stored in the coarsest slot it needs.
+When the current tick enters a new level-``i`` slot, that slot's timers
+are cascaded one level down. Each timer therefore moves at most three
+times before it reaches level 0 and fires. Timers past the last level
+park in its furthest slot and are re-placed on cascade.
+"""
+
+from typing import Hashable
+
+_BITS = 8
+_SLOTS = 1 << _BITS
+_MASK = _SLOTS - 1
+LEVELS = 4
+_SPAN = 1 << (_BITS * LEVELS)
+
+
+class TimerWheel:
+    """Keyed one-shot timers on a four-level hashed wheel.
+
+    Each key has at most one timer; scheduling an existing key moves it.
+    Advancing fires every timer whose tick has been reached, in tick order.
+    """
+
+    def __init__(self, now: int = 0) -> None:
+        """Create an empty wheel.
+
+        Args:
+            now: The current tick.
+        """
+        self.now = now
+        self._wheels: list[list[dict[Hashable, int]]] = [
+            [{} for _ in range(_SLOTS)] for _ in range(LEVELS)
+        ]
+        self._where: dict[Hashable, tuple[int, int]] = {}
+        self._counts = [0] * LEVELS
+        # Timers scheduled at or before the current tick, fired next advance.
+        self._due: dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._where) + len(self._due)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._where or key in self._due
+
+    def schedule(self, key: Hashable, tick: int) -> None:
+        """Set key's timer to fire at tick, replacing any earlier timer.
+
+        Args:
+            key: Timer identity, e.g. a case id.
+            tick: Tick at which the timer fires; past ticks fire on the
+                next advance.
+        """
+        self.cancel(key)
+        if tick <= self.now:
+            self._due[key] = tick
+        else:
+            self._place(key, tick)
+
+    def cancel(self, key: Hashable) -> bool:
+        """Remove key's timer.
+
+        Returns:
+            Whether a timer was pending.
+        """
+        where = self._where.pop(key, None)
+        if where is not None:
+            level, slot = where
+            del self._wheels[level][slot][key]
+            self._counts[level] -= 1
+            return True
+        return self._due.pop(key, None) is not None
+
+    def advance(self, to: int) -> list[tuple[Hashable, int]]:
+        """Move the current tick forward, firing timers that come due.
+
+        Costs O(1) per tick plus O(1) per fired or cascaded timer. Ticks
+        that can neither fire nor cascade a timer are skipped: with the
+        finer levels empty, the wheel jumps to the next boundary of the
+        finest occupied level.
+
+        Args:
+            to: New current tick; ticks before the current one are ignored.
+
+        Returns:
+            (key, tick) pairs of fired timers, in tick order.
+        """
+        fired = list(self._due.items())
+        self._due.clear()
+        while self.now < to:
+            if not self._where:
+                self.now = to
+                break
+            level = 0
+            while not self._counts[level]:
+                level += 1
+            if level:
+                boundary = (self.now | ((1 << (_BITS * level)) - 1)) + 1
+                if boundary > to:
+                    self.now = to
+                    break
+                self.now = boundary - 1
+            self.now += 1
+            self._cascade()
+            slot = self._wheels[0][self.now & _MASK]
+            if slot:
+                for key, tick in slot.items():
+                    del self._where[key]
+                    fired.append((key, tick))
+                self._counts[0] -= len(slot)
+                slot.clear()
+        return fired
+
+    def _place(self, key: Hashable, tick: int) -> None:
+        delta = min(tick - self.now, _SPAN - 1)
+        level = 0
+        while delta >= 1 << (_BITS * (level + 1)):
+            level += 1
+        slot = ((self.now + delta) >> (_BITS * level)) & _MASK
+        self._wheels[level][slot][key] = tick
+        self._where[key] = (level, slot)
+        self._counts[level] += 1
+
+    def _cascade(self) -> None:
+        """Re-place the timers of every coarser slot the current tick has entered."""
+        level = 1
+        while level < LEVELS and self.now & ((1 << (_BITS * level)) - 1) == 0:
+            level += 1
+        for level in range(level - 1, 0, -1):
+            slot = self._wheels[level][(self.now >> (_BITS * level)) & _MASK]
+            if slot:
+                moving = list(slot.items())
+                self._counts[level] -= len(moving)
+                slot.clear()
+                for key, tick in moving:
+                    del self._where[key]
+                    self._place(key, max(tick, self.now))
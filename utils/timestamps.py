@@ -0,0 +1,18 @@
+"""Calendar helpers over the UTC timestamps of the domain models."""
+
+from datetime import datetime
+
+from models import as_utc
+
+
+def hour_of_week(value: datetime) -> int:
+    """Return the UTC hour of the week, 0 (Monday 00:00) to 167.
+
+    Args:
+        value: Any datetime; naive values are taken to be UTC.
+
+    Returns:
+        ``weekday * 24 + hour`` of the instant in UTC.
+    """
+    value = as_utc(value)
+    return value.weekday() * 24 + value.hour
@@ -0,0 +1,80 @@
+"""Span exporters: an in-memory ring buffer and an OTLP/JSON file writer."""
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.json_codec import JSONEncoder
+from utils.tracing import Span, otlp_attributes
+
+
+class RingBufferExporter:
+    """Keeps the most recent finished spans in memory."""
+
+    def __init__(self, capacity: int = 2048) -> None:
+        self._spans: deque[Span] = deque(maxlen=capacity)
+
+    def export(self, span: Span) -> None:
+        """Record a finished span, evicting the oldest when full."""
+        self._spans.append(span)
+
+    def spans(self, trace_id: int | None = None) -> list[Span]:
+        """Return buffered spans, oldest first, optionally for one trace."""
+        if trace_id is None:
+            return list(self._spans)
+        return [span for span in self._spans if span.trace_id == trace_id]
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+class OtlpJsonFileExporter:
+    """Appends spans to a file as OTLP/JSON ``TracesData``, one batch per line.
+
+    This is the format of the OpenTelemetry Collector's file exporter, so
+    the output can be replayed into any OTLP backend. Spans are buffered
+    and written ``batch_size`` at a time by a single background thread, so
+    the event loop never waits on the file and batches stay in order.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        encoder: JSONEncoder,
+        service_name: str = "medirect-edge",
+        batch_size: int = 256,
+    ) -> None:
+        self.path = path
+        self.batch_size = batch_size
+        self._encoder = encoder
+        self._resource = {
+            "attributes": otlp_attributes([("service.name", service_name)]),
+        }
+        self._pending: list[Span] = []
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="otlp-file")
+
+    def export(self, span: Span) -> None:
+        """Buffer a finished span, writing a full batch in the background."""
+        self._pending.append(span)
+        if len(self._pending) >= self.batch_size:
+            batch, self._pending = self._pending, []
+            self._writer.submit(self._write, batch)
+
+    def close(self) -> None:
+        """Write any buffered spans and wait until every batch is on disk."""
+        batch, self._pending = self._pending, []
+        if batch:
+            self._writer.submit(self._write, batch)
+        self._writer.shutdown(wait=True)
+
+    def _write(self, batch: list[Span]) -> None:
+        line = self._encoder.dumps({
+            "resourceSpans": [{
+                "resource": self._resource,
+                "scopeSpans": [{
+                    "scope": {"name": "medirect.tracing"},
+                    "spans": [span.to_otlp() for span in batch],
+                }],
+            }],
+        })
+        with open(self.path, "ab") as f:
+            f.write(line + b"\n")
@@ -0,0 +1,289 @@
+"""Lightweight in-process tracing with W3C trace context propagation.
+
+The active span lives in a context variable, so it follows a request through
+awaits, tasks and the threadpool without being passed around. A trace is
+started once per request by the tracing middleware; start_span() and the
+Traced wrapper create child spans only while a trace is active and are
+no-ops otherwise. Finished spans are handed to the exporters in
+utils.trace_exporters.
+"""
+
+import asyncio
+import inspect
+import random
+import re
+import time
+from contextvars import ContextVar, Token
+from functools import wraps
+from typing import Any, Callable, Iterable, Protocol, Sequence
+
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+STATUS_CODE_ERROR = 2
+
+_TRACEPARENT = re.compile(r"^([0-9a-f]{2})-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})")
+_ids = random.Random()
+_current: ContextVar["Span | None"] = ContextVar("current_span", default=None)
+
+
+class SpanExporter(Protocol):
+    """Receives every finished span."""
+
+    def export(self, span: "Span") -> None: ...
+
+    def close(self) -> None: ...
+
+
+class Span:
+    """A timed operation within a trace; use as a context manager."""
+
+    __slots__ = (
+        "tracer", "trace_id", "span_id", "parent_id", "name", "kind",
+        "start_ns", "end_ns", "attributes", "error", "sampled", "_token",
+    )
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        trace_id: int,
+        parent_id: int | None,
+        kind: int = SPAN_KIND_INTERNAL,
+        attributes: dict[str, Any] | None = None,
+        sampled: bool = True,
+    ) -> None:
+        self.tracer = tracer
+        self.trace_id = trace_id
+        self.span_id = _ids.getrandbits(64) or 1
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.attributes = attributes if attributes is not None else {}
+        self.error: str | None = None
+        self.sampled = sampled
+        self.start_ns = 0
+        self.end_ns = 0
+        self._token: Token | None = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach a key/value to the span."""
+        self.attributes[key] = value
+
+    @property
+    def traceparent(self) -> str:
+        """This span as a W3C ``traceparent`` header value."""
+        return f"00-{self.trace_id:032x}-{self.span_id:016x}-{'01' if self.sampled else '00'}"
+
+    @property
+    def duration_ns(self) -> int:
+        """Elapsed nanoseconds; 0 until the span ends."""
+        return self.end_ns - self.start_ns if self.end_ns else 0
+
+    def __enter__(self) -> "Span":
+        self.start_ns = time.time_ns()
+        self._token = _current.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.end_ns = time.time_ns()
+        _current.reset(self._token)
+        if exc_type is not None and not issubclass(exc_type, asyncio.CancelledError):
+            self.error = f"{exc_type.__name__}: {exc}"
+        if self.sampled:
+            self.tracer.export(self)
+
+    def to_otlp(self) -> dict[str, Any]:
+        """Render the span in the OTLP/JSON ``Span`` shape."""
+        span = {
+            "traceId": f"{self.trace_id:032x}",
+            "spanId": f"{self.span_id:016x}",
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": otlp_attributes(self.attributes.items()),
+            "status": {},
+        }
+        if self.parent_id is not None:
+            span["parentSpanId"] = f"{self.parent_id:016x}"
+        if self.error is not None:
+            span["status"] = {"code": STATUS_CODE_ERROR, "message": self.error}
+        return span
+
+
+class _NoopSpan:
+    """Stand-in returned when no trace is active; does nothing."""
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+def parse_traceparent(header: str | None) -> tuple[int, int, bool] | None:
+    """Parse a W3C ``traceparent`` header.
+
+    Args:
+        header: The header value, or None.
+
+    Returns:
+        (trace id, parent span id, sampled) or None if absent or invalid.
+    """
+    if not header:
+        return None
+    match = _TRACEPARENT.match(header.strip().lower())
+    if match is None:
+        return None
+    version, trace_hex, span_hex, flags = match.groups()
+    if version == "ff" or (version == "00" and len(header.strip()) != 55):
+        return None
+    trace_id, span_id = int(trace_hex, 16), int(span_hex, 16)
+    if not trace_id or not span_id:
+        return None
+    return trace_id, span_id, bool(int(flags, 16) & 1)
+
+
+def current_span() -> Span | None:
+    """Return the active span, if a trace is in progress."""
+    return _current.get()
+
+
+def start_span(name: str, **attributes: Any) -> Span | _NoopSpan:
+    """Create a child of the active span, or a no-op outside a trace.
+
+    Args:
+        name: Operation name.
+        **attributes: Initial span attributes.
+
+    Returns:
+        A span to use as a context manager.
+    """
+    parent = _current.get()
+    if parent is None:
+        return NOOP_SPAN
+    return Span(
+        parent.tracer, name, parent.trace_id, parent.span_id,
+        attributes=attributes, sampled=parent.sampled,
+    )
+
+
+class Tracer:
+    """Starts traces and hands finished spans to exporters."""
+
+    def __init__(self, exporters: Sequence[SpanExporter] = ()) -> None:
+        self.exporters = list(exporters)
+
+    def start_trace(
+        self,
+        name: str,
+        traceparent: str | None = None,
+        kind: int = SPAN_KIND_SERVER,
+        **attributes: Any,
+    ) -> Span:
+        """Create a root span, continuing the caller's trace if given.
+
+        Args:
+            name: Operation name.
+            traceparent: Incoming W3C ``traceparent`` header, if any.
+            kind: OTLP span kind.
+            **attributes: Initial span attributes.
+
+        Returns:
+            A span to use as a context manager.
+        """
+        parent = parse_traceparent(traceparent)
+        if parent is None:
+            return Span(self, name, _ids.getrandbits(128) or 1, None, kind, attributes)
+        trace_id, parent_id, sampled = parent
+        return Span(self, name, trace_id, parent_id, kind, attributes, sampled)
+
+    def export(self, span: Span) -> None:
+        """Pass a finished span to every exporter."""
+        for exporter in self.exporters:
+            exporter.export(span)
+
+    def close(self) -> None:
+        """Flush and close every exporter."""
+        for exporter in self.exporters:
+            exporter.close()
+
+
+class Traced:
+    """Wraps an object so each of its coroutine methods runs in a span.
+
+    Spans are named ``<prefix>.<method>``. Other attributes, including
+    synchronous methods, pass through unchanged. Wrapped methods are cached
+    on the instance, so only the first access of each name pays for
+    the lookup.
+    """
+
+    def __init__(self, inner: Any, prefix: str) -> None:
+        self.inner = inner
+        self.prefix = prefix
+
+    def __len__(self) -> int:
+        return len(self.inner)
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self.inner, name)
+        if not inspect.iscoroutinefunction(attr):
+            return attr
+        wrapped = _traced_method(attr, f"{self.prefix}.{name}")
+        setattr(self, name, wrapped)
+        return wrapped
+
+
+def traced(span_name: str) -> Callable[[Callable], Callable]:
+    """Decorate a coroutine function to run in a span while a trace is active.
+
+    Args:
+        span_name: Name of the span, e.g. ``"CaseService.assign_expert"``.
+
+    Returns:
+        The decorator.
+    """
+    return lambda fn: _traced_method(fn, span_name)
+
+
+def _traced_method(method: Callable, span_name: str) -> Callable:
+    @wraps(method)
+    async def wrapper(*args, **kwargs):
+        parent = _current.get()
+        if parent is None:
+            return await method(*args, **kwargs)
+        with Span(parent.tracer, span_name, parent.trace_id, parent.span_id,
+                  sampled=parent.sampled):
+            return await method(*args, **kwargs)
+    return wrapper
+
+
+def otlp_attributes(items: Iterable[tuple[str, Any]]) -> list[dict[str, Any]]:
+    """Render key/value pairs as OTLP/JSON ``KeyValue`` attributes.
+
+    Args:
+        items: Attribute names and values.
+
+    Returns:
+        The attributes, typed by their Python value.
+    """
+    out = []
+    for key, value in items:
+        if isinstance(value, bool):
+            typed = {"boolValue": value}
+        elif isinstance(value, int):
+            typed = {"intValue": str(value)}
+        elif isinstance(value, float):
+            typed = {"doubleValue": value}
+        else:
+            typed = {"stringValue": str(value)}
+        out.append({"key": key, "value": typed})
+    return out